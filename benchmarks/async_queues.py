@@ -0,0 +1,136 @@
+"""
+Throughput de colas asyncio con muchos productores concurrentes.
+
+Uso:
+  python -m benchmarks.async_queues                  # 1, 10, 100 y 1000 productores
+  python -m benchmarks.async_queues --producers 100 --items 200000
+
+--items ints repartidos entre los productores pasan por una cola de
+--capacity slots hacia un consumidor. Compara:
+  asyncio.Queue       la cola de la stdlib
+  AsyncQueue          core.structures.linear.async_queue, get de a uno
+  AsyncQueue batch    el consumidor usa get_batch
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from benchmarks.run import RESULTS_DIR, _git_commit
+from core.structures.linear.async_queue import AsyncQueue
+
+PRODUCERS = (1, 10, 100, 1_000)
+BATCH = 64
+
+
+@dataclass(frozen=True)
+class AsyncCase:
+    name: str
+    factory: Callable[[int], Any]
+    batched: bool = False
+
+
+CASES: list[AsyncCase] = [
+    AsyncCase("asyncio.Queue", lambda cap: asyncio.Queue(maxsize=cap)),
+    AsyncCase("AsyncQueue", AsyncQueue),
+    AsyncCase("AsyncQueue batch", AsyncQueue, batched=True),
+]
+
+
+async def run_case(case: AsyncCase, producers: int, items: int, capacity: int) -> float:
+    """Segundos para pasar `items` de `producers` tareas a un consumidor."""
+    q = case.factory(capacity)
+    per = items // producers
+    total = per * producers
+
+    async def produce() -> None:
+        put = q.put
+        for i in range(per):
+            await put(i)
+
+    async def consume() -> None:
+        left = total
+        if case.batched:
+            while left:
+                left -= len(await q.get_batch(BATCH))
+            return
+        get = q.get
+        for _ in range(total):
+            await get()
+
+    t0 = time.perf_counter()
+    await asyncio.gather(consume(), *(produce() for _ in range(producers)))
+    return time.perf_counter() - t0
+
+
+def run_all(
+    producers: Sequence[int], *, items: int, capacity: int, repeat: int = 3, log: bool = False
+) -> dict[str, Any]:
+    results: list[dict[str, Any]] = []
+    for case in CASES:
+        for p in producers:
+            best = min(asyncio.run(run_case(case, p, items, capacity)) for _ in range(repeat))
+            total = items // p * p
+            row = {
+                "case": case.name,
+                "producers": p,
+                "items": total,
+                "seconds": round(best, 6),
+                "items_per_sec": round(total / best, 1),
+            }
+            results.append(row)
+            if log:
+                print(
+                    f"{case.name:<18} p={p:<5} {row['items_per_sec']:>14,.0f} items/s", flush=True
+                )
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "items": items,
+            "capacity": capacity,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    p = argparse.ArgumentParser(
+        prog="python -m benchmarks.async_queues", description=__doc__.split("\n")[1]
+    )
+    p.add_argument("--producers", type=int, nargs="+", default=list(PRODUCERS))
+    p.add_argument("--items", type=int, default=100_000)
+    p.add_argument("--capacity", type=int, default=1_024)
+    p.add_argument("--repeat", type=int, default=3)
+    p.add_argument("--out", type=Path, help="JSON de salida (default: benchmarks/results/)")
+    args = p.parse_args(argv)
+
+    report = run_all(
+        args.producers, items=args.items, capacity=args.capacity, repeat=args.repeat, log=True
+    )
+
+    out = args.out
+    if out is None:
+        stamp = report["meta"]["commit"] or datetime.now(UTC).strftime("%Y%m%dT%H%M%S")
+        out = RESULTS_DIR / f"async-{stamp}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"\nResultados: {out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
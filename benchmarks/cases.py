@@ -0,0 +1,468 @@
+from __future__ import annotations
+
+import random
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from core.algos.hash import hash_set_ops, hash_table_ops, ordered_map_ops
+from core.algos.linear import (
+    array_list_ops,
+    circular_doubly_linked_list_ops,
+    deque_ops,
+    doubly_linked_list_ops,
+    linked_list_ops,
+    queue_ops,
+    ring_buffer_ops,
+    skip_list_ops,
+    stack_ops,
+)
+from core.algos.trees import (
+    avl_tree_ops,
+    binary_search_tree_ops,
+    binary_tree_ops,
+    red_black_tree_ops,
+)
+from core.render.hash.hash_set_graphviz import hash_set_to_dot
+from core.render.hash.hash_table_graphviz import hash_table_to_dot
+from core.render.hash.ordered_map_graphviz import ordered_map_to_dot
+from core.render.linear.array_list_graphviz import array_list_to_dot
+from core.render.linear.circular_doubly_linked_list_graphviz import cdll_to_dot
+from core.render.linear.deque_graphviz import deque_to_dot
+from core.render.linear.doubly_linked_list_graphviz import doubly_linked_list_to_dot
+from core.render.linear.linked_list_graphviz import linked_list_to_dot
+from core.render.linear.queue_graphviz import queue_to_dot
+from core.render.linear.ring_buffer_graphviz import ring_buffer_to_dot
+from core.render.linear.skip_list_graphviz import skip_list_to_dot
+from core.render.linear.stack_graphviz import stack_to_dot
+from core.render.trees.avl_tree_graphviz import avl_tree_to_dot
+from core.render.trees.binary_search_tree_graphviz import binary_search_tree_to_dot
+from core.render.trees.binary_tree_graphviz import binary_tree_to_dot
+from core.render.trees.red_black_tree_graphviz import red_black_tree_to_dot
+from core.structures.hash.hash_set import HashSet
+from core.structures.hash.hash_table import HashTable
+from core.structures.hash.ordered_map import OrderedMap
+from core.structures.linear.array_list import ArrayList
+from core.structures.linear.circular_doubly_linked_list import CircularDoublyLinkedList
+from core.structures.linear.deque_ds import DequeDS
+from core.structures.linear.doubly_linked_list import DoublyLinkedList
+from core.structures.linear.linked_list import LinkedList
+from core.structures.linear.queue import Queue
+from core.structures.linear.ring_buffer import RingBuffer
+from core.structures.linear.skip_list import SkipList
+from core.structures.linear.stack import Stack
+from core.structures.trees.avl_tree import AVLTree
+from core.structures.trees.binary_search_tree import BinarySearchTree
+from core.structures.trees.binary_tree import BinaryTree
+from core.structures.trees.red_black_tree import RedBlackTree
+
+WORKLOADS = ("random", "sorted", "collision", "delete_heavy")
+
+# Separa las keys "collision" lo suficiente para que caigan en el mismo bucket
+# de cualquier tabla con capacidad potencia de 2 (hasta 2**20).
+_COLLISION_STRIDE = 1 << 20
+
+
+def make_keys(workload: str, n: int, seed: int = 1234) -> list[int]:
+    """
+    Keys enteras únicas para un workload:
+      random        permutación aleatoria
+      sorted        ascendentes (peor caso de un BST sin balancear)
+      collision     mismo bucket en las hash tables
+      delete_heavy  random (el caso borra todo después de insertar)
+    """
+    if workload == "sorted":
+        return list(range(n))
+    if workload == "collision":
+        return [i * _COLLISION_STRIDE for i in range(n)]
+    if workload in ("random", "delete_heavy"):
+        keys = list(range(n))
+        random.Random(seed).shuffle(keys)
+        return keys
+    raise ValueError(f"workload desconocido: {workload}")
+
+
+@dataclass(frozen=True)
+class StructureCase:
+    """
+    Benchmark directo sobre una clase de core/structures.
+
+    insert/lookup/delete reciben (estructura, key). Todas las keys se insertan,
+    luego se consultan (o se borran en delete_heavy, en otro orden).
+    slow_n: tope de n para workloads cuadráticos en esta estructura.
+    """
+
+    name: str
+    factory: Callable[[int], Any]
+    insert: Callable[[Any, int], object]
+    lookup: Callable[[Any, int], object]
+    delete: Callable[[Any, int], object]
+    max_n: int = 1_000_000
+    slow_workloads: frozenset[str] = frozenset()
+    slow_n: int = 5_000
+
+    def limit(self, workload: str) -> int:
+        return min(self.max_n, self.slow_n) if workload in self.slow_workloads else self.max_n
+
+    def run(self, workload: str, keys: list[int]) -> int:
+        """Corre el workload y devuelve la cantidad de operaciones hechas."""
+        s = self.factory(len(keys))
+        insert, lookup, delete = self.insert, self.lookup, self.delete
+        for k in keys:
+            insert(s, k)
+        if workload == "delete_heavy":
+            for k in reversed(keys):
+                delete(s, k)
+        else:
+            for k in keys:
+                lookup(s, k)
+        return 2 * len(keys)
+
+
+@dataclass(frozen=True)
+class PipelineCase:
+    """
+    Benchmark de parse_operations + build_steps (lo que hace cada página).
+
+    Genera un script de texto con una línea por operación:
+      fill(key) para cada key, luego query(key) o drop(key) (delete_heavy).
+    El DOT no se renderiza (Step.dot es lazy), solo se arman los pasos.
+    """
+
+    name: str
+    parse: Callable[[str], list[Any]]
+    build: Callable[[list[Any]], object]
+    fill: Callable[[int], str]
+    query: Callable[[int], str]
+    drop: Callable[[int], str]
+    max_n: int = 2_000  # cada paso guarda un snapshot O(n): el pipeline es O(n^2)
+
+    def limit(self, workload: str) -> int:
+        return self.max_n
+
+    def script(self, workload: str, keys: list[int]) -> str:
+        second = self.drop if workload == "delete_heavy" else self.query
+        lines = [self.fill(k) for k in keys]
+        lines += [second(k) for k in reversed(keys)]
+        return "\n".join(lines)
+
+    def run(self, workload: str, keys: list[int]) -> int:
+        ops = self.parse(self.script(workload, keys))
+        self.build(ops)
+        return len(ops)
+
+
+# Estructuras donde lookup/delete por valor recorre la lista: O(n) por operación.
+_LINEAR_SCAN = frozenset(WORKLOADS)
+
+STRUCTURES: list[StructureCase] = [
+    StructureCase(
+        "ArrayList",
+        lambda _n: ArrayList(),
+        lambda s, k: s.append(k),
+        lambda s, _k: s.get(0),
+        lambda s, _k: s.pop(),
+    ),
+    StructureCase(
+        "ArrayList[blocked]",
+        lambda _n: ArrayList(engine="blocked"),
+        lambda s, k: s.append(k),
+        lambda s, _k: s.get(0),
+        lambda s, _k: s.pop(),
+    ),
+    # insert/get/pop_at en la mitad: la list corre toda la cola en cada operación
+    StructureCase(
+        "ArrayList middle",
+        lambda _n: ArrayList(),
+        lambda s, k: s.insert(len(s) // 2, k),
+        lambda s, _k: s.get(len(s) // 2),
+        lambda s, _k: s.pop_at(len(s) // 2),
+        slow_workloads=_LINEAR_SCAN,
+    ),
+    StructureCase(
+        "ArrayList[blocked] middle",
+        lambda _n: ArrayList(engine="blocked"),
+        lambda s, k: s.insert(len(s) // 2, k),
+        lambda s, _k: s.get(len(s) // 2),
+        lambda s, _k: s.pop_at(len(s) // 2),
+    ),
+    StructureCase(
+        "ArrayList[int64]",
+        lambda _n: ArrayList(dtype="int64"),
+        lambda s, k: s.append(k),
+        lambda s, _k: s.get(0),
+        lambda s, _k: s.pop(),
+    ),
+    StructureCase(
+        "Stack",
+        lambda _n: Stack(),
+        lambda s, k: s.push(k),
+        lambda s, _k: s.peek(),
+        lambda s, _k: s.pop(),
+    ),
+    StructureCase(
+        "Queue",
+        lambda _n: Queue(),
+        lambda s, k: s.enqueue(k),
+        lambda s, _k: s.front(),
+        lambda s, _k: s.dequeue(),
+    ),
+    StructureCase(
+        "DequeDS",
+        lambda _n: DequeDS(),
+        lambda s, k: s.push_back(k),
+        lambda s, _k: s.peek_front(),
+        lambda s, _k: s.pop_front(),
+    ),
+    StructureCase(
+        "RingBuffer",
+        lambda n: RingBuffer(max(1, n)),
+        lambda s, k: s.write(k),
+        lambda s, _k: s.peek(),
+        lambda s, _k: s.read(),
+    ),
+    StructureCase(
+        "RingBuffer[int64]",
+        lambda n: RingBuffer(max(1, n), dtype="int64"),
+        lambda s, k: s.write(k),
+        lambda s, _k: s.peek(),
+        lambda s, _k: s.read(),
+    ),
+    StructureCase(
+        "LinkedList",
+        lambda _n: LinkedList(),
+        lambda s, k: s.append(k),
+        lambda s, k: s.find_index(k),
+        lambda s, k: s.delete(k),
+        slow_workloads=_LINEAR_SCAN,
+    ),
+    StructureCase(
+        "DoublyLinkedList",
+        lambda _n: DoublyLinkedList(),
+        lambda s, k: s.push_back(k),
+        lambda s, k: s.find_index(k),
+        lambda s, k: s.delete(k),
+        slow_workloads=_LINEAR_SCAN,
+    ),
+    StructureCase(
+        "CircularDoublyLinkedList",
+        lambda _n: CircularDoublyLinkedList(),
+        lambda s, k: s.push_back(k),
+        lambda s, k: s.find_index(k),
+        lambda s, k: s.delete(k),
+        slow_workloads=_LINEAR_SCAN,
+    ),
+    StructureCase(
+        "SkipList",
+        lambda _n: SkipList(),
+        lambda s, k: s.insert(k),
+        lambda s, k: s.search(k),
+        lambda s, k: s.delete(k),
+    ),
+    StructureCase(
+        "HashTable[chaining]",
+        lambda _n: HashTable(),
+        lambda s, k: s.set(k, k),
+        lambda s, k: s.get(k),
+        lambda s, k: s.delete(k),
+        slow_workloads=frozenset({"collision"}),
+    ),
+    StructureCase(
+        "HashTable[open]",
+        lambda _n: HashTable(engine="open"),
+        lambda s, k: s.set(k, k),
+        lambda s, k: s.get(k),
+        lambda s, k: s.delete(k),
+        slow_workloads=frozenset({"collision"}),
+    ),
+    StructureCase(
+        "HashTable[incremental]",
+        lambda _n: HashTable(incremental=True),
+        lambda s, k: s.set(k, k),
+        lambda s, k: s.get(k),
+        lambda s, k: s.delete(k),
+        slow_workloads=frozenset({"collision"}),
+    ),
+    StructureCase(
+        "HashSet",
+        lambda _n: HashSet(),
+        lambda s, k: s.add(k),
+        lambda s, k: s.contains(k),
+        lambda s, k: s.remove(k),
+        slow_workloads=frozenset({"collision"}),
+    ),
+    StructureCase(
+        "OrderedMap",
+        lambda _n: OrderedMap(),
+        lambda s, k: s.set(k, k),
+        lambda s, k: s.get(k),
+        lambda s, k: s.delete(k),
+        slow_workloads=frozenset({"collision"}),
+    ),
+    StructureCase(
+        "BinaryTree",
+        lambda _n: BinaryTree(),
+        lambda s, k: s.insert(k),
+        lambda s, k: s.has(k),
+        lambda s, k: s.delete(k),
+        slow_workloads=_LINEAR_SCAN,
+    ),
+    StructureCase(
+        "BinarySearchTree",
+        lambda _n: BinarySearchTree(),
+        lambda s, k: s.insert(k),
+        lambda s, k: s.contains(k),
+        lambda s, k: s.delete(k),
+        slow_workloads=frozenset({"sorted", "collision"}),
+    ),
+    StructureCase(
+        "AVLTree",
+        lambda _n: AVLTree(),
+        lambda s, k: s.insert(k),
+        lambda s, k: s.contains(k),
+        lambda s, k: s.delete(k),
+    ),
+    StructureCase(
+        "RedBlackTree",
+        lambda _n: RedBlackTree(),
+        lambda s, k: s.insert(k),
+        lambda s, k: s.contains(k),
+        lambda s, k: s.delete(k),
+    ),
+]
+
+
+def _k(template: str) -> Callable[..., str]:
+    return lambda k: template.format(k=k)
+
+
+PIPELINES: list[PipelineCase] = [
+    PipelineCase(
+        "array_list_ops",
+        array_list_ops.parse_operations,
+        lambda ops: array_list_ops.build_steps(ops, array_list_to_dot),
+        _k("append {k}"),
+        _k("get 0"),
+        _k("pop"),
+    ),
+    PipelineCase(
+        "stack_ops",
+        stack_ops.parse_operations,
+        lambda ops: stack_ops.build_steps(ops, stack_to_dot),
+        _k("push {k}"),
+        _k("peek"),
+        _k("pop"),
+    ),
+    PipelineCase(
+        "queue_ops",
+        queue_ops.parse_operations,
+        lambda ops: queue_ops.build_steps(ops, queue_to_dot),
+        _k("enqueue {k}"),
+        _k("front"),
+        _k("dequeue"),
+    ),
+    PipelineCase(
+        "deque_ops",
+        deque_ops.parse_operations,
+        lambda ops: deque_ops.build_steps(ops, deque_to_dot),
+        _k("push_back {k}"),
+        _k("peek_front"),
+        _k("pop_front"),
+    ),
+    PipelineCase(
+        "ring_buffer_ops",
+        ring_buffer_ops.parse_operations,
+        lambda ops: ring_buffer_ops.build_steps(ops, len(ops) // 2 + 1, ring_buffer_to_dot),
+        _k("write {k}"),
+        _k("peek"),
+        _k("read"),
+    ),
+    PipelineCase(
+        "linked_list_ops",
+        linked_list_ops.parse_operations,
+        lambda ops: linked_list_ops.build_steps(ops, linked_list_to_dot),
+        _k("append {k}"),
+        _k("find {k}"),
+        _k("delete {k}"),
+    ),
+    PipelineCase(
+        "doubly_linked_list_ops",
+        doubly_linked_list_ops.parse_operations,
+        lambda ops: doubly_linked_list_ops.build_steps(ops, doubly_linked_list_to_dot),
+        _k("push_back {k}"),
+        _k("find {k}"),
+        _k("delete {k}"),
+    ),
+    PipelineCase(
+        "circular_doubly_linked_list_ops",
+        circular_doubly_linked_list_ops.parse_operations,
+        lambda ops: circular_doubly_linked_list_ops.build_steps(ops, cdll_to_dot),
+        _k("push_back {k}"),
+        _k("find {k}"),
+        _k("delete {k}"),
+    ),
+    PipelineCase(
+        "skip_list_ops",
+        skip_list_ops.parse_operations,
+        lambda ops: skip_list_ops.build_steps(ops, skip_list_to_dot),
+        _k("insert {k}"),
+        _k("search {k}"),
+        _k("delete {k}"),
+    ),
+    PipelineCase(
+        "hash_table_ops",
+        hash_table_ops.parse_operations,
+        lambda ops: hash_table_ops.build_steps(ops, 8, hash_table_to_dot),
+        _k("set {k} {k}"),
+        _k("get {k}"),
+        _k("delete {k}"),
+    ),
+    PipelineCase(
+        "hash_set_ops",
+        hash_set_ops.parse_operations,
+        lambda ops: hash_set_ops.build_steps(ops, 8, hash_set_to_dot),
+        _k("add {k}"),
+        _k("contains {k}"),
+        _k("remove {k}"),
+    ),
+    PipelineCase(
+        "ordered_map_ops",
+        ordered_map_ops.parse_operations,
+        lambda ops: ordered_map_ops.build_steps(ops, 8, ordered_map_to_dot),
+        _k("set {k} {k}"),
+        _k("get {k}"),
+        _k("del {k}"),
+    ),
+    PipelineCase(
+        "binary_tree_ops",
+        binary_tree_ops.parse_operations,
+        lambda ops: binary_tree_ops.build_steps(ops, dot_builder=binary_tree_to_dot),
+        _k("insert {k}"),
+        _k("has {k}"),
+        _k("delete {k}"),
+    ),
+    PipelineCase(
+        "binary_search_tree_ops",
+        binary_search_tree_ops.parse_operations,
+        lambda ops: binary_search_tree_ops.build_steps(ops, binary_search_tree_to_dot),
+        _k("insert {k}"),
+        _k("search {k}"),
+        _k("delete {k}"),
+    ),
+    PipelineCase(
+        "avl_tree_ops",
+        avl_tree_ops.parse_operations,
+        lambda ops: avl_tree_ops.build_steps(ops, dot_builder=avl_tree_to_dot),
+        _k("insert {k}"),
+        _k("contains {k}"),
+        _k("delete {k}"),
+    ),
+    PipelineCase(
+        "red_black_tree_ops",
+        red_black_tree_ops.parse_operations,
+        lambda ops: red_black_tree_ops.build_steps(ops, dot_builder=red_black_tree_to_dot),
+        _k("insert {k}"),
+        _k("contains {k}"),
+        _k("delete {k}"),
+    ),
+]
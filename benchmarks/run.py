@@ -0,0 +1,215 @@
+"""
+Runner de benchmarks (sin dependencias extra).
+
+Uso:
+  python -m benchmarks.run                         # 10^3 y 10^4, todo
+  python -m benchmarks.run --sizes 1000 1000000 --only HashTable
+  python -m benchmarks.run --out base.json
+  python -m benchmarks.run --compare base.json     # marca regresiones
+
+Mide throughput (ops/s, mejor de --repeat corridas) y memoria pico
+(tracemalloc, en una corrida aparte para no inflar los tiempos).
+Los resultados se guardan en JSON para comparar entre commits.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from benchmarks.cases import (
+    PIPELINES,
+    STRUCTURES,
+    WORKLOADS,
+    PipelineCase,
+    StructureCase,
+    make_keys,
+)
+
+ROOT = Path(__file__).resolve().parents[1]
+RESULTS_DIR = ROOT / "benchmarks" / "results"
+
+Case = StructureCase | PipelineCase
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def measure(case: Case, workload: str, n: int, *, repeat: int, memory: bool) -> dict[str, Any]:
+    """Corre un caso y devuelve una fila de resultados (con `error` si falló)."""
+    row: dict[str, Any] = {
+        "group": "pipeline" if isinstance(case, PipelineCase) else "structure",
+        "case": case.name,
+        "workload": workload,
+        "n": n,
+    }
+    keys = make_keys(workload, n)
+    try:
+        best = float("inf")
+        ops = 0
+        for _ in range(repeat):
+            gc.collect()
+            t0 = time.perf_counter()
+            ops = case.run(workload, keys)
+            best = min(best, time.perf_counter() - t0)
+
+        peak = None
+        if memory:
+            gc.collect()
+            tracemalloc.start()
+            case.run(workload, keys)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+    except Exception as e:  # el caso falla, el benchmark sigue (RecursionError, etc.)
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        row["error"] = f"{type(e).__name__}: {e}"
+        return row
+
+    row.update(
+        ops=ops,
+        seconds=round(best, 6),
+        ops_per_sec=round(ops / best, 1) if best > 0 else None,
+        peak_kib=round(peak / 1024, 1) if peak is not None else None,
+    )
+    return row
+
+
+def run_all(
+    sizes: Sequence[int],
+    *,
+    workloads: Sequence[str] = WORKLOADS,
+    only: str | None = None,
+    groups: Sequence[str] = ("structure", "pipeline"),
+    repeat: int = 3,
+    memory: bool = True,
+    log: bool = False,
+) -> dict[str, Any]:
+    cases: list[Case] = []
+    if "structure" in groups:
+        cases += STRUCTURES
+    if "pipeline" in groups:
+        cases += PIPELINES
+    if only:
+        cases = [c for c in cases if only.lower() in c.name.lower()]
+
+    results: list[dict[str, Any]] = []
+    for case in cases:
+        for workload in workloads:
+            for n in sizes:
+                if n > case.limit(workload):
+                    continue
+                row = measure(case, workload, n, repeat=repeat, memory=memory)
+                results.append(row)
+                if log:
+                    print(_format_row(row), flush=True)
+
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "sizes": list(sizes),
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def _key(row: dict[str, Any]) -> tuple[str, str, str, int]:
+    return (row["group"], row["case"], row["workload"], row["n"])
+
+
+def _format_row(row: dict[str, Any]) -> str:
+    name = f"{row['case']:<32} {row['workload']:<13} n={row['n']:<8}"
+    if "error" in row:
+        return f"{name} ERROR {row['error']}"
+    peak = f"{row['peak_kib']:>10.1f} KiB" if row.get("peak_kib") is not None else ""
+    return f"{name} {row['ops_per_sec']:>14,.0f} ops/s {peak}"
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any], *, threshold: float) -> list[str]:
+    """
+    Compara ops/s contra un JSON anterior.
+    Retorna las filas que empeoraron más que `threshold` (0.10 = 10%).
+    """
+    base = {_key(r): r for r in baseline["results"] if "error" not in r}
+    regressions: list[str] = []
+    for row in current["results"]:
+        old = base.get(_key(row))
+        if old is None or "error" in row or not row.get("ops_per_sec"):
+            continue
+        ratio = row["ops_per_sec"] / old["ops_per_sec"]
+        line = f"{row['case']:<32} {row['workload']:<13} n={row['n']:<8} x{ratio:.2f}"
+        print(line)
+        if ratio < 1 - threshold:
+            regressions.append(line)
+    return regressions
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    p = argparse.ArgumentParser(prog="python -m benchmarks.run", description=__doc__.split("\n")[1])
+    p.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000])
+    p.add_argument("--workloads", nargs="+", choices=WORKLOADS, default=list(WORKLOADS))
+    p.add_argument("--group", choices=("structure", "pipeline"), action="append")
+    p.add_argument("--only", help="filtra casos por nombre (substring)")
+    p.add_argument("--repeat", type=int, default=3)
+    p.add_argument("--no-memory", action="store_true", help="omite la corrida con tracemalloc")
+    p.add_argument("--out", type=Path, help="JSON de salida (default: benchmarks/results/)")
+    p.add_argument("--compare", type=Path, help="JSON anterior contra el cual comparar")
+    p.add_argument("--threshold", type=float, default=0.10)
+    args = p.parse_args(argv)
+
+    report = run_all(
+        args.sizes,
+        workloads=args.workloads,
+        only=args.only,
+        groups=args.group or ("structure", "pipeline"),
+        repeat=args.repeat,
+        memory=not args.no_memory,
+        log=True,
+    )
+
+    out = args.out
+    if out is None:
+        stamp = report["meta"]["commit"] or datetime.now(UTC).strftime("%Y%m%dT%H%M%S")
+        out = RESULTS_DIR / f"{stamp}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"\nResultados: {out}")
+
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        print(f"\nComparación contra {args.compare}:")
+        regressions = compare(report, baseline, threshold=args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regresiones (> {args.threshold:.0%}):")
+            print("\n".join(regressions))
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,188 @@
+"""
+Throughput productor/consumidor entre threads.
+
+Uso:
+  python -m benchmarks.threads                       # 1, 2, 4, 8 y 16 threads
+  python -m benchmarks.threads --threads 1 4 --items 200000
+  python -m benchmarks.threads --out threads.json
+
+Con t threads corren t productores y t consumidores que pasan --items ints
+en total por una cola de --capacity slots. Compara:
+  Queue+lock       Queue del repo bajo un lock global (lo que había antes)
+  MPMCQueue        put/get de a un item
+  MPMCQueue batch  consumidores con get_many
+  SPSCRingBuffer   solo con t=1 (un productor, un consumidor)
+
+meta.gil_enabled distingue un CPython free-threaded (3.13t+) de uno con GIL.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import threading
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from benchmarks.run import RESULTS_DIR, _git_commit
+from core.structures.linear.concurrent_queue import MPMCQueue, SPSCRingBuffer
+from core.structures.linear.queue import Queue
+
+THREADS = (1, 2, 4, 8, 16)
+BATCH = 64
+
+
+class LockedQueue:
+    """Baseline: Queue del repo + un Condition global, acotada a mano."""
+
+    def __init__(self, capacity: int) -> None:
+        self._q: Queue[Any] = Queue()
+        self._cap = capacity
+        self._cond = threading.Condition()
+
+    def put(self, value: Any) -> None:
+        with self._cond:
+            self._cond.wait_for(lambda: len(self._q) < self._cap)
+            self._q.enqueue(value)
+            self._cond.notify_all()
+
+    def get(self) -> Any:
+        with self._cond:
+            self._cond.wait_for(lambda: not self._q.is_empty())
+            value = self._q.dequeue()
+            self._cond.notify_all()
+            return value
+
+
+@dataclass(frozen=True)
+class ThreadCase:
+    name: str
+    factory: Callable[[int], Any]
+    batched: bool = False
+    spsc: bool = False  # solo admite un productor y un consumidor
+
+
+CASES: list[ThreadCase] = [
+    ThreadCase("Queue+lock", LockedQueue),
+    ThreadCase("MPMCQueue", MPMCQueue),
+    ThreadCase("MPMCQueue batch", MPMCQueue, batched=True),
+    ThreadCase("SPSCRingBuffer", SPSCRingBuffer, spsc=True),
+    ThreadCase("SPSCRingBuffer batch", SPSCRingBuffer, batched=True, spsc=True),
+]
+
+
+def gil_enabled() -> bool:
+    check = getattr(sys, "_is_gil_enabled", None)
+    return True if check is None else bool(check())
+
+
+def run_case(case: ThreadCase, threads: int, items: int, capacity: int) -> float:
+    """Segundos para pasar `items` de t productores a t consumidores."""
+    q = case.factory(capacity)
+    per = items // threads
+    stop = object()
+
+    def produce() -> None:
+        put = q.put
+        for i in range(per):
+            put(i)
+
+    def consume() -> None:
+        if case.batched:
+            while True:
+                batch = q.get_many(BATCH)
+                seen = sum(v is stop for v in batch)
+                if seen:
+                    for _ in range(seen - 1):
+                        q.put(stop)  # los sentinels de otros consumidores vuelven a la cola
+                    return
+        get = q.get
+        while get() is not stop:
+            pass
+
+    producers = [threading.Thread(target=produce) for _ in range(threads)]
+    consumers = [threading.Thread(target=consume) for _ in range(threads)]
+    t0 = time.perf_counter()
+    for t in consumers + producers:
+        t.start()
+    for t in producers:
+        t.join()
+    # los sentinels van después de todos los datos: un consumidor que ve uno ya terminó
+    for _ in range(threads):
+        q.put(stop)
+    for t in consumers:
+        t.join()
+    return time.perf_counter() - t0
+
+
+def run_all(
+    threads: Sequence[int], *, items: int, capacity: int, repeat: int = 3, log: bool = False
+) -> dict[str, Any]:
+    results: list[dict[str, Any]] = []
+    for case in CASES:
+        for t in threads:
+            if case.spsc and t != 1:
+                continue
+            best = min(run_case(case, t, items, capacity) for _ in range(repeat))
+            row = {
+                "case": case.name,
+                "threads": t,
+                "items": items // t * t,
+                "seconds": round(best, 6),
+                "items_per_sec": round(items // t * t / best, 1),
+            }
+            results.append(row)
+            if log:
+                print(
+                    f"{case.name:<22} t={t:<3} {row['items_per_sec']:>14,.0f} items/s", flush=True
+                )
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "gil_enabled": gil_enabled(),
+            "items": items,
+            "capacity": capacity,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    p = argparse.ArgumentParser(
+        prog="python -m benchmarks.threads", description=__doc__.split("\n")[1]
+    )
+    p.add_argument("--threads", type=int, nargs="+", default=list(THREADS))
+    p.add_argument("--items", type=int, default=100_000)
+    p.add_argument("--capacity", type=int, default=1_024)
+    p.add_argument("--repeat", type=int, default=3)
+    p.add_argument("--out", type=Path, help="JSON de salida (default: benchmarks/results/)")
+    args = p.parse_args(argv)
+
+    gil = "con GIL" if gil_enabled() else "free-threaded"
+    print(f"Python {platform.python_version()} ({gil})")
+    report = run_all(
+        args.threads, items=args.items, capacity=args.capacity, repeat=args.repeat, log=True
+    )
+
+    out = args.out
+    if out is None:
+        stamp = report["meta"]["commit"] or datetime.now(UTC).strftime("%Y%m%dT%H%M%S")
+        out = RESULTS_DIR / f"threads-{stamp}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"\nResultados: {out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Callable
-from dataclasses import dataclass
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
 from enum import StrEnum
 from typing import Any
 
 from core.structures.hash.hash_set import HashSet
 from core.structures.hash.hash_table import stable_hash
+from core.timeline import Timeline
 
 
 class OpKind(StrEnum):
@@ -24,10 +25,21 @@ class Operation:
 
 @dataclass(frozen=True)
 class Step:
-    dot: str
     buckets: list[list[Any]]
     values: list[Any]
     message: str
+    dot_builder: Callable[..., str] = field(repr=False, compare=False)
+    highlight_bucket: int | None = None
+    highlight_value: Any | None = None
+    cost: dict[str, int] = field(default_factory=dict)  # ver core.structures.counters
+
+    @property
+    def dot(self) -> str:
+        return self.dot_builder(
+            self.buckets,
+            highlight_bucket=self.highlight_bucket,
+            highlight_value=self.highlight_value,
+        )
 
 
 def _parse_value(tok: str) -> Any:
@@ -37,9 +49,8 @@ def _parse_value(tok: str) -> Any:
         return tok
 
 
-def parse_operations(text: str) -> list[Operation]:
-    ops: list[Operation] = []
-    for i, raw in enumerate(text.splitlines(), start=1):
+def iter_operations(lines: Iterable[str]) -> Iterator[Operation]:
+    for i, raw in enumerate(lines, start=1):
         line = raw.strip()
         if not line or line.startswith("#"):
             continue
@@ -57,11 +68,14 @@ def parse_operations(text: str) -> list[Operation]:
         if kind in {OpKind.ADD, OpKind.REMOVE, OpKind.CONTAINS}:
             if len(parts) < 2:
                 raise ValueError(f"Línea {i}: '{kind.value}' requiere un valor.")
-            ops.append(Operation(kind=kind, value=_parse_value(parts[1])))
+            yield Operation(kind=kind, value=_parse_value(parts[1]))
         else:
-            ops.append(Operation(kind=kind))
+            yield Operation(kind=kind)
 
-    return ops
+
+def parse_operations(text: str) -> list[Operation]:
+    """Parsea todo el texto de una vez (ver iter_operations para streaming)."""
+    return list(iter_operations(text.splitlines()))
 
 
 Handler = Callable[[HashSet[Any], Operation], str]
@@ -99,27 +113,39 @@ HANDLERS: dict[OpKind, Handler] = {
 }
 
 
-def build_steps(ops: list[Operation], capacity: int, dot_builder: callable) -> list[Step]:
-    s: HashSet[Any] = HashSet(capacity=capacity)
+def iter_steps(
+    ops: Iterable[Operation], capacity: int, dot_builder: callable, *, engine: str = "chaining"
+) -> Iterator[Step]:
+    s: HashSet[Any] = HashSet(capacity=capacity, engine=engine)
+    c = s.enable_counters()
 
-    def snap(msg: str, hv: Any | None = None) -> Step:
+    def snap(msg: str, hv: Any | None = None, cost: dict[str, int] | None = None) -> Step:
         ss = s.snapshot()
         buckets = ss["buckets"]
         hb = None
         if hv is not None:
             hb = stable_hash(hv) % int(ss["capacity"])
         return Step(
-            dot=dot_builder(buckets, highlight_bucket=hb, highlight_value=hv),
             buckets=buckets,
             values=s.to_list(),
             message=msg,
+            dot_builder=dot_builder,
+            highlight_bucket=hb,
+            highlight_value=hv,
+            cost=cost or {},
         )
 
-    steps: list[Step] = [snap("Estado inicial")]
+    yield snap("Estado inicial")
 
     for op in ops:
+        before = c.as_dict()
         hv = op.value
         msg = HANDLERS[op.kind](s, op)
-        steps.append(snap(msg, hv=hv))
+        yield snap(msg, hv=hv, cost=c.since(before))
+
 
-    return steps
+def build_steps(
+    ops: Iterable[Operation], capacity: int, dot_builder: callable, *, engine: str = "chaining"
+) -> Timeline[Step]:
+    """Todos los pasos en un Timeline (ver iter_steps para consumirlos a medida)."""
+    return Timeline(iter_steps(ops, capacity, dot_builder, engine=engine))
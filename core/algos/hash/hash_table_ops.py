@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from collections.abc import Callable
-from dataclasses import dataclass
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
 from enum import StrEnum
 from typing import Any
 
 from core.structures.hash.hash_table import HashTable, stable_hash
+from core.timeline import Timeline
 
 
 class OpKind(StrEnum):
@@ -24,13 +25,28 @@ class Operation:
 
 @dataclass(frozen=True)
 class Step:
-    dot: str
     buckets: list[list[tuple[Any, Any]]]
     items: list[tuple[Any, Any]]
     size: int
     capacity: int
     load_factor: float
     message: str
+    dot_builder: Callable[..., str] = field(repr=False, compare=False)
+    highlight_bucket: int | None = None
+    highlight_key: Any | None = None
+    old_buckets: list[list[tuple[Any, Any]]] | None = None  # rehash incremental en curso
+    migrated: int = 0
+    cost: dict[str, int] = field(default_factory=dict)  # ver core.structures.counters
+
+    @property
+    def dot(self) -> str:
+        return self.dot_builder(
+            self.buckets,
+            highlight_bucket=self.highlight_bucket,
+            highlight_key=self.highlight_key,
+            old_buckets=self.old_buckets,
+            migrated=self.migrated,
+        )
 
 
 def _parse_value(tok: str) -> Any:
@@ -40,9 +56,8 @@ def _parse_value(tok: str) -> Any:
         return tok
 
 
-def parse_operations(text: str) -> list[Operation]:
-    ops: list[Operation] = []
-    for i, raw in enumerate(text.splitlines(), start=1):
+def iter_operations(lines: Iterable[str]) -> Iterator[Operation]:
+    for i, raw in enumerate(lines, start=1):
         line = raw.strip()
         if not line or line.startswith("#"):
             continue
@@ -64,15 +79,16 @@ def parse_operations(text: str) -> list[Operation]:
         if kind is OpKind.SET:
             if len(parts) < 3:
                 raise ValueError(f"Línea {i}: set requiere 2 args: set key value")
-            ops.append(
-                Operation(kind=kind, key=_parse_value(parts[1]), value=_parse_value(parts[2]))
-            )
+            yield Operation(kind=kind, key=_parse_value(parts[1]), value=_parse_value(parts[2]))
         else:
             if len(parts) < 2:
                 raise ValueError(f"Línea {i}: {kind.value} requiere key: {parts[0]} key")
-            ops.append(Operation(kind=kind, key=_parse_value(parts[1])))
+            yield Operation(kind=kind, key=_parse_value(parts[1]))
 
-    return ops
+
+def parse_operations(text: str) -> list[Operation]:
+    """Parsea todo el texto de una vez (ver iter_operations para streaming)."""
+    return list(iter_operations(text.splitlines()))
 
 
 Handler = Callable[[HashTable[Any, Any], Operation], str]
@@ -106,10 +122,18 @@ HANDLERS: dict[OpKind, Handler] = {
 }
 
 
-def build_steps(ops: list[Operation], capacity: int, dot_builder: callable) -> list[Step]:
-    ht: HashTable[Any, Any] = HashTable(capacity=capacity)
+def iter_steps(
+    ops: Iterable[Operation],
+    capacity: int,
+    dot_builder: callable,
+    *,
+    engine: str = "chaining",
+    incremental: bool = False,
+) -> Iterator[Step]:
+    ht: HashTable[Any, Any] = HashTable(capacity=capacity, engine=engine, incremental=incremental)
+    c = ht.enable_counters()
 
-    def snap(msg: str, hk: Any | None = None) -> Step:
+    def snap(msg: str, hk: Any | None = None, cost: dict[str, int] | None = None) -> Step:
         s = ht.snapshot()
         buckets = s["buckets"]  # type: ignore[assignment]
         cap = int(s["capacity"])
@@ -117,23 +141,41 @@ def build_steps(ops: list[Operation], capacity: int, dot_builder: callable) -> l
 
         items = list(ht.items())
         return Step(
-            dot=dot_builder(buckets, highlight_bucket=hb, highlight_key=hk),
             buckets=buckets,  # type: ignore[arg-type]
             items=items,
             size=int(s["size"]),
             capacity=cap,
             load_factor=float(s["load_factor"]),
             message=msg,
+            dot_builder=dot_builder,
+            highlight_bucket=hb,
+            highlight_key=hk,
+            old_buckets=s.get("old_buckets"),  # type: ignore[arg-type]
+            migrated=int(s.get("migrated", 0)),  # type: ignore[call-overload]
+            cost=cost or {},
         )
 
-    steps: list[Step] = [snap("Estado inicial")]
+    yield snap("Estado inicial")
 
     for op in ops:
+        before = c.as_dict()
         try:
             msg = HANDLERS[op.kind](ht, op)
-            steps.append(snap(msg, hk=op.key))
+            yield snap(msg, hk=op.key, cost=c.since(before))
         except KeyError as e:
-            steps.append(snap(f"ERROR: KeyError {e} (se detuvo la simulación)", hk=op.key))
+            yield snap(
+                f"ERROR: KeyError {e} (se detuvo la simulación)", hk=op.key, cost=c.since(before)
+            )
             break
 
-    return steps
+
+def build_steps(
+    ops: Iterable[Operation],
+    capacity: int,
+    dot_builder: callable,
+    *,
+    engine: str = "chaining",
+    incremental: bool = False,
+) -> Timeline[Step]:
+    """Todos los pasos en un Timeline (ver iter_steps para consumirlos a medida)."""
+    return Timeline(iter_steps(ops, capacity, dot_builder, engine=engine, incremental=incremental))
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Callable
-from dataclasses import dataclass
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
 from enum import StrEnum
 from typing import Any
 
 from core.structures.hash.hash_table import stable_hash
 from core.structures.hash.ordered_map import OrderedMap
+from core.timeline import Timeline
 
 
 class OpKind(StrEnum):
@@ -14,6 +15,8 @@ class OpKind(StrEnum):
     GET = "get"
     DEL = "del"
     HAS = "has"
+    TOUCH = "touch"  # move_to_end: pasa a ser el más reciente
+    EVICT = "evict"  # pop_first: saca el más viejo (orden de desalojo LRU)
 
 
 @dataclass(frozen=True)
@@ -25,10 +28,22 @@ class Operation:
 
 @dataclass(frozen=True)
 class Step:
-    dot: str
     buckets: list[list[tuple[Any, Any]]]
     ordered: list[tuple[Any, Any]]
     message: str
+    dot_builder: Callable[..., str] = field(repr=False, compare=False)
+    highlight_bucket: int | None = None
+    highlight_key: Any | None = None
+    cost: dict[str, int] = field(default_factory=dict)  # ver core.structures.counters
+
+    @property
+    def dot(self) -> str:
+        return self.dot_builder(
+            self.buckets,
+            self.ordered,
+            highlight_bucket=self.highlight_bucket,
+            highlight_key=self.highlight_key,
+        )
 
 
 def _parse_value(tok: str) -> Any:
@@ -38,9 +53,8 @@ def _parse_value(tok: str) -> Any:
         return tok
 
 
-def parse_operations(text: str) -> list[Operation]:
-    ops: list[Operation] = []
-    for i, raw in enumerate(text.splitlines(), start=1):
+def iter_operations(lines: Iterable[str]) -> Iterator[Operation]:
+    for i, raw in enumerate(lines, start=1):
         line = raw.strip()
         if not line or line.startswith("#"):
             continue
@@ -52,21 +66,24 @@ def parse_operations(text: str) -> list[Operation]:
             kind = OpKind(cmd)
         except ValueError as err:
             raise ValueError(
-                f"Línea {i}: comando inválido '{parts[0]}'. Usa set/get/del/has."
+                f"Línea {i}: comando inválido '{parts[0]}'. Usa set/get/del/has/touch/evict."
             ) from err
 
         if kind is OpKind.SET:
             if len(parts) < 3:
                 raise ValueError(f"Línea {i}: set requiere: set key value")
-            ops.append(
-                Operation(kind=kind, key=_parse_value(parts[1]), value=_parse_value(parts[2]))
-            )
+            yield Operation(kind=kind, key=_parse_value(parts[1]), value=_parse_value(parts[2]))
+        elif kind is OpKind.EVICT:
+            yield Operation(kind=kind)
         else:
             if len(parts) < 2:
                 raise ValueError(f"Línea {i}: {kind.value} requiere: {kind.value} key")
-            ops.append(Operation(kind=kind, key=_parse_value(parts[1])))
+            yield Operation(kind=kind, key=_parse_value(parts[1]))
 
-    return ops
+
+def parse_operations(text: str) -> list[Operation]:
+    """Parsea todo el texto de una vez (ver iter_operations para streaming)."""
+    return list(iter_operations(text.splitlines()))
 
 
 Handler = Callable[[OrderedMap[Any, Any], Operation], str]
@@ -95,36 +112,62 @@ def _h_has(m: OrderedMap[Any, Any], op: Operation) -> str:
         return f"has {op.key} → False"
 
 
+def _h_touch(m: OrderedMap[Any, Any], op: Operation) -> str:
+    m.move_to_end(op.key)
+    return f"touch {op.key} → pasa al final"
+
+
+def _h_evict(m: OrderedMap[Any, Any], op: Operation) -> str:
+    k, v = m.pop_first()
+    return f"evict → ({k}, {v})"
+
+
 HANDLERS: dict[OpKind, Handler] = {
     OpKind.SET: _h_set,
     OpKind.GET: _h_get,
     OpKind.DEL: _h_del,
     OpKind.HAS: _h_has,
+    OpKind.TOUCH: _h_touch,
+    OpKind.EVICT: _h_evict,
 }
 
 
-def build_steps(ops: list[Operation], capacity: int, dot_builder: callable) -> list[Step]:
-    m: OrderedMap[Any, Any] = OrderedMap(capacity=capacity)
+def iter_steps(
+    ops: Iterable[Operation], capacity: int, dot_builder: callable, *, engine: str = "chaining"
+) -> Iterator[Step]:
+    m: OrderedMap[Any, Any] = OrderedMap(capacity=capacity, engine=engine)
+    c = m.enable_counters()
 
-    def snap(msg: str, hk: Any | None = None) -> Step:
+    def snap(msg: str, hk: Any | None = None, cost: dict[str, int] | None = None) -> Step:
         s = m.snapshot()
         cap = int(s["capacity"])
         hb = stable_hash(hk) % cap if hk is not None else None
         return Step(
-            dot=dot_builder(s["buckets"], s["ordered"], highlight_bucket=hb, highlight_key=hk),
             buckets=s["buckets"],
             ordered=s["ordered"],
             message=msg,
+            dot_builder=dot_builder,
+            highlight_bucket=hb,
+            highlight_key=hk,
+            cost=cost or {},
         )
 
-    steps: list[Step] = [snap("Estado inicial")]
+    yield snap("Estado inicial")
 
     for op in ops:
+        before = c.as_dict()
         try:
             msg = HANDLERS[op.kind](m, op)
-            steps.append(snap(msg, hk=op.key))
+            yield snap(msg, hk=op.key, cost=c.since(before))
         except KeyError as e:
-            steps.append(snap(f"ERROR: KeyError {e} (se detuvo la simulación)", hk=op.key))
+            yield snap(
+                f"ERROR: KeyError {e} (se detuvo la simulación)", hk=op.key, cost=c.since(before)
+            )
             break
 
-    return steps
+
+def build_steps(
+    ops: Iterable[Operation], capacity: int, dot_builder: callable, *, engine: str = "chaining"
+) -> Timeline[Step]:
+    """Todos los pasos en un Timeline (ver iter_steps para consumirlos a medida)."""
+    return Timeline(iter_steps(ops, capacity, dot_builder, engine=engine))
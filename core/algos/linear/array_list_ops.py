@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from collections.abc import Callable
-from dataclasses import dataclass
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
 from enum import StrEnum
 from typing import Any
 
 from core.structures.linear.array_list import ArrayList
+from core.timeline import Timeline
 
 
 class OpKind(StrEnum):
@@ -17,6 +18,12 @@ class OpKind(StrEnum):
     POP_AT = "pop_at"
     REMOVE_FIRST = "remove"
     CLEAR = "clear"
+    EXTEND = "extend"
+    INSERT_MANY = "insert_many"
+    TAKE = "take"
+    FIND_ALL = "find_all"
+    SORT = "sort"
+    ARGSORT = "argsort"
 
 
 @dataclass(frozen=True)
@@ -28,9 +35,15 @@ class Operation:
 
 @dataclass(frozen=True)
 class Step:
-    dot: str
     values: list[Any]
     message: str
+    dot_builder: Callable[..., str] = field(repr=False, compare=False)
+    highlight_index: int | None = None
+    dtype: str | None = None
+
+    @property
+    def dot(self) -> str:
+        return self.dot_builder(self.values, highlight_index=self.highlight_index, dtype=self.dtype)
 
 
 def _parse_value(token: str) -> Any:
@@ -47,10 +60,17 @@ def _parse_int(token: str, *, line: int, what: str) -> int:
         raise ValueError(f"Línea {line}: {what} inválido '{token}'. Debe ser entero.") from err
 
 
-def parse_operations(text: str) -> list[Operation]:
-    ops: list[Operation] = []
-
-    for i, raw in enumerate(text.splitlines(), start=1):
+def iter_operations(lines: Iterable[str]) -> Iterator[Operation]:
+    """
+    Gramática (una por línea):
+      append X | insert I X | pop | pop_at I | remove X | get I | set I X | clear
+      extend X1 X2 ...
+      insert_many I X1 X2 ...
+      take I1 I2 ...
+      find_all X
+      sort | argsort
+    """
+    for i, raw in enumerate(lines, start=1):
         line = raw.strip()
         if not line or line.startswith("#"):
             continue
@@ -63,43 +83,67 @@ def parse_operations(text: str) -> list[Operation]:
         except ValueError as err:
             raise ValueError(
                 f"Línea {i}: comando no válido '{parts[0]}'. "
-                "Usa append/insert/pop/pop_at/remove/get/set/clear."
+                "Usa append/insert/pop/pop_at/remove/get/set/clear/"
+                "extend/insert_many/take/find_all/sort/argsort."
             ) from err
 
         try:
             match kind:
                 case OpKind.APPEND:
-                    ops.append(Operation(kind=kind, a=_parse_value(parts[1])))
+                    yield Operation(kind=kind, a=_parse_value(parts[1]))
 
                 case OpKind.INSERT:
                     idx = _parse_int(parts[1], line=i, what="índice")
-                    ops.append(Operation(kind=kind, a=idx, b=_parse_value(parts[2])))
+                    yield Operation(kind=kind, a=idx, b=_parse_value(parts[2]))
 
                 case OpKind.POP:
-                    ops.append(Operation(kind=kind))
+                    yield Operation(kind=kind)
 
                 case OpKind.POP_AT:
                     idx = _parse_int(parts[1], line=i, what="índice")
-                    ops.append(Operation(kind=kind, a=idx))
+                    yield Operation(kind=kind, a=idx)
 
                 case OpKind.REMOVE_FIRST:
-                    ops.append(Operation(kind=kind, a=_parse_value(parts[1])))
+                    yield Operation(kind=kind, a=_parse_value(parts[1]))
 
                 case OpKind.GET:
                     idx = _parse_int(parts[1], line=i, what="índice")
-                    ops.append(Operation(kind=kind, a=idx))
+                    yield Operation(kind=kind, a=idx)
 
                 case OpKind.SET:
                     idx = _parse_int(parts[1], line=i, what="índice")
-                    ops.append(Operation(kind=kind, a=idx, b=_parse_value(parts[2])))
+                    yield Operation(kind=kind, a=idx, b=_parse_value(parts[2]))
+
+                case OpKind.CLEAR | OpKind.SORT | OpKind.ARGSORT:
+                    yield Operation(kind=kind)
+
+                case OpKind.EXTEND:
+                    if len(parts) < 2:
+                        raise IndexError
+                    yield Operation(kind=kind, a=tuple(_parse_value(t) for t in parts[1:]))
+
+                case OpKind.INSERT_MANY:
+                    idx = _parse_int(parts[1], line=i, what="índice")
+                    if len(parts) < 3:
+                        raise IndexError
+                    yield Operation(kind=kind, a=idx, b=tuple(_parse_value(t) for t in parts[2:]))
 
-                case OpKind.CLEAR:
-                    ops.append(Operation(kind=kind))
+                case OpKind.TAKE:
+                    if len(parts) < 2:
+                        raise IndexError
+                    idxs = tuple(_parse_int(t, line=i, what="índice") for t in parts[1:])
+                    yield Operation(kind=kind, a=idxs)
+
+                case OpKind.FIND_ALL:
+                    yield Operation(kind=kind, a=_parse_value(parts[1]))
 
         except IndexError as err:
             raise ValueError(f"Línea {i}: faltan argumentos para '{cmd}'.") from err
 
-    return ops
+
+def parse_operations(text: str) -> list[Operation]:
+    """Parsea todo el texto de una vez (ver iter_operations para streaming)."""
+    return list(iter_operations(text.splitlines()))
 
 
 def _clamp_hi(idx: int | None, n: int) -> int | None:
@@ -161,6 +205,43 @@ def _h_clear(arr: ArrayList[Any], op: Operation) -> tuple[str, int | None]:
     return ("clear", None)
 
 
+def _h_extend(arr: ArrayList[Any], op: Operation) -> tuple[str, int | None]:
+    arr.extend(op.a)
+    return (f"extend {' '.join(map(str, op.a))}", len(arr) - 1)
+
+
+def _h_insert_many(arr: ArrayList[Any], op: Operation) -> tuple[str, int | None]:
+    idx = int(op.a)
+    arr.insert_many(idx, op.b)
+    return (f"insert_many {idx} {' '.join(map(str, op.b))}", _clamp_hi(idx, len(arr)))
+
+
+def _h_take(arr: ArrayList[Any], op: Operation) -> tuple[str, int | None]:
+    vals = arr.take(op.a)
+    return (f"take {' '.join(map(str, op.a))} → {vals}", _clamp_hi(op.a[0], len(arr)))
+
+
+def _h_find_all(arr: ArrayList[Any], op: Operation) -> tuple[str, int | None]:
+    hits = arr.find_all(op.a)
+    return (f"find_all {op.a} → {hits}", hits[0] if hits else None)
+
+
+def _h_sort(arr: ArrayList[Any], op: Operation) -> tuple[str, int | None]:
+    try:
+        arr.sort()
+    except TypeError as err:  # valores no comparables (ej. int y str)
+        raise ValueError(f"sort: {err}") from err
+    return ("sort", None)
+
+
+def _h_argsort(arr: ArrayList[Any], op: Operation) -> tuple[str, int | None]:
+    try:
+        order = arr.argsort()
+    except TypeError as err:
+        raise ValueError(f"argsort: {err}") from err
+    return (f"argsort → {order}", None)
+
+
 HANDLERS: dict[OpKind, Handler] = {
     OpKind.APPEND: _h_append,
     OpKind.INSERT: _h_insert,
@@ -170,24 +251,51 @@ HANDLERS: dict[OpKind, Handler] = {
     OpKind.GET: _h_get,
     OpKind.SET: _h_set,
     OpKind.CLEAR: _h_clear,
+    OpKind.EXTEND: _h_extend,
+    OpKind.INSERT_MANY: _h_insert_many,
+    OpKind.TAKE: _h_take,
+    OpKind.FIND_ALL: _h_find_all,
+    OpKind.SORT: _h_sort,
+    OpKind.ARGSORT: _h_argsort,
 }
 
 
-def build_steps(ops: list[Operation], dot_builder: callable) -> list[Step]:
-    arr: ArrayList[Any] = ArrayList()
+def iter_steps(
+    ops: Iterable[Operation],
+    dot_builder: callable,
+    *,
+    dtype: str | None = None,
+    engine: str = "list",
+) -> Iterator[Step]:
+    """
+    dtype=None: ArrayList sobre list; dtype="int64" etc.: buffer tipado.
+    engine="blocked": lista por bloques (mismo grammar y mismos pasos).
+    """
+    arr: ArrayList[Any] = ArrayList(dtype=dtype, engine=engine)
 
     def snap(msg: str, hi: int | None = None) -> Step:
         vals = arr.to_list()
-        return Step(dot=dot_builder(vals, highlight_index=hi), values=vals, message=msg)
+        return Step(
+            values=vals, message=msg, dot_builder=dot_builder, highlight_index=hi, dtype=dtype
+        )
 
-    steps: list[Step] = [snap("Estado inicial")]
+    yield snap("Estado inicial")
 
     for op in ops:
         try:
             msg, hi = HANDLERS[op.kind](arr, op)
-            steps.append(snap(msg, hi=hi))
+            yield snap(msg, hi=hi)
         except (IndexError, ValueError) as e:
-            steps.append(snap(f"ERROR: {e} (se detuvo la simulación)"))
+            yield snap(f"ERROR: {e} (se detuvo la simulación)")
             break
 
-    return steps
+
+def build_steps(
+    ops: Iterable[Operation],
+    dot_builder: callable,
+    *,
+    dtype: str | None = None,
+    engine: str = "list",
+) -> Timeline[Step]:
+    """Todos los pasos en un Timeline (ver iter_steps para consumirlos a medida)."""
+    return Timeline(iter_steps(ops, dot_builder, dtype=dtype, engine=engine))
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from collections.abc import Callable
-from dataclasses import dataclass
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
 from enum import StrEnum
 from typing import Any
 
 from core.structures.linear.linked_list import LinkedList
+from core.timeline import Timeline
 
 
 class OpKind(StrEnum):
@@ -27,9 +28,15 @@ class Operation:
 
 @dataclass(frozen=True)
 class Step:
-    dot: str
     values: list[Any]
     message: str
+    dot_builder: Callable[..., str] = field(repr=False, compare=False)
+    highlight_index: int | None = None
+    cost: dict[str, int] = field(default_factory=dict)  # ver core.structures.counters
+
+    @property
+    def dot(self) -> str:
+        return self.dot_builder(self.values, highlight_index=self.highlight_index)
 
 
 def _parse_value(token: str) -> Any:
@@ -46,9 +53,8 @@ def _parse_int(token: str, *, line: int, what: str) -> int:
         raise ValueError(f"Línea {line}: {what} inválido '{token}'. Debe ser entero.") from err
 
 
-def parse_operations(text: str) -> list[Operation]:
-    ops: list[Operation] = []
-    for i, raw in enumerate(text.splitlines(), start=1):
+def iter_operations(lines: Iterable[str]) -> Iterator[Operation]:
+    for i, raw in enumerate(lines, start=1):
         line = raw.strip()
         if not line or line.startswith("#"):
             continue
@@ -73,19 +79,22 @@ def parse_operations(text: str) -> list[Operation]:
                 OpKind.FIND,
                 OpKind.SEARCH,
             }:
-                ops.append(Operation(kind=kind, value=_parse_value(parts[1])))
+                yield Operation(kind=kind, value=_parse_value(parts[1]))
 
             elif kind == OpKind.DELETE_AT:
                 idx = _parse_int(parts[1], line=i, what="índice")
-                ops.append(Operation(kind=kind, value=idx))
+                yield Operation(kind=kind, value=idx)
 
             else:  # REVERSE
-                ops.append(Operation(kind=kind))
+                yield Operation(kind=kind)
 
         except IndexError as err:
             raise ValueError(f"Línea {i}: faltan argumentos para '{cmd}'.") from err
 
-    return ops
+
+def parse_operations(text: str) -> list[Operation]:
+    """Parsea todo el texto de una vez (ver iter_operations para streaming)."""
+    return list(iter_operations(text.splitlines()))
 
 
 def _clamp_hi(idx: int | None, n: int) -> int | None:
@@ -156,21 +165,28 @@ HANDLERS: dict[OpKind, Handler] = {
 }
 
 
-def build_steps(ops: list[Operation], dot_builder: callable) -> list[Step]:
+def iter_steps(ops: Iterable[Operation], dot_builder: callable) -> Iterator[Step]:
     ll: LinkedList[Any] = LinkedList()
+    c = ll.enable_counters()
 
-    def snap(msg: str, hi: int | None = None) -> Step:
+    def snap(msg: str, hi: int | None = None, cost: dict[str, int] | None = None) -> Step:
         vals = ll.to_list()
-        return Step(dot=dot_builder(vals, highlight_index=hi), values=vals, message=msg)
+        return Step(
+            values=vals, message=msg, dot_builder=dot_builder, highlight_index=hi, cost=cost or {}
+        )
 
-    steps: list[Step] = [snap("Estado inicial")]
+    yield snap("Estado inicial")
 
     for op in ops:
+        before = c.as_dict()
         try:
             msg, hi = HANDLERS[op.kind](ll, op)
-            steps.append(snap(msg, hi=hi))
+            yield snap(msg, hi=hi, cost=c.since(before))
         except (IndexError, ValueError) as e:
-            steps.append(snap(f"ERROR: {e} (se detuvo la simulación)"))
+            yield snap(f"ERROR: {e} (se detuvo la simulación)", cost=c.since(before))
             break
 
-    return steps
+
+def build_steps(ops: Iterable[Operation], dot_builder: callable) -> Timeline[Step]:
+    """Todos los pasos en un Timeline (ver iter_steps para consumirlos a medida)."""
+    return Timeline(iter_steps(ops, dot_builder))
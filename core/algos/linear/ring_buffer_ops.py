@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from collections.abc import Callable
-from dataclasses import dataclass
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
 from enum import StrEnum
 from typing import Any
 
 from core.structures.linear.ring_buffer import RingBuffer
+from core.timeline import Timeline
 
 
 class OpKind(StrEnum):
@@ -14,17 +15,18 @@ class OpKind(StrEnum):
     PEEK = "peek"
     CLEAR = "clear"
     WRITE_OVER = "write_over"
+    WRITE_MANY = "writemany"
+    READ_MANY = "readmany"
 
 
 @dataclass(frozen=True)
 class Operation:
     kind: OpKind
-    value: Any | None = None
+    value: Any | None = None  # writemany: tupla de valores; readmany: n
 
 
 @dataclass(frozen=True)
 class Step:
-    dot: str
     buffer: list[Any | None]
     items: list[Any]
     head: int
@@ -32,6 +34,11 @@ class Step:
     size: int
     capacity: int
     message: str
+    dot_builder: Callable[..., str] = field(repr=False, compare=False)
+
+    @property
+    def dot(self) -> str:
+        return self.dot_builder(self.buffer, head=self.head, tail=self.tail, size=self.size)
 
 
 def _parse_value(token: str) -> Any:
@@ -41,9 +48,8 @@ def _parse_value(token: str) -> Any:
         return token
 
 
-def parse_operations(text: str) -> list[Operation]:
-    ops: list[Operation] = []
-    for i, raw in enumerate(text.splitlines(), start=1):
+def iter_operations(lines: Iterable[str]) -> Iterator[Operation]:
+    for i, raw in enumerate(lines, start=1):
         line = raw.strip()
         if not line or line.startswith("#"):
             continue
@@ -55,17 +61,34 @@ def parse_operations(text: str) -> list[Operation]:
             kind = OpKind(cmd)
         except ValueError as err:
             raise ValueError(
-                f"Línea {i}: comando no válido '{parts[0]}'. Usa write/read/peek/clear/write_over."
+                f"Línea {i}: comando no válido '{parts[0]}'. Usa write/read/peek/clear/write_over/writemany/readmany."
             ) from err
 
         if kind in {OpKind.WRITE, OpKind.WRITE_OVER}:
             if len(parts) < 2:
                 raise ValueError(f"Línea {i}: '{kind.value}' requiere un valor.")
-            ops.append(Operation(kind=kind, value=_parse_value(parts[1])))
+            yield Operation(kind=kind, value=_parse_value(parts[1]))
+        elif kind is OpKind.WRITE_MANY:
+            if len(parts) < 2:
+                raise ValueError(f"Línea {i}: 'writemany' requiere al menos un valor.")
+            yield Operation(kind=kind, value=tuple(_parse_value(p) for p in parts[1:]))
+        elif kind is OpKind.READ_MANY:
+            if len(parts) < 2:
+                raise ValueError(f"Línea {i}: 'readmany' requiere una cantidad.")
+            try:
+                n = int(parts[1])
+            except ValueError as err:
+                raise ValueError(f"Línea {i}: la cantidad debe ser un entero.") from err
+            if n < 0:
+                raise ValueError(f"Línea {i}: la cantidad debe ser >= 0.")
+            yield Operation(kind=kind, value=n)
         else:
-            ops.append(Operation(kind=kind))
+            yield Operation(kind=kind)
+
 
-    return ops
+def parse_operations(text: str) -> list[Operation]:
+    """Parsea todo el texto de una vez (ver iter_operations para streaming)."""
+    return list(iter_operations(text.splitlines()))
 
 
 Handler = Callable[[RingBuffer[Any], Operation], str]
@@ -91,6 +114,18 @@ def _h_peek(rb: RingBuffer[Any], op: Operation) -> str:
     return f"peek → {v}"
 
 
+def _h_write_many(rb: RingBuffer[Any], op: Operation) -> str:
+    rb.write_many(op.value)
+    return f"writemany {list(op.value)}"
+
+
+def _h_read_many(rb: RingBuffer[Any], op: Operation) -> str:
+    values = rb.read_many(op.value)
+    if not isinstance(values, list):
+        values = values.tolist()  # ndarray / array.array en modo tipado
+    return f"readmany {op.value} → {values}"
+
+
 def _h_clear(rb: RingBuffer[Any], op: Operation) -> str:
     rb.clear()
     return "clear"
@@ -102,18 +137,24 @@ HANDLERS: dict[OpKind, Handler] = {
     OpKind.READ: _h_read,
     OpKind.PEEK: _h_peek,
     OpKind.CLEAR: _h_clear,
+    OpKind.WRITE_MANY: _h_write_many,
+    OpKind.READ_MANY: _h_read_many,
 }
 
 
-def build_steps(ops: list[Operation], capacity: int, dot_builder: callable) -> list[Step]:
-    rb: RingBuffer[Any] = RingBuffer(capacity=capacity)
+def iter_steps(
+    ops: Iterable[Operation],
+    capacity: int,
+    dot_builder: callable,
+    *,
+    dtype: str | None = None,
+) -> Iterator[Step]:
+    """dtype=None: slots en una list; dtype="int64" etc.: buffer tipado."""
+    rb: RingBuffer[Any] = RingBuffer(capacity=capacity, dtype=dtype)
 
     def snap(msg: str) -> Step:
         s = rb.snapshot()
         return Step(
-            dot=dot_builder(
-                s["buffer"], head=int(s["head"]), tail=int(s["tail"]), size=int(s["size"])
-            ),
             buffer=list(s["buffer"]),
             items=list(s["items"]),
             head=int(s["head"]),
@@ -121,16 +162,26 @@ def build_steps(ops: list[Operation], capacity: int, dot_builder: callable) -> l
             size=int(s["size"]),
             capacity=int(s["capacity"]),
             message=msg,
+            dot_builder=dot_builder,
         )
 
-    steps: list[Step] = [snap("Estado inicial")]
+    yield snap("Estado inicial")
 
     for op in ops:
         try:
             msg = HANDLERS[op.kind](rb, op)
-            steps.append(snap(msg))
-        except (IndexError, OverflowError) as e:
-            steps.append(snap(f"ERROR: {e} (se detuvo la simulación)"))
+            yield snap(msg)
+        except (IndexError, OverflowError, ValueError) as e:
+            yield snap(f"ERROR: {e} (se detuvo la simulación)")
             break
 
-    return steps
+
+def build_steps(
+    ops: Iterable[Operation],
+    capacity: int,
+    dot_builder: callable,
+    *,
+    dtype: str | None = None,
+) -> Timeline[Step]:
+    """Todos los pasos en un Timeline (ver iter_steps para consumirlos a medida)."""
+    return Timeline(iter_steps(ops, capacity, dot_builder, dtype=dtype))
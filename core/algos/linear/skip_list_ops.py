@@ -1,17 +1,24 @@
 from __future__ import annotations
 
-from collections.abc import Callable
-from dataclasses import dataclass
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
 from enum import StrEnum
 from typing import Any
 
 from core.structures.linear.skip_list import SkipList
+from core.timeline import Timeline
 
 
 class OpKind(StrEnum):
     INSERT = "insert"
     DELETE = "delete"
     SEARCH = "search"
+    AT = "at"
+    INDEX = "index"
+    RANK = "rank"
+    FLOOR = "floor"
+    CEILING = "ceiling"
+    RANGE = "range"
 
 
 @dataclass(frozen=True)
@@ -19,13 +26,20 @@ class Operation:
     kind: OpKind
     value: Any
     level: int | None = None
+    hi: Any | None = None  # solo range
 
 
 @dataclass(frozen=True)
 class Step:
-    dot: str
     levels: list[list[Any]]  # top->bottom
     message: str
+    dot_builder: Callable[..., str] = field(repr=False, compare=False)
+    highlight: set[tuple[int, Any]] | None = None
+    cost: dict[str, int] = field(default_factory=dict)  # ver core.structures.counters
+
+    @property
+    def dot(self) -> str:
+        return self.dot_builder(self.levels, highlight=self.highlight)
 
 
 def _parse_value(token: str) -> Any:
@@ -35,9 +49,20 @@ def _parse_value(token: str) -> Any:
         return token
 
 
-def parse_operations(text: str) -> list[Operation]:
-    ops: list[Operation] = []
-    for i, raw in enumerate(text.splitlines(), start=1):
+def iter_operations(lines: Iterable[str]) -> Iterator[Operation]:
+    """
+    Gramática (una por línea):
+      insert X [NIVEL]
+      delete X
+      search X
+      at K       (valor en la posición K, 0-indexed)
+      index X    (posición de X)
+      rank X     (cuántos valores < X)
+      floor X    (mayor valor <= X)
+      ceiling X  (menor valor >= X)
+      range LO HI
+    """
+    for i, raw in enumerate(lines, start=1):
         line = raw.strip()
         if not line or line.startswith("#"):
             continue
@@ -49,7 +74,8 @@ def parse_operations(text: str) -> list[Operation]:
             kind = OpKind(cmd)
         except ValueError as err:
             raise ValueError(
-                f"Línea {i}: comando no válido '{parts[0]}'. Usa insert/delete/search."
+                f"Línea {i}: comando no válido '{parts[0]}'. "
+                "Usa insert/delete/search/at/index/rank/floor/ceiling/range."
             ) from err
 
         if kind == OpKind.INSERT:
@@ -64,15 +90,31 @@ def parse_operations(text: str) -> list[Operation]:
                     raise ValueError(
                         f"Línea {i}: nivel inválido '{parts[2]}'. Debe ser entero."
                     ) from err
-            ops.append(Operation(kind=kind, value=val, level=lvl))
+            yield Operation(kind=kind, value=val, level=lvl)
+            continue
+
+        if kind == OpKind.AT:
+            k = _parse_value(parts[1]) if len(parts) >= 2 else None
+            if not isinstance(k, int):
+                raise ValueError(f"Línea {i}: 'at' requiere un índice entero.")
+            yield Operation(kind=kind, value=k)
             continue
 
-        # delete/search
+        if kind == OpKind.RANGE:
+            if len(parts) < 3:
+                raise ValueError(f"Línea {i}: 'range' requiere dos valores (LO HI).")
+            yield Operation(kind=kind, value=_parse_value(parts[1]), hi=_parse_value(parts[2]))
+            continue
+
+        # delete/search/index/rank/floor/ceiling
         if len(parts) < 2:
             raise ValueError(f"Línea {i}: '{kind.value}' requiere un valor.")
-        ops.append(Operation(kind=kind, value=_parse_value(parts[1])))
+        yield Operation(kind=kind, value=_parse_value(parts[1]))
+
 
-    return ops
+def parse_operations(text: str) -> list[Operation]:
+    """Parsea todo el texto de una vez (ver iter_operations para streaming)."""
+    return list(iter_operations(text.splitlines()))
 
 
 Handler = Callable[[SkipList[Any], Operation], tuple[str, set[tuple[int, Any]] | None]]
@@ -90,42 +132,94 @@ def _h_delete(sl: SkipList[Any], op: Operation) -> tuple[str, None]:
     return f"delete {op.value} → {'OK' if ok else 'NO ENCONTRADO'}", None
 
 
+def _trace_highlight(sl: SkipList[Any], value: Any) -> set[tuple[int, Any]]:
+    top_level = sl.level
+    # row_idx cuenta top->bottom
+    return {(top_level - lvl_internal, v) for lvl_internal, v in sl.search_trace(value)}
+
+
 def _h_search(sl: SkipList[Any], op: Operation) -> tuple[str, set[tuple[int, Any]]]:
     found = sl.search(op.value)
-    trace = sl.search_trace(op.value)
+    msg = f"search {op.value} → {'FOUND' if found else 'NOT FOUND'}"
+    return msg, _trace_highlight(sl, op.value)
 
-    top_level = sl.level
-    highlight: set[tuple[int, Any]] = set()
-    for lvl_internal, v in trace:
-        row_idx = top_level - lvl_internal  # top->bottom
-        highlight.add((row_idx, v))
 
-    msg = f"search {op.value} → {'FOUND' if found else 'NOT FOUND'}"
-    return msg, highlight
+def _h_at(sl: SkipList[Any], op: Operation) -> tuple[str, set[tuple[int, Any]]]:
+    v = sl.at(op.value)
+    return f"at {op.value} → {v}", _trace_highlight(sl, v)
+
+
+def _h_index(sl: SkipList[Any], op: Operation) -> tuple[str, set[tuple[int, Any]]]:
+    try:
+        msg = f"index {op.value} → {sl.index_of(op.value)}"
+    except ValueError:
+        msg = f"index {op.value} → NO ENCONTRADO"
+    return msg, _trace_highlight(sl, op.value)
+
+
+def _h_rank(sl: SkipList[Any], op: Operation) -> tuple[str, set[tuple[int, Any]]]:
+    return f"rank {op.value} → {sl.rank(op.value)}", _trace_highlight(sl, op.value)
+
+
+def _h_floor(sl: SkipList[Any], op: Operation) -> tuple[str, set[tuple[int, Any]]]:
+    v = sl.floor(op.value)
+    hi = _trace_highlight(sl, op.value)
+    if v is not None:
+        hi.add((sl.level, v))
+    return f"floor {op.value} → {'NINGUNO' if v is None else v}", hi
+
+
+def _h_ceiling(sl: SkipList[Any], op: Operation) -> tuple[str, set[tuple[int, Any]]]:
+    v = sl.ceiling(op.value)
+    hi = _trace_highlight(sl, op.value)
+    if v is not None:
+        hi.add((sl.level, v))
+    return f"ceiling {op.value} → {'NINGUNO' if v is None else v}", hi
+
+
+def _h_range(sl: SkipList[Any], op: Operation) -> tuple[str, set[tuple[int, Any]]]:
+    res = list(sl.range(op.value, op.hi))
+    hi = _trace_highlight(sl, op.value) | {(sl.level, v) for v in res}  # nivel 0 = última fila
+    return f"range {op.value} {op.hi} → {res}", hi
 
 
 HANDLERS: dict[OpKind, Handler] = {
     OpKind.INSERT: _h_insert,
     OpKind.DELETE: _h_delete,
     OpKind.SEARCH: _h_search,
+    OpKind.AT: _h_at,
+    OpKind.INDEX: _h_index,
+    OpKind.RANK: _h_rank,
+    OpKind.FLOOR: _h_floor,
+    OpKind.CEILING: _h_ceiling,
+    OpKind.RANGE: _h_range,
 }
 
 
-def build_steps(ops: list[Operation], dot_builder: callable) -> list[Step]:
-    sl: SkipList[Any] = SkipList(max_level=6, p=0.5, seed=7)
+def iter_steps(ops: Iterable[Operation], dot_builder: callable) -> Iterator[Step]:
+    sl: SkipList[Any] = SkipList(p=0.5, seed=7)
+    c = sl.enable_counters()
 
-    def snap(msg: str, highlight: set[tuple[int, Any]] | None = None) -> Step:
+    def snap(
+        msg: str, highlight: set[tuple[int, Any]] | None = None, cost: dict[str, int] | None = None
+    ) -> Step:
         lvls = sl.levels_as_lists()
-        return Step(dot=dot_builder(lvls, highlight=highlight), levels=lvls, message=msg)
+        return Step(
+            levels=lvls, message=msg, dot_builder=dot_builder, highlight=highlight, cost=cost or {}
+        )
 
-    steps: list[Step] = [snap("Estado inicial")]
+    yield snap("Estado inicial")
 
     for op in ops:
+        before = c.as_dict()
         try:
             msg, hi = HANDLERS[op.kind](sl, op)
-            steps.append(snap(msg, highlight=hi))
+            yield snap(msg, highlight=hi, cost=c.since(before))
         except (ValueError, IndexError) as e:
-            steps.append(snap(f"ERROR: {e} (se detuvo la simulación)"))
+            yield snap(f"ERROR: {e} (se detuvo la simulación)", cost=c.since(before))
             break
 
-    return steps
+
+def build_steps(ops: Iterable[Operation], dot_builder: callable) -> Timeline[Step]:
+    """Todos los pasos en un Timeline (ver iter_steps para consumirlos a medida)."""
+    return Timeline(iter_steps(ops, dot_builder))
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from collections.abc import Callable
-from dataclasses import dataclass
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
 from enum import StrEnum
 from typing import Any
 
 from core.structures.linear.stack import Stack
+from core.timeline import Timeline
 
 
 class OpKind(StrEnum):
@@ -23,9 +24,13 @@ class Operation:
 
 @dataclass(frozen=True)
 class Step:
-    dot: str
     stack: list[Any]
     message: str
+    dot_builder: Callable[..., str] = field(repr=False, compare=False)
+
+    @property
+    def dot(self) -> str:
+        return self.dot_builder(self.stack)
 
 
 def _parse_value(token: str) -> Any:
@@ -35,9 +40,8 @@ def _parse_value(token: str) -> Any:
         return token
 
 
-def parse_operations(text: str) -> list[Operation]:
-    ops: list[Operation] = []
-    for i, raw in enumerate(text.splitlines(), start=1):
+def iter_operations(lines: Iterable[str]) -> Iterator[Operation]:
+    for i, raw in enumerate(lines, start=1):
         line = raw.strip()
         if not line or line.startswith("#"):
             continue
@@ -55,11 +59,14 @@ def parse_operations(text: str) -> list[Operation]:
         if kind == OpKind.PUSH:
             if len(parts) < 2:
                 raise ValueError(f"Línea {i}: 'push' requiere un valor (ej: push 10).")
-            ops.append(Operation(kind=kind, value=_parse_value(parts[1])))
+            yield Operation(kind=kind, value=_parse_value(parts[1]))
         else:
-            ops.append(Operation(kind=kind))
+            yield Operation(kind=kind)
 
-    return ops
+
+def parse_operations(text: str) -> list[Operation]:
+    """Parsea todo el texto de una vez (ver iter_operations para streaming)."""
+    return list(iter_operations(text.splitlines()))
 
 
 Handler = Callable[[Stack[Any], Operation], str]
@@ -93,21 +100,24 @@ HANDLERS: dict[OpKind, Handler] = {
 }
 
 
-def build_steps(ops: list[Operation], dot_builder: callable) -> list[Step]:
+def iter_steps(ops: Iterable[Operation], dot_builder: callable) -> Iterator[Step]:
     s: Stack[Any] = Stack()
 
     def snap(msg: str) -> Step:
         vals = s.to_list()
-        return Step(dot=dot_builder(vals), stack=vals, message=msg)
+        return Step(stack=vals, message=msg, dot_builder=dot_builder)
 
-    steps: list[Step] = [snap("Estado inicial")]
+    yield snap("Estado inicial")
 
     for op in ops:
         try:
             msg = HANDLERS[op.kind](s, op)
-            steps.append(snap(msg))
+            yield snap(msg)
         except IndexError as e:
-            steps.append(snap(f"ERROR: {e} (se detuvo la simulación)"))
+            yield snap(f"ERROR: {e} (se detuvo la simulación)")
             break
 
-    return steps
+
+def build_steps(ops: Iterable[Operation], dot_builder: callable) -> Timeline[Step]:
+    """Todos los pasos en un Timeline (ver iter_steps para consumirlos a medida)."""
+    return Timeline(iter_steps(ops, dot_builder))
@@ -1,17 +1,22 @@
 from __future__ import annotations
 
-from collections.abc import Callable
-from dataclasses import dataclass
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
 from enum import StrEnum
 from typing import Any
 
-from core.structures.trees.binary_search_tree import BinarySearchTree
+from core.structures.trees.binary_search_tree import BinarySearchTree, BSTNode
+from core.structures.trees.tree_shape import Shape, freeze_tree, thaw_tree
+from core.timeline import Timeline
 
 
 class OpKind(StrEnum):
     INSERT = "insert"
     DELETE = "delete"
     SEARCH = "search"
+    FLOOR = "floor"
+    CEILING = "ceiling"
+    RANGE = "range"
     INORDER = "inorder"
     PREORDER = "preorder"
     POSTORDER = "postorder"
@@ -23,14 +28,27 @@ class OpKind(StrEnum):
 class Operation:
     kind: OpKind
     value: Any | None = None
+    hi: Any | None = None  # solo range
 
 
 @dataclass(frozen=True)
 class Step:
-    dot: str
     values: list[Any]  # inorder (siempre)
     traversal: list[Any] | None
     message: str
+    dot_builder: Callable[..., str] = field(repr=False, compare=False)
+    shape: Shape = field(default_factory=list, repr=False)
+    highlight_values: list[Any] | None = None
+    highlight_target: Any | None = None
+    cost: dict[str, int] = field(default_factory=dict)  # ver core.structures.counters
+
+    @property
+    def dot(self) -> str:
+        return self.dot_builder(
+            thaw_tree(self.shape, BSTNode),
+            highlight_values=self.highlight_values,
+            highlight_target=self.highlight_target,
+        )
 
 
 def _parse_value(tok: str) -> Any:
@@ -40,9 +58,8 @@ def _parse_value(tok: str) -> Any:
         return tok
 
 
-def parse_operations(text: str) -> list[Operation]:
-    ops: list[Operation] = []
-    for i, raw in enumerate(text.splitlines(), start=1):
+def iter_operations(lines: Iterable[str]) -> Iterator[Operation]:
+    for i, raw in enumerate(lines, start=1):
         line = raw.strip()
         if not line or line.startswith("#"):
             continue
@@ -55,17 +72,30 @@ def parse_operations(text: str) -> list[Operation]:
         except ValueError as err:
             raise ValueError(
                 f"Línea {i}: comando no válido '{parts[0]}'. "
-                "Usa insert/delete/search/inorder/preorder/postorder/bfs/clear."
+                "Usa insert/delete/search/floor/ceiling/range/inorder/preorder/postorder/bfs/clear."
             ) from err
 
-        if kind in {OpKind.INSERT, OpKind.DELETE, OpKind.SEARCH}:
+        if kind is OpKind.RANGE:
+            if len(parts) < 3:
+                raise ValueError(f"Línea {i}: 'range' requiere dos valores (LO HI).")
+            yield Operation(kind=kind, value=_parse_value(parts[1]), hi=_parse_value(parts[2]))
+            continue
+
+        if kind in {OpKind.INSERT, OpKind.DELETE, OpKind.SEARCH, OpKind.FLOOR, OpKind.CEILING}:
             if len(parts) < 2:
                 raise ValueError(f"Línea {i}: '{kind.value}' requiere un valor.")
-            ops.append(Operation(kind=kind, value=_parse_value(parts[1])))
+            yield Operation(kind=kind, value=_parse_value(parts[1]))
         else:
-            ops.append(Operation(kind=kind))
+            yield Operation(kind=kind)
+
 
-    return ops
+def parse_operations(text: str) -> list[Operation]:
+    """Parsea todo el texto de una vez (ver iter_operations para streaming)."""
+    return list(iter_operations(text.splitlines()))
+
+
+def _or_none(v: Any | None) -> Any:
+    return "NINGUNO" if v is None else v
 
 
 Handler = Callable[
@@ -96,6 +126,27 @@ def _h_search(
     return (f"search {op.value} → {found}", trace, None, op.value if found else None)
 
 
+def _h_floor(
+    t: BinarySearchTree[Any], op: Operation
+) -> tuple[str, list[Any] | None, list[Any] | None, Any | None]:
+    v = t.floor(op.value)
+    return (f"floor {op.value} → {_or_none(v)}", t.search_trace(op.value), None, v)
+
+
+def _h_ceiling(
+    t: BinarySearchTree[Any], op: Operation
+) -> tuple[str, list[Any] | None, list[Any] | None, Any | None]:
+    v = t.ceiling(op.value)
+    return (f"ceiling {op.value} → {_or_none(v)}", t.search_trace(op.value), None, v)
+
+
+def _h_range(
+    t: BinarySearchTree[Any], op: Operation
+) -> tuple[str, list[Any] | None, list[Any] | None, Any | None]:
+    res = list(t.range(op.value, op.hi))
+    return (f"range {op.value} {op.hi} → {res}", res, res, None)
+
+
 def _h_inorder(
     t: BinarySearchTree[Any], _op: Operation
 ) -> tuple[str, list[Any] | None, list[Any] | None, Any | None]:
@@ -135,6 +186,9 @@ HANDLERS: dict[OpKind, Handler] = {
     OpKind.INSERT: _h_insert,
     OpKind.DELETE: _h_delete,
     OpKind.SEARCH: _h_search,
+    OpKind.FLOOR: _h_floor,
+    OpKind.CEILING: _h_ceiling,
+    OpKind.RANGE: _h_range,
     OpKind.INORDER: _h_inorder,
     OpKind.PREORDER: _h_preorder,
     OpKind.POSTORDER: _h_postorder,
@@ -143,28 +197,41 @@ HANDLERS: dict[OpKind, Handler] = {
 }
 
 
-def build_steps(ops: list[Operation], dot_builder: callable) -> list[Step]:
+def iter_steps(ops: Iterable[Operation], dot_builder: callable) -> Iterator[Step]:
     t: BinarySearchTree[Any] = BinarySearchTree()
+    c = t.enable_counters()
 
     def snap(
-        msg: str, hv: list[Any] | None = None, trav: list[Any] | None = None, ht: Any | None = None
+        msg: str,
+        hv: list[Any] | None = None,
+        trav: list[Any] | None = None,
+        ht: Any | None = None,
+        cost: dict[str, int] | None = None,
     ) -> Step:
         inorder_vals = t.inorder()
         return Step(
-            dot=dot_builder(t.root, highlight_values=hv, highlight_target=ht),
             values=inorder_vals,
             traversal=trav,
             message=msg,
+            dot_builder=dot_builder,
+            shape=freeze_tree(t.root),
+            highlight_values=hv,
+            highlight_target=ht,
+            cost=cost or {},
         )
 
-    steps: list[Step] = [snap("Estado inicial")]
+    yield snap("Estado inicial")
 
     for op in ops:
+        before = c.as_dict()
         try:
             msg, hv, trav, ht = HANDLERS[op.kind](t, op)
-            steps.append(snap(msg, hv=hv, trav=trav, ht=ht))
+            yield snap(msg, hv=hv, trav=trav, ht=ht, cost=c.since(before))
         except Exception as e:  # para no crashear la simulación
-            steps.append(snap(f"ERROR: {e} (se detuvo la simulación)"))
+            yield snap(f"ERROR: {e} (se detuvo la simulación)", cost=c.since(before))
             break
 
-    return steps
+
+def build_steps(ops: Iterable[Operation], dot_builder: callable) -> Timeline[Step]:
+    """Todos los pasos en un Timeline (ver iter_steps para consumirlos a medida)."""
+    return Timeline(iter_steps(ops, dot_builder))
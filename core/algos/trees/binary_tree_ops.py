@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Callable
-from dataclasses import dataclass
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
 from enum import StrEnum
 from typing import Any, Literal
 
 from core.structures.trees.binary_tree import BinaryTree, BTNode
+from core.structures.trees.tree_shape import Shape, freeze_tree, thaw_tree
+from core.timeline import Timeline
 
 
 class OpKind(StrEnum):
@@ -29,10 +31,17 @@ class Operation:
 
 @dataclass(frozen=True)
 class Step:
-    dot: str
     levels: list[list[Any]]
     values: list[Any]
     message: str
+    dot_builder: Callable[..., str] = field(repr=False, compare=False)
+    shape: Shape = field(default_factory=list, repr=False)
+    highlight_value: Any | None = None
+    cost: dict[str, int] = field(default_factory=dict)  # ver core.structures.counters
+
+    @property
+    def dot(self) -> str:
+        return self.dot_builder(thaw_tree(self.shape, BTNode), highlight_value=self.highlight_value)
 
 
 def _parse_value(tok: str) -> Any:
@@ -42,9 +51,8 @@ def _parse_value(tok: str) -> Any:
         return tok
 
 
-def parse_operations(text: str) -> list[Operation]:
-    ops: list[Operation] = []
-    for i, raw in enumerate(text.splitlines(), start=1):
+def iter_operations(lines: Iterable[str]) -> Iterator[Operation]:
+    for i, raw in enumerate(lines, start=1):
         line = raw.strip()
         if not line or line.startswith("#"):
             continue
@@ -56,14 +64,13 @@ def parse_operations(text: str) -> list[Operation]:
             kind = OpKind(cmd)
         except ValueError as err:
             raise ValueError(
-                f"Línea {i}: comando inválido '{parts[0]}'. "
-                "Usa insert/delete/find/traverse/clear."
+                f"Línea {i}: comando inválido '{parts[0]}'. Usa insert/delete/find/traverse/clear."
             ) from err
 
         if kind in {OpKind.INSERT, OpKind.DELETE, OpKind.FIND}:
             if len(parts) < 2:
                 raise ValueError(f"Línea {i}: '{kind.value}' requiere un valor.")
-            ops.append(Operation(kind=kind, a=_parse_value(parts[1])))
+            yield Operation(kind=kind, a=_parse_value(parts[1]))
 
         elif kind == OpKind.TRAVERSE:
             if len(parts) < 2:
@@ -76,12 +83,15 @@ def parse_operations(text: str) -> list[Operation]:
                     f"Línea {i}: traverse inválido '{parts[1]}'. "
                     "Usa inorder/preorder/postorder/level."
                 )
-            ops.append(Operation(kind=kind, b=t))
+            yield Operation(kind=kind, b=t)
 
         else:  # clear
-            ops.append(Operation(kind=kind))
+            yield Operation(kind=kind)
 
-    return ops
+
+def parse_operations(text: str) -> list[Operation]:
+    """Parsea todo el texto de una vez (ver iter_operations para streaming)."""
+    return list(iter_operations(text.splitlines()))
 
 
 Handler = Callable[[BinaryTree[Any], Operation], tuple[str, Any | None]]
@@ -135,28 +145,40 @@ HANDLERS: dict[OpKind, Handler] = {
 }
 
 
-def build_steps(
-    ops: list[Operation],
+def iter_steps(
+    ops: Iterable[Operation],
     *,
     dot_builder: Callable[[BTNode[Any] | None], str],
-) -> list[Step]:
+) -> Iterator[Step]:
     bt: BinaryTree[Any] = BinaryTree()
+    c = bt.enable_counters()
 
-    def snap(msg: str, highlight: Any | None = None) -> Step:
+    def snap(msg: str, highlight: Any | None = None, cost: dict[str, int] | None = None) -> Step:
         s = bt.snapshot()
         levels = s["levels"]  # type: ignore[assignment]
         values = s["level_order"]  # type: ignore[assignment]
         return Step(
-            dot=dot_builder(bt.root, highlight_value=highlight),  # type: ignore[arg-type]
             levels=levels,  # type: ignore[arg-type]
             values=values,  # type: ignore[arg-type]
             message=msg,
+            dot_builder=dot_builder,
+            shape=freeze_tree(bt.root),
+            highlight_value=highlight,
+            cost=cost or {},
         )
 
-    steps: list[Step] = [snap("Estado inicial")]
+    yield snap("Estado inicial")
 
     for op in ops:
+        before = c.as_dict()
         msg, hi = HANDLERS[op.kind](bt, op)
-        steps.append(snap(msg, highlight=hi))
+        yield snap(msg, highlight=hi, cost=c.since(before))
 
-    return steps
+
+def build_steps(
+    ops: Iterable[Operation],
+    *,
+    dot_builder: Callable[[BTNode[Any] | None], str],
+) -> Timeline[Step]:
+    """Todos los pasos en un Timeline (ver iter_steps para consumirlos a medida)."""
+    return Timeline(iter_steps(ops, dot_builder=dot_builder))
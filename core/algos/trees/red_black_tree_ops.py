@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Callable
-from dataclasses import dataclass
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
 from enum import StrEnum
 from typing import Any
 
-from core.structures.trees.red_black_tree import RedBlackTree
+from core.structures.trees.red_black_tree import RBNode, RedBlackTree
+from core.structures.trees.tree_shape import Shape, freeze_tree, thaw_tree
+from core.timeline import Timeline
 
 
 class OpKind(StrEnum):
@@ -15,6 +17,11 @@ class OpKind(StrEnum):
     TRACE = "trace"
     MIN = "min"
     MAX = "max"
+    SELECT = "select"
+    RANK = "rank"
+    FLOOR = "floor"
+    CEILING = "ceiling"
+    RANGE = "range"
     INORDER = "inorder"
     BFS = "bfs"
     CLEAR = "clear"
@@ -24,15 +31,27 @@ class OpKind(StrEnum):
 class Operation:
     kind: OpKind
     value: Any | None = None
+    hi: Any | None = None  # solo range
 
 
 @dataclass(frozen=True)
 class Step:
-    dot: str
     inorder: list[Any]
     bfs: list[Any]
     height: int
     message: str
+    dot_builder: Callable[..., str] = field(repr=False, compare=False)
+    shape: Shape = field(default_factory=list, repr=False)
+    highlight: list[Any] = field(default_factory=list)
+    cost: dict[str, int] = field(default_factory=dict)  # ver core.structures.counters
+
+    @property
+    def dot(self) -> str:
+        root = thaw_tree(self.shape, RBNode, attrs=_SHAPE_ATTRS)
+        return self.dot_builder(root, highlight=self.highlight)
+
+
+_SHAPE_ATTRS = ("red",)
 
 
 def _parse_value(tok: str) -> Any:
@@ -42,7 +61,7 @@ def _parse_value(tok: str) -> Any:
         return tok
 
 
-def parse_operations(text: str) -> list[Operation]:
+def iter_operations(lines: Iterable[str]) -> Iterator[Operation]:
     """
     Comandos:
       insert X
@@ -51,12 +70,16 @@ def parse_operations(text: str) -> list[Operation]:
       trace X
       min
       max
+      select K   (K-ésimo menor, 0-indexed)
+      rank X     (cuántos valores < X)
+      floor X    (mayor valor <= X)
+      ceiling X  (menor valor >= X)
+      range LO HI
       inorder
       bfs
       clear
     """
-    ops: list[Operation] = []
-    for i, raw in enumerate(text.splitlines(), start=1):
+    for i, raw in enumerate(lines, start=1):
         line = raw.strip()
         if not line or line.startswith("#"):
             continue
@@ -69,17 +92,37 @@ def parse_operations(text: str) -> list[Operation]:
         except ValueError as err:
             raise ValueError(
                 f"Línea {i}: comando inválido '{parts[0]}'. "
-                "Usa insert/delete/contains/trace/min/max/inorder/bfs/clear."
+                "Usa insert/delete/contains/trace/min/max/select/rank/floor/ceiling/range/inorder/bfs/clear."
             ) from err
 
-        if kind in {OpKind.INSERT, OpKind.DELETE, OpKind.CONTAINS, OpKind.TRACE}:
+        if kind is OpKind.SELECT:
+            k = _parse_value(parts[1]) if len(parts) >= 2 else None
+            if not isinstance(k, int):
+                raise ValueError(f"Línea {i}: 'select' requiere un índice entero.")
+            yield Operation(kind=kind, value=k)
+        elif kind is OpKind.RANGE:
+            if len(parts) < 3:
+                raise ValueError(f"Línea {i}: 'range' requiere dos valores (LO HI).")
+            yield Operation(kind=kind, value=_parse_value(parts[1]), hi=_parse_value(parts[2]))
+        elif kind in {
+            OpKind.INSERT,
+            OpKind.DELETE,
+            OpKind.CONTAINS,
+            OpKind.TRACE,
+            OpKind.RANK,
+            OpKind.FLOOR,
+            OpKind.CEILING,
+        }:
             if len(parts) < 2:
                 raise ValueError(f"Línea {i}: '{kind.value}' requiere un valor.")
-            ops.append(Operation(kind=kind, value=_parse_value(parts[1])))
+            yield Operation(kind=kind, value=_parse_value(parts[1]))
         else:
-            ops.append(Operation(kind=kind))
+            yield Operation(kind=kind)
 
-    return ops
+
+def parse_operations(text: str) -> list[Operation]:
+    """Parsea todo el texto de una vez (ver iter_operations para streaming)."""
+    return list(iter_operations(text.splitlines()))
 
 
 Handler = Callable[[RedBlackTree[Any], Operation], tuple[str, list[Any]]]
@@ -124,6 +167,31 @@ def _h_max(t: RedBlackTree[Any], _op: Operation) -> tuple[str, list[Any]]:
         return (f"ERROR: {e}", [])
 
 
+def _h_select(t: RedBlackTree[Any], op: Operation) -> tuple[str, list[Any]]:
+    v = t.select(op.value)
+    return (f"select {op.value} → {v}", t.search_trace(v))
+
+
+def _h_rank(t: RedBlackTree[Any], op: Operation) -> tuple[str, list[Any]]:
+    r = t.rank(op.value)
+    return (f"rank {op.value} → {r}", t.search_trace(op.value))
+
+
+def _h_floor(t: RedBlackTree[Any], op: Operation) -> tuple[str, list[Any]]:
+    v = t.floor(op.value)
+    return (f"floor {op.value} → {'NINGUNO' if v is None else v}", t.search_trace(op.value))
+
+
+def _h_ceiling(t: RedBlackTree[Any], op: Operation) -> tuple[str, list[Any]]:
+    v = t.ceiling(op.value)
+    return (f"ceiling {op.value} → {'NINGUNO' if v is None else v}", t.search_trace(op.value))
+
+
+def _h_range(t: RedBlackTree[Any], op: Operation) -> tuple[str, list[Any]]:
+    res = list(t.range(op.value, op.hi))
+    return (f"range {op.value} {op.hi} → {res}", res)
+
+
 def _h_inorder(t: RedBlackTree[Any], _op: Operation) -> tuple[str, list[Any]]:
     return (f"inorder → {t.inorder()}", [])
 
@@ -144,32 +212,45 @@ HANDLERS: dict[OpKind, Handler] = {
     OpKind.TRACE: _h_trace,
     OpKind.MIN: _h_min,
     OpKind.MAX: _h_max,
+    OpKind.SELECT: _h_select,
+    OpKind.RANK: _h_rank,
+    OpKind.FLOOR: _h_floor,
+    OpKind.CEILING: _h_ceiling,
+    OpKind.RANGE: _h_range,
     OpKind.INORDER: _h_inorder,
     OpKind.BFS: _h_bfs,
     OpKind.CLEAR: _h_clear,
 }
 
 
-def build_steps(ops: list[Operation], *, dot_builder: callable) -> list[Step]:
+def iter_steps(ops: Iterable[Operation], *, dot_builder: callable) -> Iterator[Step]:
     t: RedBlackTree[Any] = RedBlackTree()
+    c = t.enable_counters()
 
-    def snap(msg: str, hi: list[Any] | None = None) -> Step:
+    def snap(msg: str, hi: list[Any] | None = None, cost: dict[str, int] | None = None) -> Step:
         return Step(
-            dot=dot_builder(t.root, highlight=hi or []),
             inorder=t.inorder(),
             bfs=t.bfs(),
             height=t.height(),
             message=msg,
+            dot_builder=dot_builder,
+            shape=freeze_tree(t.root, attrs=_SHAPE_ATTRS),
+            highlight=hi or [],
+            cost=cost or {},
         )
 
-    steps: list[Step] = [snap("Estado inicial")]
+    yield snap("Estado inicial")
 
     for op in ops:
+        before = c.as_dict()
         try:
             msg, hi = HANDLERS[op.kind](t, op)
-            steps.append(snap(msg, hi))
+            yield snap(msg, hi, cost=c.since(before))
         except Exception as e:  # demo/visualizador
-            steps.append(snap(f"ERROR: {e} (se detuvo la simulación)"))
+            yield snap(f"ERROR: {e} (se detuvo la simulación)", cost=c.since(before))
             break
 
-    return steps
+
+def build_steps(ops: Iterable[Operation], *, dot_builder: callable) -> Timeline[Step]:
+    """Todos los pasos en un Timeline (ver iter_steps para consumirlos a medida)."""
+    return Timeline(iter_steps(ops, dot_builder=dot_builder))
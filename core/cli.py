@@ -0,0 +1,397 @@
+"""
+CLI sin Streamlit.
+
+Uso:
+  python -m core.cli replay --structure avl ops.txt
+  python -m core.cli replay --structure hash_table --engine open --capacity 1024 ops.txt --json
+  cat ops.txt | python -m core.cli replay --structure queue -
+  python -m core.cli generate -s avl -n 1000000 --keys zipf --mix read_heavy > ops.txt
+
+replay corre un script de operaciones (la misma gramática que la página de la
+estructura) aplicando los HANDLERS del módulo *_ops directamente sobre la
+estructura: no se arman Step ni se genera DOT. Reporta cuántas operaciones hubo
+de cada tipo, el tiempo (mejor de --repeat corridas), ops/s, la memoria pico
+(tracemalloc, en una corrida aparte) y el estado final (size, height,
+load_factor según la estructura).
+
+Como en las páginas, la primera operación que falla (IndexError, KeyError,
+OverflowError, TypeError, ValueError) detiene la corrida; el reporte la incluye
+y el exit code es 1. Un error de parseo sale con exit code 2.
+
+generate escribe un script de core.workloads (determinístico por --seed) para
+la gramática de la estructura.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import Any, TextIO
+
+from core.algos.hash import hash_set_ops, hash_table_ops, ordered_map_ops
+from core.algos.linear import (
+    array_list_ops,
+    circular_doubly_linked_list_ops,
+    deque_ops,
+    doubly_linked_list_ops,
+    linked_list_ops,
+    queue_ops,
+    ring_buffer_ops,
+    skip_list_ops,
+    stack_ops,
+)
+from core.algos.trees import (
+    avl_tree_ops,
+    binary_search_tree_ops,
+    binary_tree_ops,
+    red_black_tree_ops,
+)
+from core.structures.hash.hash_set import HashSet
+from core.structures.hash.hash_table import HashTable
+from core.structures.hash.ordered_map import OrderedMap
+from core.structures.linear.array_list import ArrayList
+from core.structures.linear.circular_doubly_linked_list import CircularDoublyLinkedList
+from core.structures.linear.deque_ds import DequeDS
+from core.structures.linear.doubly_linked_list import DoublyLinkedList
+from core.structures.linear.linked_list import LinkedList
+from core.structures.linear.queue import Queue
+from core.structures.linear.ring_buffer import RingBuffer
+from core.structures.linear.skip_list import SkipList
+from core.structures.linear.stack import Stack
+from core.structures.trees.avl_tree import AVLTree
+from core.structures.trees.binary_search_tree import BinarySearchTree
+from core.structures.trees.binary_tree import BinaryTree
+from core.structures.trees.red_black_tree import RedBlackTree
+from core.workloads import KEY_DISTRIBUTIONS, MIXES, generate
+
+# lo que corta la simulación en las páginas (iter_steps); TypeError: keys no
+# comparables en los árboles y la skip list (ej. insert 1 / insert a)
+OP_ERRORS = (IndexError, KeyError, OverflowError, TypeError, ValueError)
+
+
+def _tree_stats(t: Any) -> dict[str, Any]:
+    return {"size": len(t), "height": t.height()}
+
+
+def _hash_stats(h: Any) -> dict[str, Any]:
+    return {"size": len(h), "load_factor": round(h.load_factor(), 4)}
+
+
+@dataclass(frozen=True)
+class ReplayTarget:
+    """
+    Una estructura que replay sabe correr.
+
+    factory recibe solo los params de `params` (los que el usuario pasó o los
+    `defaults`); stats resume la estructura al final.
+    """
+
+    name: str
+    ops: ModuleType
+    factory: Callable[..., Any]
+    params: tuple[str, ...] = ()
+    defaults: dict[str, Any] = field(default_factory=dict)
+    stats: Callable[[Any], dict[str, Any]] = lambda s: {"size": len(s)}
+    aliases: tuple[str, ...] = ()
+
+
+TARGETS: list[ReplayTarget] = [
+    ReplayTarget(
+        "array_list",
+        array_list_ops,
+        lambda dtype=None, engine="list": ArrayList(dtype=dtype, engine=engine),
+        params=("dtype", "engine"),
+    ),
+    ReplayTarget("stack", stack_ops, Stack),
+    ReplayTarget("queue", queue_ops, Queue),
+    ReplayTarget("deque", deque_ops, DequeDS),
+    ReplayTarget(
+        "ring_buffer",
+        ring_buffer_ops,
+        lambda capacity, dtype=None: RingBuffer(capacity, dtype=dtype),
+        params=("capacity", "dtype"),
+        defaults={"capacity": 1_024},
+        stats=lambda rb: {"size": len(rb), "capacity": rb.capacity()},
+    ),
+    ReplayTarget("linked_list", linked_list_ops, LinkedList),
+    ReplayTarget("doubly_linked_list", doubly_linked_list_ops, DoublyLinkedList, aliases=("dll",)),
+    ReplayTarget(
+        "circular_doubly_linked_list",
+        circular_doubly_linked_list_ops,
+        CircularDoublyLinkedList,
+        aliases=("cdll",),
+    ),
+    ReplayTarget(
+        "skip_list",
+        skip_list_ops,
+        lambda: SkipList(p=0.5, seed=7),  # mismos parámetros que skip_list_ops
+        stats=lambda sl: {"size": len(sl), "levels": len(sl.levels_as_lists())},
+    ),
+    ReplayTarget(
+        "hash_table",
+        hash_table_ops,
+        lambda capacity, engine="chaining", incremental=False: HashTable(
+            capacity=capacity, engine=engine, incremental=incremental
+        ),
+        params=("capacity", "engine", "incremental"),
+        defaults={"capacity": 8},
+        stats=_hash_stats,
+    ),
+    ReplayTarget(
+        "hash_set",
+        hash_set_ops,
+        lambda capacity, engine="chaining": HashSet(capacity=capacity, engine=engine),
+        params=("capacity", "engine"),
+        defaults={"capacity": 8},
+        stats=_hash_stats,
+        aliases=("set",),
+    ),
+    ReplayTarget(
+        "ordered_map",
+        ordered_map_ops,
+        lambda capacity, engine="chaining": OrderedMap(capacity=capacity, engine=engine),
+        params=("capacity", "engine"),
+        defaults={"capacity": 8},
+        stats=_hash_stats,
+    ),
+    ReplayTarget(
+        "binary_tree",
+        binary_tree_ops,
+        BinaryTree,
+        stats=lambda bt: {"size": len(bt), "height": len(bt.levels())},
+    ),
+    ReplayTarget(
+        "binary_search_tree",
+        binary_search_tree_ops,
+        lambda storage="node": BinarySearchTree(storage=storage),
+        params=("storage",),
+        stats=_tree_stats,
+        aliases=("bst",),
+    ),
+    ReplayTarget(
+        "avl_tree",
+        avl_tree_ops,
+        lambda storage="node": AVLTree(storage=storage),
+        params=("storage",),
+        stats=_tree_stats,
+        aliases=("avl",),
+    ),
+    ReplayTarget(
+        "red_black_tree",
+        red_black_tree_ops,
+        lambda storage="node": RedBlackTree(storage=storage),
+        params=("storage",),
+        stats=_tree_stats,
+        aliases=("rbt", "red_black"),
+    ),
+]
+
+_BY_NAME: dict[str, ReplayTarget] = {name: t for t in TARGETS for name in (t.name, *t.aliases)}
+
+
+def get_target(name: str) -> ReplayTarget:
+    try:
+        return _BY_NAME[name.lower()]
+    except KeyError:
+        raise ValueError(f"unknown structure {name!r}; choose from {sorted(_BY_NAME)}") from None
+
+
+def _apply(
+    target: ReplayTarget, ops: Sequence[Any], params: dict[str, Any]
+) -> tuple[Any, int, Any]:
+    """Corre ops sobre una estructura nueva. Retorna (estructura, hechas, op fallida | None)."""
+    s = target.factory(**params)
+    handlers = target.ops.HANDLERS
+    done = 0
+    for op in ops:
+        try:
+            handlers[op.kind](s, op)
+        except OP_ERRORS as e:
+            return s, done, (op, e)
+        done += 1
+    return s, done, None
+
+
+def replay(
+    target: ReplayTarget,
+    source: TextIO | Sequence[str],
+    *,
+    params: dict[str, Any] | None = None,
+    repeat: int = 1,
+    memory: bool = True,
+) -> dict[str, Any]:
+    """
+    Parsea `source` (archivo o líneas) y lo corre headless sobre `target`.
+
+    ValueError si el script no parsea o si se pasa un param que la
+    estructura no acepta.
+    """
+    params = {**target.defaults, **(params or {})}
+    unknown = set(params) - set(target.params)
+    if unknown:
+        raise ValueError(f"{target.name} does not accept {sorted(unknown)}")
+    if repeat <= 0:
+        raise ValueError("repeat must be > 0")
+
+    t0 = time.perf_counter()
+    ops = list(target.ops.iter_operations(source))
+    parse_seconds = time.perf_counter() - t0
+
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        t0 = time.perf_counter()
+        s, done, failed = _apply(target, ops, params)
+        best = min(best, time.perf_counter() - t0)
+
+    peak = None
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            _apply(target, ops, params)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    report: dict[str, Any] = {
+        "structure": target.name,
+        "params": params,
+        "ops": len(ops),
+        "done": done,
+        "counts": dict(Counter(op.kind.value for op in ops).most_common()),
+        "parse_seconds": round(parse_seconds, 6),
+        "seconds": round(best, 6),
+        "ops_per_sec": round(done / best, 1) if best > 0 else None,
+        "peak_kib": round(peak / 1024, 1) if peak is not None else None,
+        "final": target.stats(s),
+        "error": None,
+    }
+    if failed is not None:
+        op, e = failed
+        report["error"] = {
+            "op": done + 1,
+            "kind": op.kind.value,
+            "message": f"{type(e).__name__}: {e}",
+        }
+    return report
+
+
+def format_report(report: dict[str, Any]) -> str:
+    lines = [
+        f"{report['structure']} {report['params'] or ''}".rstrip(),
+        f"  ops        {report['done']:,} / {report['ops']:,}",
+    ]
+    lines += [f"    {kind:<14} {n:>12,}" for kind, n in report["counts"].items()]
+    lines.append(f"  parse      {report['parse_seconds']:.4f} s")
+    rate = report["ops_per_sec"]
+    lines.append(
+        f"  replay     {report['seconds']:.4f} s" + (f"  ({rate:,.0f} ops/s)" if rate else "")
+    )
+    if report["peak_kib"] is not None:
+        lines.append(f"  peak mem   {report['peak_kib']:,.1f} KiB")
+    lines.append("  final      " + "  ".join(f"{k}={v}" for k, v in report["final"].items()))
+    if report["error"]:
+        err = report["error"]
+        lines.append(f"  ERROR en la operación {err['op']} ({err['kind']}): {err['message']}")
+    return "\n".join(lines)
+
+
+def _cmd_replay(args: argparse.Namespace) -> int:
+    target = get_target(args.structure)
+    params = {
+        name: value
+        for name in ("capacity", "engine", "dtype", "incremental", "storage")
+        if (value := getattr(args, name)) is not None
+    }
+    try:
+        if args.script == "-":
+            report = replay(
+                target, sys.stdin, params=params, repeat=args.repeat, memory=not args.no_memory
+            )
+        else:
+            with args.script.open(encoding="utf-8") as f:
+                report = replay(
+                    target, f, params=params, repeat=args.repeat, memory=not args.no_memory
+                )
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+    return 1 if report["error"] else 0
+
+
+def _cmd_generate(args: argparse.Namespace) -> int:
+    try:
+        lines = generate(
+            get_target(args.structure).name,
+            args.n,
+            keys=args.keys,
+            mix=args.mix,
+            seed=args.seed,
+            universe=args.universe,
+            zipf_s=args.zipf_s,
+            capacity=args.capacity,
+        )
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    try:
+        out = sys.stdout if args.out is None else args.out.open("w", encoding="utf-8")
+    except OSError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    try:
+        for line in lines:
+            out.write(line + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    p = argparse.ArgumentParser(prog="python -m core.cli", description=__doc__.split("\n")[1])
+    sub = p.add_subparsers(dest="command", required=True)
+
+    r = sub.add_parser("replay", help="corre un script de operaciones sin UI")
+    r.add_argument("--structure", "-s", required=True, choices=sorted(_BY_NAME))
+    r.add_argument("script", type=lambda v: v if v == "-" else Path(v), help="archivo o - (stdin)")
+    r.add_argument("--capacity", type=int)
+    r.add_argument("--engine")
+    r.add_argument("--dtype")
+    r.add_argument("--incremental", action="store_true", default=None)
+    r.add_argument("--storage", choices=("node", "arena"))
+    r.add_argument("--repeat", type=int, default=1)
+    r.add_argument("--no-memory", action="store_true", help="omite la corrida con tracemalloc")
+    r.add_argument("--json", action="store_true", help="reporte en JSON")
+    r.set_defaults(func=_cmd_replay)
+
+    g = sub.add_parser("generate", help="escribe un workload sintético (core.workloads)")
+    g.add_argument("--structure", "-s", required=True, choices=sorted(_BY_NAME))
+    g.add_argument("-n", type=int, required=True, help="cantidad de operaciones")
+    g.add_argument("--keys", choices=KEY_DISTRIBUTIONS, default="uniform")
+    g.add_argument("--mix", choices=sorted(MIXES), default="balanced")
+    g.add_argument("--seed", type=int, default=0)
+    g.add_argument("--universe", type=int, help="rango de keys (default: n)")
+    g.add_argument("--zipf-s", type=float, default=1.1)
+    g.add_argument("--capacity", type=int, default=1_024, help="solo ring_buffer")
+    g.add_argument("--out", type=Path, help="archivo de salida (default: stdout)")
+    g.set_defaults(func=_cmd_generate)
+
+    args = p.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
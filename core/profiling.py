@@ -0,0 +1,170 @@
+"""
+Profiling de build_steps (toggle "Profiling" del sidebar).
+
+  profile = profile_build(ops_text, parse_operations, build_steps, dot_builder=avl_tree_to_dot)
+  profile.to_json()   # tiempos y memoria por paso
+  profile.pstats      # cProfile del build completo (formato de pstats.Stats.dump_stats)
+
+Usa el iter_steps del mismo módulo que build_steps y hace tres pasadas sobre
+las operaciones ya parseadas, para que ninguna medición distorsione a otra:
+  tiempos   perf_counter de cada paso (operación + snapshot de la estructura)
+            y, aparte, de su render DOT (dot_builder)
+  memoria   pico de tracemalloc por paso (operación + DOT) sobre lo ya retenido
+  cProfile  todos los pasos con su DOT
+
+Cada pasada vuelve a simular todo: con el toggle apagado no se llama.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import io
+import json
+import marshal
+import pstats
+import sys
+import tracemalloc
+from collections.abc import Callable, Iterator
+from dataclasses import asdict, dataclass, field
+from time import perf_counter
+from typing import Any
+
+
+@dataclass(frozen=True)
+class StepProfile:
+    index: int
+    message: str
+    op_ms: float  # estructura + snapshot (el iter_steps)
+    dot_ms: float  # dot_builder
+    peak_kib: float  # pico de tracemalloc del paso sobre lo ya retenido
+
+
+@dataclass(frozen=True)
+class BuildProfile:
+    structure: str
+    parse_ms: float
+    steps: list[StepProfile]
+    pstats: bytes = field(repr=False)  # marshal de Stats.stats (lo mismo que dump_stats)
+    pstats_text: str = field(repr=False, default="")
+
+    @property
+    def op_ms(self) -> float:
+        return sum(s.op_ms for s in self.steps)
+
+    @property
+    def dot_ms(self) -> float:
+        return sum(s.dot_ms for s in self.steps)
+
+    @property
+    def peak_kib(self) -> float:
+        return max((s.peak_kib for s in self.steps), default=0.0)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Todo menos el pstats binario (va aparte, como .prof)."""
+        return {
+            "structure": self.structure,
+            "parse_ms": self.parse_ms,
+            "op_ms": self.op_ms,
+            "dot_ms": self.dot_ms,
+            "peak_kib": self.peak_kib,
+            "steps": [asdict(s) for s in self.steps],
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.as_dict(), indent=2, ensure_ascii=False)
+
+
+def _iter_steps_of(build: Callable[..., Any]) -> Callable[..., Iterator[Any]]:
+    try:
+        return sys.modules[build.__module__].iter_steps  # type: ignore[no-any-return]
+    except AttributeError:
+        raise ValueError(f"{build.__module__} has no iter_steps to profile") from None
+
+
+def _timings(
+    iter_steps: Callable[..., Iterator[Any]], ops: list[Any], params: dict[str, Any]
+) -> list[tuple[str, float, float]]:
+    out: list[tuple[str, float, float]] = []
+    steps = iter_steps(ops, **params)
+    while True:
+        t0 = perf_counter()
+        try:
+            step = next(steps)
+        except StopIteration:
+            break
+        t1 = perf_counter()
+        step.dot  # noqa: B018 - el render es lazy: se fuerza para medirlo
+        t2 = perf_counter()
+        out.append((step.message, (t1 - t0) * 1e3, (t2 - t1) * 1e3))
+    return out
+
+
+def _peaks(
+    iter_steps: Callable[..., Iterator[Any]], ops: list[Any], params: dict[str, Any]
+) -> list[float]:
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    peaks: list[float] = []
+    kept: list[Any] = []  # como el Timeline: los pasos previos siguen vivos
+    try:
+        steps = iter_steps(ops, **params)
+        while True:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            try:
+                step = next(steps)
+            except StopIteration:
+                break
+            step.dot  # noqa: B018
+            peaks.append((tracemalloc.get_traced_memory()[1] - base) / 1024)
+            kept.append(step)
+    finally:
+        if started:
+            tracemalloc.stop()
+    return peaks
+
+
+def _cprofile(
+    iter_steps: Callable[..., Iterator[Any]], ops: list[Any], params: dict[str, Any], limit: int
+) -> tuple[bytes, str]:
+    prof = cProfile.Profile()
+    prof.enable()
+    try:
+        for step in iter_steps(ops, **params):
+            step.dot  # noqa: B018
+    finally:
+        prof.disable()
+    out = io.StringIO()
+    stats = pstats.Stats(prof, stream=out)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(limit)
+    return marshal.dumps(stats.stats), out.getvalue()  # type: ignore[attr-defined]
+
+
+def profile_build(
+    ops_text: str,
+    parse: Callable[[str], Any],
+    build: Callable[..., Any],
+    *,
+    top: int = 25,
+    **params: Any,
+) -> BuildProfile:
+    """
+    Perfil de build(parse(ops_text), **params) (mismos argumentos que
+    cached_build_steps). top: funciones del resumen de texto de cProfile.
+    Un ValueError de parse se propaga.
+    """
+    iter_steps = _iter_steps_of(build)
+    t0 = perf_counter()
+    ops = list(parse(ops_text))
+    parse_ms = (perf_counter() - t0) * 1e3
+
+    timings = _timings(iter_steps, ops, params)
+    peaks = _peaks(iter_steps, ops, params)
+    blob, text = _cprofile(iter_steps, ops, params, top)
+    steps = [
+        StepProfile(i, msg, op_ms, dot_ms, peak)
+        for i, ((msg, op_ms, dot_ms), peak) in enumerate(zip(timings, peaks, strict=True))
+    ]
+    structure = build.__module__.rsplit(".", 1)[-1].removesuffix("_ops")
+    return BuildProfile(structure, parse_ms, steps, blob, text)
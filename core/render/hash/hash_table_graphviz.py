@@ -11,7 +11,13 @@ def hash_table_to_dot(
     *,
     highlight_bucket: int | None = None,
     highlight_key: Any | None = None,
+    old_buckets: Sequence[Sequence[tuple[Any, Any]]] | None = None,
+    migrated: int = 0,
 ) -> str:
+    """
+    old_buckets/migrated: rehash incremental en curso. Se dibuja la tabla vieja
+    al lado; los buckets [0, migrated) ya se movieron a la nueva.
+    """
     g = Digraph("hash_table")
     g.attr(rankdir="LR")
     g.attr("node", shape="box")
@@ -35,4 +41,20 @@ def hash_table_to_dot(
             g.edge(prev, n_id)
             prev = n_id
 
+    if old_buckets is not None:
+        with g.subgraph(name="cluster_old") as sg:
+            sg.attr(label=f"tabla vieja (migrados {migrated}/{len(old_buckets)})", style="dashed")
+            for i, bucket in enumerate(old_buckets):
+                b_id = f"ob{i}"
+                if i < migrated:
+                    sg.node(b_id, f"old {i} ✓", style="dashed", fontcolor="gray")
+                    continue
+                sg.node(b_id, f"old {i}")
+                prev = b_id
+                for j, (k, v) in enumerate(bucket):
+                    n_id = f"on{i}_{j}"
+                    sg.node(n_id, f"{k} → {v}", color="gray")
+                    sg.edge(prev, n_id)
+                    prev = n_id
+
     return g.source
@@ -6,12 +6,17 @@ from typing import Any
 from graphviz import Digraph
 
 
-def array_list_to_dot(values: Sequence[Any], *, highlight_index: int | None = None) -> str:
+def array_list_to_dot(
+    values: Sequence[Any], *, highlight_index: int | None = None, dtype: str | None = None
+) -> str:
+    """values: list, ndarray o cualquier secuencia; dtype (modo tipado) va como título."""
     g = Digraph("array_list")
     g.attr(rankdir="LR")
     g.attr("node", shape="record")
+    if dtype is not None:
+        g.attr(label=f"dtype={dtype}", labelloc="t")
 
-    if not values:
+    if len(values) == 0:
         g.node("empty", "∅", shape="plaintext")
         return g.source
 
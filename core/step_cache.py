@@ -0,0 +1,237 @@
+"""
+Cache de build_steps compartido entre sesiones.
+
+Dos niveles, consultados en orden:
+  memoria  LRUCache del proceso, acotado en entradas y en bytes (tamaño del pickle)
+  disco    SQLite; sobrevive reinicios del server, acotado en bytes (LRU por último uso)
+
+La clave es (módulo de build_steps, hash del texto de operaciones, params,
+versión del código de core/): tocar cualquier .py de core/ invalida todo.
+
+Los Timeline cacheados se comparten entre sesiones y solo se leen: cada
+Stepper guarda su propio índice. Un resultado que no se puede picklear (por
+ejemplo con un dot_builder lambda) se devuelve sin cachear en ningún nivel.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from contextlib import closing
+from functools import cache
+from pathlib import Path
+from typing import Any, TypeVar
+
+from core.structures.hash.lru_cache import LRUCache
+
+T = TypeVar("T")
+
+CORE_DIR = Path(__file__).resolve().parent
+DEFAULT_PATH = CORE_DIR.parent / ".cache" / "steps.sqlite"
+# Ruta del SQLite; "off" deja solo el nivel en memoria.
+ENV_PATH = "PYDSA_STEP_CACHE"
+
+
+@cache
+def code_version() -> str:
+    """Hash de los .py de core/ (se calcula una vez por proceso)."""
+    h = hashlib.sha256()
+    for path in sorted(CORE_DIR.rglob("*.py")):
+        h.update(path.relative_to(CORE_DIR).as_posix().encode())
+        h.update(path.read_bytes())
+    return h.hexdigest()[:16]
+
+
+def _param_repr(value: Any) -> str:
+    if callable(value):
+        return f"{value.__module__}.{value.__qualname__}"
+    return repr(value)
+
+
+def cache_key(structure: str, ops_text: str, params: dict[str, Any]) -> str:
+    # los parsers hacen strip() de cada línea: espacios de más no cambian los pasos
+    ops = "\n".join(line.strip() for line in ops_text.splitlines())
+    payload = {
+        "structure": structure,
+        "ops": hashlib.sha256(ops.encode()).hexdigest(),
+        "params": {k: _param_repr(v) for k, v in sorted(params.items())},
+        "version": code_version(),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+class StepCache:
+    def __init__(
+        self,
+        path: Path | None = None,
+        *,
+        memory_entries: int = 128,
+        memory_bytes: int = 64 << 20,
+        disk_bytes: int = 256 << 20,
+    ) -> None:
+        self.path = path
+        self.memory_bytes = memory_bytes
+        self.disk_bytes = disk_bytes
+        self._mem: LRUCache[str, tuple[Any, int]] = LRUCache(memory_entries, on_evict=self._forget)
+        self._mem_used = 0
+        self._lock = threading.Lock()
+        self.disk_hits = 0
+        self.builds = 0
+        if path is not None:
+            self._init_db()
+
+    # ---------- Memoria ----------
+    def _forget(self, _key: str, entry: tuple[Any, int]) -> None:
+        self._mem_used -= entry[1]
+
+    def _remember(self, key: str, value: Any, size: int) -> None:
+        if size > self.memory_bytes:
+            return
+        with self._lock:
+            try:
+                self._mem.peek(key)
+                return  # otra sesión lo guardó mientras se construía
+            except KeyError:
+                pass
+            self._mem.set(key, (value, size))
+            self._mem_used += size
+            while self._mem_used > self.memory_bytes:
+                self._mem.evict()
+
+    # ---------- Disco ----------
+    def _connect(self) -> sqlite3.Connection:
+        assert self.path is not None
+        return sqlite3.connect(self.path, timeout=5)
+
+    def _init_db(self) -> None:
+        assert self.path is not None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with closing(self._connect()) as db, db:
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS steps ("
+                    "key TEXT PRIMARY KEY, version TEXT NOT NULL, "
+                    "blob BLOB NOT NULL, used REAL NOT NULL)"
+                )
+                db.execute("DELETE FROM steps WHERE version != ?", (code_version(),))
+        except (OSError, sqlite3.Error):
+            self.path = None  # sin disco escribible: queda solo la memoria
+
+    def _disk_get(self, key: str) -> bytes | None:
+        if self.path is None:
+            return None
+        try:
+            with closing(self._connect()) as db, db:
+                row = db.execute("SELECT blob FROM steps WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    db.execute("UPDATE steps SET used = ? WHERE key = ?", (time.time(), key))
+        except sqlite3.Error:
+            return None
+        return None if row is None else bytes(row[0])
+
+    def _disk_put(self, key: str, blob: bytes) -> None:
+        if self.path is None or len(blob) > self.disk_bytes:
+            return
+        try:
+            with closing(self._connect()) as db, db:
+                db.execute(
+                    "INSERT OR REPLACE INTO steps VALUES (?, ?, ?, ?)",
+                    (key, code_version(), blob, time.time()),
+                )
+                rows = db.execute(
+                    "SELECT key, length(blob) FROM steps ORDER BY used DESC"
+                ).fetchall()
+                total = 0
+                stale = []
+                for k, size in rows:
+                    total += size
+                    if total > self.disk_bytes:
+                        stale.append((k,))
+                db.executemany("DELETE FROM steps WHERE key = ?", stale)
+        except sqlite3.Error:
+            pass  # el disco es best-effort: el resultado ya está en memoria
+
+    # ---------- API ----------
+    def get_or_build(self, key: str, build: Callable[[], T]) -> T:
+        with self._lock:
+            try:
+                return self._mem.get(key)[0]
+            except KeyError:
+                pass
+
+        blob = self._disk_get(key)
+        if blob is not None:
+            value: T = pickle.loads(blob)
+            with self._lock:
+                self.disk_hits += 1
+        else:
+            value = build()
+            with self._lock:
+                self.builds += 1
+            try:
+                blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            except (pickle.PicklingError, AttributeError, TypeError, RecursionError):
+                return value
+            self._disk_put(key, blob)
+        self._remember(key, value, len(blob))
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._mem.clear()
+            self._mem_used = 0
+        if self.path is not None:
+            try:
+                with closing(self._connect()) as db, db:
+                    db.execute("DELETE FROM steps")
+            except sqlite3.Error:
+                pass
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            mem = self._mem.stats()
+            return {
+                "memory_hits": mem["hits"],
+                "memory_entries": mem["size"],
+                "memory_bytes": self._mem_used,
+                "disk_hits": self.disk_hits,
+                "builds": self.builds,
+            }
+
+
+_default: StepCache | None = None
+_default_lock = threading.Lock()
+
+
+def default_cache() -> StepCache:
+    """StepCache del proceso (ruta tomada de PYDSA_STEP_CACHE la primera vez)."""
+    global _default
+    with _default_lock:
+        if _default is None:
+            env = os.environ.get(ENV_PATH)
+            path = None if env == "off" else Path(env) if env else DEFAULT_PATH
+            _default = StepCache(path)
+        return _default
+
+
+def cached_build_steps(
+    ops_text: str,
+    parse: Callable[[str], Any],
+    build: Callable[..., T],
+    *,
+    cache: StepCache | None = None,
+    **params: Any,
+) -> T:
+    """
+    build(parse(ops_text), **params) pasando por el cache.
+    Un ValueError de parse se propaga y no se cachea.
+    """
+    cache = cache or default_cache()
+    key = cache_key(build.__module__, ops_text, params)
+    return cache.get_or_build(key, lambda: build(parse(ops_text), **params))
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from collections.abc import Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Generic, TypeVar
 
 T = TypeVar("T")
@@ -11,10 +12,45 @@ T = TypeVar("T")
 class Stepper(Generic[T]):
     steps: Sequence[T]
     index: int = 0
+    dot_cache_size: int = 8
+    _dot_cache: OrderedDict[int, str] = field(default_factory=OrderedDict, init=False, repr=False)
+    _cost_totals: dict[str, int] | None = field(default=None, init=False, repr=False)
 
     def current(self) -> T:
         return self.steps[self.index]
 
+    def current_dot(self) -> str:
+        """
+        DOT del paso actual.
+
+        Los Step renderizan `dot` on-demand; aquí guardamos los últimos
+        `dot_cache_size` pasos vistos (LRU) para que Prev/Next alrededor del
+        índice actual no vuelvan a generar Graphviz en cada rerun.
+        """
+        cached = self._dot_cache.get(self.index)
+        if cached is not None:
+            self._dot_cache.move_to_end(self.index)
+            return cached
+
+        dot: str = self.current().dot  # type: ignore[attr-defined]
+        self._dot_cache[self.index] = dot
+        while len(self._dot_cache) > self.dot_cache_size:
+            self._dot_cache.popitem(last=False)
+        return dot
+
+    def cost_totals(self) -> dict[str, int]:
+        """
+        Suma de `step.cost` de todos los pasos (vacío si los Step no tienen costo).
+        Recorre el Timeline una sola vez y queda guardada.
+        """
+        if self._cost_totals is None:
+            totals: dict[str, int] = {}
+            for step in self.steps:
+                for name, n in getattr(step, "cost", {}).items():
+                    totals[name] = totals.get(name, 0) + n
+            self._cost_totals = totals
+        return self._cost_totals
+
     def can_prev(self) -> bool:
         return self.index > 0
 
@@ -31,3 +67,8 @@ class Stepper(Generic[T]):
 
     def reset(self) -> None:
         self.index = 0
+
+    def seek(self, index: int) -> T:
+        """Salta a un paso (con clamp). Con un Timeline cuesta O(keyframe_interval)."""
+        self.index = max(0, min(index, len(self.steps) - 1))
+        return self.current()
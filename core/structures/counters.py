@@ -0,0 +1,77 @@
+"""
+Contadores de costo por operación (opt-in).
+
+  t = AVLTree()
+  c = t.enable_counters()
+  before = c.as_dict()
+  t.insert(5)
+  c.since(before)  # {"compares": 3, "rotations": 1}
+
+Apagados (counters=None, el default) el costo es un `is not None` por
+operación o por iteración de los loops que no llevan ya un índice; donde hay
+uno (slot de open addressing, índice de find_index) el conteo sale de él al
+final, sin tocar el loop.
+
+  compares      nodos contra los que se comparó la key (árboles, SkipList)
+  probes        entries/slots revisados en HashTable
+  rehash_moves  entries movidas por un rehash o una migración incremental
+  rotations     rotaciones (AVL, red-black)
+  color_flips   flips de color (red-black)
+  hops          saltos de nodo en las listas enlazadas
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+
+COUNTERS = ("compares", "probes", "rehash_moves", "rotations", "color_flips", "hops")
+
+
+@dataclass(slots=True)
+class OpCounters:
+    compares: int = 0
+    probes: int = 0
+    rehash_moves: int = 0
+    rotations: int = 0
+    color_flips: int = 0
+    hops: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+    def since(self, before: dict[str, int]) -> dict[str, int]:
+        """Diferencia contra un as_dict() anterior (solo los que cambiaron)."""
+        out = {}
+        for name, old in before.items():
+            d = getattr(self, name) - old
+            if d:
+                out[name] = d
+        return out
+
+    def reset(self) -> None:
+        for name in COUNTERS:
+            setattr(self, name, 0)
+
+
+class Instrumented:
+    """
+    Mixin de las estructuras con contadores.
+
+    `counters` es None (desactivado) a nivel de clase, así que las subclases
+    no tienen que inicializarlo.
+    """
+
+    counters: OpCounters | None = None
+
+    def enable_counters(self) -> OpCounters:
+        """Activa (o devuelve los ya activos) contadores de esta instancia."""
+        if self.counters is None:
+            self.counters = OpCounters()
+        return self.counters
+
+    def disable_counters(self) -> None:
+        self.counters = None
+
+
+def format_cost(cost: dict[str, int]) -> str:
+    return " · ".join(f"{name}={n}" for name, n in cost.items())
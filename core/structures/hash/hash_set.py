@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Generic, TypeVar
 
+from core.structures.counters import Instrumented, OpCounters
 from core.structures.hash.hash_table import HashTable
 
 T = TypeVar("T")
@@ -9,13 +10,26 @@ T = TypeVar("T")
 _PRESENT = object()
 
 
-class HashSet(Generic[T]):
-    def __init__(self, capacity: int = 4) -> None:
-        self._ht: HashTable[T, object] = HashTable(capacity=capacity)
+class HashSet(Instrumented, Generic[T]):
+    """enable_counters() comparte los contadores de la HashTable interna."""
+
+    def __init__(self, capacity: int = 4, *, engine: str = "chaining") -> None:
+        self._ht: HashTable[T, object] = HashTable(capacity=capacity, engine=engine)
+
+    def enable_counters(self) -> OpCounters:
+        self.counters = self._ht.enable_counters()
+        return self.counters
+
+    def disable_counters(self) -> None:
+        self._ht.disable_counters()
+        self.counters = None
 
     def __len__(self) -> int:
         return len(self._ht)
 
+    def load_factor(self) -> float:
+        return self._ht.load_factor()
+
     def add(self, value: T) -> None:
         self._ht.set(value, _PRESENT)
 
@@ -2,37 +2,132 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 from dataclasses import dataclass
-from typing import Generic, TypeVar
+from functools import lru_cache
+from typing import Any, Generic, TypeVar
+
+from core.structures.counters import Instrumented
+
+try:
+    import numpy as np
+except ImportError:  # numpy es opcional (extra "fast")
+    np = None
 
 K = TypeVar("K")
 V = TypeVar("V")
 
+ENGINES = ("chaining", "open")
+
+_FNV_OFFSET = 2166136261
+_FNV_PRIME = 16777619
+_BULK_CHUNK = 65536
+# El lote se rellena al largo de la key más larga (<U) y se recorre una columna
+# por carácter: una key larga haría el chunk de _BULK_CHUNK * largo celdas.
+_BULK_MAX_LEN = 64
+
+
+@lru_cache(maxsize=4096)
+def _fnv_str(key: str) -> int:
+    h = _FNV_OFFSET  # FNV-ish simple
+    for ch in key:
+        h ^= ord(ch)
+        h = (h * _FNV_PRIME) & 0xFFFFFFFF
+    return h
+
 
 def stable_hash(key: object) -> int:
     """Hash determinístico (útil para visualización)."""
     if isinstance(key, int):
         return key & 0xFFFFFFFF
     if isinstance(key, str):
-        h = 2166136261  # FNV-ish simple
-        for ch in key:
-            h ^= ord(ch)
-            h = (h * 16777619) & 0xFFFFFFFF
-        return h
+        return _fnv_str(key)
     return hash(key) & 0xFFFFFFFF
 
 
+def _fnv_str_many_np(keys: list[str]) -> list[int]:
+    """FNV por columnas: un paso vectorizado por posición de carácter, no por key."""
+    out: list[int] = []
+    for start in range(0, len(keys), _BULK_CHUNK):
+        chunk = np.array(keys[start : start + _BULK_CHUNK], dtype=str)
+        width = chunk.dtype.itemsize // 4  # UCS4: un uint32 por code point
+        codes = chunk.view(np.uint32).reshape(len(chunk), width)
+        lengths = np.char.str_len(chunk)
+        h = np.full(len(chunk), _FNV_OFFSET, dtype=np.uint64)
+        for col in range(int(lengths.max(initial=0))):
+            mixed = ((h ^ codes[:, col]) * _FNV_PRIME) & 0xFFFFFFFF
+            h = np.where(lengths > col, mixed, h)
+        out.extend(h.tolist())
+    return out
+
+
+def stable_hash_many(keys: Iterable[object]) -> list[int]:
+    """
+    stable_hash para un lote de keys (mismo resultado, key por key).
+    Las keys str se hashean vectorizadas con NumPy si está instalado.
+    """
+    keys = list(keys)
+    if np is None:
+        return [stable_hash(k) for k in keys]
+
+    out = [0] * len(keys)
+    str_pos: list[int] = []
+    for i, k in enumerate(keys):
+        # keys largas (ver _BULK_MAX_LEN) y con '\x00' finales (el dtype <U de
+        # NumPy los pierde) van por el escalar
+        if isinstance(k, str) and len(k) <= _BULK_MAX_LEN and not k.endswith("\x00"):
+            str_pos.append(i)
+        else:
+            out[i] = stable_hash(k)
+    if str_pos:
+        hashed = _fnv_str_many_np([keys[i] for i in str_pos])  # type: ignore[misc]
+        for i, h in zip(str_pos, hashed, strict=True):
+            out[i] = h
+    return out
+
+
 @dataclass
 class Entry(Generic[K, V]):
     key: K
     value: V
+    hash: int  # stable_hash(key) guardado: rehash/migración y comparaciones no lo recalculan
+
+
+class HashTable(Instrumented, Generic[K, V]):
+    """
+    Hash table con encadenamiento separado (lista de Entry por bucket).
+
+    engine="open" crea en su lugar un OpenAddressingHashTable (misma API).
 
+    incremental=True: al superar el load factor no se rehashea todo de golpe.
+    Se guardan los buckets viejos y cada operación migra como mucho
+    MIGRATE_BUCKETS_PER_OP de ellos (estilo Redis), así ningún `set` paga O(n).
 
-class HashTable(Generic[K, V]):
-    def __init__(self, capacity: int = 8) -> None:
+    enable_counters(): probes (entries revisadas del bucket) y rehash_moves.
+    """
+
+    MIGRATE_BUCKETS_PER_OP = 4
+
+    def __new__(
+        cls, capacity: int = 8, *, engine: str = "chaining", incremental: bool = False
+    ) -> Any:
+        if engine not in ENGINES:
+            raise ValueError(f"engine must be one of {ENGINES}")
+        if cls is HashTable and engine == "open":
+            from core.structures.hash.open_addressing import OpenAddressingHashTable
+
+            return super().__new__(OpenAddressingHashTable)
+        return super().__new__(cls)
+
+    def __init__(
+        self, capacity: int = 8, *, engine: str = "chaining", incremental: bool = False
+    ) -> None:
         if capacity <= 0:
             raise ValueError("capacity must be > 0")
         self._buckets: list[list[Entry[K, V]]] = [[] for _ in range(capacity)]
         self._size = 0
+        self._incremental = incremental
+        # Migración en curso: buckets viejos + cuántos ya se movieron (prefijo)
+        self._old_buckets: list[list[Entry[K, V]]] | None = None
+        self._migrated = 0
 
     def __len__(self) -> int:
         return self._size
@@ -46,35 +141,107 @@ class HashTable(Generic[K, V]):
     def _index(self, key: K) -> int:
         return stable_hash(key) % self.capacity()
 
+    def is_migrating(self) -> bool:
+        return self._old_buckets is not None
+
+    def _bucket_of(self, h: int) -> list[Entry[K, V]]:
+        """
+        Bucket donde vive (o viviría) una key con hash h.
+        Durante una migración, las keys de un bucket viejo aún no migrado siguen ahí.
+        """
+        old = self._old_buckets
+        if old is not None:
+            j = h % len(old)
+            if j >= self._migrated:
+                return old[j]
+        return self._buckets[h % len(self._buckets)]
+
+    def _migrate(self, n: int) -> None:
+        """Mueve hasta n buckets viejos a la tabla nueva."""
+        old = self._old_buckets
+        if old is None:
+            return
+        buckets = self._buckets
+        cap = len(buckets)
+        end = min(self._migrated + n, len(old))
+        c = self.counters
+        for j in range(self._migrated, end):
+            if c is not None:
+                c.rehash_moves += len(old[j])
+            for e in old[j]:
+                buckets[e.hash % cap].append(e)
+            old[j] = []
+        self._migrated = end
+        if end == len(old):
+            self._old_buckets = None
+            self._migrated = 0
+
     def _maybe_resize(self) -> None:
         if self.load_factor() <= 0.75:
             return
-        self._rehash(self.capacity() * 2)
+        if not self._incremental:
+            self._rehash(self.capacity() * 2)
+            return
+        if self._old_buckets is not None:
+            self._migrate(len(self._old_buckets))
+        self._old_buckets = self._buckets
+        self._buckets = [[] for _ in range(self.capacity() * 2)]
+        self._migrated = 0
 
     def _rehash(self, new_capacity: int) -> None:
-        old_items = list(self.items())
-        self._buckets = [[] for _ in range(new_capacity)]
-        self._size = 0
-        for k, v in old_items:
-            self.set(k, v)
+        old_buckets = self._buckets
+        self._buckets = buckets = [[] for _ in range(new_capacity)]
+        if self.counters is not None:
+            self.counters.rehash_moves += self._size
+        for bucket in old_buckets:
+            for e in bucket:
+                buckets[e.hash % new_capacity].append(e)
+
+    def _count_probes(self, bucket: list[Entry[K, V]], hit: Entry[K, V] | None) -> None:
+        """Probes de un recorrido ya hecho: hasta `hit` o el bucket entero."""
+        c = self.counters
+        assert c is not None
+        if hit is None:
+            c.probes += len(bucket)
+        else:
+            c.probes += next(i for i, e in enumerate(bucket) if e is hit) + 1
 
     def set(self, key: K, value: V) -> None:
-        idx = self._index(key)
-        bucket = self._buckets[idx]
+        self._set_hashed(key, value, stable_hash(key))
+
+    def set_many(self, items: Iterable[tuple[K, V]]) -> None:
+        """Inserta un lote; los hashes se calculan juntos con stable_hash_many."""
+        pairs = list(items)
+        hashes = stable_hash_many(k for k, _v in pairs)
+        for (k, v), h in zip(pairs, hashes, strict=True):
+            self._set_hashed(k, v, h)
+
+    def _set_hashed(self, key: K, value: V, h: int) -> None:
+        self._migrate(self.MIGRATE_BUCKETS_PER_OP)
+        bucket = self._bucket_of(h)
         for e in bucket:
-            if e.key == key:
+            if e.hash == h and e.key == key:
+                if self.counters is not None:
+                    self._count_probes(bucket, e)
                 e.value = value
                 return
-        bucket.append(Entry(key, value))
+        if self.counters is not None:
+            self._count_probes(bucket, None)
+        bucket.append(Entry(key, value, h))
         self._size += 1
         self._maybe_resize()
 
     def get(self, key: K) -> V:
-        idx = self._index(key)
-        bucket = self._buckets[idx]
+        self._migrate(self.MIGRATE_BUCKETS_PER_OP)
+        h = stable_hash(key)
+        bucket = self._bucket_of(h)
         for e in bucket:
-            if e.key == key:
+            if e.hash == h and e.key == key:
+                if self.counters is not None:
+                    self._count_probes(bucket, e)
                 return e.value
+        if self.counters is not None:
+            self._count_probes(bucket, None)
         raise KeyError(key)
 
     def has(self, key: K) -> bool:
@@ -85,24 +252,39 @@ class HashTable(Generic[K, V]):
             return False
 
     def delete(self, key: K) -> bool:
-        idx = self._index(key)
-        bucket = self._buckets[idx]
+        self._migrate(self.MIGRATE_BUCKETS_PER_OP)
+        h = stable_hash(key)
+        bucket = self._bucket_of(h)
         for i, e in enumerate(bucket):
-            if e.key == key:
+            if e.hash == h and e.key == key:
+                if self.counters is not None:
+                    self.counters.probes += i + 1
                 bucket.pop(i)
                 self._size -= 1
                 return True
+        if self.counters is not None:
+            self.counters.probes += len(bucket)
         return False
 
     def items(self) -> Iterable[tuple[K, V]]:
         for bucket in self._buckets:
             for e in bucket:
                 yield (e.key, e.value)
+        if self._old_buckets is not None:
+            for bucket in self._old_buckets[self._migrated :]:
+                for e in bucket:
+                    yield (e.key, e.value)
 
     def snapshot(self) -> dict[str, object]:
+        old = self._old_buckets
         return {
+            "engine": "chaining",
             "capacity": self.capacity(),
             "size": self._size,
             "load_factor": self.load_factor(),
             "buckets": [[(e.key, e.value) for e in b] for b in self._buckets],
+            # progreso de la migración incremental (None si no hay una en curso)
+            "old_buckets": None if old is None else [[(e.key, e.value) for e in b] for b in old],
+            "migrated": self._migrated,
+            "migration_progress": 1.0 if old is None else self._migrated / len(old),
         }
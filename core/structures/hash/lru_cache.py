@@ -0,0 +1,139 @@
+"""
+Cache LRU sobre OrderedMap y el decorador lru_memoize.
+
+La lista doble de OrderedMap queda ordenada de menos a más reciente: un acierto
+mueve el nodo al final y, al pasar maxsize, se desaloja el primero. get, set y
+el desalojo son O(1): una búsqueda en el HashTable y unos relinks de la lista.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+from functools import wraps
+from typing import Any, ParamSpec, TypeVar
+
+from core.structures.hash.ordered_map import OrderedMap
+
+K = TypeVar("K")
+V = TypeVar("V")
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+class LRUCache(OrderedMap[K, V]):
+    """
+    OrderedMap con tope de maxsize entradas y política LRU.
+
+    get cuenta hits/misses (KeyError en un miss, como OrderedMap.get) y
+    peek consulta sin tocar ni el orden ni los contadores. on_evict(key, value)
+    se llama con cada entrada desalojada por capacidad (no con delete/clear).
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        *,
+        on_evict: Callable[[K, V], None] | None = None,
+        engine: str = "chaining",
+    ) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be > 0")
+        super().__init__(engine=engine)
+        self.maxsize = maxsize
+        self.on_evict = on_evict
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: K) -> V:
+        try:
+            node = self._index.get(key)
+        except KeyError:
+            self.misses += 1
+            raise
+        self.hits += 1
+        self._move_node(node)
+        return node.value
+
+    def peek(self, key: K) -> V:
+        return self._index.get(key).value
+
+    def set(self, key: K, value: V) -> None:
+        try:
+            node = self._index.get(key)
+        except KeyError:
+            super().set(key, value)
+            if self._size > self.maxsize:
+                self.evict()
+            return
+        node.value = value
+        self._move_node(node)
+
+    put = set
+
+    def evict(self) -> tuple[K, V]:
+        """Desaloja la entrada menos reciente. KeyError si está vacío."""
+        key, value = self.pop_first()
+        self.evictions += 1
+        if self.on_evict is not None:
+            self.on_evict(key, value)
+        return key, value
+
+    def clear(self) -> None:
+        """Vacía el cache (sin on_evict); los contadores se mantienen."""
+        while self._head is not None:
+            self.pop_first()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": self._size,
+            "maxsize": self.maxsize,
+        }
+
+    def snapshot(self) -> dict[str, object]:
+        return {**super().snapshot(), **self.stats()}
+
+
+_KWARGS_MARK = object()
+
+
+def _make_key(args: tuple[Any, ...], kwargs: dict[str, Any]) -> Hashable:
+    if not kwargs:
+        # un solo int/str va suelto (hash más barato); una tupla no, o f((1, 2))
+        # chocaría con f(1, 2)
+        if len(args) == 1 and type(args[0]) in (int, str):
+            return args[0]
+        return args
+    return (*args, _KWARGS_MARK, *sorted(kwargs.items()))
+
+
+def lru_memoize(maxsize: int = 128) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """
+    Memoiza una función en un LRUCache (argumentos hasheables).
+
+    La función decorada expone .cache (el LRUCache, con stats()) y
+    .cache_clear().
+    """
+
+    def decorate(fn: Callable[P, R]) -> Callable[P, R]:
+        cache: LRUCache[Hashable, R] = LRUCache(maxsize)
+
+        @wraps(fn)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            key = _make_key(args, kwargs)
+            try:
+                return cache.get(key)
+            except KeyError:
+                pass
+            result = fn(*args, **kwargs)
+            cache.set(key, result)
+            return result
+
+        wrapper.cache = cache  # type: ignore[attr-defined]
+        wrapper.cache_clear = cache.clear  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorate
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable
+from typing import TypeVar
+
+from core.structures.hash.hash_table import HashTable, stable_hash
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+_EMPTY = -1
+_DELETED = -2  # tombstone
+
+
+class OpenAddressingHashTable(HashTable[K, V]):
+    """
+    Motor de direccionamiento abierto (linear probing + tombstones).
+
+    En vez de una lista de `Entry` por bucket, usa arrays paralelos:
+      _hashes: array('q') con el hash de 32 bits de cada slot (o EMPTY/DELETED)
+      _keys / _values: listas planas del mismo largo
+
+    Sin objetos por entrada ni listas por bucket, y el probe recorre slots
+    contiguos. Se crea con `HashTable(capacity, engine="open")`.
+    """
+
+    def __init__(
+        self, capacity: int = 8, *, engine: str = "open", incremental: bool = False
+    ) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be > 0")
+        if incremental:
+            raise ValueError("incremental resize is only supported by the chaining engine")
+        self._size = 0
+        self._alloc(capacity)
+
+    def _alloc(self, capacity: int) -> None:
+        self._hashes = array("q", [_EMPTY]) * capacity
+        self._keys: list[K | None] = [None] * capacity
+        self._values: list[V | None] = [None] * capacity
+        self._tombstones = 0
+
+    def capacity(self) -> int:
+        return len(self._hashes)
+
+    def is_migrating(self) -> bool:
+        return False  # siempre rehashea de golpe (no hay modo incremental)
+
+    def _probe(self, key: K, h: int) -> tuple[int, int]:
+        """
+        Recorre desde el slot home.
+        :returns (slot con la key o -1, primer slot reutilizable para insertar)
+        """
+        hashes = self._hashes
+        keys = self._keys
+        cap = len(hashes)
+        home = i = h % cap
+        free = -1
+        c = self.counters
+        while True:
+            sh = hashes[i]
+            if sh == _EMPTY:
+                if c is not None:
+                    c.probes += (i - home) % cap + 1  # home..i con wrap
+                return -1, (i if free < 0 else free)
+            if sh == _DELETED:
+                if free < 0:
+                    free = i
+            elif sh == h and keys[i] == key:
+                if c is not None:
+                    c.probes += (i - home) % cap + 1
+                return i, free
+            i += 1
+            if i == cap:
+                i = 0
+
+    def _maybe_resize(self) -> None:
+        cap = self.capacity()
+        if (self._size + self._tombstones) / cap <= 0.75:
+            return
+        # Si lo que llena la tabla son tombstones, basta con compactar.
+        self._rehash(cap * 2 if self.load_factor() > 0.5 else cap)
+
+    def _rehash(self, new_capacity: int) -> None:
+        old = [
+            (h, k, v)
+            for h, k, v in zip(self._hashes, self._keys, self._values, strict=True)
+            if h >= 0
+        ]
+        self._alloc(new_capacity)
+        if self.counters is not None:
+            self.counters.rehash_moves += len(old)
+        hashes, keys, values = self._hashes, self._keys, self._values
+        for h, k, v in old:
+            # Reusa el hash guardado: no se vuelve a llamar stable_hash.
+            i = h % new_capacity
+            while hashes[i] != _EMPTY:
+                i = (i + 1) % new_capacity
+            hashes[i] = h
+            keys[i] = k
+            values[i] = v
+
+    def _set_hashed(self, key: K, value: V, h: int) -> None:
+        i, free = self._probe(key, h)
+        if i >= 0:
+            self._values[i] = value
+            return
+        if self._hashes[free] == _DELETED:
+            self._tombstones -= 1
+        self._hashes[free] = h
+        self._keys[free] = key
+        self._values[free] = value
+        self._size += 1
+        self._maybe_resize()
+
+    def get(self, key: K) -> V:
+        i, _ = self._probe(key, stable_hash(key))
+        if i < 0:
+            raise KeyError(key)
+        return self._values[i]  # type: ignore[return-value]
+
+    def has(self, key: K) -> bool:
+        return self._probe(key, stable_hash(key))[0] >= 0
+
+    def delete(self, key: K) -> bool:
+        i, _ = self._probe(key, stable_hash(key))
+        if i < 0:
+            return False
+        self._hashes[i] = _DELETED
+        self._keys[i] = None
+        self._values[i] = None
+        self._size -= 1
+        self._tombstones += 1
+        return True
+
+    def items(self) -> Iterable[tuple[K, V]]:
+        for h, k, v in zip(self._hashes, self._keys, self._values, strict=True):
+            if h >= 0:
+                yield (k, v)  # type: ignore[misc]
+
+    def snapshot(self) -> dict[str, object]:
+        # Un "bucket" por slot (0 o 1 entrada) para reutilizar los renders de chaining.
+        return {
+            "engine": "open",
+            "capacity": self.capacity(),
+            "size": self._size,
+            "load_factor": self.load_factor(),
+            "tombstones": self._tombstones,
+            "buckets": [
+                [(k, v)] if h >= 0 else []
+                for h, k, v in zip(self._hashes, self._keys, self._values, strict=True)
+            ],
+        }
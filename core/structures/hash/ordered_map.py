@@ -4,6 +4,7 @@ from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Generic, TypeVar
 
+from core.structures.counters import Instrumented, OpCounters
 from core.structures.hash.hash_table import HashTable
 
 K = TypeVar("K")
@@ -18,9 +19,11 @@ class _Node(Generic[K, V]):
     next: _Node[K, V] | None = None
 
 
-class OrderedMap(Generic[K, V]):
-    def __init__(self, capacity: int = 8) -> None:
-        self._index: HashTable[K, _Node[K, V]] = HashTable(capacity=capacity)
+class OrderedMap(Instrumented, Generic[K, V]):
+    """enable_counters() comparte los contadores de la HashTable índice."""
+
+    def __init__(self, capacity: int = 8, *, engine: str = "chaining") -> None:
+        self._index: HashTable[K, _Node[K, V]] = HashTable(capacity=capacity, engine=engine)
         self._head: _Node[K, V] | None = None
         self._tail: _Node[K, V] | None = None
         self._size = 0
@@ -28,6 +31,17 @@ class OrderedMap(Generic[K, V]):
     def __len__(self) -> int:
         return self._size
 
+    def load_factor(self) -> float:
+        return self._index.load_factor()
+
+    def enable_counters(self) -> OpCounters:
+        self.counters = self._index.enable_counters()
+        return self.counters
+
+    def disable_counters(self) -> None:
+        self._index.disable_counters()
+        self.counters = None
+
     def set(self, key: K, value: V) -> None:
         # update si existe
         try:
@@ -38,14 +52,7 @@ class OrderedMap(Generic[K, V]):
             pass
 
         node = _Node(key, value)
-
-        if self._tail is None:
-            self._head = self._tail = node
-        else:
-            node.prev = self._tail
-            self._tail.next = node
-            self._tail = node
-
+        self._link_last(node)
         self._index.set(key, node)
         self._size += 1
 
@@ -59,7 +66,29 @@ class OrderedMap(Generic[K, V]):
         except KeyError:
             return False
 
-        # unlink en lista
+        self._unlink(node)
+        self._index.delete(key)
+        self._size -= 1
+        return True
+
+    # ---------- Orden ----------
+    def _link_last(self, node: _Node[K, V]) -> None:
+        if self._tail is None:
+            self._head = self._tail = node
+        else:
+            node.prev = self._tail
+            self._tail.next = node
+            self._tail = node
+
+    def _link_first(self, node: _Node[K, V]) -> None:
+        if self._head is None:
+            self._head = self._tail = node
+        else:
+            node.next = self._head
+            self._head.prev = node
+            self._head = node
+
+    def _unlink(self, node: _Node[K, V]) -> None:
         if node.prev is None:
             self._head = node.next
         else:
@@ -72,9 +101,34 @@ class OrderedMap(Generic[K, V]):
 
         node.prev = node.next = None
 
-        self._index.delete(key)
-        self._size -= 1
-        return True
+    def _move_node(self, node: _Node[K, V], last: bool = True) -> None:
+        if (self._tail if last else self._head) is node:
+            return
+        self._unlink(node)
+        if last:
+            self._link_last(node)
+        else:
+            self._link_first(node)
+
+    def move_to_end(self, key: K, last: bool = True) -> None:
+        """Mueve key al final (o al principio con last=False). KeyError si no existe."""
+        self._move_node(self._index.get(key), last)
+
+    def pop_first(self) -> tuple[K, V]:
+        """Saca y devuelve el par más viejo. KeyError si está vacío."""
+        if self._head is None:
+            raise KeyError("pop_first from empty OrderedMap")
+        node = self._head
+        self.delete(node.key)
+        return node.key, node.value
+
+    def pop_last(self) -> tuple[K, V]:
+        """Saca y devuelve el par más nuevo. KeyError si está vacío."""
+        if self._tail is None:
+            raise KeyError("pop_last from empty OrderedMap")
+        node = self._tail
+        self.delete(node.key)
+        return node.key, node.value
 
     def items(self) -> Iterable[tuple[K, V]]:
         cur = self._head
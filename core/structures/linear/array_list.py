@@ -1,16 +1,47 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass
-from typing import Generic, TypeVar
+from typing import Any, Generic, TypeVar
+
+from core.structures.linear.typed_storage import DTYPES
 
 T = TypeVar("T")
 
+ENGINES = ("list", "blocked")
+
 
 @dataclass
 class ArrayList(Generic[T]):
+    """
+    Lista dinámica sobre una list de Python.
+
+    ArrayList(dtype="int64") (o cualquier DTYPES) devuelve un TypedArrayList:
+    mismo API, valores en un buffer contiguo tipado.
+    ArrayList(engine="blocked") devuelve un BlockedArrayList: bloques acotados,
+    insert/pop_at en posiciones intermedias sin correr toda la cola.
+    """
+
     _items: list[T]
 
-    def __init__(self) -> None:
+    def __new__(cls, *, dtype: str | None = None, engine: str = "list") -> Any:
+        if engine not in ENGINES:
+            raise ValueError(f"engine must be one of {ENGINES}")
+        if dtype is not None and dtype not in DTYPES:
+            raise ValueError(f"dtype must be one of {DTYPES}")
+        if dtype is not None and engine != "list":
+            raise ValueError("dtype is only supported with engine='list'")
+        if cls is ArrayList and dtype is not None:
+            from core.structures.linear.typed_array_list import TypedArrayList
+
+            return super().__new__(TypedArrayList)
+        if cls is ArrayList and engine == "blocked":
+            from core.structures.linear.blocked_array_list import BlockedArrayList
+
+            return super().__new__(BlockedArrayList)
+        return super().__new__(cls)
+
+    def __init__(self, *, dtype: str | None = None, engine: str = "list") -> None:
         self._items = []
 
     def __len__(self) -> int:
@@ -56,3 +87,26 @@ class ArrayList(Generic[T]):
 
     def clear(self) -> None:
         self._items.clear()
+
+    # ---------- Bulk ----------
+    def extend(self, values: Iterable[T]) -> None:
+        self._items.extend(values)
+
+    def insert_many(self, index: int, values: Iterable[T]) -> None:
+        """Inserta todos los values a partir de index con un solo corrimiento: O(n + m)."""
+        self._items[index:index] = list(values)
+
+    def take(self, indices: Iterable[int]) -> list[T]:
+        """Valores en esas posiciones (IndexError si alguna está fuera de rango)."""
+        return [self._items[i] for i in indices]
+
+    def find_all(self, value: T) -> list[int]:
+        """Todas las posiciones donde aparece value."""
+        return [i for i, v in enumerate(self._items) if v == value]
+
+    def argsort(self) -> list[int]:
+        """Posiciones que ordenarían la lista (estable)."""
+        return sorted(range(len(self._items)), key=self._items.__getitem__)
+
+    def sort(self, *, reverse: bool = False) -> None:
+        self._items.sort(reverse=reverse)  # type: ignore[call-overload]
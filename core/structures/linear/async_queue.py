@@ -0,0 +1,238 @@
+"""
+Queue y DequeDS acotadas para asyncio.
+
+  AsyncQueue  FIFO sobre Queue: put / get
+  AsyncDeque  sobre DequeDS: put / put_front / get / get_back
+
+put espera mientras la estructura tenga `capacity` items (backpressure) y get
+espera mientras esté vacía. Las variantes *_nowait no esperan: OverflowError
+si está llena, IndexError si está vacía (como RingBuffer.write/read).
+
+Cancelar un put/get/get_batch no pierde items: el item se mueve recién
+después del último await, y si una tarea despertada se cancela, el aviso pasa
+a la siguiente en espera (mismo esquema que asyncio.Queue).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from typing import Any, Generic, TypeVar
+
+from core.structures.linear.deque_ds import DequeDS
+from core.structures.linear.queue import Queue
+
+T = TypeVar("T")
+
+
+def _wakeup_next(waiters: deque[asyncio.Future[None]]) -> None:
+    while waiters:
+        fut = waiters.popleft()
+        if not fut.done():
+            fut.set_result(None)
+            return
+
+
+def _release(fut: asyncio.Future[None]) -> None:
+    if not fut.done():
+        fut.set_result(None)
+
+
+class _AsyncBounded(Generic[T]):
+    """Esperas y avisos compartidos; las subclases eligen la estructura y los extremos."""
+
+    _items: Any  # Queue | DequeDS
+
+    def __init__(self, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be > 0")
+        self._cap = capacity
+        self._n = 0  # len() propio: evita pasar por __len__ de la estructura en cada operación
+        self._getters: deque[asyncio.Future[None]] = deque()
+        self._putters: deque[asyncio.Future[None]] = deque()
+        # get_batch con timeout espera aparte: un put lo despierta sin gastar
+        # el aviso que le corresponde a un get()
+        self._lingering: list[asyncio.Future[None]] = []
+
+    def capacity(self) -> int:
+        return self._cap
+
+    def __len__(self) -> int:
+        return self._n
+
+    def is_empty(self) -> bool:
+        return self._n == 0
+
+    def is_full(self) -> bool:
+        return self._n >= self._cap
+
+    def _has_room(self) -> bool:
+        return self._n < self._cap
+
+    def _has_items(self) -> bool:
+        return self._n > 0
+
+    def to_list(self) -> list[T]:
+        return self._items.to_list()
+
+    # ---------- Esperas ----------
+    async def _wait(self, waiters: deque[asyncio.Future[None]], ready: Callable[[], bool]) -> None:
+        loop = asyncio.get_running_loop()
+        while not ready():
+            fut: asyncio.Future[None] = loop.create_future()
+            waiters.append(fut)
+            try:
+                await fut
+            except BaseException:
+                fut.cancel()
+                with suppress(ValueError):  # ya lo habían despertado
+                    waiters.remove(fut)
+                if ready() and not fut.cancelled():
+                    _wakeup_next(waiters)  # el aviso era para esta tarea: pasarlo
+                raise
+
+    def _pushed(self) -> None:
+        self._n += 1
+        if self._getters:
+            _wakeup_next(self._getters)
+        if self._lingering:
+            for fut in self._lingering:
+                _release(fut)
+            self._lingering.clear()
+
+    def _popped(self, k: int = 1) -> None:
+        self._n -= k
+        for _ in range(k):
+            if not self._putters:
+                break
+            _wakeup_next(self._putters)
+
+    # camino rápido sin await cuando hay lugar / hay items
+    async def _put(self, push: Callable[[T], None], item: T) -> None:
+        if self._n >= self._cap:
+            await self._wait(self._putters, self._has_room)
+        push(item)
+        self._pushed()
+
+    def _put_nowait(self, push: Callable[[T], None], item: T) -> None:
+        if self._n >= self._cap:
+            raise OverflowError(f"put into full {type(self).__name__}")
+        push(item)
+        self._pushed()
+
+    async def _get(self, pop: Callable[[], T]) -> T:
+        if not self._n:
+            await self._wait(self._getters, self._has_items)
+        item = pop()
+        self._popped()
+        return item
+
+    def _get_nowait(self, pop: Callable[[], T]) -> T:
+        if not self._n:
+            raise IndexError(f"get from empty {type(self).__name__}")
+        item = pop()
+        self._popped()
+        return item
+
+    # ---------- Batch ----------
+    async def _get_batch(
+        self, pop: Callable[[], T], max_n: int, timeout: float | None = None
+    ) -> list[T]:
+        """
+        Hasta max_n items desde el frente (pop saca uno).
+
+        timeout=None: espera al primer item y devuelve lo que haya (sin juntar).
+        Con timeout: espera hasta tener max_n (o capacity) items o hasta que
+        venza el plazo, y devuelve lo que haya entonces (puede ser []).
+        """
+        if max_n < 0:
+            raise ValueError("max_n must be >= 0")
+        if max_n == 0:
+            return []
+        if timeout is None:
+            if not self._n:
+                await self._wait(self._getters, self._has_items)
+        else:
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + timeout
+            target = min(max_n, self._cap)
+            while self._n < target and loop.time() < deadline:
+                fut: asyncio.Future[None] = loop.create_future()
+                self._lingering.append(fut)
+                timer = loop.call_at(deadline, _release, fut)
+                try:
+                    await fut
+                finally:
+                    timer.cancel()
+                    if fut in self._lingering:
+                        self._lingering.remove(fut)
+        out = [pop() for _ in range(min(max_n, self._n))]
+        self._popped(len(out))
+        if self._n and self._getters:
+            _wakeup_next(self._getters)  # quedó algo: que siga otro get()
+        return out
+
+
+class AsyncQueue(_AsyncBounded[T]):
+    """
+    Queue FIFO acotada con put/get awaitables.
+
+    put/get devuelven directamente la corrutina de la base (sin un async def
+    intermedio): un frame menos por operación.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        super().__init__(capacity)
+        self._items: Queue[T] = Queue()
+
+    def put(self, item: T) -> Awaitable[None]:
+        return self._put(self._items.enqueue, item)
+
+    def put_nowait(self, item: T) -> None:
+        self._put_nowait(self._items.enqueue, item)
+
+    def get(self) -> Awaitable[T]:
+        return self._get(self._items.dequeue)
+
+    def get_nowait(self) -> T:
+        return self._get_nowait(self._items.dequeue)
+
+    def get_batch(self, max_n: int, timeout: float | None = None) -> Awaitable[list[T]]:
+        return self._get_batch(self._items.dequeue, max_n, timeout)
+
+
+class AsyncDeque(_AsyncBounded[T]):
+    """DequeDS acotada: put/get por los extremos habituales, put_front/get_back por los otros."""
+
+    def __init__(self, capacity: int) -> None:
+        super().__init__(capacity)
+        self._items: DequeDS[T] = DequeDS()
+
+    def put(self, item: T) -> Awaitable[None]:
+        return self._put(self._items.push_back, item)
+
+    def put_front(self, item: T) -> Awaitable[None]:
+        return self._put(self._items.push_front, item)
+
+    def put_nowait(self, item: T) -> None:
+        self._put_nowait(self._items.push_back, item)
+
+    def put_front_nowait(self, item: T) -> None:
+        self._put_nowait(self._items.push_front, item)
+
+    def get(self) -> Awaitable[T]:
+        return self._get(self._items.pop_front)
+
+    def get_back(self) -> Awaitable[T]:
+        return self._get(self._items.pop_back)
+
+    def get_nowait(self) -> T:
+        return self._get_nowait(self._items.pop_front)
+
+    def get_back_nowait(self) -> T:
+        return self._get_nowait(self._items.pop_back)
+
+    def get_batch(self, max_n: int, timeout: float | None = None) -> Awaitable[list[T]]:
+        return self._get_batch(self._items.pop_front, max_n, timeout)
@@ -0,0 +1,243 @@
+"""
+ArrayList por bloques: ArrayList(engine="blocked") devuelve esta clase.
+
+Los items viven en una lista de bloques (listas de a lo sumo 2 * LOAD items).
+Un Fenwick tree sobre los largos de los bloques traduce una posición global a
+(bloque, offset) en O(log(n / LOAD)).
+
+  insert/pop_at en el medio  O(LOAD + log n): solo se corre un bloque
+  get/set                    O(log n)
+  append/pop                 O(1) amortizado + O(log n) del índice
+
+Partir o fusionar bloques cambia la cantidad de bloques: el índice se marca
+sucio y se reconstruye en O(n / LOAD) en la próxima consulta posicional.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from itertools import chain
+from typing import TypeVar
+
+from core.structures.linear.array_list import ArrayList
+
+T = TypeVar("T")
+
+LOAD = 512
+
+
+class BlockedArrayList(ArrayList[T]):
+    def __init__(self, *, dtype: str | None = None, engine: str = "blocked") -> None:
+        self._blocks: list[list[T]] = []
+        self._size = 0
+        self._tree: list[int] = [0]  # Fenwick 1-indexed sobre len(bloque)
+        self._dirty = False
+
+    # ---------- Índice posicional ----------
+    def _rebuild(self) -> None:
+        nb = len(self._blocks)
+        tree = [0] + [len(b) for b in self._blocks]
+        for i in range(1, nb + 1):
+            j = i + (i & -i)
+            if j <= nb:
+                tree[j] += tree[i]
+        self._tree = tree
+        self._dirty = False
+
+    def _add(self, b: int, delta: int) -> None:
+        if self._dirty:
+            return  # se recalcula entero en la próxima consulta
+        tree = self._tree
+        i = b + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def _locate(self, index: int) -> tuple[int, int]:
+        """(bloque, offset) de una posición ya validada."""
+        if self._dirty:
+            self._rebuild()
+        tree = self._tree
+        nb = len(tree) - 1
+        pos = 0
+        step = 1 << (nb.bit_length() - 1) if nb else 0
+        while step:
+            nxt = pos + step
+            if nxt <= nb and tree[nxt] <= index:
+                pos = nxt
+                index -= tree[nxt]
+            step >>= 1
+        return pos, index
+
+    def _check(self, index: int, msg: str = "ArrayList index out of range") -> int:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError(msg)
+        return index
+
+    # ---------- Mantenimiento de bloques ----------
+    def _grew(self, b: int) -> None:
+        block = self._blocks[b]
+        if len(block) > 2 * LOAD:
+            self._blocks.insert(b + 1, block[LOAD:])
+            del block[LOAD:]
+            self._dirty = True
+        else:
+            self._add(b, 1)
+
+    def _shrank(self, b: int) -> None:
+        block = self._blocks[b]
+        if not block:
+            del self._blocks[b]
+            self._dirty = True
+        elif len(block) < LOAD // 2 and len(self._blocks) > 1:
+            # fusionar con un vecino (y volver a partir si quedó grande)
+            left = b - 1 if b > 0 else b
+            merged = self._blocks[left] + self._blocks[left + 1]
+            self._blocks[left : left + 2] = self._chunks(merged)
+            self._dirty = True
+        else:
+            self._add(b, -1)
+
+    @staticmethod
+    def _chunks(items: list[T]) -> list[list[T]]:
+        if len(items) <= 2 * LOAD:
+            return [items] if items else []
+        return [items[i : i + LOAD] for i in range(0, len(items), LOAD)]
+
+    def _reset(self, items: list[T]) -> None:
+        self._blocks = [items[i : i + LOAD] for i in range(0, len(items), LOAD)]
+        self._size = len(items)
+        self._dirty = True
+
+    # ---------- API ----------
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BlockedArrayList):
+            return NotImplemented
+        return self.to_list() == other.to_list()
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"BlockedArrayList({self.to_list()!r})"
+
+    @property
+    def block_count(self) -> int:
+        return len(self._blocks)
+
+    def is_empty(self) -> bool:
+        return self._size == 0
+
+    def to_list(self) -> list[T]:
+        return list(chain.from_iterable(self._blocks))
+
+    def get(self, index: int) -> T:
+        b, o = self._locate(self._check(index))
+        return self._blocks[b][o]
+
+    def set(self, index: int, value: T) -> None:
+        b, o = self._locate(self._check(index))
+        self._blocks[b][o] = value
+
+    def append(self, value: T) -> None:
+        if not self._blocks:
+            self._blocks.append([value])
+            self._dirty = True
+        else:
+            self._blocks[-1].append(value)
+            self._grew(len(self._blocks) - 1)
+        self._size += 1
+
+    def insert(self, index: int, value: T) -> None:
+        # mismas reglas que list.insert: fuera de rango se pega al borde
+        n = self._size
+        index = max(0, index + n) if index < 0 else min(index, n)
+        if index == n:
+            self.append(value)
+            return
+        b, o = self._locate(index)
+        self._blocks[b].insert(o, value)
+        self._grew(b)
+        self._size += 1
+
+    def pop(self) -> T:
+        if not self._size:
+            raise IndexError("pop from empty ArrayList")
+        b = len(self._blocks) - 1
+        value = self._blocks[b].pop()
+        self._shrank(b)
+        self._size -= 1
+        return value
+
+    def pop_at(self, index: int) -> T:
+        if not self._size:
+            raise IndexError("pop_at from empty ArrayList")
+        b, o = self._locate(self._check(index, "pop index out of range"))
+        value = self._blocks[b].pop(o)
+        self._shrank(b)
+        self._size -= 1
+        return value
+
+    def remove_first(self, value: T) -> bool:
+        for b, block in enumerate(self._blocks):
+            try:
+                o = block.index(value)
+            except ValueError:
+                continue
+            del block[o]
+            self._shrank(b)
+            self._size -= 1
+            return True
+        return False
+
+    def clear(self) -> None:
+        self._blocks = []
+        self._size = 0
+        self._dirty = True
+
+    # ---------- Bulk ----------
+    def extend(self, values: Iterable[T]) -> None:
+        new = list(values)
+        if not new:
+            return
+        self._size += len(new)
+        if self._blocks and len(self._blocks[-1]) < LOAD:
+            room = LOAD - len(self._blocks[-1])
+            self._blocks[-1].extend(new[:room])
+            new = new[room:]
+        self._blocks.extend(new[i : i + LOAD] for i in range(0, len(new), LOAD))
+        self._dirty = True
+
+    def insert_many(self, index: int, values: Iterable[T]) -> None:
+        """Inserta todos los values a partir de index rehaciendo solo un bloque."""
+        new = list(values)
+        n = self._size
+        index = max(0, index + n) if index < 0 else min(index, n)
+        if index == n:
+            self.extend(new)
+            return
+        b, o = self._locate(index)
+        block = self._blocks[b]
+        self._blocks[b : b + 1] = self._chunks(block[:o] + new + block[o:])
+        self._size += len(new)
+        self._dirty = True
+
+    def take(self, indices: Iterable[int]) -> list[T]:
+        return [self.get(i) for i in indices]
+
+    def find_all(self, value: T) -> list[int]:
+        return [i for i, v in enumerate(chain.from_iterable(self._blocks)) if v == value]
+
+    def argsort(self) -> list[int]:
+        flat = self.to_list()
+        return sorted(range(len(flat)), key=flat.__getitem__)
+
+    def sort(self, *, reverse: bool = False) -> None:
+        self._reset(sorted(self.to_list(), reverse=reverse))  # type: ignore[type-var]
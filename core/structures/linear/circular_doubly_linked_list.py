@@ -3,6 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Generic, TypeVar
 
+from core.structures.counters import Instrumented
+
 T = TypeVar("T")
 
 
@@ -13,7 +15,9 @@ class CDNode(Generic[T]):
     next: CDNode[T] | None = None
 
 
-class CircularDoublyLinkedList(Generic[T]):
+class CircularDoublyLinkedList(Instrumented, Generic[T]):
+    """enable_counters(): hops (avances por .next/.prev) en búsquedas, borrados y rotaciones."""
+
     def __init__(self) -> None:
         self.head: CDNode[T] | None = None
         self._size: int = 0
@@ -110,6 +114,8 @@ class CircularDoublyLinkedList(Generic[T]):
         if self.head is None or self._size <= 1:
             return
         steps = k % self._size
+        if self.counters is not None:
+            self.counters.hops += steps
         for _ in range(steps):
             assert self.head is not None and self.head.next is not None
             self.head = self.head.next
@@ -118,6 +124,8 @@ class CircularDoublyLinkedList(Generic[T]):
         if self.head is None or self._size <= 1:
             return
         steps = k % self._size
+        if self.counters is not None:
+            self.counters.hops += steps
         for _ in range(steps):
             assert self.head is not None and self.head.prev is not None
             self.head = self.head.prev
@@ -129,9 +137,13 @@ class CircularDoublyLinkedList(Generic[T]):
         cur = self.head
         for i in range(self._size):
             if cur.value == value:
+                if self.counters is not None:
+                    self.counters.hops += i
                 return i
             assert cur.next is not None
             cur = cur.next
+        if self.counters is not None:
+            self.counters.hops += self._size
         return None
 
     def delete(self, value: T) -> bool:
@@ -146,6 +158,8 @@ class CircularDoublyLinkedList(Generic[T]):
             return 0
         removed = 0
         n = self._size
+        if self.counters is not None:
+            self.counters.hops += n
         cur = self.head
         for _ in range(n):
             if cur is None:
@@ -185,11 +199,15 @@ class CircularDoublyLinkedList(Generic[T]):
         if self.head is None:
             return None
         cur = self.head
-        for _ in range(self._size):
+        for i in range(self._size):
             if cur.value == value:
+                if self.counters is not None:
+                    self.counters.hops += i
                 return cur
             assert cur.next is not None
             cur = cur.next
+        if self.counters is not None:
+            self.counters.hops += self._size
         return None
 
     def _unlink(self, node: CDNode[T]) -> None:
@@ -0,0 +1,191 @@
+"""
+Colas acotadas para pasar items entre threads.
+
+  SPSCRingBuffer  un productor y un consumidor: sin lock en el camino rápido
+  MPMCQueue       varios productores y consumidores: un lock y dos Conditions
+
+Las dos bloquean en put/get (con timeout opcional) y tienen get_many para
+consumir en lotes. Con block=False se comportan como RingBuffer.write/read:
+OverflowError si está llena, IndexError si está vacía. Un timeout vencido
+levanta TimeoutError.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class SPSCRingBuffer(Generic[T]):
+    """
+    Ring buffer para exactamente un thread productor y un thread consumidor.
+
+    _tail (items escritos) solo lo modifica el productor y _head (items leídos)
+    solo el consumidor; son contadores monótonos y el slot es contador % capacidad.
+    Cada lado lee el contador del otro para saber si hay lugar o datos, así que
+    put/get no comparten lock. El Condition solo se usa cuando un lado tiene que
+    dormir: se anota en _put_waiting/_get_waiting y el otro lado lo despierta.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be > 0")
+        self._buf: list[T | None] = [None] * capacity
+        self._cap = capacity
+        self._head = 0
+        self._tail = 0
+        self._cond = threading.Condition()
+        self._put_waiting = False
+        self._get_waiting = False
+
+    def capacity(self) -> int:
+        return self._cap
+
+    def __len__(self) -> int:
+        """Aproximado mientras los dos threads trabajan."""
+        return self._tail - self._head
+
+    def is_empty(self) -> bool:
+        return self._tail == self._head
+
+    def is_full(self) -> bool:
+        return self._tail - self._head == self._cap
+
+    def _wait(self, ready: Callable[[], bool], timeout: float | None, flag: str) -> None:
+        with self._cond:
+            # el flag se anota antes de volver a mirar ready(): si el otro lado
+            # avanzó sin ver el flag, ready() ya da True y no se duerme
+            setattr(self, flag, True)
+            try:
+                if not self._cond.wait_for(ready, timeout):
+                    raise TimeoutError(f"SPSCRingBuffer wait timed out after {timeout}s")
+            finally:
+                setattr(self, flag, False)
+
+    def _wake(self) -> None:
+        with self._cond:
+            self._cond.notify_all()
+
+    # ---------- Productor ----------
+    def put(self, value: T, block: bool = True, timeout: float | None = None) -> None:
+        if self._tail - self._head == self._cap:
+            if not block:
+                raise OverflowError("put into full SPSCRingBuffer")
+            self._wait(lambda: self._tail - self._head < self._cap, timeout, "_put_waiting")
+        self._buf[self._tail % self._cap] = value
+        self._tail += 1  # publica el slot recién escrito
+        if self._get_waiting:
+            self._wake()
+
+    # ---------- Consumidor ----------
+    def get(self, block: bool = True, timeout: float | None = None) -> T:
+        if self._tail == self._head:
+            if not block:
+                raise IndexError("get from empty SPSCRingBuffer")
+            self._wait(lambda: self._tail != self._head, timeout, "_get_waiting")
+        i = self._head % self._cap
+        value = self._buf[i]
+        self._buf[i] = None
+        self._head += 1  # libera el slot para el productor
+        if self._put_waiting:
+            self._wake()
+        return value  # type: ignore[return-value]
+
+    def get_many(self, n: int, block: bool = True, timeout: float | None = None) -> list[T]:
+        """
+        Hasta n items con a lo sumo dos slices. Si está vacía espera al primero
+        (o devuelve [] con block=False); no espera a juntar n.
+        """
+        if n < 0:
+            raise ValueError("n must be >= 0")
+        if n and self._tail == self._head:
+            if not block:
+                return []
+            self._wait(lambda: self._tail != self._head, timeout, "_get_waiting")
+        n = min(n, self._tail - self._head)
+        start = self._head % self._cap
+        first = min(n, self._cap - start)
+        out = self._buf[start : start + first] + self._buf[: n - first]
+        self._buf[start : start + first] = [None] * first
+        self._buf[: n - first] = [None] * (n - first)
+        self._head += n
+        if n and self._put_waiting:
+            self._wake()
+        return out  # type: ignore[return-value]
+
+
+class MPMCQueue(Generic[T]):
+    """
+    Cola acotada para cualquier cantidad de productores y consumidores.
+
+    Un deque acotado a mano protegido por un lock, con dos Conditions sobre ese
+    lock (not_empty / not_full) para que put y get esperen sin busy-wait.
+    get_many desencola un lote con una sola toma del lock.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be > 0")
+        self._items: deque[T] = deque()
+        self._cap = capacity
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    def capacity(self) -> int:
+        return self._cap
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._items)
+
+    def is_empty(self) -> bool:
+        with self._lock:
+            return not self._items
+
+    def is_full(self) -> bool:
+        with self._lock:
+            return len(self._items) == self._cap
+
+    def put(self, value: T, block: bool = True, timeout: float | None = None) -> None:
+        with self._not_full:
+            if len(self._items) == self._cap:
+                if not block:
+                    raise OverflowError("put into full MPMCQueue")
+                if not self._not_full.wait_for(lambda: len(self._items) < self._cap, timeout):
+                    raise TimeoutError(f"MPMCQueue put timed out after {timeout}s")
+            self._items.append(value)
+            self._not_empty.notify()
+
+    def get(self, block: bool = True, timeout: float | None = None) -> T:
+        with self._not_empty:
+            if not self._items:
+                if not block:
+                    raise IndexError("get from empty MPMCQueue")
+                if not self._not_empty.wait_for(lambda: bool(self._items), timeout):
+                    raise TimeoutError(f"MPMCQueue get timed out after {timeout}s")
+            value = self._items.popleft()
+            self._not_full.notify()
+            return value
+
+    def get_many(self, n: int, block: bool = True, timeout: float | None = None) -> list[T]:
+        """
+        Hasta n items en una sola toma del lock. Si está vacía espera al primero
+        (o devuelve [] con block=False); no espera a juntar n.
+        """
+        if n < 0:
+            raise ValueError("n must be >= 0")
+        with self._not_empty:
+            if n and not self._items:
+                if not block:
+                    return []
+                if not self._not_empty.wait_for(lambda: bool(self._items), timeout):
+                    raise TimeoutError(f"MPMCQueue get_many timed out after {timeout}s")
+            popleft = self._items.popleft
+            out = [popleft() for _ in range(min(n, len(self._items)))]
+            self._not_full.notify(len(out))
+            return out
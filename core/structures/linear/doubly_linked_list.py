@@ -3,6 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Generic, TypeVar
 
+from core.structures.counters import Instrumented
+
 T = TypeVar("T")
 
 
@@ -13,11 +15,20 @@ class DNode(Generic[T]):
     next: DNode[T] | None = None
 
 
-class DoublyLinkedList(Generic[T]):
+class DoublyLinkedList(Instrumented, Generic[T]):
+    """
+    _finger: (índice, nodo) del último acceso por índice.
+    _node_at arranca desde el más cercano entre head, tail y finger.
+
+    enable_counters(): hops (avances por .next/.prev) en búsquedas, borrados
+    y accesos por índice.
+    """
+
     def __init__(self) -> None:
         self.head: DNode[T] | None = None
         self.tail: DNode[T] | None = None
         self._size: int = 0
+        self._finger: tuple[int, DNode[T]] | None = None
 
     def push_front(self, value: T) -> None:
         node = DNode(value, None, next=self.head)
@@ -26,6 +37,9 @@ class DoublyLinkedList(Generic[T]):
         else:
             self.head.prev = node
             self.head = node
+        if self._finger is not None:
+            i, f = self._finger
+            self._finger = (i + 1, f)
         self._size += 1
 
     def push_back(self, value: T) -> None:
@@ -50,6 +64,9 @@ class DoublyLinkedList(Generic[T]):
             new_head.prev = None
             self.head = new_head
 
+        if self._finger is not None:
+            i, f = self._finger
+            self._finger = None if f is removed else (i - 1, f)
         self._size -= 1
         return removed.value
 
@@ -66,20 +83,28 @@ class DoublyLinkedList(Generic[T]):
             new_tail.next = None
             self.tail = new_tail
 
+        if self._finger is not None and self._finger[1] is removed:
+            self._finger = None
         self._size -= 1
         return removed.value
 
     def delete(self, value: T) -> bool:
         cur = self.head
+        c = self.counters
         while cur is not None:
             if cur.value == value:
                 self._unlink(cur)
                 self._size -= 1
+                self._finger = None
                 return True
             cur = cur.next
+            if c is not None:
+                c.hops += 1
         return False
 
     def delete_all(self, value: T) -> int:
+        if self.counters is not None:
+            self.counters.hops += self._size
         count = 0
         cur = self.head
         while cur is not None:
@@ -89,12 +114,17 @@ class DoublyLinkedList(Generic[T]):
                 count += 1
             cur = nxt
         self._size -= count
+        if count:
+            self._finger = None
         return count
 
     def delete_at(self, index: int) -> T:
         node = self._node_at(index)
+        nxt = node.next
         self._unlink(node)
         self._size -= 1
+        # El siguiente ocupa ahora el mismo índice.
+        self._finger = (index, nxt) if nxt is not None else None
         return node.value
 
     def find_index(self, value: T) -> int | None:
@@ -102,29 +132,35 @@ class DoublyLinkedList(Generic[T]):
         cur = self.head
         while cur is not None:
             if cur.value == value:
-                return idx
+                break
             cur = cur.next
             idx += 1
-        return None
+        if self.counters is not None:
+            self.counters.hops += idx
+        return idx if cur is not None else None
 
     def _node_at(self, index: int) -> DNode[T] | None:
         if index < 0 or index >= self._size:
             raise IndexError("index out of range")
 
-        if index <= self._size // 2:
-            cur = self.head
-            i = 0
-            while i < index:
-                cur = cur.next
-                i += 1
-            return cur
-        else:
-            cur = self.tail
-            i = self._size - 1
-            while i > index:
-                cur = cur.prev
-                i -= 1
-            return cur
+        # Punto de partida más cercano: head, tail o finger.
+        i, cur = 0, self.head
+        if self._size - 1 - index < index:
+            i, cur = self._size - 1, self.tail
+        if self._finger is not None and abs(self._finger[0] - index) < abs(i - index):
+            i, cur = self._finger
+        if self.counters is not None:
+            self.counters.hops += abs(index - i)
+
+        while i < index:
+            cur = cur.next
+            i += 1
+        while i > index:
+            cur = cur.prev
+            i -= 1
+
+        self._finger = (index, cur)
+        return cur
 
     def _unlink(self, node: DNode[T]) -> None:
         prev = node.prev
@@ -165,6 +201,9 @@ class DoublyLinkedList(Generic[T]):
             cur.prev, cur.next = cur.next, cur.prev
             cur = cur.prev
         self.head, self.tail = self.tail, self.head
+        if self._finger is not None:
+            i, f = self._finger
+            self._finger = (self._size - 1 - i, f)
 
     def __len__(self) -> int:
         return self._size
@@ -3,6 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Generic, TypeVar
 
+from core.structures.counters import Instrumented
+
 T = TypeVar("T")
 
 
@@ -12,37 +14,63 @@ class Node(Generic[T]):
     next: Node[T] | None = None
 
 
-class LinkedList(Generic[T]):
+class LinkedList(Instrumented, Generic[T]):
+    """
+    Singly linked list con:
+      tail    -> append O(1)
+      _finger -> (índice, nodo) del último acceso por índice; accesos
+                 secuenciales o cercanos hacia adelante cuestan O(distancia)
+
+    enable_counters(): hops (avances por .next) en búsquedas, borrados y
+    accesos por índice.
+    """
+
     def __init__(self) -> None:
         self.head: Node[T] | None = None
+        self.tail: Node[T] | None = None
         self._size: int = 0
+        self._finger: tuple[int, Node[T]] | None = None
 
     def push_front(self, value: T) -> None:
         self.head = Node(value, self.head)
+        if self.tail is None:
+            self.tail = self.head
+        if self._finger is not None:
+            i, node = self._finger
+            self._finger = (i + 1, node)
         self._size += 1
 
     def append(self, value: T) -> None:
-        if self.head is None:
-            self.head = Node(value)
-            self._size += 1
-            return
-
-        cur = self.head
-        while cur.next is not None:
-            cur = cur.next
-        cur.next = Node(value)
+        node = Node(value)
+        if self.tail is None:
+            self.head = self.tail = node
+        else:
+            self.tail.next = node
+            self.tail = node
         self._size += 1
 
     def _node_at(self, index: int) -> Node[T]:
         if index < 0 or index >= self._size:
             raise IndexError("index out of range")
 
-        cur = self.head
-        for _ in range(index):
+        if index == self._size - 1:
+            assert self.tail is not None
+            return self.tail
+
+        # Solo se puede avanzar: desde el finger si está antes de index, si no desde head.
+        i, cur = 0, self.head
+        if self._finger is not None and self._finger[0] <= index:
+            i, cur = self._finger
+        c = self.counters
+        if c is not None:
+            c.hops += index - i
+        while i < index:
             assert cur is not None
             cur = cur.next
+            i += 1
 
         assert cur is not None
+        self._finger = (index, cur)
         return cur
 
     def _unlink_head(self) -> Node[T]:
@@ -50,8 +78,11 @@ class LinkedList(Generic[T]):
             raise IndexError("unlink_head from empty list")
         removed = self.head
         self.head = removed.next
+        if self.head is None:
+            self.tail = None
         removed.next = None
         self._size -= 1
+        self._finger = None
         return removed
 
     def _unlink_after(self, prev: Node[T]) -> Node[T]:
@@ -59,27 +90,35 @@ class LinkedList(Generic[T]):
             raise IndexError("unlink_after with no text node")
         removed = prev.next
         prev.next = removed.next
+        if removed is self.tail:
+            self.tail = prev
         removed.next = None
         self._size -= 1
+        self._finger = None
         return removed
 
     def search(self, value: T) -> Node[T] | None:
         cur = self.head
+        c = self.counters
         while cur is not None:
             if cur.value == value:
                 return cur
             cur = cur.next
+            if c is not None:
+                c.hops += 1
         return None
 
     def reverse(self) -> None:
         prev: Node[T] | None = None
         cur = self.head
+        self.tail = cur
         while cur is not None:
             nxt = cur.next
             cur.next = prev
             prev = cur
             cur = nxt
         self.head = prev
+        self._finger = None
 
     def delete(self, value: T) -> bool:
         if self.head is None:
@@ -91,16 +130,23 @@ class LinkedList(Generic[T]):
 
         prev = self.head
         cur = self.head.next
+        c = self.counters
+        if c is not None:
+            c.hops += 1
         while cur is not None:
             if cur.value == value:
                 self._unlink_after(prev)
                 return True
             prev = cur
             cur = cur.next
+            if c is not None:
+                c.hops += 1
 
         return False
 
     def delete_all(self, value: T) -> int:
+        if self.counters is not None:
+            self.counters.hops += self._size
         dummy = Node(value, self.head)  # value no importa aquí
         prev = dummy
         cur = self.head
@@ -119,6 +165,9 @@ class LinkedList(Generic[T]):
                 cur = cur.next
 
         self.head = dummy.next
+        self.tail = prev if prev is not dummy else None
+        if removed_count:
+            self._finger = None
         return removed_count
 
     def delete_at(self, index: int) -> T:
@@ -129,17 +178,22 @@ class LinkedList(Generic[T]):
             return self._unlink_head().value
 
         prev = self._node_at(index - 1)
-        return self._unlink_after(prev).value
+        value = self._unlink_after(prev).value
+        # Los nodos antes de index no se movieron: el finger en prev sigue válido.
+        self._finger = (index - 1, prev)
+        return value
 
     def find_index(self, value: T) -> int | None:
         idx = 0
         cur = self.head
         while cur is not None:
             if cur.value == value:
-                return idx
+                break
             idx += 1
             cur = cur.next
-        return None
+        if self.counters is not None:
+            self.counters.hops += idx
+        return idx if cur is not None else None
 
     def to_list(self) -> list[T]:
         out: list[T] = []
@@ -1,26 +1,74 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass
-from typing import Generic, TypeVar
+from typing import Any, Generic, TypeVar
+
+from core.structures.linear.typed_storage import DTYPES
 
 T = TypeVar("T")
 
 
 @dataclass
 class RingBuffer(Generic[T]):
+    """
+    Buffer circular de capacidad fija sobre una list de Python.
+
+    RingBuffer(cap, dtype="int64") (o cualquier DTYPES) devuelve un
+    TypedRingBuffer: mismo API, slots en un buffer contiguo tipado y views()
+    sin copias.
+    """
+
     _buf: list[T | None]
     _head: int
     _tail: int
     _size: int
 
-    def __init__(self, capacity: int) -> None:
+    def __new__(cls, capacity: int, *, dtype: str | None = None) -> Any:
+        if dtype is not None and dtype not in DTYPES:
+            raise ValueError(f"dtype must be one of {DTYPES}")
+        if cls is RingBuffer and dtype is not None:
+            from core.structures.linear.typed_ring_buffer import TypedRingBuffer
+
+            return super().__new__(TypedRingBuffer)
+        return super().__new__(cls)
+
+    def __init__(self, capacity: int, *, dtype: str | None = None) -> None:
         if capacity <= 0:
             raise ValueError("capacity must be > 0")
-        self._buf = [None] * capacity
+        self._buf = self._alloc(capacity)
         self._head = 0
         self._tail = 0
         self._size = 0
 
+    # ---------- Slots (los redefine TypedRingBuffer) ----------
+    def _alloc(self, capacity: int) -> Any:
+        return [None] * capacity
+
+    def _get(self, index: int) -> T:
+        v = self._buf[index]
+        assert v is not None
+        return v
+
+    def _put(self, index: int, value: T) -> None:
+        self._buf[index] = value
+
+    def _release(self, start: int, stop: int) -> None:
+        """Suelta las referencias de slots ya leídos."""
+        self._buf[start:stop] = [None] * (stop - start)
+
+    def _batch(self, values: Iterable[T]) -> Any:
+        return list(values)
+
+    def _join(self, first: Any, second: Any) -> Any:
+        return first + second
+
+    def _spans(self, n: int) -> tuple[tuple[int, int], tuple[int, int]]:
+        """Rangos [start, stop) de los n elementos más viejos: antes y después del wrap."""
+        first = min(n, self.capacity() - self._head)
+        return (self._head, self._head + first), (0, n - first)
+
+    # ---------- API ----------
     def capacity(self) -> int:
         return len(self._buf)
 
@@ -34,21 +82,19 @@ class RingBuffer(Generic[T]):
         return self._size == self.capacity()
 
     def clear(self) -> None:
-        self._buf = [None] * self.capacity()
+        self._buf = self._alloc(self.capacity())
         self._head = self._tail = self._size = 0
 
     def peek(self) -> T | None:
         if self._size == 0:
             return None
-        v = self._buf[self._head]
-        assert v is not None
-        return v
+        return self._get(self._head)
 
     def write(self, value: T) -> None:
         """Enqueue (sin overwrite)."""
         if self.is_full():
             raise OverflowError("write into full RingBuffer")
-        self._buf[self._tail] = value
+        self._put(self._tail, value)
         self._tail = (self._tail + 1) % self.capacity()
         self._size += 1
 
@@ -56,7 +102,7 @@ class RingBuffer(Generic[T]):
         """Enqueue con overwrite: si está lleno, pisa el más viejo."""
         if self.is_full():
             # head == tail en estado full; al escribir, se pierde el elemento más viejo.
-            self._buf[self._tail] = value
+            self._put(self._tail, value)
             self._tail = (self._tail + 1) % self.capacity()
             self._head = self._tail
             # size se mantiene (cap)
@@ -67,25 +113,76 @@ class RingBuffer(Generic[T]):
         """Dequeue."""
         if self._size == 0:
             raise IndexError("read from empty RingBuffer")
-        v = self._buf[self._head]
-        assert v is not None
-        self._buf[self._head] = None
+        v = self._get(self._head)
+        self._release(self._head, self._head + 1)
         self._head = (self._head + 1) % self.capacity()
         self._size -= 1
         return v
 
-    def to_list(self) -> list[T]:
-        """Vista lógica (en orden de lectura)."""
-        out: list[T] = []
+    # ---------- Batch ----------
+    def write_many(self, values: Iterable[T], *, overwrite: bool = False) -> None:
+        """
+        Encola un lote con a lo sumo dos copias por slice (antes y después del wrap).
+
+        Sin overwrite, OverflowError si el lote no entra entero (no escribe nada).
+        Con overwrite pisa los más viejos; si el lote supera la capacidad solo
+        quedan sus últimos capacity() valores.
+        """
+        batch = self._batch(values)
+        m = len(batch)
         cap = self.capacity()
-        idx = self._head
-        for _ in range(self._size):
-            v = self._buf[idx]
-            assert v is not None
-            out.append(v)
-            idx = (idx + 1) % cap
+        free = cap - self._size
+        if m > free:
+            if not overwrite:
+                raise OverflowError(f"write_many of {m} items into RingBuffer with {free} free")
+            if m >= cap:
+                batch = batch[m - cap :]
+                m = cap
+                self._head = self._tail = self._size = 0
+            else:
+                drop = m - free
+                self._head = (self._head + drop) % cap
+                self._size -= drop
+        first = min(m, cap - self._tail)
+        # sin copias vacías: array.array con vistas vivas (views()) rechaza
+        # hasta la asignación de un slice vacío con BufferError
+        if first:
+            self._buf[self._tail : self._tail + first] = batch[:first]
+        if m > first:
+            self._buf[: m - first] = batch[first:]
+        self._tail = (self._tail + m) % cap
+        self._size += m
+
+    def read_many(self, n: int) -> Any:
+        """
+        Desencola hasta n valores (menos si no hay tantos) con a lo sumo dos slices.
+        Devuelve una list (un ndarray/array.array en modo tipado).
+        """
+        if n < 0:
+            raise ValueError("n must be >= 0")
+        n = min(n, self._size)
+        (a, b), (c, d) = self._spans(n)
+        out = self._join(self._buf[a:b], self._buf[c:d])
+        self._release(a, b)
+        self._release(c, d)
+        self._head = (self._head + n) % self.capacity()
+        self._size -= n
         return out
 
+    def views(self) -> tuple[Any, ...]:
+        """
+        Los (hasta dos) segmentos contiguos con el contenido, en orden de lectura.
+        En modo list son copias (una list no admite vistas); con dtype son
+        ndarray/memoryview sobre el buffer, sin copiar.
+        """
+        (a, b), (c, d) = self._spans(self._size)
+        return tuple(self._buf[i:j] for i, j in ((a, b), (c, d)) if j > i)
+
+    def to_list(self) -> list[T]:
+        """Vista lógica (en orden de lectura)."""
+        (a, b), (c, d) = self._spans(self._size)
+        return self._buf[a:b] + self._buf[c:d]
+
     def snapshot(self) -> dict[str, object]:
         return {
             "buffer": list(self._buf),
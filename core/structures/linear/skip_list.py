@@ -1,26 +1,51 @@
 from __future__ import annotations
 
+import math
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from random import Random
 from typing import Generic, TypeVar
 
+from core.structures.counters import Instrumented
+
 T = TypeVar("T")
 
+MIN_AUTO_LEVEL = 4
+MAX_LEVEL = 32
+
 
 @dataclass
 class SkipNode(Generic[T]):
+    """
+    width[lvl]: posiciones de nivel 0 que salta forward[lvl]
+    (si forward[lvl] es None, la distancia hasta el final de la lista).
+    """
+
     value: T | None
     forward: list[SkipNode[T] | None] = field(default_factory=list)
+    width: list[int] = field(default_factory=list)
+
+
+class SkipList(Instrumented, Generic[T]):
+    """
+    Skip list indexable (cada link guarda su ancho): at/index_of/rank en O(log n).
 
+    max_level=None (default): el tope de niveles crece con el tamaño,
+    ~log_{1/p}(n), para que la búsqueda siga siendo O(log n).
+    Un max_level explícito lo deja fijo.
 
-class SkipList(Generic[T]):
-    def __init__(self, *, max_level: int = 6, p: float = 0.5, seed: int = 7) -> None:
-        if max_level < 1:
-            raise ValueError("max_level must be >= 1")
+    enable_counters(): compares en search/insert/delete (un avance más el
+    que corta la bajada en cada nivel).
+    """
+
+    def __init__(self, *, max_level: int | None = None, p: float = 0.5, seed: int = 7) -> None:
+        if max_level is not None and not 1 <= max_level <= MAX_LEVEL:
+            raise ValueError(f"max_level must be between 1 and {MAX_LEVEL}")
         if not (0.0 < p < 1.0):
             raise ValueError("p must be between 0 and 1")
 
-        self.max_level = max_level
+        self.auto_level = max_level is None
+        self.max_level = MIN_AUTO_LEVEL if max_level is None else max_level
         self.p = p
         self._rnd = Random(seed)
 
@@ -28,11 +53,26 @@ class SkipList(Generic[T]):
         self._size = 0
 
         # Sentinel head (no value), with max_level+1 pointers (0..max_level)
-        self.head: SkipNode[T] = SkipNode(value=None, forward=[None] * (max_level + 1))
+        self.head: SkipNode[T] = SkipNode(
+            value=None, forward=[None] * (self.max_level + 1), width=[1] * (self.max_level + 1)
+        )
 
     def __len__(self) -> int:
         return self._size
 
+    def _grow(self, max_level: int) -> None:
+        """Sube el tope de niveles (solo crece: bajar obligaría a recortar nodos)."""
+        extra = max_level - self.max_level
+        if extra <= 0:
+            return
+        self.head.forward.extend([None] * extra)
+        self.head.width.extend([self._size + 1] * extra)
+        self.max_level = max_level
+
+    def _target_level(self) -> int:
+        want = math.ceil(math.log(self._size + 1, 1 / self.p))
+        return min(MAX_LEVEL, max(MIN_AUTO_LEVEL, want))
+
     def random_level(self) -> int:
         lvl = 0
         while self._rnd.random() < self.p and lvl < self.max_level:
@@ -41,9 +81,14 @@ class SkipList(Generic[T]):
 
     def search(self, value: T) -> bool:
         cur = self.head
+        c = self.counters
+        if c is not None:
+            c.compares += self.level + 1
         for lvl in range(self.level, -1, -1):
             while cur.forward[lvl] is not None and cur.forward[lvl].value < value:  # type: ignore[operator]
                 cur = cur.forward[lvl]  # type: ignore[assignment]
+                if c is not None:
+                    c.compares += 1
         cur = cur.forward[0] or self.head
         return cur.value == value
 
@@ -66,13 +111,25 @@ class SkipList(Generic[T]):
         return trace
 
     def insert(self, value: T, *, level: int | None = None) -> bool:
+        if self.auto_level and level is not None and self.max_level < level <= MAX_LEVEL:
+            self._grow(level)
+
         update: list[SkipNode[T]] = [self.head] * (self.max_level + 1)
+        pos = [0] * (self.max_level + 1)  # posición de update[lvl] (head = 0)
         cur = self.head
+        cur_pos = 0
+        c = self.counters
+        if c is not None:
+            c.compares += self.level + 1
 
         for lvl in range(self.level, -1, -1):
             while cur.forward[lvl] is not None and cur.forward[lvl].value < value:  # type: ignore[operator]
+                cur_pos += cur.width[lvl]
                 cur = cur.forward[lvl]  # type: ignore[assignment]
+                if c is not None:
+                    c.compares += 1
             update[lvl] = cur
+            pos[lvl] = cur_pos
 
         nxt = cur.forward[0]
         if nxt is not None and nxt.value == value:
@@ -83,35 +140,51 @@ class SkipList(Generic[T]):
             raise ValueError("level out of range")
 
         if new_level > self.level:
-            for lvl in range(self.level + 1, new_level + 1):
-                update[lvl] = self.head
             self.level = new_level
 
-        node = SkipNode(value=value, forward=[None] * (new_level + 1))
-        for lvl in range(new_level + 1):
-            node.forward[lvl] = update[lvl].forward[lvl]
-            update[lvl].forward[lvl] = node
+        new_pos = pos[0] + 1
+        node = SkipNode(value=value, forward=[None] * (new_level + 1), width=[0] * (new_level + 1))
+        for lvl in range(self.max_level + 1):
+            prev = update[lvl]
+            if lvl <= new_level:
+                # el siguiente se corre una posición por el nodo nuevo
+                node.width[lvl] = pos[lvl] + prev.width[lvl] + 1 - new_pos
+                node.forward[lvl] = prev.forward[lvl]
+                prev.forward[lvl] = node
+                prev.width[lvl] = new_pos - pos[lvl]
+            else:
+                prev.width[lvl] += 1
 
         self._size += 1
+        if self.auto_level:
+            self._grow(self._target_level())
         return True
 
     def delete(self, value: T) -> bool:
         update: list[SkipNode[T]] = [self.head] * (self.max_level + 1)
         cur = self.head
+        c = self.counters
+        if c is not None:
+            c.compares += self.level + 1
 
         for lvl in range(self.level, -1, -1):
             while cur.forward[lvl] is not None and cur.forward[lvl].value < value:  # type: ignore[operator]
                 cur = cur.forward[lvl]  # type: ignore[assignment]
+                if c is not None:
+                    c.compares += 1
             update[lvl] = cur
 
         target = cur.forward[0]
         if target is None or target.value != value:
             return False
 
-        for lvl in range(self.level + 1):
-            if update[lvl].forward[lvl] != target:
-                continue
-            update[lvl].forward[lvl] = target.forward[lvl] if lvl < len(target.forward) else None
+        for lvl in range(self.max_level + 1):
+            prev = update[lvl]
+            if prev.forward[lvl] is target:
+                prev.forward[lvl] = target.forward[lvl]
+                prev.width[lvl] += target.width[lvl] - 1
+            else:
+                prev.width[lvl] -= 1
 
         while self.level > 0 and self.head.forward[self.level] is None:
             self.level -= 1
@@ -119,6 +192,80 @@ class SkipList(Generic[T]):
         self._size -= 1
         return True
 
+    # ---------- Indexable (anchos) ----------
+    def at(self, index: int) -> T:
+        """Valor en la posición index (0-indexed, admite negativos) en O(log n)."""
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("skip list index out of range")
+
+        target = index + 1  # head está en la posición 0
+        cur = self.head
+        cur_pos = 0
+        for lvl in range(self.level, -1, -1):
+            while cur.forward[lvl] is not None and cur_pos + cur.width[lvl] <= target:
+                cur_pos += cur.width[lvl]
+                cur = cur.forward[lvl]  # type: ignore[assignment]
+        return cur.value  # type: ignore[return-value]
+
+    def _last_before(self, value: T) -> tuple[SkipNode[T], int]:
+        """Último nodo con valor < value y su posición (head = 0)."""
+        cur = self.head
+        cur_pos = 0
+        for lvl in range(self.level, -1, -1):
+            while cur.forward[lvl] is not None and cur.forward[lvl].value < value:  # type: ignore[operator]
+                cur_pos += cur.width[lvl]
+                cur = cur.forward[lvl]  # type: ignore[assignment]
+        return cur, cur_pos
+
+    def rank(self, value: T) -> int:
+        """Cantidad de valores < value (value no tiene que existir)."""
+        return self._last_before(value)[1]
+
+    def index_of(self, value: T) -> int:
+        """Posición de value (0-indexed). ValueError si no está, como list.index."""
+        node, i = self._last_before(value)
+        nxt = node.forward[0]
+        if nxt is None or nxt.value != value:
+            raise ValueError(f"{value!r} is not in skip list")
+        return i
+
+    # ---------- Ordered queries (O(log n)) ----------
+    def floor(self, value: T) -> T | None:
+        """Mayor valor <= value, o None."""
+        node, _ = self._last_before(value)
+        nxt = node.forward[0]
+        if nxt is not None and nxt.value == value:
+            return nxt.value
+        return node.value
+
+    def ceiling(self, value: T) -> T | None:
+        """Menor valor >= value, o None."""
+        nxt = self._last_before(value)[0].forward[0]
+        return nxt.value if nxt is not None else None
+
+    def predecessor(self, value: T) -> T | None:
+        """Mayor valor < value, o None (head no tiene valor)."""
+        return self._last_before(value)[0].value
+
+    def successor(self, value: T) -> T | None:
+        """Menor valor > value, o None."""
+        nxt = self._last_before(value)[0].forward[0]
+        if nxt is not None and nxt.value == value:
+            nxt = nxt.forward[0]
+        return nxt.value if nxt is not None else None
+
+    def range(self, lo: T | None = None, hi: T | None = None) -> Iterator[T]:
+        """
+        Valores en [lo, hi] en orden (None = sin cota), perezoso.
+        Baja por los niveles hasta lo y después camina el nivel 0: O(log n + k).
+        """
+        cur = self.head.forward[0] if lo is None else self._last_before(lo)[0].forward[0]
+        while cur is not None and (hi is None or not hi < cur.value):  # type: ignore[operator]
+            yield cur.value  # type: ignore[misc]
+            cur = cur.forward[0]
+
     def levels_as_lists(self) -> list[list[T]]:
         """
         Retorna listas por nivel desde top->0, solo valores.
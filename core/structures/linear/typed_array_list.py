@@ -0,0 +1,182 @@
+"""
+ArrayList tipado: ArrayList(dtype=...) devuelve esta clase.
+
+Los valores viven en un buffer contiguo (ndarray de NumPy si está instalado,
+si no array.array) de `capacity` celdas, de las que se usan las primeras len().
+La capacidad se duplica al llenarse (append amortizado O(1)), así que un
+int64 ocupa 8 bytes en vez de un puntero + un int boxeado de 28.
+
+Las operaciones bulk (extend/insert_many/take/find_all/argsort/sort) se
+vectorizan con NumPy; con array.array caen a loops equivalentes.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable
+from typing import Any
+
+from core.structures.linear import typed_storage as ts
+from core.structures.linear.array_list import ArrayList
+
+MIN_CAPACITY = 8
+
+
+class TypedArrayList(ArrayList[Any]):
+    def __init__(self, *, dtype: str | None = None, engine: str = "list") -> None:
+        if dtype is None:
+            raise ValueError("TypedArrayList requires a dtype")
+        self.dtype = dtype
+        self._n = 0
+        self._items = ts.alloc(dtype, MIN_CAPACITY)
+
+    def _reserve(self, need: int) -> None:
+        """Asegura capacidad >= need, duplicando (amortizado)."""
+        cap = len(self._items)
+        if need <= cap:
+            return
+        buf = ts.alloc(self.dtype, max(need, cap * 2))
+        buf[: self._n] = self._items[: self._n]
+        self._items = buf
+
+    def _index(self, index: int) -> int:
+        if index < 0:
+            index += self._n
+        if not 0 <= index < self._n:
+            raise IndexError("ArrayList index out of range")
+        return index
+
+    def _view(self) -> Any:
+        return self._items[: self._n]
+
+    @property
+    def capacity(self) -> int:
+        return len(self._items)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes del buffer (capacidad completa, no solo len())."""
+        return len(self._items) * self._items.itemsize
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __bool__(self) -> bool:
+        return self._n > 0
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TypedArrayList):
+            return NotImplemented
+        return self.dtype == other.dtype and self.to_list() == other.to_list()
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"TypedArrayList(dtype={self.dtype!r}, values={self.to_list()!r})"
+
+    def is_empty(self) -> bool:
+        return self._n == 0
+
+    def to_list(self) -> list[Any]:
+        return self._view().tolist()
+
+    def get(self, index: int) -> Any:
+        value = self._items[self._index(index)]
+        return ts.item(value)
+
+    def set(self, index: int, value: Any) -> None:
+        ts.store(self._items, self._index(index), self.dtype, value)
+
+    def append(self, value: Any) -> None:
+        self._reserve(self._n + 1)
+        ts.store(self._items, self._n, self.dtype, value)
+        self._n += 1
+
+    def insert(self, index: int, value: Any) -> None:
+        # mismas reglas que list.insert: fuera de rango se pega al borde
+        n = self._n
+        index = max(0, index + n) if index < 0 else min(index, n)
+        checked = ts.checked(self.dtype, value)  # antes del corrimiento: si falla no mueve nada
+        self._reserve(n + 1)
+        self._items[index + 1 : n + 1] = self._items[index:n]
+        self._items[index] = checked
+        self._n += 1
+
+    def pop(self) -> Any:
+        if not self._n:
+            raise IndexError("pop from empty ArrayList")
+        value = self.get(self._n - 1)
+        self._n -= 1
+        return value
+
+    def pop_at(self, index: int) -> Any:
+        if not self._n:
+            raise IndexError("pop_at from empty ArrayList")
+        index = self._index(index)
+        value = self.get(index)
+        self._items[index : self._n - 1] = self._items[index + 1 : self._n]
+        self._n -= 1
+        return value
+
+    def remove_first(self, value: Any) -> bool:
+        hits = self.find_all(value)
+        if not hits:
+            return False
+        self.pop_at(hits[0])
+        return True
+
+    def clear(self) -> None:
+        self._n = 0
+        self._items = ts.alloc(self.dtype, MIN_CAPACITY)
+
+    # ---------- Bulk (vectorizado) ----------
+    def extend(self, values: Iterable[Any]) -> None:
+        buf = ts.as_buffer(self.dtype, values)
+        m = len(buf)
+        self._reserve(self._n + m)
+        self._items[self._n : self._n + m] = buf
+        self._n += m
+
+    def insert_many(self, index: int, values: Iterable[Any]) -> None:
+        """Inserta todos los values a partir de index con un solo corrimiento: O(n + m)."""
+        n = self._n
+        index = max(0, index + n) if index < 0 else min(index, n)
+        buf = ts.as_buffer(self.dtype, values)
+        m = len(buf)
+        self._reserve(n + m)
+        self._items[index + m : n + m] = self._items[index:n]
+        self._items[index : index + m] = buf
+        self._n += m
+
+    def take(self, indices: Iterable[int]) -> list[Any]:
+        """Valores en esas posiciones (IndexError si alguna está fuera de rango)."""
+        if ts.np is not None:
+            return self._view()[ts.np.asarray(list(indices), dtype=ts.np.intp)].tolist()
+        return [self._items[self._index(i)] for i in indices]
+
+    def find_all(self, value: Any) -> list[int]:
+        """Todas las posiciones donde aparece value."""
+        try:
+            value = ts.coerce(self.dtype, value)
+        except ValueError:
+            return []  # un valor de otro tipo no puede estar en el buffer
+        if ts.np is not None:
+            return ts.np.flatnonzero(self._view() == value).tolist()
+        return [i for i in range(self._n) if self._items[i] == value]
+
+    def argsort(self) -> list[int]:
+        """Posiciones que ordenarían la lista (estable)."""
+        if ts.np is not None:
+            return ts.np.argsort(self._view(), kind="stable").tolist()
+        return sorted(range(self._n), key=self._items.__getitem__)
+
+    def sort(self, *, reverse: bool = False) -> None:
+        if ts.np is not None:
+            view = self._view()
+            view.sort(kind="stable")
+            if reverse:
+                view[:] = view[::-1].copy()
+            return
+        self._items[: self._n] = array(
+            self._items.typecode, sorted(self._items[: self._n], reverse=reverse)
+        )
@@ -0,0 +1,90 @@
+"""
+RingBuffer tipado: RingBuffer(capacity, dtype=...) devuelve esta clase.
+
+Los slots viven en un buffer contiguo (ndarray de NumPy si está instalado,
+si no array.array). write_many/read_many copian lotes con a lo sumo dos
+slices y views() expone los segmentos ocupados sin copiar: ndarray con NumPy,
+memoryview con array.array.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+from core.structures.linear import typed_storage as ts
+from core.structures.linear.ring_buffer import RingBuffer
+
+
+class TypedRingBuffer(RingBuffer[Any]):
+    def __init__(self, capacity: int, *, dtype: str | None = None) -> None:
+        if dtype is None:
+            raise ValueError("TypedRingBuffer requires a dtype")
+        self.dtype = dtype
+        super().__init__(capacity)
+
+    def _alloc(self, capacity: int) -> Any:
+        return ts.alloc(self.dtype, capacity)
+
+    def _get(self, index: int) -> Any:
+        return ts.item(self._buf[index])
+
+    def _put(self, index: int, value: Any) -> None:
+        ts.store(self._buf, index, self.dtype, value)
+
+    def _release(self, start: int, stop: int) -> None:
+        pass  # no hay referencias que soltar: el slot se pisa en la próxima vuelta
+
+    def _batch(self, values: Iterable[Any]) -> Any:
+        return ts.as_buffer(self.dtype, values)
+
+    def _join(self, first: Any, second: Any) -> Any:
+        if ts.np is not None:
+            return ts.np.concatenate((first, second))
+        return first + second
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._buf) * self._buf.itemsize
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TypedRingBuffer):
+            return NotImplemented
+        return (
+            self.dtype == other.dtype
+            and self.capacity() == other.capacity()
+            and self.to_list() == other.to_list()
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return (
+            f"TypedRingBuffer(capacity={self.capacity()}, dtype={self.dtype!r}, "
+            f"items={self.to_list()!r})"
+        )
+
+    def views(self) -> tuple[Any, ...]:
+        (a, b), (c, d) = self._spans(self._size)
+        buf = self._buf if ts.np is not None else memoryview(self._buf)
+        return tuple(buf[i:j] for i, j in ((a, b), (c, d)) if j > i)
+
+    def to_list(self) -> list[Any]:
+        (a, b), (c, d) = self._spans(self._size)
+        return self._buf[a:b].tolist() + self._buf[c:d].tolist()
+
+    def snapshot(self) -> dict[str, object]:
+        # slots libres como None, igual que en modo list (el buffer guarda basura)
+        cap = self.capacity()
+        items = self.to_list()
+        buffer: list[Any] = [None] * cap
+        for k, v in enumerate(items):
+            buffer[(self._head + k) % cap] = v
+        return {
+            "buffer": buffer,
+            "head": self._head,
+            "tail": self._tail,
+            "size": self._size,
+            "capacity": cap,
+            "items": items,
+        }
@@ -0,0 +1,99 @@
+"""
+Buffers tipados compartidos por las estructuras con dtype (ArrayList, RingBuffer).
+
+ndarray de NumPy si está instalado; si no, array.array con el typecode
+equivalente. Las estructuras consultan `np` de este módulo en cada operación,
+así que hay un solo punto donde decidir el backend.
+"""
+
+from __future__ import annotations
+
+import operator
+from array import array
+from collections.abc import Iterable
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:  # numpy es opcional (extra "fast")
+    np = None
+
+# dtype (nombre NumPy) -> typecode de array.array (fallback sin NumPy)
+TYPECODES = {
+    "int8": "b",
+    "uint8": "B",
+    "int16": "h",
+    "uint16": "H",
+    "int32": "i",
+    "uint32": "I",
+    "int64": "q",
+    "uint64": "Q",
+    "float32": "f",
+    "float64": "d",
+}
+DTYPES = tuple(TYPECODES)
+
+
+def alloc(dtype: str, n: int) -> Any:
+    """Buffer de n celdas en cero."""
+    if np is not None:
+        return np.zeros(n, dtype=dtype)
+    typecode = TYPECODES[dtype]
+    return array(typecode, bytes(n * array(typecode).itemsize))
+
+
+def coerce(dtype: str, value: Any) -> Any:
+    """int/float de Python listo para guardar; ValueError si no corresponde al dtype."""
+    try:
+        return float(value) if dtype.startswith("float") else operator.index(value)
+    except (TypeError, ValueError) as err:
+        raise ValueError(f"value {value!r} is not valid for dtype {dtype}") from err
+
+
+def checked(dtype: str, value: Any) -> Any:
+    """coerce + chequeo de rango (antes de tocar el buffer): ValueError si no entra."""
+    value = coerce(dtype, value)
+    try:
+        array(TYPECODES[dtype], [value])  # mismos rangos que el dtype de NumPy
+    except OverflowError as err:
+        raise ValueError(f"value {value!r} out of range for dtype {dtype}") from err
+    return value
+
+
+def store(buf: Any, index: int, dtype: str, value: Any) -> None:
+    try:
+        buf[index] = coerce(dtype, value)
+    except OverflowError as err:
+        raise ValueError(f"value {value!r} out of range for dtype {dtype}") from err
+
+
+def _from_ndarray(dtype: str, values: Any) -> Any:
+    # Mismas reglas que coerce, pero vectorizadas: un float no entra en un dtype
+    # entero y un entero fuera de rango es ValueError (np.asarray castearía en silencio).
+    kind = values.dtype.kind
+    if kind not in "biuf":
+        return np.asarray([coerce(dtype, v) for v in values.tolist()], dtype=dtype)
+    if not dtype.startswith("float") and values.size:
+        if kind == "f":
+            raise ValueError(f"float values are not valid for dtype {dtype}")
+        info = np.iinfo(dtype)
+        if int(values.min()) < info.min or int(values.max()) > info.max:
+            raise ValueError(f"values out of range for dtype {dtype}")
+    return np.asarray(values, dtype=dtype)
+
+
+def as_buffer(dtype: str, values: Iterable[Any]) -> Any:
+    """Lote de values como buffer del backend (un ndarray se valida sin recorrerlo en Python)."""
+    try:
+        if np is not None:
+            if isinstance(values, np.ndarray):
+                return _from_ndarray(dtype, values)
+            return np.asarray([coerce(dtype, v) for v in values], dtype=dtype)
+        return array(TYPECODES[dtype], [coerce(dtype, v) for v in values])
+    except OverflowError as err:
+        raise ValueError(f"values out of range for dtype {dtype}") from err
+
+
+def item(value: Any) -> Any:
+    """Escalar de NumPy -> int/float de Python (array.array ya devuelve nativos)."""
+    return value.item() if np is not None and isinstance(value, np.generic) else value
@@ -0,0 +1,156 @@
+"""
+Almacenamiento struct-of-arrays para nodos de árbol binario.
+
+En vez de un objeto por nodo, cada nodo es un índice en arrays paralelos:
+  values  list con el valor
+  left    array('i') índice del hijo izquierdo (NIL = sin hijo)
+  right   array('i') índice del hijo derecho
+  size    array('i') nodos del subárbol (solo si sized=True)
+  meta    bytearray  un byte por nodo: height (AVL) o red (LLRB)
+
+Los índices liberados van a una free list y se reutilizan. Índices de 32 bits:
+alcanza para 2^31 nodos y deja ~20 bytes por nodo en vez de ~100 de un dataclass.
+
+NodeView adapta un índice a la interfaz de nodo (.value/.left/.right/.height/
+.red/.size), para que renderers, freeze_tree y validadores sigan funcionando.
+"""
+
+from __future__ import annotations
+
+import weakref
+from array import array
+from typing import Any
+
+from core.structures.counters import OpCounters
+
+NIL = -1
+STORAGES = ("node", "arena")
+
+
+class NodeArena:
+    counters: OpCounters | None = None  # los del árbol dueño (enable_counters)
+
+    def __init__(self, *, sized: bool = False) -> None:
+        self.sized = sized
+        self.clear()
+
+    def clear(self) -> None:
+        self.values: list[Any] = []
+        self.left = array("i")
+        self.right = array("i")
+        self.size = array("i")
+        self.meta = bytearray()
+        self._free = array("i")
+        self._views: weakref.WeakValueDictionary[int, NodeView] = weakref.WeakValueDictionary()
+
+    def __len__(self) -> int:
+        """Nodos vivos (sin contar slots libres)."""
+        return len(self.values) - len(self._free)
+
+    def alloc(self, value: Any, meta: int = 0) -> int:
+        if self._free:
+            i = self._free.pop()
+            self.values[i] = value
+            self.left[i] = NIL
+            self.right[i] = NIL
+            self.meta[i] = meta
+            if self.sized:
+                self.size[i] = 1
+            return i
+        self.values.append(value)
+        self.left.append(NIL)
+        self.right.append(NIL)
+        self.meta.append(meta)
+        if self.sized:
+            self.size.append(1)
+        return len(self.values) - 1
+
+    def release(self, i: int) -> None:
+        self.values[i] = None
+        self._free.append(i)
+        view = self._views.pop(i, None)
+        if view is not None:
+            # vistas viejas quedan "muertas" en vez de apuntar al nodo que reuse el slot
+            view._i = NIL
+
+    def subtree_size(self, i: int) -> int:
+        return self.size[i] if i != NIL else 0
+
+    def update_size(self, i: int) -> None:
+        left, right = self.left[i], self.right[i]
+        self.size[i] = (
+            1 + (self.size[left] if left != NIL else 0) + (self.size[right] if right != NIL else 0)
+        )
+
+    def view(self, i: int) -> NodeView | None:
+        """Vista del nodo i (la misma instancia mientras alguien la tenga referenciada)."""
+        if i == NIL:
+            return None
+        v = self._views.get(i)
+        if v is None:
+            v = NodeView(self, i)
+            self._views[i] = v
+        return v
+
+
+class NodeView:
+    """
+    Nodo de solo lectura sobre un NodeArena.
+
+    Guarda las vistas de sus hijos: mientras se tenga la raíz, recorrer el árbol
+    devuelve siempre los mismos objetos (los renderers usan id(nodo)).
+    Leer una vista cuyo nodo ya se liberó levanta ValueError.
+    """
+
+    __slots__ = ("__weakref__", "_arena", "_i", "_lv", "_rv")
+
+    def __init__(self, arena: NodeArena, i: int) -> None:
+        self._arena = arena
+        self._i = i
+        self._lv: NodeView | None = None
+        self._rv: NodeView | None = None
+
+    def _index(self) -> int:
+        i = self._i
+        if i == NIL:
+            raise ValueError("NodeView used after its node was released")
+        return i
+
+    @property
+    def value(self) -> Any:
+        return self._arena.values[self._index()]
+
+    @property
+    def left(self) -> NodeView | None:
+        j = self._arena.left[self._index()]
+        if j == NIL:
+            self._lv = None
+        elif self._lv is None or self._lv._i != j:
+            self._lv = self._arena.view(j)
+        return self._lv
+
+    @property
+    def right(self) -> NodeView | None:
+        j = self._arena.right[self._index()]
+        if j == NIL:
+            self._rv = None
+        elif self._rv is None or self._rv._i != j:
+            self._rv = self._arena.view(j)
+        return self._rv
+
+    @property
+    def height(self) -> int:
+        return self._arena.meta[self._index()]
+
+    @property
+    def red(self) -> bool:
+        return bool(self._arena.meta[self._index()])
+
+    @property
+    def size(self) -> int:
+        return self._arena.size[self._index()]
+
+    def __repr__(self) -> str:
+        if self._i == NIL:
+            return "NodeView(released)"
+        return f"NodeView(index={self._i}, value={self.value!r})"
@@ -0,0 +1,530 @@
+"""
+BST / AVL / LLRB sobre un NodeArena (storage="arena").
+
+Mismo API que las versiones con nodos: insert/delete/contains/bulk_insert
+mutan índices en los arrays; `root` devuelve un NodeView, así que recorridos,
+select/rank, validadores, snapshot y renderers funcionan sin cambios.
+
+No se instancian directo: BinarySearchTree(storage="arena") devuelve un
+ArenaBinarySearchTree (y lo mismo para AVLTree y RedBlackTree).
+
+Los contadores (enable_counters) se cuelgan también del arena para que las
+funciones de módulo (_find, rotaciones, flips) los vean como `a.counters`.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any, TypeVar
+
+from core.structures.counters import Instrumented, OpCounters
+from core.structures.trees.arena import NIL, NodeArena, NodeView
+from core.structures.trees.avl_tree import AVLTree
+from core.structures.trees.binary_search_tree import BinarySearchTree
+from core.structures.trees.red_black_tree import RedBlackTree
+
+T = TypeVar("T")
+
+
+def _iter_inorder(a: NodeArena, root: int) -> Iterator[Any]:
+    values, left, right = a.values, a.left, a.right
+    stack: list[int] = []
+    cur = root
+    while stack or cur != NIL:
+        while cur != NIL:
+            stack.append(cur)
+            cur = left[cur]
+        i = stack.pop()
+        yield values[i]
+        cur = right[i]
+
+
+def _find(a: NodeArena, root: int, value: Any) -> int:
+    values, left, right = a.values, a.left, a.right
+    c = a.counters
+    cur = root
+    while cur != NIL:
+        if c is not None:
+            c.compares += 1
+        v = values[cur]
+        if value == v:
+            return cur
+        cur = left[cur] if value < v else right[cur]
+    return NIL
+
+
+def _min_index(a: NodeArena, i: int) -> int:
+    while a.left[i] != NIL:
+        i = a.left[i]
+    return i
+
+
+class _ArenaCounters(Instrumented):
+    _arena: NodeArena
+
+    def enable_counters(self) -> OpCounters:
+        self._arena.counters = super().enable_counters()
+        return self._arena.counters
+
+    def disable_counters(self) -> None:
+        super().disable_counters()
+        self._arena.counters = None
+
+
+class ArenaBinarySearchTree(_ArenaCounters, BinarySearchTree[T]):
+    def __init__(self, *, storage: str = "arena") -> None:
+        self._arena = NodeArena()
+        self._root = NIL
+        self._size = 0
+
+    @property
+    def root(self) -> NodeView | None:  # type: ignore[override]
+        return self._arena.view(self._root)
+
+    def clear(self) -> None:
+        self._arena.clear()
+        self._root = NIL
+        self._size = 0
+
+    def contains(self, value: T) -> bool:
+        return _find(self._arena, self._root, value) != NIL
+
+    def _find_node(self, value: T) -> NodeView | None:  # type: ignore[override]
+        return self._arena.view(_find(self._arena, self._root, value))
+
+    def iter_inorder(self) -> Iterator[T]:
+        return _iter_inorder(self._arena, self._root)
+
+    def insert(self, value: T) -> bool:
+        a = self._arena
+        if self._root == NIL:
+            self._root = a.alloc(value)
+            self._size = 1
+            return True
+
+        cur = self._root
+        c = a.counters
+        while True:
+            if c is not None:
+                c.compares += 1
+            v = a.values[cur]
+            if value == v:
+                return False
+            side = a.left if value < v else a.right
+            nxt = side[cur]
+            if nxt == NIL:
+                side[cur] = a.alloc(value)
+                self._size += 1
+                return True
+            cur = nxt
+
+    def delete(self, value: T) -> bool:
+        a = self._arena
+        parent, cur = NIL, self._root
+        depth = 0
+        while cur != NIL and a.values[cur] != value:
+            parent = cur
+            cur = a.left[cur] if value < a.values[cur] else a.right[cur]
+            depth += 1
+        if a.counters is not None:
+            a.counters.compares += depth + (cur != NIL)
+        if cur == NIL:
+            return False
+
+        if a.left[cur] != NIL and a.right[cur] != NIL:
+            # dos hijos: copia el sucesor inorder y desengancha ese nodo
+            parent, succ = cur, a.right[cur]
+            while a.left[succ] != NIL:
+                parent, succ = succ, a.left[succ]
+            a.values[cur] = a.values[succ]
+            cur = succ
+
+        child = a.left[cur] if a.left[cur] != NIL else a.right[cur]
+        if parent == NIL:
+            self._root = child
+        elif a.left[parent] == cur:
+            a.left[parent] = child
+        else:
+            a.right[parent] = child
+        a.release(cur)
+        self._size -= 1
+        return True
+
+    def _load_sorted(self, vals: list[T]) -> None:
+        self._arena.clear()
+        self._root = self._build_idx(vals, 0, len(vals))
+        self._size = len(vals)
+
+    def _build_idx(self, vals: list[T], lo: int, hi: int) -> int:
+        if lo >= hi:
+            return NIL
+        mid = (lo + hi) // 2
+        a = self._arena
+        i = a.alloc(vals[mid])
+        a.left[i] = self._build_idx(vals, lo, mid)
+        a.right[i] = self._build_idx(vals, mid + 1, hi)
+        return i
+
+
+# ---------- AVL (meta = height) ----------
+def _avl_h(a: NodeArena, i: int) -> int:
+    return a.meta[i] if i != NIL else 0
+
+
+def _avl_bf(a: NodeArena, i: int) -> int:
+    return _avl_h(a, a.left[i]) - _avl_h(a, a.right[i])
+
+
+def _avl_update(a: NodeArena, i: int) -> None:
+    a.meta[i] = 1 + max(_avl_h(a, a.left[i]), _avl_h(a, a.right[i]))
+    a.update_size(i)
+
+
+def _avl_rotate_right(a: NodeArena, y: int) -> int:
+    if a.counters is not None:
+        a.counters.rotations += 1
+    x = a.left[y]
+    a.left[y] = a.right[x]
+    a.right[x] = y
+    _avl_update(a, y)
+    _avl_update(a, x)
+    return x
+
+
+def _avl_rotate_left(a: NodeArena, x: int) -> int:
+    if a.counters is not None:
+        a.counters.rotations += 1
+    y = a.right[x]
+    a.right[x] = a.left[y]
+    a.left[y] = x
+    _avl_update(a, x)
+    _avl_update(a, y)
+    return y
+
+
+def _avl_rebalance(a: NodeArena, n: int) -> int:
+    _avl_update(a, n)
+    bf = _avl_bf(a, n)
+    if bf > 1:
+        if _avl_bf(a, a.left[n]) < 0:
+            a.left[n] = _avl_rotate_left(a, a.left[n])
+        return _avl_rotate_right(a, n)
+    if bf < -1:
+        if _avl_bf(a, a.right[n]) > 0:
+            a.right[n] = _avl_rotate_right(a, a.right[n])
+        return _avl_rotate_left(a, n)
+    return n
+
+
+class ArenaAVLTree(_ArenaCounters, AVLTree[T]):
+    def __init__(self, *, storage: str = "arena") -> None:
+        self._arena = NodeArena(sized=True)
+        self._root = NIL
+        self._size = 0
+
+    @property
+    def root(self) -> NodeView | None:  # type: ignore[override]
+        return self._arena.view(self._root)
+
+    def clear(self) -> None:
+        """Vacía el árbol en O(1)."""
+        self._arena.clear()
+        self._root = NIL
+        self._size = 0
+
+    def contains(self, value: T) -> bool:
+        return _find(self._arena, self._root, value) != NIL
+
+    def _find_node(self, value: T) -> NodeView | None:  # type: ignore[override]
+        return self._arena.view(_find(self._arena, self._root, value))
+
+    def iter_inorder(self) -> Iterator[T]:
+        return _iter_inorder(self._arena, self._root)
+
+    def insert(self, value: T) -> bool:
+        self._root, inserted = self._insert_idx(self._root, value)
+        if inserted:
+            self._size += 1
+        return inserted
+
+    def delete(self, value: T) -> bool:
+        self._root, deleted = self._delete_idx(self._root, value)
+        if deleted:
+            self._size -= 1
+        return deleted
+
+    def _insert_idx(self, i: int, value: T) -> tuple[int, bool]:
+        a = self._arena
+        if i == NIL:
+            return a.alloc(value, 1), True
+        if a.counters is not None:
+            a.counters.compares += 1
+        v = a.values[i]
+        if value == v:
+            return i, False
+        if value < v:
+            child, ins = self._insert_idx(a.left[i], value)
+            a.left[i] = child
+        else:
+            child, ins = self._insert_idx(a.right[i], value)
+            a.right[i] = child
+        if not ins:
+            return i, False
+        return _avl_rebalance(a, i), True
+
+    def _delete_idx(self, i: int, value: T) -> tuple[int, bool]:
+        a = self._arena
+        if i == NIL:
+            return NIL, False
+        if a.counters is not None:
+            a.counters.compares += 1
+        v = a.values[i]
+        if value < v:
+            child, deleted = self._delete_idx(a.left[i], value)
+            a.left[i] = child
+        elif value > v:
+            child, deleted = self._delete_idx(a.right[i], value)
+            a.right[i] = child
+        else:
+            left, right = a.left[i], a.right[i]
+            if left == NIL or right == NIL:
+                a.release(i)
+                return (left if left != NIL else right), True
+            # dos hijos: reemplaza por el sucesor inorder (mínimo a la derecha)
+            a.values[i] = a.values[_min_index(a, right)]
+            child, deleted = self._delete_idx(right, a.values[i])
+            a.right[i] = child
+        if not deleted:
+            return i, False
+        return _avl_rebalance(a, i), True
+
+    def _load_sorted(self, vals: list[T]) -> None:
+        self._arena.clear()
+        self._root = self._build_idx(vals, 0, len(vals))
+        self._size = len(vals)
+
+    def _build_idx(self, vals: list[T], lo: int, hi: int) -> int:
+        if lo >= hi:
+            return NIL
+        mid = (lo + hi) // 2
+        a = self._arena
+        i = a.alloc(vals[mid], 1)
+        a.left[i] = self._build_idx(vals, lo, mid)
+        a.right[i] = self._build_idx(vals, mid + 1, hi)
+        _avl_update(a, i)
+        return i
+
+
+# ---------- LLRB (meta = 1 si el link es rojo) ----------
+def _rb_red(a: NodeArena, i: int) -> bool:
+    return i != NIL and a.meta[i] == 1
+
+
+def _rb_red_left_left(a: NodeArena, i: int) -> bool:
+    left = a.left[i]
+    return left != NIL and _rb_red(a, a.left[left])
+
+
+def _rb_rotate_left(a: NodeArena, h: int) -> int:
+    if a.counters is not None:
+        a.counters.rotations += 1
+    x = a.right[h]
+    a.right[h] = a.left[x]
+    a.left[x] = h
+    a.meta[x] = a.meta[h]
+    a.meta[h] = 1
+    a.size[x] = a.size[h]
+    a.update_size(h)
+    return x
+
+
+def _rb_rotate_right(a: NodeArena, h: int) -> int:
+    if a.counters is not None:
+        a.counters.rotations += 1
+    x = a.left[h]
+    a.left[h] = a.right[x]
+    a.right[x] = h
+    a.meta[x] = a.meta[h]
+    a.meta[h] = 1
+    a.size[x] = a.size[h]
+    a.update_size(h)
+    return x
+
+
+def _rb_flip_colors(a: NodeArena, h: int) -> None:
+    if a.counters is not None:
+        a.counters.color_flips += 1
+    a.meta[h] ^= 1
+    if a.left[h] != NIL:
+        a.meta[a.left[h]] ^= 1
+    if a.right[h] != NIL:
+        a.meta[a.right[h]] ^= 1
+
+
+def _rb_fix_up(a: NodeArena, h: int) -> int:
+    if _rb_red(a, a.right[h]) and not _rb_red(a, a.left[h]):
+        h = _rb_rotate_left(a, h)
+    if _rb_red(a, a.left[h]) and _rb_red_left_left(a, h):
+        h = _rb_rotate_right(a, h)
+    if _rb_red(a, a.left[h]) and _rb_red(a, a.right[h]):
+        _rb_flip_colors(a, h)
+    a.update_size(h)
+    return h
+
+
+def _rb_move_red_left(a: NodeArena, h: int) -> int:
+    _rb_flip_colors(a, h)
+    right = a.right[h]
+    if right != NIL and _rb_red(a, a.left[right]):
+        a.right[h] = _rb_rotate_right(a, right)
+        h = _rb_rotate_left(a, h)
+        _rb_flip_colors(a, h)
+    return h
+
+
+def _rb_move_red_right(a: NodeArena, h: int) -> int:
+    _rb_flip_colors(a, h)
+    if _rb_red_left_left(a, h):
+        h = _rb_rotate_right(a, h)
+        _rb_flip_colors(a, h)
+    return h
+
+
+def _rb_delete_min(a: NodeArena, h: int) -> int:
+    if a.left[h] == NIL:
+        a.release(h)
+        return NIL
+    if not _rb_red(a, a.left[h]) and not _rb_red_left_left(a, h):
+        h = _rb_move_red_left(a, h)
+    a.left[h] = _rb_delete_min(a, a.left[h])
+    return _rb_fix_up(a, h)
+
+
+class ArenaRedBlackTree(_ArenaCounters, RedBlackTree[T]):
+    def __init__(self, *, storage: str = "arena") -> None:
+        self._arena = NodeArena(sized=True)
+        self._root = NIL
+        self._size = 0
+
+    @property
+    def root(self) -> NodeView | None:  # type: ignore[override]
+        return self._arena.view(self._root)
+
+    def clear(self) -> None:
+        self._arena.clear()
+        self._root = NIL
+        self._size = 0
+
+    def contains(self, value: T) -> bool:
+        return _find(self._arena, self._root, value) != NIL
+
+    def _find_node(self, value: T) -> NodeView | None:  # type: ignore[override]
+        return self._arena.view(_find(self._arena, self._root, value))
+
+    def iter_inorder(self) -> Iterator[T]:
+        return _iter_inorder(self._arena, self._root)
+
+    def insert(self, value: T) -> bool:
+        a = self._arena
+        self._root, inserted = self._insert_idx(self._root, value)
+        a.meta[self._root] = 0
+        if inserted:
+            self._size += 1
+        return inserted
+
+    def delete(self, value: T) -> bool:
+        a = self._arena
+        if not self.contains(value):
+            return False
+
+        if not _rb_red(a, a.left[self._root]) and not _rb_red(a, a.right[self._root]):
+            a.meta[self._root] = 1
+
+        self._root = self._delete_idx(self._root, value)
+        if self._root != NIL:
+            a.meta[self._root] = 0
+
+        self._size -= 1
+        return True
+
+    def _insert_idx(self, h: int, value: T) -> tuple[int, bool]:
+        a = self._arena
+        if h == NIL:
+            return a.alloc(value, 1), True
+        if a.counters is not None:
+            a.counters.compares += 1
+        v = a.values[h]
+        if value == v:
+            return h, False
+        if value < v:
+            child, ins = self._insert_idx(a.left[h], value)
+            a.left[h] = child
+        else:
+            child, ins = self._insert_idx(a.right[h], value)
+            a.right[h] = child
+        return _rb_fix_up(a, h), ins
+
+    def _delete_idx(self, h: int, value: T) -> int:
+        """Delete recursivo LLRB (asume que value existe)."""
+        a = self._arena
+        if a.counters is not None:
+            a.counters.compares += 1
+        if value < a.values[h] and a.left[h] != NIL:
+            if not _rb_red(a, a.left[h]) and not _rb_red_left_left(a, h):
+                h = _rb_move_red_left(a, h)
+            a.left[h] = self._delete_idx(a.left[h], value)
+        else:
+            if _rb_red(a, a.left[h]):
+                h = _rb_rotate_right(a, h)
+
+            if value == a.values[h] and a.right[h] == NIL:
+                a.release(h)
+                return NIL
+
+            right = a.right[h]
+            if right != NIL:
+                if not _rb_red(a, right) and not _rb_red(a, a.left[right]):
+                    h = _rb_move_red_right(a, h)
+
+                if value == a.values[h]:
+                    a.values[h] = a.values[_min_index(a, a.right[h])]
+                    a.right[h] = _rb_delete_min(a, a.right[h])
+                else:
+                    a.right[h] = self._delete_idx(a.right[h], value)
+
+        return _rb_fix_up(a, h)
+
+    def _load_sorted(self, vals: list[T]) -> None:
+        self._arena.clear()
+        self._root = self._build_idx(vals, 0, len(vals), (len(vals) + 1).bit_length() - 1)
+        self._size = len(vals)
+
+    def _build_idx(self, vals: list[T], lo: int, hi: int, bh: int) -> int:
+        """Mismo layout 2-3 que RedBlackTree._build_sorted, sobre índices."""
+        n = hi - lo
+        if bh == 0:
+            return NIL
+        cap = 3 ** (bh - 1) - 1
+        if n - 1 <= 2 * cap:
+            mid = lo + (n - 1) // 2
+            left = self._build_idx(vals, lo, mid, bh - 1)
+            right = self._build_idx(vals, mid + 1, hi, bh - 1)
+            return self._alloc_built(vals[mid], left, right, False, n)
+
+        # 3-nodo: [a] x [b] y [c]
+        third = (n - 2) // 3
+        x = lo + third
+        y = x + 1 + third + (1 if (n - 2) % 3 == 2 else 0)
+        left = self._build_idx(vals, lo, x, bh - 1)
+        middle = self._build_idx(vals, x + 1, y, bh - 1)
+        red = self._alloc_built(vals[x], left, middle, True, y - lo)
+        right = self._build_idx(vals, y + 1, hi, bh - 1)
+        return self._alloc_built(vals[y], red, right, False, n)
+
+    def _alloc_built(self, value: T, left: int, right: int, red: bool, size: int) -> int:
+        a = self._arena
+        i = a.alloc(value, int(red))
+        a.left[i] = left
+        a.right[i] = right
+        a.size[i] = size
+        return i
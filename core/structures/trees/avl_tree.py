@@ -1,8 +1,20 @@
 from __future__ import annotations
 
-from collections import deque
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
-from typing import Generic, TypeVar
+from typing import Any, Generic, Self, TypeVar
+
+from core.structures.counters import Instrumented
+from core.structures.trees import bounds, order_stats
+from core.structures.trees.arena import STORAGES
+from core.structures.trees.bulk import merge_unique, prefer_rebuild, sorted_unique
+from core.structures.trees.traversal import (
+    iter_inorder,
+    iter_level_order,
+    iter_postorder,
+    iter_preorder,
+    iter_range,
+)
 
 T = TypeVar("T")
 
@@ -15,15 +27,18 @@ class AVLNode(Generic[T]):
     height:
       Altura en nodos (hoja = 1, None = 0).
       Se recalcula con _update_height() después de cambios.
+    size:
+      Nodos del subárbol (order statistics); se mantiene junto con height.
     """
 
     value: T
     height: int = 1
+    size: int = 1
     left: AVLNode[T] | None = None
     right: AVLNode[T] | None = None
 
 
-class AVLTree(Generic[T]):
+class AVLTree(Instrumented, Generic[T]):
     """
     AVL Tree (BST auto-balanceado).
 
@@ -33,9 +48,23 @@ class AVLTree(Generic[T]):
 
     Garantiza:
       altura O(log n) => operaciones típicas O(log n).
+
+    storage="arena": nodos en arrays paralelos (ver trees.arena), mismo API.
+
+    enable_counters(): compares en insert/delete/contains y rotations
+    (ver core.structures.counters).
     """
 
-    def __init__(self) -> None:
+    def __new__(cls, *, storage: str = "node") -> Any:
+        if storage not in STORAGES:
+            raise ValueError(f"storage must be one of {STORAGES}")
+        if cls is AVLTree and storage == "arena":
+            from core.structures.trees.arena_trees import ArenaAVLTree
+
+            return super().__new__(ArenaAVLTree)
+        return super().__new__(cls)
+
+    def __init__(self, *, storage: str = "node") -> None:
         self.root: AVLNode[T] | None = None
         self._size: int = 0
 
@@ -83,74 +112,117 @@ class AVLTree(Generic[T]):
             self._size += 1
         return inserted
 
+    @classmethod
+    def from_sorted(cls, values: Iterable[T]) -> Self:
+        """
+        Construye un árbol balanceado en O(n) desde valores ya ordenados
+        (los duplicados se descartan).
+        """
+        vals = list(values)
+        if any(vals[i] > vals[i + 1] for i in range(len(vals) - 1)):
+            raise ValueError("values must be sorted")
+        tree = cls()
+        tree._load_sorted(sorted_unique(vals))
+        return tree
+
+    def bulk_insert(self, values: Iterable[T]) -> int:
+        """
+        Inserta un lote (ordenado o no). Retorna cuántos valores nuevos insertó.
+
+        Lote grande: ordena, mezcla con el inorder actual y reconstruye en O(n + m).
+        Lote chico sobre árbol grande: insert uno a uno.
+        """
+        new = sorted_unique(values)
+        if not prefer_rebuild(self._size, len(new)):
+            return sum(self.insert(v) for v in new)
+        before = self._size
+        self._load_sorted(merge_unique(self.inorder(), new) if self.root is not None else new)
+        return self._size - before
+
+    def _load_sorted(self, vals: list[T]) -> None:
+        self.root = self._build_sorted(vals, 0, len(vals))
+        self._size = len(vals)
+
     def delete(self, value: T) -> bool:
         self.root, deleted = self._delete_rec(self.root, value)
         if deleted:
             self._size -= 1
         return deleted
 
-    # TODO: Conseguir un ejemplo
-    # DFS inorder (en un BST retorna ordenado)
-    def inorder(self) -> list[T]:
-        out: list[T] = []
+    def __iter__(self) -> Iterator[T]:
+        return self.iter_inorder()
 
-        def dfs(n: AVLNode[T] | None) -> None:
-            if n is None:
-                return
-            dfs(n.left)
-            out.append(n.value)
-            dfs(n.right)
+    def __reversed__(self) -> Iterator[T]:
+        return iter_inorder(self.root, reverse=True)
 
-        dfs(self.root)
-        return out
+    def iter_inorder(self) -> Iterator[T]:
+        return iter_inorder(self.root)
 
-    # DFS preorder
-    def preorder(self) -> list[T]:
-        out: list[T] = []
+    def iter_preorder(self) -> Iterator[T]:
+        return iter_preorder(self.root)
 
-        def dfs(n: AVLNode[T] | None) -> None:
-            if n is None:
-                return
-            out.append(n.value)
-            dfs(n.left)
-            dfs(n.right)
+    def iter_postorder(self) -> Iterator[T]:
+        return iter_postorder(self.root)
 
-        dfs(self.root)
-        return out
+    def iter_range(self, lo: T | None = None, hi: T | None = None) -> Iterator[T]:
+        """Valores en [lo, hi] en orden, sin recorrer el resto del árbol."""
+        return iter_range(self.root, lo, hi)
 
-    # DFS postorder
-    def postorder(self) -> list[T]:
-        out: list[T] = []
+    def range(self, lo: T | None = None, hi: T | None = None) -> Iterator[T]:
+        """Alias de iter_range: O(log n + k), perezoso."""
+        return self.iter_range(lo, hi)
 
-        def dfs(n: AVLNode[T] | None) -> None:
-            if n is None:
-                return
-            dfs(n.left)
-            dfs(n.right)
-            out.append(n.value)
+    # ---------- Bounds (O(altura)) ----------
+    def floor(self, value: T) -> T | None:
+        """Mayor valor <= value, o None."""
+        return bounds.floor(self.root, value)
 
-        dfs(self.root)
-        return out
+    def ceiling(self, value: T) -> T | None:
+        """Menor valor >= value, o None."""
+        return bounds.ceiling(self.root, value)
 
-    def bfs(self) -> list[T]:
-        if self.root is None:
-            return []
+    def predecessor(self, value: T) -> T | None:
+        """Mayor valor < value, o None."""
+        return bounds.predecessor(self.root, value)
 
-        out: list[T] = []
-        q: deque[AVLNode[T]] = deque([self.root])
+    def successor(self, value: T) -> T | None:
+        """Menor valor > value, o None."""
+        return bounds.successor(self.root, value)
 
-        while q:
-            cur = q.popleft()
-            out.append(cur.value)
-            if cur.left is not None:
-                q.append(cur.left)
-            if cur.right is not None:
-                q.append(cur.right)
-        return out
+    # TODO: Conseguir un ejemplo
+    # DFS inorder (en un BST retorna ordenado)
+    def inorder(self) -> list[T]:
+        return list(self.iter_inorder())
+
+    # DFS preorder
+    def preorder(self) -> list[T]:
+        return list(self.iter_preorder())
+
+    # DFS postorder
+    def postorder(self) -> list[T]:
+        return list(self.iter_postorder())
+
+    def bfs(self) -> list[T]:
+        return list(iter_level_order(self.root))
 
     def height(self) -> int:
         return self._h(self.root)
 
+    # ---------- Order statistics (O(log n) con `size`) ----------
+    def select(self, k: int) -> T:
+        """k-ésimo menor (0-indexed). IndexError si k está fuera de rango."""
+        return order_stats.select(self.root, k)
+
+    def rank(self, value: T) -> int:
+        """Cantidad de valores < value (value no tiene que existir)."""
+        return order_stats.rank(self.root, value)
+
+    def count_range(self, lo: T, hi: T) -> int:
+        """Cantidad de valores en [lo, hi]."""
+        if hi < lo:
+            return 0
+        return order_stats.rank(self.root, hi, inclusive=True) - order_stats.rank(self.root, lo)
+
     def is_valid_avl(self) -> bool:
         """
         Verifica
@@ -209,8 +281,9 @@ class AVLTree(Generic[T]):
         return self._h(n.left) - self._h(n.right)
 
     def _update_height(self, n: AVLNode[T]) -> None:
-        """Recalculate the height from n"""
+        """Recalculate the height (and subtree size) from n"""
         n.height = 1 + max(self._h(n.left), self._h(n.right))
+        n.size = 1 + order_stats.node_size(n.left) + order_stats.node_size(n.right)
 
     def _rotate_right(self, y: AVLNode[T]) -> AVLNode[T]:
         """
@@ -222,6 +295,9 @@ class AVLTree(Generic[T]):
 
         T1  T2               T2  T3
         """
+        c = self.counters
+        if c is not None:
+            c.rotations += 1
         x = y.left
         assert x is not None
         t2 = x.right
@@ -243,6 +319,9 @@ class AVLTree(Generic[T]):
 
           T2 T3          T1 T2
         """
+        c = self.counters
+        if c is not None:
+            c.rotations += 1
         y = x.right
         assert y is not None
         t2 = y.left
@@ -250,8 +329,8 @@ class AVLTree(Generic[T]):
         y.left = x
         x.right = t2
 
-        self._update_height(y)
         self._update_height(x)
+        self._update_height(y)
         return y
 
     def _rebalance(self, n: AVLNode[T]) -> AVLNode[T]:
@@ -286,6 +365,9 @@ class AVLTree(Generic[T]):
         """
         if node is None:
             return AVLNode(value), True
+        c = self.counters
+        if c is not None:
+            c.compares += 1
 
         if value == node.value:
             return node, False
@@ -309,6 +391,9 @@ class AVLTree(Generic[T]):
 
         if node is None:
             return None, False
+        c = self.counters
+        if c is not None:
+            c.compares += 1
 
         if value < node.value:
             node.left, deleted = self._delete_rec(node.left, value)
@@ -337,6 +422,20 @@ class AVLTree(Generic[T]):
         node.right, _ = self._delete_rec(node.right, succ.value)
         return self._rebalance(node), True
 
+    def _build_sorted(self, vals: list[T], lo: int, hi: int) -> AVLNode[T] | None:
+        """
+        Mediana como raíz: los subárboles difieren en a lo sumo 1 nodo,
+        así que sus alturas difieren en a lo sumo 1 (AVL válido sin rotar).
+        """
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        n = AVLNode(vals[mid])
+        n.left = self._build_sorted(vals, lo, mid)
+        n.right = self._build_sorted(vals, mid + 1, hi)
+        self._update_height(n)
+        return n
+
     def _min_node(self, node: AVLNode[T]) -> AVLNode[T]:
         cur = node
         while cur.left is not None:
@@ -352,7 +451,10 @@ class AVLTree(Generic[T]):
     def _find_node(self, value: T) -> AVLNode[T] | None:
         """Iterative Search BST"""
         cur = self.root
+        c = self.counters
         while cur is not None:
+            if c is not None:
+                c.compares += 1
             if value == cur.value:
                 return cur
             cur = cur.left if value < cur.value else cur.right
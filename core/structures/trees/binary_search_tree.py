@@ -1,8 +1,22 @@
 from __future__ import annotations
 
-from collections import deque
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
-from typing import Generic, TypeVar
+from itertools import pairwise
+from typing import Any, Generic, Self, TypeVar
+
+from core.structures.counters import Instrumented
+from core.structures.trees import bounds
+from core.structures.trees.arena import STORAGES
+from core.structures.trees.bulk import merge_unique, prefer_rebuild, sorted_unique
+from core.structures.trees.traversal import (
+    iter_inorder,
+    iter_level_order,
+    iter_postorder,
+    iter_preorder,
+    iter_range,
+    tree_height,
+)
 
 T = TypeVar("T")
 
@@ -14,8 +28,19 @@ class BSTNode(Generic[T]):
     right: BSTNode[T] | None = None
 
 
-class BinarySearchTree(Generic[T]):
-    def __init__(self) -> None:
+class BinarySearchTree(Instrumented, Generic[T]):
+    """BST sin balancear. enable_counters(): compares en insert/delete/contains."""
+
+    def __new__(cls, *, storage: str = "node") -> Any:
+        if storage not in STORAGES:
+            raise ValueError(f"storage must be one of {STORAGES}")
+        if cls is BinarySearchTree and storage == "arena":
+            from core.structures.trees.arena_trees import ArenaBinarySearchTree
+
+            return super().__new__(ArenaBinarySearchTree)
+        return super().__new__(cls)
+
+    def __init__(self, *, storage: str = "node") -> None:
         self.root: BSTNode[T] | None = None
         self._size: int = 0
 
@@ -82,7 +107,10 @@ class BinarySearchTree(Generic[T]):
             return True
 
         cur = self.root
+        c = self.counters
         while True:
+            if c is not None:
+                c.compares += 1
             if value == cur.value:
                 return False
             elif value < cur.value:
@@ -98,6 +126,49 @@ class BinarySearchTree(Generic[T]):
                     return True
                 cur = cur.right
 
+    # ---------- Bulk load ----------
+    @classmethod
+    def from_sorted(cls, values: Iterable[T]) -> Self:
+        """
+        Construye un árbol balanceado en O(n) desde valores ya ordenados
+        (los duplicados se descartan).
+        """
+        vals = list(values)
+        if any(vals[i] > vals[i + 1] for i in range(len(vals) - 1)):
+            raise ValueError("values must be sorted")
+        tree = cls()
+        tree._load_sorted(sorted_unique(vals))
+        return tree
+
+    def bulk_insert(self, values: Iterable[T]) -> int:
+        """
+        Inserta un lote (ordenado o no). Retorna cuántos valores nuevos insertó.
+
+        Lote grande: ordena, mezcla con el inorder actual y reconstruye en O(n + m).
+        Lote chico sobre árbol grande: insert uno a uno.
+        """
+        new = sorted_unique(values)
+        if not prefer_rebuild(self._size, len(new)):
+            return sum(self.insert(v) for v in new)
+        before = self._size
+        self._load_sorted(merge_unique(self.inorder(), new) if self.root is not None else new)
+        return self._size - before
+
+    def _load_sorted(self, vals: list[T]) -> None:
+        self.root = self._build_sorted(vals, 0, len(vals))
+        self._size = len(vals)
+
+    def _build_sorted(self, vals: list[T], lo: int, hi: int) -> BSTNode[T] | None:
+        """Mediana como raíz de vals[lo:hi]; profundidad de recursión O(log n)."""
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        return BSTNode(
+            vals[mid],
+            self._build_sorted(vals, lo, mid),
+            self._build_sorted(vals, mid + 1, hi),
+        )
+
     # ---------- Delete ----------
     def delete(self, value: T) -> bool:
         """
@@ -116,6 +187,9 @@ class BinarySearchTree(Generic[T]):
         """
         if node is None:
             return None, False
+        c = self.counters
+        if c is not None:
+            c.compares += 1
 
         if value < node.value:  # type: ignore[operator]
             node.left, deleted = self._delete_rec(node.left, value)
@@ -162,6 +236,46 @@ class BinarySearchTree(Generic[T]):
         return node
 
     # ---------- Traversals ----------
+    def __iter__(self) -> Iterator[T]:
+        return self.iter_inorder()
+
+    def __reversed__(self) -> Iterator[T]:
+        return iter_inorder(self.root, reverse=True)
+
+    def iter_inorder(self) -> Iterator[T]:
+        return iter_inorder(self.root)
+
+    def iter_preorder(self) -> Iterator[T]:
+        return iter_preorder(self.root)
+
+    def iter_postorder(self) -> Iterator[T]:
+        return iter_postorder(self.root)
+
+    def iter_range(self, lo: T | None = None, hi: T | None = None) -> Iterator[T]:
+        """Valores en [lo, hi] en orden, sin recorrer el resto del árbol."""
+        return iter_range(self.root, lo, hi)
+
+    def range(self, lo: T | None = None, hi: T | None = None) -> Iterator[T]:
+        """Alias de iter_range: O(log n + k), perezoso."""
+        return self.iter_range(lo, hi)
+
+    # ---------- Bounds (O(altura)) ----------
+    def floor(self, value: T) -> T | None:
+        """Mayor valor <= value, o None."""
+        return bounds.floor(self.root, value)
+
+    def ceiling(self, value: T) -> T | None:
+        """Menor valor >= value, o None."""
+        return bounds.ceiling(self.root, value)
+
+    def predecessor(self, value: T) -> T | None:
+        """Mayor valor < value, o None."""
+        return bounds.predecessor(self.root, value)
+
+    def successor(self, value: T) -> T | None:
+        """Menor valor > value, o None."""
+        return bounds.successor(self.root, value)
+
     """
     TREE:
               4
@@ -172,17 +286,7 @@ class BinarySearchTree(Generic[T]):
     """
 
     def inorder(self) -> list[T]:
-        out: list[T] = []
-
-        def dfs(n: BSTNode[T] | None) -> None:
-            if n is None:
-                return
-            dfs(n.left)
-            out.append(n.value)
-            dfs(n.right)
-
-        dfs(self.root)
-        return out
+        return list(self.iter_inorder())
 
     """
     TREE:
@@ -194,17 +298,7 @@ class BinarySearchTree(Generic[T]):
     """
 
     def preorder(self) -> list[T]:
-        out: list[T] = []
-
-        def dfs(n: BSTNode[T] | None) -> None:
-            if n is None:
-                return
-            out.append(n.value)
-            dfs(n.left)
-            dfs(n.right)
-
-        dfs(self.root)
-        return out
+        return list(self.iter_preorder())
 
     """
     TREE:
@@ -216,40 +310,21 @@ class BinarySearchTree(Generic[T]):
     """
 
     def postorder(self) -> list[T]:
-        out: list[T] = []
-
-        def dfs(n: BSTNode[T] | None) -> None:
-            if n is None:
-                return
-            dfs(n.left)
-            dfs(n.right)
-            out.append(n.value)
-
-        dfs(self.root)
-        return out
+        return list(self.iter_postorder())
 
     def bfs(self) -> list[T]:
         """Level-order traversal (cola)."""
-        if self.root is None:
-            return []
-
-        out: list[T] = []
-        q: deque[BSTNode[T]] = deque([self.root])
-        while q:
-            cur = q.popleft()
-            out.append(cur.value)
-            if cur.left is not None:
-                q.append(cur.left)
-            if cur.right is not None:
-                q.append(cur.right)
-        return out
+        return list(iter_level_order(self.root))
 
     # ---------- Utils ----------
     def _find_node(self, value: T) -> BSTNode[T] | None:
         if self.root is None:
             return None
         cur = self.root
+        c = self.counters
         while cur is not None:
+            if c is not None:
+                c.compares += 1
             if cur.value == value:
                 return cur
             cur = cur.left if value < cur.value else cur.right
@@ -261,27 +336,13 @@ class BinarySearchTree(Generic[T]):
         - árbol vacío -> 0
         - 1 nodo -> 1
         """
-
-        def h(n: BSTNode[T] | None) -> int:
-            if n is None:
-                return 0
-            return 1 + max(h(n.left), h(n.right))
-
-        return h(self.root)
+        return tree_height(self.root)
 
     def is_valid_bst(self) -> bool:
         """Verifica que se cumple la propiedad BST en el árbol."""
 
-        def ok(n: BSTNode[T] | None, low: T | None, high: T | None) -> bool:
-            if n is None:
-                return True
-            if low is not None and n.value <= low:
-                return False
-            if high is not None and n.value >= high:
-                return False
-            return ok(n.left, low, n.value) and ok(n.right, n.value, high)
-
-        return ok(self.root, None, None)
+        # Equivale a que el inorder sea estrictamente creciente (sin recursión).
+        return all(a < b for a, b in pairwise(self.iter_inorder()))
 
     def snapshot(self) -> dict[str, object]:
         return {
@@ -1,9 +1,18 @@
 from __future__ import annotations
 
 from collections import deque
+from collections.abc import Iterator
 from dataclasses import dataclass
 from typing import Generic, TypeVar
 
+from core.structures.counters import Instrumented
+from core.structures.trees.traversal import (
+    iter_inorder,
+    iter_level_order,
+    iter_postorder,
+    iter_preorder,
+)
+
 T = TypeVar("T")
 
 
@@ -14,7 +23,9 @@ class BTNode(Generic[T]):
     right: BTNode[T] | None = None
 
 
-class BinaryTree(Generic[T]):
+class BinaryTree(Instrumented, Generic[T]):
+    """Árbol binario por niveles. enable_counters(): compares en find/has/delete."""
+
     def __init__(self) -> None:
         self.root: BTNode[T] | None = None
         self._size: int = 0
@@ -55,8 +66,11 @@ class BinaryTree(Generic[T]):
         if self.root is None:
             return None
         q: deque[BTNode[T]] = deque([self.root])
+        c = self.counters
         while q:
             cur = q.popleft()
+            if c is not None:
+                c.compares += 1
             if cur.value == value:
                 return cur
             if cur.left is not None:
@@ -69,8 +83,11 @@ class BinaryTree(Generic[T]):
         if self.root is None:
             return False
         q: deque[BTNode[T]] = deque([self.root])
+        c = self.counters
         while q:
             cur = q.popleft()
+            if c is not None:
+                c.compares += 1
             if cur.value == value:
                 return True
             if cur.left is not None:
@@ -90,6 +107,10 @@ class BinaryTree(Generic[T]):
         if self.root is None:
             return False
 
+        c = self.counters
+        if c is not None:
+            c.compares += self._size  # el BFS compara todos los nodos
+
         if self._size == 1:
             if self.root.value == value:
                 self.clear()
@@ -140,6 +161,18 @@ class BinaryTree(Generic[T]):
         return True
 
     # ---------- Traversals ----------
+    def iter_inorder(self) -> Iterator[T]:
+        return iter_inorder(self.root)
+
+    def iter_preorder(self) -> Iterator[T]:
+        return iter_preorder(self.root)
+
+    def iter_postorder(self) -> Iterator[T]:
+        return iter_postorder(self.root)
+
+    def iter_level_order(self) -> Iterator[T]:
+        return iter_level_order(self.root)
+
     """
     TREE:
               4
@@ -150,17 +183,7 @@ class BinaryTree(Generic[T]):
     """
 
     def inorder(self) -> list[T]:
-        out: list[T] = []
-
-        def dfs(n: BTNode[T] | None) -> None:
-            if n is None:
-                return
-            dfs(n.left)
-            out.append(n.value)
-            dfs(n.right)
-
-        dfs(self.root)
-        return out
+        return list(self.iter_inorder())
 
     """
     TREE:
@@ -172,17 +195,7 @@ class BinaryTree(Generic[T]):
     """
 
     def preorder(self) -> list[T]:
-        out: list[T] = []
-
-        def dfs(n: BTNode[T] | None) -> None:
-            if n is None:
-                return
-            out.append(n.value)
-            dfs(n.left)
-            dfs(n.right)
-
-        dfs(self.root)
-        return out
+        return list(self.iter_preorder())
 
     """
     TREE:
@@ -194,17 +207,7 @@ class BinaryTree(Generic[T]):
     """
 
     def postorder(self) -> list[T]:
-        out: list[T] = []
-
-        def dfs(n: BTNode[T] | None) -> None:
-            if n is None:
-                return
-            dfs(n.left)
-            dfs(n.right)
-            out.append(n.value)
-
-        dfs(self.root)
-        return out
+        return list(self.iter_postorder())
 
     """
     TREE:
@@ -217,18 +220,7 @@ class BinaryTree(Generic[T]):
 
     def level_order(self) -> list[T]:
         """BFS (level-order)"""
-        if self.root is None:
-            return []
-        out: list[T] = []
-        q: deque[BTNode[T]] = deque([self.root])
-        while q:
-            cur = q.popleft()
-            out.append(cur.value)
-            if cur.left is not None:
-                q.append(cur.left)
-            if cur.right is not None:
-                q.append(cur.right)
-        return out
+        return list(iter_level_order(self.root))
 
     def levels(self) -> list[list[T]]:
         """Para UI/render: niveles como listas."""
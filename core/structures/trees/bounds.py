@@ -0,0 +1,64 @@
+"""
+Consultas de cota sobre un BST (nodos con .value / .left / .right).
+Todas bajan un solo camino raíz -> hoja: O(altura). None si no hay tal valor.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+def floor(root: Any | None, value: Any) -> Any | None:
+    """Mayor valor <= value."""
+    out = None
+    cur = root
+    while cur is not None:
+        if cur.value == value:
+            return cur.value
+        if cur.value < value:
+            out = cur.value
+            cur = cur.right
+        else:
+            cur = cur.left
+    return out
+
+
+def ceiling(root: Any | None, value: Any) -> Any | None:
+    """Menor valor >= value."""
+    out = None
+    cur = root
+    while cur is not None:
+        if cur.value == value:
+            return cur.value
+        if cur.value > value:
+            out = cur.value
+            cur = cur.left
+        else:
+            cur = cur.right
+    return out
+
+
+def predecessor(root: Any | None, value: Any) -> Any | None:
+    """Mayor valor < value (value no tiene que existir)."""
+    out = None
+    cur = root
+    while cur is not None:
+        if cur.value < value:
+            out = cur.value
+            cur = cur.right
+        else:
+            cur = cur.left
+    return out
+
+
+def successor(root: Any | None, value: Any) -> Any | None:
+    """Menor valor > value (value no tiene que existir)."""
+    out = None
+    cur = root
+    while cur is not None:
+        if cur.value > value:
+            out = cur.value
+            cur = cur.left
+        else:
+            cur = cur.right
+    return out
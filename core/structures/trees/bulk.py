@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+
+def sorted_unique(values: Iterable[Any]) -> list[Any]:
+    """
+    Valores ordenados y sin duplicados (los árboles no guardan repetidos).
+    Si ya vienen ordenados no se vuelve a ordenar: una sola pasada O(n).
+    """
+    out = list(values)
+    if any(out[i] > out[i + 1] for i in range(len(out) - 1)):
+        out.sort()
+    return [v for i, v in enumerate(out) if i == 0 or out[i - 1] != v]
+
+
+def merge_unique(a: list[Any], b: list[Any]) -> list[Any]:
+    """Merge O(n + m) de dos listas ordenadas y sin duplicados."""
+    out: list[Any] = []
+    i = j = 0
+    while i < len(a) and j < len(b):
+        if a[i] < b[j]:
+            out.append(a[i])
+            i += 1
+        elif b[j] < a[i]:
+            out.append(b[j])
+            j += 1
+        else:
+            out.append(a[i])
+            i += 1
+            j += 1
+    out.extend(a[i:])
+    out.extend(b[j:])
+    return out
+
+
+def prefer_rebuild(size: int, batch: int) -> bool:
+    """
+    ¿Conviene reconstruir todo (O(n + m)) en vez de insertar uno a uno (O(m log n))?
+    Para lotes chicos sobre un árbol grande, insertar sale más barato.
+    """
+    return batch * max(1, size.bit_length()) >= size
@@ -0,0 +1,41 @@
+"""
+Order statistics sobre nodos aumentados con `size` (cantidad de nodos del subárbol).
+Todas bajan un solo camino raíz -> hoja: O(altura).
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+def node_size(n: Any | None) -> int:
+    return n.size if n is not None else 0
+
+
+def select(root: Any | None, k: int) -> Any:
+    """k-ésimo menor valor (0-indexed)."""
+    if not 0 <= k < node_size(root):
+        raise IndexError("select index out of range")
+    cur = root
+    while True:
+        left = node_size(cur.left)
+        if k < left:
+            cur = cur.left
+        elif k == left:
+            return cur.value
+        else:
+            k -= left + 1
+            cur = cur.right
+
+
+def rank(root: Any | None, value: Any, *, inclusive: bool = False) -> int:
+    """Cantidad de valores < value (<= value si inclusive)."""
+    out = 0
+    cur = root
+    while cur is not None:
+        if cur.value < value or (inclusive and cur.value == value):
+            out += node_size(cur.left) + 1
+            cur = cur.right
+        else:
+            cur = cur.left
+    return out
@@ -1,8 +1,21 @@
 from __future__ import annotations
 
-from collections import deque
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
-from typing import Generic, TypeVar
+from typing import Any, Generic, Self, TypeVar
+
+from core.structures.counters import Instrumented
+from core.structures.trees import bounds, order_stats
+from core.structures.trees.arena import STORAGES
+from core.structures.trees.bulk import merge_unique, prefer_rebuild, sorted_unique
+from core.structures.trees.traversal import (
+    iter_inorder,
+    iter_level_order,
+    iter_postorder,
+    iter_preorder,
+    iter_range,
+    tree_height,
+)
 
 T = TypeVar("T")
 
@@ -14,15 +27,17 @@ class RBNode(Generic[T]):
 
     red=True => red link
     red=False => black
+    size => nodes in the subtree (order statistics)
     """
 
     value: T
     left: RBNode[T] | None = None
     right: RBNode[T] | None = None
     red: bool = True
+    size: int = 1
 
 
-class RedBlackTree(Generic[T]):
+class RedBlackTree(Instrumented, Generic[T]):
     """
     Red-Black Tree style LLRB (Left-Leaning Red-Black)
 
@@ -30,9 +45,23 @@ class RedBlackTree(Generic[T]):
     - No two consecutive reds (a red node cannot have a red child)
     - All ways root->None have the same quantity of black nodes
     - Property BST: left < node < right (without duplicates)
+
+    storage="arena": nodos en arrays paralelos (ver trees.arena), mismo API.
+
+    enable_counters(): compares en insert/delete/contains, rotations y
+    color_flips (ver core.structures.counters).
     """
 
-    def __init__(self) -> None:
+    def __new__(cls, *, storage: str = "node") -> Any:
+        if storage not in STORAGES:
+            raise ValueError(f"storage must be one of {STORAGES}")
+        if cls is RedBlackTree and storage == "arena":
+            from core.structures.trees.arena_trees import ArenaRedBlackTree
+
+            return super().__new__(ArenaRedBlackTree)
+        return super().__new__(cls)
+
+    def __init__(self, *, storage: str = "node") -> None:
         self.root: RBNode[T] | None = None
         self._size: int = 0
 
@@ -80,6 +109,37 @@ class RedBlackTree(Generic[T]):
             self._size += 1
         return inserted
 
+    @classmethod
+    def from_sorted(cls, values: Iterable[T]) -> Self:
+        """
+        Construye un árbol balanceado en O(n) desde valores ya ordenados
+        (los duplicados se descartan).
+        """
+        vals = list(values)
+        if any(vals[i] > vals[i + 1] for i in range(len(vals) - 1)):
+            raise ValueError("values must be sorted")
+        tree = cls()
+        tree._load_sorted(sorted_unique(vals))
+        return tree
+
+    def bulk_insert(self, values: Iterable[T]) -> int:
+        """
+        Inserta un lote (ordenado o no). Retorna cuántos valores nuevos insertó.
+
+        Lote grande: ordena, mezcla con el inorder actual y reconstruye en O(n + m).
+        Lote chico sobre árbol grande: insert uno a uno.
+        """
+        new = sorted_unique(values)
+        if not prefer_rebuild(self._size, len(new)):
+            return sum(self.insert(v) for v in new)
+        before = self._size
+        self._load_sorted(merge_unique(self.inorder(), new) if self.root is not None else new)
+        return self._size - before
+
+    def _load_sorted(self, vals: list[T]) -> None:
+        self.root = self._build_sorted(vals, 0, len(vals), (len(vals) + 1).bit_length() - 1)
+        self._size = len(vals)
+
     def delete(self, value: T) -> bool:
         if self.root is None:
             return False
@@ -98,66 +158,75 @@ class RedBlackTree(Generic[T]):
         self._size -= 1
         return True
 
-    def inorder(self) -> list[T]:
-        out: list[T] = []
+    def __iter__(self) -> Iterator[T]:
+        return self.iter_inorder()
 
-        def dfs(n: RBNode[T] | None) -> None:
-            if n is None:
-                return
-            dfs(n.left)
-            out.append(n.value)
-            dfs(n.right)
+    def __reversed__(self) -> Iterator[T]:
+        return iter_inorder(self.root, reverse=True)
 
-        dfs(self.root)
-        return out
+    def iter_inorder(self) -> Iterator[T]:
+        return iter_inorder(self.root)
 
-    def preorder(self) -> list[T]:
-        out: list[T] = []
+    def iter_preorder(self) -> Iterator[T]:
+        return iter_preorder(self.root)
 
-        def dfs(n: RBNode[T] | None) -> None:
-            if n is None:
-                return
-            out.append(n.value)
-            dfs(n.left)
-            dfs(n.right)
+    def iter_postorder(self) -> Iterator[T]:
+        return iter_postorder(self.root)
 
-        dfs(self.root)
-        return out
+    def iter_range(self, lo: T | None = None, hi: T | None = None) -> Iterator[T]:
+        """Valores en [lo, hi] en orden, sin recorrer el resto del árbol."""
+        return iter_range(self.root, lo, hi)
 
-    def postorder(self) -> list[T]:
-        out: list[T] = []
+    def range(self, lo: T | None = None, hi: T | None = None) -> Iterator[T]:
+        """Alias de iter_range: O(log n + k), perezoso."""
+        return self.iter_range(lo, hi)
 
-        def dfs(n: RBNode[T] | None) -> None:
-            if n is None:
-                return
-            dfs(n.left)
-            dfs(n.right)
-            out.append(n.value)
+    # ---------- Bounds (O(altura)) ----------
+    def floor(self, value: T) -> T | None:
+        """Mayor valor <= value, o None."""
+        return bounds.floor(self.root, value)
 
-        dfs(self.root)
-        return out
+    def ceiling(self, value: T) -> T | None:
+        """Menor valor >= value, o None."""
+        return bounds.ceiling(self.root, value)
 
-    def bfs(self) -> list[T]:
-        if self.root is None:
-            return []
+    def predecessor(self, value: T) -> T | None:
+        """Mayor valor < value, o None."""
+        return bounds.predecessor(self.root, value)
 
-        out: list[T] = []
-        q: deque[RBNode[T]] = deque([self.root])
+    def successor(self, value: T) -> T | None:
+        """Menor valor > value, o None."""
+        return bounds.successor(self.root, value)
 
-        while q:
-            cur = q.popleft()
-            out.append(cur.value)
-            if cur.left is not None:
-                q.append(cur.left)
-            if cur.right is not None:
-                q.append(cur.right)
-        return out
+    def inorder(self) -> list[T]:
+        return list(self.iter_inorder())
+
+    def preorder(self) -> list[T]:
+        return list(self.iter_preorder())
+
+    def postorder(self) -> list[T]:
+        return list(self.iter_postorder())
+
+    def bfs(self) -> list[T]:
+        return list(iter_level_order(self.root))
 
     def height(self) -> int:
-        def h(n: RBNode[T] | None) -> int:
-            return 0 if n is None else max(h(n.left), h(n.right)) + 1
+        return tree_height(self.root)
 
-        return h(self.root)
+    # ---------- Order statistics (O(log n) con `size`) ----------
+    def select(self, k: int) -> T:
+        """k-ésimo menor (0-indexed). IndexError si k está fuera de rango."""
+        return order_stats.select(self.root, k)
+
+    def rank(self, value: T) -> int:
+        """Cantidad de valores < value (value no tiene que existir)."""
+        return order_stats.rank(self.root, value)
+
+    def count_range(self, lo: T, hi: T) -> int:
+        """Cantidad de valores en [lo, hi]."""
+        if hi < lo:
+            return 0
+        return order_stats.rank(self.root, hi, inclusive=True) - order_stats.rank(self.root, lo)
 
     def is_valid_llrb(self) -> bool:
         """
@@ -224,12 +293,17 @@ class RedBlackTree(Generic[T]):
           a   x     =>      h   c
             b   c         a   b
         """
+        c = self.counters
+        if c is not None:
+            c.rotations += 1
         x = h.right
         assert x is not None
         h.right = x.left
         x.left = h
         x.red = h.red
         h.red = True
+        x.size = h.size
+        self._update_size(h)
         return x
 
     def _rotate_right(self, h: RBNode[T]) -> RBNode[T]:
@@ -239,16 +313,27 @@ class RedBlackTree(Generic[T]):
             x   c   =>     a   h
           a   b              b   c
         """
+        c = self.counters
+        if c is not None:
+            c.rotations += 1
         x = h.left
         assert x is not None
         h.left = x.right
         x.right = h
         x.red = h.red
         h.red = True
+        x.size = h.size
+        self._update_size(h)
         return x
 
+    def _update_size(self, h: RBNode[T]) -> None:
+        h.size = 1 + order_stats.node_size(h.left) + order_stats.node_size(h.right)
+
     def _flip_colors(self, h: RBNode[T]) -> None:
         """Split/Merge four nodes (toggle)"""
+        c = self.counters
+        if c is not None:
+            c.color_flips += 1
         h.red = not h.red
         if h.left is not None:
             h.left.red = not h.left.red
@@ -263,6 +348,7 @@ class RedBlackTree(Generic[T]):
             h = self._rotate_right(h)
         if self._is_red(h.left) and self._is_red(h.right):
             self._flip_colors(h)
+        self._update_size(h)
         return h
 
     def _move_red_left(self, h: RBNode[T]) -> RBNode[T]:
@@ -292,6 +378,9 @@ class RedBlackTree(Generic[T]):
         """Recursive insert LLRB"""
         if h is None:
             return RBNode(value=value, red=True), True
+        c = self.counters
+        if c is not None:
+            c.compares += 1
 
         if value == h.value:
             return h, False
@@ -303,6 +392,42 @@ class RedBlackTree(Generic[T]):
 
         return self._fix_up(h), ins
 
+    def _build_sorted(self, vals: list[T], lo: int, hi: int, bh: int) -> RBNode[T] | None:
+        """
+        Construye vals[lo:hi] como un árbol 2-3 de altura negra bh (bulk load).
+
+        Un subárbol de altura negra b tiene entre 2^b - 1 (todo 2-nodos) y
+        3^b - 1 (todo 3-nodos) valores. Si el resto no entra en dos hijos,
+        la raíz es un 3-nodo: negro con hijo izquierdo rojo (left-leaning).
+        """
+        n = hi - lo
+        if bh == 0:
+            return None
+        cap = 3 ** (bh - 1) - 1  # máximo por hijo de altura negra bh - 1
+
+        if n - 1 <= 2 * cap:
+            mid = lo + (n - 1) // 2
+            return RBNode(
+                vals[mid],
+                self._build_sorted(vals, lo, mid, bh - 1),
+                self._build_sorted(vals, mid + 1, hi, bh - 1),
+                red=False,
+                size=n,
+            )
+
+        # 3-nodo: [a] x [b] y [c]
+        third = (n - 2) // 3
+        x = lo + third
+        y = x + 1 + third + (1 if (n - 2) % 3 == 2 else 0)
+        red = RBNode(
+            vals[x],
+            self._build_sorted(vals, lo, x, bh - 1),
+            self._build_sorted(vals, x + 1, y, bh - 1),
+            red=True,
+            size=y - lo,
+        )
+        return RBNode(vals[y], red, self._build_sorted(vals, y + 1, hi, bh - 1), red=False, size=n)
+
     def _delete_min(self, h: RBNode[T]) -> RBNode[T] | None:
         """Delete the minimum value from subtree h"""
         if h.left is None:
@@ -319,9 +444,12 @@ class RedBlackTree(Generic[T]):
         """Recursive delete LLRB (assumes value exists)"""
         if h is None:
             return None
+        c = self.counters
+        if c is not None:
+            c.compares += 1
 
         if value < h.value and h.left is not None:
-            if not self._is_red(h.left) and self._is_red(h.left.left):
+            if not self._is_red(h.left) and not self._is_red(h.left.left):
                 h = self._move_red_left(h)
             h.left = self._delete_rec(h.left, value)
         else:
@@ -358,7 +486,10 @@ class RedBlackTree(Generic[T]):
 
     def _find_node(self, value: T) -> RBNode[T] | None:
         cur = self.root
+        c = self.counters
         while cur is not None:
+            if c is not None:
+                c.compares += 1
             if value == cur.value:
                 return cur
             cur = cur.left if value < cur.value else cur.right
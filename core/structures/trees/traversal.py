@@ -0,0 +1,98 @@
+"""
+Recorridos iterativos (pila explícita) para nodos con .value / .left / .right.
+
+Son generadores: no arman la lista completa ni dependen del recursion limit,
+así que sirven para árboles degenerados y para consumir solo los primeros k.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterator
+from typing import Any
+
+
+def iter_inorder(root: Any | None, *, reverse: bool = False) -> Iterator[Any]:
+    """Inorder (reverse=True: derecha -> nodo -> izquierda, o sea descendente en un BST)."""
+    first, second = ("right", "left") if reverse else ("left", "right")
+    stack: list[Any] = []
+    cur = root
+    while stack or cur is not None:
+        while cur is not None:
+            stack.append(cur)
+            cur = getattr(cur, first)
+        n = stack.pop()
+        yield n.value
+        cur = getattr(n, second)
+
+
+def iter_preorder(root: Any | None) -> Iterator[Any]:
+    stack = [root] if root is not None else []
+    while stack:
+        n = stack.pop()
+        yield n.value
+        if n.right is not None:
+            stack.append(n.right)
+        if n.left is not None:
+            stack.append(n.left)
+
+
+def iter_postorder(root: Any | None) -> Iterator[Any]:
+    stack: list[Any] = []
+    last: Any | None = None
+    cur = root
+    while stack or cur is not None:
+        while cur is not None:
+            stack.append(cur)
+            cur = cur.left
+        top = stack[-1]
+        if top.right is not None and top.right is not last:
+            cur = top.right
+            continue
+        stack.pop()
+        yield top.value
+        last = top
+
+
+def iter_range(root: Any | None, lo: Any | None, hi: Any | None) -> Iterator[Any]:
+    """
+    Valores de un BST con lo <= v <= hi, en orden (None = sin cota).
+    Poda: no baja a la izquierda de nodos < lo y corta al pasar hi, O(log n + k).
+    """
+    stack: list[Any] = []
+    cur = root
+    while stack or cur is not None:
+        while cur is not None:
+            if lo is not None and cur.value < lo:
+                cur = cur.right
+            else:
+                stack.append(cur)
+                cur = cur.left
+        if not stack:
+            return
+        n = stack.pop()
+        if hi is not None and n.value > hi:
+            return
+        yield n.value
+        cur = n.right
+
+
+def iter_level_order(root: Any | None) -> Iterator[Any]:
+    q: deque[Any] = deque([root] if root is not None else [])
+    while q:
+        n = q.popleft()
+        yield n.value
+        if n.left is not None:
+            q.append(n.left)
+        if n.right is not None:
+            q.append(n.right)
+
+
+def tree_height(root: Any | None) -> int:
+    """Altura en nodos (vacío -> 0), por niveles en vez de recursión."""
+    height = 0
+    level = [root] if root is not None else []
+    while level:
+        height += 1
+        level = [c for n in level for c in (n.left, n.right) if c is not None]
+    return height
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from typing import Any
+
+Shape = list[tuple[Any, ...]]
+"""
+Forma congelada de un árbol binario en preorder.
+
+Cada entrada: (value, has_left, has_right, *attrs)
+Es una lista plana (no nodos), así que es barata de guardar por paso y
+se diferencia bien con un splice (ver core.timeline).
+"""
+
+
+def freeze_tree(root: Any | None, *, attrs: Sequence[str] = ()) -> Shape:
+    """Captura valores, forma y `attrs` extra (ej: height, red) sin recursión."""
+    out: Shape = []
+    stack = [root] if root is not None else []
+    while stack:
+        n = stack.pop()
+        out.append(
+            (n.value, n.left is not None, n.right is not None, *(getattr(n, a) for a in attrs))
+        )
+        if n.right is not None:
+            stack.append(n.right)
+        if n.left is not None:
+            stack.append(n.left)
+    return out
+
+
+def thaw_tree(
+    shape: Sequence[tuple[Any, ...]],
+    node_factory: Callable[[Any], Any],
+    *,
+    attrs: Sequence[str] = (),
+) -> Any | None:
+    """Reconstruye nodos nuevos a partir de freeze_tree (para los renderers)."""
+    if not shape:
+        return None
+
+    root: Any | None = None
+    # pila de (nodo, lado pendiente) donde colgar el siguiente nodo del preorder
+    pending: list[tuple[Any, str]] = []
+    for value, has_left, has_right, *extra in shape:
+        node = node_factory(value)
+        for name, v in zip(attrs, extra, strict=True):
+            setattr(node, name, v)
+
+        if pending:
+            parent, side = pending.pop()
+            setattr(parent, side, node)
+        else:
+            root = node
+
+        if has_right:
+            pending.append((node, "right"))
+        if has_left:
+            pending.append((node, "left"))
+    return root
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import fields, is_dataclass, replace
+from typing import Any, Generic, NamedTuple, TypeVar, overload
+
+T = TypeVar("T")
+
+_SPLICEABLE = (list, tuple, str)
+
+
+class _Splice(NamedTuple):
+    """Reemplazo old[start:stop] -> chunk (listas, tuplas o strings)."""
+
+    start: int
+    stop: int
+    chunk: Any
+
+
+class _Delta(dict[str, Any]):
+    """Campos que cambiaron respecto al paso anterior (valor o _Splice)."""
+
+
+def _common_prefix(a: Sequence[Any], b: Sequence[Any], limit: int) -> int:
+    # Búsqueda binaria sobre comparaciones de slices (se hacen en C).
+    lo, hi = 0, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[:mid] == b[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _common_suffix(a: Sequence[Any], b: Sequence[Any], limit: int) -> int:
+    la, lb = len(a), len(b)
+    lo, hi = 0, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[la - mid :] == b[lb - mid :]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _encode(old: Any, new: Any) -> Any:
+    """Codifica `new` relativo a `old`: splice si es más chico, si no el valor completo."""
+    if type(old) is not type(new) or not isinstance(new, _SPLICEABLE):
+        return new
+    limit = min(len(old), len(new))
+    start = _common_prefix(old, new, limit)
+    end = _common_suffix(old, new, limit - start)
+    chunk = new[start : len(new) - end]
+    if len(chunk) * 2 > len(new):
+        return new
+    return _Splice(start, len(old) - end, chunk)
+
+
+def _decode(old: Any, patch: Any) -> Any:
+    if isinstance(patch, _Splice):
+        return old[: patch.start] + patch.chunk + old[patch.stop :]
+    return patch
+
+
+def _diff(old: Any, new: Any) -> _Delta:
+    delta = _Delta()
+    for f in fields(new):
+        a = getattr(old, f.name)
+        b = getattr(new, f.name)
+        if a is b or a == b:
+            continue
+        delta[f.name] = _encode(a, b)
+    return delta
+
+
+class Timeline(Sequence[T], Generic[T]):
+    """
+    Secuencia de pasos con codificación delta.
+
+    Cada `keyframe_interval` pasos se guarda el Step completo (keyframe); entre
+    keyframes solo se guardan los campos que cambiaron respecto al paso anterior
+    (listas y strings como un splice prefijo/sufijo). Memoria ~O(cambios) en vez de
+    O(pasos * tamaño de la estructura).
+
+    Acceso aleatorio: O(keyframe_interval) reconstruyendo desde el keyframe previo.
+    Acceso secuencial (Prev/Next, iteración): O(1) amortizado por paso. Hacia
+    adelante se avanza desde el cursor; hacia atrás, el primer Prev materializa
+    el tramo keyframe..índice y los siguientes lo reutilizan.
+
+    Los pasos deben ser dataclasses del mismo tipo para poder diferenciarlos;
+    cualquier otro valor se guarda completo.
+    """
+
+    def __init__(self, steps: Iterable[T] = (), *, keyframe_interval: int = 32) -> None:
+        if keyframe_interval < 1:
+            raise ValueError("keyframe_interval must be >= 1")
+        self.keyframe_interval = keyframe_interval
+        self._frames: list[Any] = []  # Step completo (keyframe) o _Delta
+        self._since_keyframe = 0
+        self._last: T | None = None
+        self._cursor: tuple[int, T] | None = None
+        self._segment: tuple[int, list[T]] | None = None  # pasos start..start+len-1
+        for step in steps:
+            self.append(step)
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def append(self, step: T) -> None:
+        prev = self._last
+        if (
+            prev is None
+            or self._since_keyframe + 1 >= self.keyframe_interval
+            or not is_dataclass(step)
+            or type(step) is not type(prev)
+        ):
+            self._frames.append(step)
+            self._since_keyframe = 0
+        else:
+            self._frames.append(_diff(prev, step))
+            self._since_keyframe += 1
+        self._last = step
+
+    def extend(self, steps: Iterable[T]) -> None:
+        for step in steps:
+            self.append(step)
+
+    def keyframes(self) -> int:
+        """Cantidad de pasos guardados completos."""
+        return sum(1 for f in self._frames if not isinstance(f, _Delta))
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+
+    def __getitem__(self, index: int | slice) -> T | list[T]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        n = len(self._frames)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("Timeline index out of range")
+
+        if index == n - 1:
+            assert self._last is not None
+            return self._last
+
+        step = self._seek(index)
+        self._cursor = (index, step)
+        return step
+
+    def __iter__(self) -> Iterator[T]:
+        cur: T | None = None
+        for frame in self._frames:
+            cur = self._apply(cur, frame)
+            yield cur
+
+    def _seek(self, index: int) -> T:
+        # una sola lectura de cursor y tramo: un Timeline cacheado lo leen varias
+        # sesiones a la vez (se reemplazan enteros, nunca se mutan)
+        segment = self._segment
+        if segment is not None and 0 <= index - segment[0] < len(segment[1]):
+            return segment[1][index - segment[0]]
+
+        start = index
+        while isinstance(self._frames[start], _Delta):
+            start -= 1
+
+        # Hacia adelante en el mismo tramo: se sigue desde el cursor.
+        cursor = self._cursor
+        if cursor is not None and start <= cursor[0] <= index:
+            i, cur = cursor
+            while i < index:
+                i += 1
+                cur = self._apply(cur, self._frames[i])
+            return cur
+
+        # Si no (hacia atrás o a otro tramo): se reconstruye desde el keyframe
+        # guardando los pasos intermedios para los Prev que siguen.
+        cur = self._frames[start]
+        steps = [cur]
+        for i in range(start + 1, index + 1):
+            cur = self._apply(cur, self._frames[i])
+            steps.append(cur)
+        self._segment = (start, steps)
+        return cur
+
+    @staticmethod
+    def _apply(cur: Any, frame: Any) -> Any:
+        if not isinstance(frame, _Delta):
+            return frame
+        if not frame:
+            return cur
+        return replace(cur, **{name: _decode(getattr(cur, name), p) for name, p in frame.items()})
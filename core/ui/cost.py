@@ -0,0 +1,23 @@
+import streamlit as st
+
+from core.stepper import Stepper
+from core.structures.counters import format_cost
+
+# Un paso que cuesta esto o más veces el promedio del script se marca
+SPIKE_FACTOR = 3.0
+
+
+def render_step_cost(stepper: Stepper) -> None:
+    """Contadores de la operación del paso actual (compares, probes, ...)."""
+    cost = getattr(stepper.current(), "cost", None)
+    if not cost:
+        return
+    ops = len(stepper.steps) - 1  # el paso 0 es el estado inicial
+    avg = sum(stepper.cost_totals().values()) / ops
+    total = sum(cost.values())
+    if ops > 1 and total >= SPIKE_FACTOR * avg:
+        st.warning(
+            f"**Costo:** {format_cost(cost)} — {total / avg:.1f} veces el promedio del script"
+        )
+    else:
+        st.caption(f"Costo: {format_cost(cost)}")
@@ -0,0 +1,69 @@
+from collections.abc import Callable
+from typing import Any
+
+import streamlit as st
+
+from core.profiling import BuildProfile, profile_build
+from core.step_cache import cached_build_steps
+from core.ui.sidebar import profiling_enabled
+
+
+def build_steps_with_profile(
+    ops_text: str,
+    parse: Callable[[str], Any],
+    build: Callable[..., Any],
+    *,
+    profile_key: str,
+    **params: Any,
+) -> Any:
+    """
+    cached_build_steps y, con el toggle "Profiling" encendido, además un
+    BuildProfile en st.session_state[profile_key] (si no, se borra el anterior).
+    """
+    steps = cached_build_steps(ops_text, parse, build, **params)
+    if profiling_enabled():
+        st.session_state[profile_key] = profile_build(ops_text, parse, build, **params)
+    else:
+        st.session_state.pop(profile_key, None)
+    return steps
+
+
+def render_profile_panel(profile_key: str) -> None:
+    """Tiempos y memoria por paso del último build perfilado, con exports."""
+    profile: BuildProfile | None = st.session_state.get(profile_key)
+    if profile is None or not profiling_enabled():
+        return
+
+    with st.expander("Profiling del build", expanded=True):
+        c1, c2, c3, c4 = st.columns(4)
+        c1.metric("Parse", f"{profile.parse_ms:.1f} ms")
+        c2.metric("Estructura", f"{profile.op_ms:.1f} ms")
+        c3.metric("DOT", f"{profile.dot_ms:.1f} ms")
+        c4.metric("Pico por paso", f"{profile.peak_kib:.1f} KiB")
+
+        steps = profile.steps
+        st.bar_chart(
+            {
+                "estructura (ms)": [s.op_ms for s in steps],
+                "dot (ms)": [s.dot_ms for s in steps],
+            },
+            x_label="paso",
+            height=200,
+        )
+        st.line_chart({"pico (KiB)": [s.peak_kib for s in steps]}, x_label="paso", height=160)
+
+        d1, d2 = st.columns(2)
+        d1.download_button(
+            "Exportar JSON",
+            data=profile.to_json(),
+            file_name=f"{profile.structure}_profile.json",
+            mime="application/json",
+        )
+        d2.download_button(
+            "cProfile (.prof)",
+            data=profile.pstats,
+            file_name=f"{profile.structure}.prof",
+            mime="application/octet-stream",
+            help="Abrir con pstats.Stats(archivo) o snakeviz.",
+        )
+        st.code(profile.pstats_text, language="text")
@@ -4,6 +4,13 @@ import streamlit as st
 
 Group = Literal["linear", "hash", "trees"]
 
+PROFILING_KEY = "profiling"
+
+
+def profiling_enabled() -> bool:
+    """Toggle "Profiling" del sidebar (ver core.ui.profiling)."""
+    return bool(st.session_state.get(PROFILING_KEY, False))
+
 
 def render_sidebar_nav(active_group: Group | None = None) -> None:
     # Persistimos el último grupo visitado (sin UI extra)
@@ -40,3 +47,11 @@ def render_sidebar_nav(active_group: Group | None = None) -> None:
             st.page_link("pages/13_BinarySearchTree.py", label="Binary Search Tree (BST)")
             st.page_link("pages/14_AVLTree.py", label="AVL Tree")
             st.page_link("pages/15_RedBlackTree.py", label="Red-Black Tree (LLRB)")
+
+        st.divider()
+        # Sin key: el estado de un widget con key no sobrevive al cambio de página
+        st.session_state[PROFILING_KEY] = st.toggle(
+            "Profiling",
+            value=profiling_enabled(),
+            help="Al construir pasos mide tiempo y memoria por operación (más lento).",
+        )
@@ -0,0 +1,282 @@
+"""
+Generador de workloads: scripts de operaciones válidos para cada gramática *_ops.
+
+  for line in generate("hash_table", 1_000_000, keys="zipf", mix="read_heavy", seed=1):
+      ...
+
+Cada línea sale de un generador (nada se arma de antemano) y todo el azar
+viene de random.Random(seed): misma config y seed → mismo script. La memoria
+es O(tamaño vivo de la estructura), no O(operaciones): para borrar o leer keys
+presentes se lleva el conjunto de keys vivas. Si el mix no lo necesita (sin
+delete y con lookups sacados del stream, sin lookup_hit; p. ej. mix=insert) no
+se lleva y la memoria es O(1).
+
+Distribuciones de keys (`keys`):
+  uniform     uniforme en [0, universe)
+  zipf        sesgo Zipf de exponente zipf_s (la key 0 es la más caliente)
+  sorted      inserts ascendentes 0, 1, 2, ... (peor caso de un BST)
+  reverse     inserts descendentes
+  collision   i << 32: stable_hash da 0 para todas → mismo bucket con
+              cualquier capacidad
+
+Mezclas (`mix`, pesos insert / lookup / delete):
+  insert        solo inserts
+  read_heavy    10 / 90 / 0
+  balanced      50 / 30 / 20
+  delete_heavy  35 / 15 / 50
+
+Los scripts no cortan la simulación: los pop/read/peek salen solo con la
+estructura no vacía (si no, se inserta), los delete por key eligen una key
+viva y los lookup que fallan con KeyError (get de hash_table / ordered_map)
+solo se usan con keys vivas.
+"""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+KEY_DISTRIBUTIONS = ("uniform", "zipf", "sorted", "reverse", "collision")
+
+MIXES: dict[str, tuple[int, int, int]] = {
+    "insert": (1, 0, 0),
+    "read_heavy": (10, 90, 0),
+    "balanced": (50, 30, 20),
+    "delete_heavy": (35, 15, 50),
+}
+
+_COLLISION_SHIFT = 32  # stable_hash(int) = key & 0xFFFFFFFF
+
+
+@dataclass(frozen=True)
+class Grammar:
+    """
+    Cómo se escriben insert / lookup / delete en una gramática.
+
+    Los templates se formatean con k (key) o i (índice < size).
+    by_key=False: delete es un pop (sin key) y lookup mira un extremo.
+    lookup_hit: comando para keys vivas (get), si difiere de lookup.
+    multiset: la estructura guarda duplicados (las listas).
+    overwrite: insert con la estructura llena (solo ring_buffer).
+    """
+
+    name: str
+    insert: str
+    lookup: str
+    delete: str
+    by_key: bool = True
+    lookup_hit: str | None = None
+    multiset: bool = False
+    overwrite: str | None = None
+
+
+GRAMMARS: dict[str, Grammar] = {
+    g.name: g
+    for g in (
+        Grammar("array_list", "append {k}", "get {i}", "pop", by_key=False),
+        Grammar("stack", "push {k}", "peek", "pop", by_key=False),
+        Grammar("queue", "enqueue {k}", "front", "dequeue", by_key=False),
+        Grammar("deque", "push_back {k}", "peek_front", "pop_front", by_key=False),
+        Grammar(
+            "ring_buffer", "write {k}", "peek", "read", by_key=False, overwrite="write_over {k}"
+        ),
+        Grammar("linked_list", "append {k}", "find {k}", "delete {k}", multiset=True),
+        Grammar("doubly_linked_list", "push_back {k}", "find {k}", "delete {k}", multiset=True),
+        Grammar(
+            "circular_doubly_linked_list",
+            "push_back {k}",
+            "find {k}",
+            "delete {k}",
+            multiset=True,
+        ),
+        Grammar("skip_list", "insert {k}", "search {k}", "delete {k}"),
+        Grammar("hash_table", "set {k} {k}", "has {k}", "delete {k}", lookup_hit="get {k}"),
+        Grammar("hash_set", "add {k}", "contains {k}", "remove {k}"),
+        Grammar("ordered_map", "set {k} {k}", "has {k}", "del {k}", lookup_hit="get {k}"),
+        Grammar("binary_tree", "insert {k}", "find {k}", "delete {k}"),
+        Grammar("binary_search_tree", "insert {k}", "search {k}", "delete {k}"),
+        Grammar("avl_tree", "insert {k}", "contains {k}", "delete {k}"),
+        Grammar("red_black_tree", "insert {k}", "contains {k}", "delete {k}"),
+    )
+}
+
+
+def get_grammar(name: str) -> Grammar:
+    """Acepta el nombre de la estructura o del módulo (hash_table / hash_table_ops)."""
+    try:
+        return GRAMMARS[name.lower().removesuffix("_ops")]
+    except KeyError:
+        raise ValueError(f"unknown grammar {name!r}; choose from {sorted(GRAMMARS)}") from None
+
+
+def _zipf_keys(rng: random.Random, universe: int, s: float) -> Iterator[int]:
+    """
+    Ranks con ley de potencia acotada a [0, universe) por inversión de la CDF
+    continua: O(1) memoria, sin tabla de pesos por key.
+    """
+    if s == 1.0:
+        while True:
+            yield min(int((universe + 1) ** rng.random()), universe) - 1
+    a = 1.0 - s
+    top = (universe + 1) ** a - 1.0
+    while True:
+        yield min(int((top * rng.random() + 1.0) ** (1.0 / a)), universe) - 1
+
+
+def iter_keys(
+    dist: str, *, seed: int = 0, universe: int = 1_000_000, zipf_s: float = 1.1
+) -> Iterator[int]:
+    """Stream infinito de keys enteras según `dist` (ver KEY_DISTRIBUTIONS)."""
+    if universe <= 0:
+        raise ValueError("universe must be > 0")
+    rng = random.Random(seed)
+    if dist == "uniform":
+        return (rng.randrange(universe) for _ in iter(int, 1))
+    if dist == "zipf":
+        if zipf_s <= 0:
+            raise ValueError("zipf_s must be > 0")
+        return _zipf_keys(rng, universe, zipf_s)
+    if dist == "sorted":
+        return _count(0, 1)
+    if dist == "reverse":
+        return _count(universe - 1, -1)
+    if dist == "collision":
+        return (i << _COLLISION_SHIFT for i in _count(0, 1))
+    raise ValueError(f"unknown key distribution {dist!r}; choose from {KEY_DISTRIBUTIONS}")
+
+
+def _count(start: int, step: int) -> Iterator[int]:
+    k = start
+    while True:
+        yield k
+        k += step
+
+
+class _Live:
+    """Keys presentes con elección al azar y borrado O(1) (swap con la última)."""
+
+    def __init__(self, multiset: bool) -> None:
+        self.multiset = multiset
+        self.keys: list[int] = []
+        self.pos: dict[int, int] = {}
+        self.count: dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, key: int) -> bool:
+        return key in self.pos
+
+    def add(self, key: int) -> None:
+        if key in self.pos:
+            if self.multiset:
+                self.count[key] += 1
+            return
+        self.pos[key] = len(self.keys)
+        self.keys.append(key)
+        self.count[key] = 1
+
+    def pick(self, rng: random.Random) -> int:
+        return self.keys[rng.randrange(len(self.keys))]
+
+    def discard(self, key: int) -> None:
+        self.count[key] -= 1
+        if self.count[key]:
+            return
+        del self.count[key]
+        i = self.pos.pop(key)
+        last = self.keys.pop()
+        if last != key:
+            self.keys[i] = last
+            self.pos[last] = i
+
+
+def generate(
+    grammar: str | Grammar,
+    n: int,
+    *,
+    keys: str = "uniform",
+    mix: str = "balanced",
+    seed: int = 0,
+    universe: int | None = None,
+    zipf_s: float = 1.1,
+    capacity: int = 1_024,
+) -> Iterator[str]:
+    """
+    n líneas de operaciones para `grammar`, una por iteración.
+
+    universe: rango de keys de uniform/zipf (default n) y punto de partida de
+    reverse. capacity: solo ring_buffer (el RingBuffer que correrá el script).
+    ValueError si la config no es válida (se valida al llamar, no al iterar).
+    """
+    g = grammar if isinstance(grammar, Grammar) else get_grammar(grammar)
+    if n < 0:
+        raise ValueError("n must be >= 0")
+    try:
+        weights = MIXES[mix]
+    except KeyError:
+        raise ValueError(f"unknown mix {mix!r}; choose from {sorted(MIXES)}") from None
+    if g.overwrite is not None and capacity <= 0:
+        raise ValueError("capacity must be > 0")
+    key_stream = iter_keys(keys, seed=seed, universe=universe or max(n, 1), zipf_s=zipf_s)
+    # sorted/reverse/collision: los lookups van sobre keys vivas (un lookup
+    # "del stream" sería siempre un miss)
+    lookup_from_stream = keys in ("uniform", "zipf")
+    return _generate(
+        g, n, key_stream, weights, random.Random(seed + 1), lookup_from_stream, capacity
+    )
+
+
+def _generate(
+    g: Grammar,
+    n: int,
+    key_stream: Iterator[int],
+    weights: tuple[int, int, int],
+    rng: random.Random,
+    lookup_from_stream: bool,
+    capacity: int,
+) -> Iterator[str]:
+    w_insert, w_lookup, w_delete = weights
+    total = w_insert + w_lookup + w_delete
+    live = _Live(g.multiset)
+    # solo delete y los lookups sobre keys vivas (o con lookup_hit) consultan live
+    track = g.by_key and (
+        w_delete > 0 or (w_lookup > 0 and (not lookup_from_stream or g.lookup_hit is not None))
+    )
+    size = 0  # gramáticas sin key (pops) o keys insertadas si no se lleva live
+
+    for _ in range(n):
+        r = rng.randrange(total)
+        empty = not (live if track else size)
+
+        if r < w_insert or empty:
+            k = next(key_stream)
+            if not g.by_key:
+                if g.overwrite is not None and size >= capacity:
+                    yield g.overwrite.format(k=k)
+                    continue
+                size += 1
+                yield g.insert.format(k=k)
+                continue
+            if track:
+                live.add(k)
+            else:
+                size += 1  # sin deletes: solo importa si ya hubo un insert
+            yield g.insert.format(k=k)
+
+        elif r < w_insert + w_lookup:
+            if not g.by_key:
+                yield g.lookup.format(i=rng.randrange(size))
+                continue
+            k = next(key_stream) if lookup_from_stream else live.pick(rng)
+            hit = g.lookup_hit is not None and k in live
+            yield (g.lookup_hit if hit else g.lookup).format(k=k)
+
+        elif not g.by_key:
+            size -= 1
+            yield g.delete
+        else:
+            k = live.pick(rng)
+            live.discard(k)
+            yield g.delete.format(k=k)
@@ -3,11 +3,24 @@ import streamlit as st
 from core.algos.linear.array_list_ops import build_steps, parse_operations
 from core.render.linear.array_list_graphviz import array_list_to_dot
 from core.stepper import Stepper
+from core.ui.profiling import build_steps_with_profile, render_profile_panel
 from core.ui.sidebar import render_sidebar_nav
 
 render_sidebar_nav("linear")
 st.title("Array / List — Visualizador (lista dinámica)")
 
+_STORAGE_LABELS = {
+    "list": "list de Python (objetos)",
+    "blocked": "Bloques (insert en el medio rápido)",
+    "int64": "Buffer tipado (int64)",
+    "float64": "Buffer tipado (float64)",
+}
+storage = st.selectbox(
+    "Almacenamiento", options=list(_STORAGE_LABELS), format_func=_STORAGE_LABELS.get
+)
+engine = "blocked" if storage == "blocked" else "list"
+dtype = storage if storage in ("int64", "float64") else None
+
 default_ops = """# Ejemplo
 append 10
 append 20
@@ -16,6 +29,9 @@ get 2
 set 0 99
 remove 15
 pop
+extend 5 3 8
+sort
+find_all 8
 """
 
 colA, colB = st.columns(2, gap="large")
@@ -25,8 +41,15 @@ with colA:
 
     if st.button("Construir pasos", type="primary"):
         try:
-            ops = parse_operations(ops_text)
-            steps = build_steps(ops, dot_builder=array_list_to_dot)
+            steps = build_steps_with_profile(
+                ops_text,
+                parse_operations,
+                build_steps,
+                profile_key="array_profile",
+                dot_builder=array_list_to_dot,
+                dtype=dtype,
+                engine=engine,
+            )
             st.session_state["array_stepper"] = Stepper(steps=steps, index=0)
         except ValueError as e:
             st.error(str(e))
@@ -59,4 +82,6 @@ with colB:
     if stepper is None:
         st.info("Aquí se mostrará el diagrama cuando construyas pasos.")
     else:
-        st.graphviz_chart(step.dot, width="stretch", height="stretch")
+        st.graphviz_chart(stepper.current_dot(), width="stretch", height="stretch")
+
+render_profile_panel("array_profile")
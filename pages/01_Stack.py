@@ -3,6 +3,7 @@ import streamlit as st
 from core.algos.linear.stack_ops import build_steps, parse_operations
 from core.render.linear.stack_graphviz import stack_to_dot
 from core.stepper import Stepper
+from core.ui.profiling import build_steps_with_profile, render_profile_panel
 from core.ui.sidebar import render_sidebar_nav
 
 render_sidebar_nav("linear")
@@ -23,8 +24,13 @@ with colA:
     ops_text = st.text_area("Operaciones (push/pop):", value=default_ops, height=180)
     if st.button("Construir pasos", type="primary"):
         try:
-            ops = parse_operations(ops_text)
-            steps = build_steps(ops, dot_builder=stack_to_dot)
+            steps = build_steps_with_profile(
+                ops_text,
+                parse_operations,
+                build_steps,
+                profile_key="stack_profile",
+                dot_builder=stack_to_dot,
+            )
             st.session_state["stack_stepper"] = Stepper(steps=steps, index=0)
         except ValueError as e:
             st.error(str(e))
@@ -54,6 +60,8 @@ with colB:
     stepper = st.session_state.get("stack_stepper")
     if stepper is not None:
         step = stepper.current()
-        st.graphviz_chart(step.dot, width="stretch", height="stretch")
+        st.graphviz_chart(stepper.current_dot(), width="stretch", height="stretch")
     else:
         st.info("Aquí se mostrará el diagrama cuando construyas pasos.")
+
+render_profile_panel("stack_profile")
@@ -3,6 +3,7 @@ import streamlit as st
 from core.algos.linear.queue_ops import build_steps, parse_operations
 from core.render.linear.queue_graphviz import queue_to_dot
 from core.stepper import Stepper
+from core.ui.profiling import build_steps_with_profile, render_profile_panel
 from core.ui.sidebar import render_sidebar_nav
 
 render_sidebar_nav("linear")
@@ -22,8 +23,13 @@ ops_text = st.text_area("Operaciones (enqueue/dequeue):", value=default_ops, hei
 # 1) construir pasos
 if st.button("Construir pasos", type="primary"):
     try:
-        ops = parse_operations(ops_text)
-        steps = build_steps(ops, dot_builder=queue_to_dot)
+        steps = build_steps_with_profile(
+            ops_text,
+            parse_operations,
+            build_steps,
+            profile_key="queue_profile",
+            dot_builder=queue_to_dot,
+        )
         st.session_state["queue_stepper"] = Stepper(steps=steps, index=0)
     except ValueError as e:
         st.error(str(e))
@@ -50,8 +56,10 @@ else:
     step = stepper.current()
 
     # 3) diagrama
-    st.graphviz_chart(step.dot, width="stretch", height="stretch")
+    st.graphviz_chart(stepper.current_dot(), width="stretch", height="stretch")
 
     # 4) estado
     st.write(f"**Acción:** {step.message}")
     st.code(f"Queue: {step.values}", language="python")
+
+render_profile_panel("queue_profile")
@@ -3,6 +3,7 @@ import streamlit as st
 from core.algos.linear.deque_ops import build_steps, parse_operations
 from core.render.linear.deque_graphviz import deque_to_dot
 from core.stepper import Stepper
+from core.ui.profiling import build_steps_with_profile, render_profile_panel
 from core.ui.sidebar import render_sidebar_nav
 
 render_sidebar_nav("linear")
@@ -26,8 +27,13 @@ ops_text = st.text_area(
 
 if st.button("Construir pasos", type="primary"):
     try:
-        ops = parse_operations(ops_text)
-        steps = build_steps(ops, dot_builder=deque_to_dot)
+        steps = build_steps_with_profile(
+            ops_text,
+            parse_operations,
+            build_steps,
+            profile_key="deque_profile",
+            dot_builder=deque_to_dot,
+        )
         st.session_state["deque_stepper"] = Stepper(steps=steps, index=0)
     except ValueError as e:
         st.error(str(e))
@@ -49,6 +55,8 @@ else:
             stepper.next()
 
     step = stepper.current()
-    st.graphviz_chart(step.dot, width="stretch", height="stretch")
+    st.graphviz_chart(stepper.current_dot(), width="stretch", height="stretch")
     st.write(f"**Acción:** {step.message}")
     st.code(f"Deque: {step.deque}", language="python")
+
+render_profile_panel("deque_profile")
@@ -3,6 +3,8 @@ import streamlit as st
 from core.algos.linear.doubly_linked_list_ops import build_steps, parse_operations
 from core.render.linear.doubly_linked_list_graphviz import doubly_linked_list_to_dot
 from core.stepper import Stepper
+from core.ui.cost import render_step_cost
+from core.ui.profiling import build_steps_with_profile, render_profile_panel
 from core.ui.sidebar import render_sidebar_nav
 
 render_sidebar_nav("linear")
@@ -24,8 +26,13 @@ ops_text = st.text_area("Operaciones:", value=default_ops, height=200)
 
 if st.button("Construir pasos", type="primary"):
     try:
-        ops = parse_operations(ops_text)
-        steps = build_steps(ops, dot_builder=doubly_linked_list_to_dot)
+        steps = build_steps_with_profile(
+            ops_text,
+            parse_operations,
+            build_steps,
+            profile_key="dll_profile",
+            dot_builder=doubly_linked_list_to_dot,
+        )
         st.session_state["dll_stepper"] = Stepper(steps=steps, index=0)
     except ValueError as e:
         st.error(str(e))
@@ -49,6 +56,9 @@ else:
     st.caption(f"Paso {stepper.index + 1} / {len(stepper.steps)}")
     step = stepper.current()
 
-    st.graphviz_chart(step.dot, width="stretch", height="stretch")
+    st.graphviz_chart(stepper.current_dot(), width="stretch", height="stretch")
     st.write(f"**Acción:** {step.message}")
+    render_step_cost(stepper)
     st.code(f"List: {step.values}", language="python")
+
+render_profile_panel("dll_profile")
@@ -3,6 +3,8 @@ import streamlit as st
 from core.algos.linear.skip_list_ops import build_steps, parse_operations
 from core.render.linear.skip_list_graphviz import skip_list_to_dot
 from core.stepper import Stepper
+from core.ui.cost import render_step_cost
+from core.ui.profiling import build_steps_with_profile, render_profile_panel
 from core.ui.sidebar import render_sidebar_nav
 
 render_sidebar_nav("linear")
@@ -17,14 +19,26 @@ search 20
 delete 10
 search 10
 insert 25 2
+at 1
+index 30
+rank 26
 """
 
-ops_text = st.text_area("Operaciones (insert/delete/search):", value=default_ops, height=220)
+ops_text = st.text_area(
+    "Operaciones (insert/delete/search/at/index/rank/floor/ceiling/range):",
+    value=default_ops,
+    height=220,
+)
 
 if st.button("Construir pasos", type="primary"):
     try:
-        ops = parse_operations(ops_text)
-        steps = build_steps(ops, dot_builder=skip_list_to_dot)
+        steps = build_steps_with_profile(
+            ops_text,
+            parse_operations,
+            build_steps,
+            profile_key="skip_profile",
+            dot_builder=skip_list_to_dot,
+        )
         st.session_state["skip_stepper"] = Stepper(steps=steps, index=0)
     except ValueError as e:
         st.error(str(e))
@@ -48,6 +62,9 @@ else:
     st.caption(f"Paso {stepper.index + 1} / {len(stepper.steps)}")
     step = stepper.current()
 
-    st.graphviz_chart(step.dot, width="stretch", height="stretch")
+    st.graphviz_chart(stepper.current_dot(), width="stretch", height="stretch")
     st.write(f"**Acción:** {step.message}")
+    render_step_cost(stepper)
     st.code("\n".join([f"L{i}: {row}" for i, row in enumerate(step.levels)]), language="text")
+
+render_profile_panel("skip_profile")
@@ -3,6 +3,7 @@ import streamlit as st
 from core.algos.linear.ring_buffer_ops import build_steps, parse_operations
 from core.render.linear.ring_buffer_graphviz import ring_buffer_to_dot
 from core.stepper import Stepper
+from core.ui.profiling import build_steps_with_profile, render_profile_panel
 from core.ui.sidebar import render_sidebar_nav
 
 render_sidebar_nav("linear")
@@ -11,8 +12,19 @@ st.title("Ring Buffer — Visualizer (buffer circular)")
 
 capacity = st.number_input("Capacidad", min_value=1, max_value=64, value=5, step=1)
 
+_STORAGE_LABELS = {
+    "list": "list de Python (objetos)",
+    "int64": "Buffer tipado (int64)",
+    "float64": "Buffer tipado (float64)",
+}
+storage = st.selectbox(
+    "Almacenamiento", options=list(_STORAGE_LABELS), format_func=_STORAGE_LABELS.get
+)
+dtype = None if storage == "list" else storage
+
 default_ops = """# write = encola (sin overwrite)
 # write_over = encola pisando si está lleno
+# writemany / readmany = lotes (a lo sumo dos copias por slice)
 write 10
 write 20
 write 30
@@ -20,14 +32,23 @@ read
 write 40
 peek
 write_over 99
+readmany 2
+writemany 1 2
 """
 
 ops_text = st.text_area("Operaciones:", value=default_ops, height=220)
 
 if st.button("Construir pasos", type="primary"):
     try:
-        ops = parse_operations(ops_text)
-        steps = build_steps(ops, capacity=int(capacity), dot_builder=ring_buffer_to_dot)
+        steps = build_steps_with_profile(
+            ops_text,
+            parse_operations,
+            build_steps,
+            profile_key="ring_profile",
+            capacity=int(capacity),
+            dot_builder=ring_buffer_to_dot,
+            dtype=dtype,
+        )
         st.session_state["rb_stepper"] = Stepper(steps=steps, index=0)
     except ValueError as e:
         st.error(str(e))
@@ -51,7 +72,7 @@ else:
     st.caption(f"Paso {stepper.index + 1} / {len(stepper.steps)}")
     step = stepper.current()
 
-    st.graphviz_chart(step.dot, width="stretch", height="stretch")
+    st.graphviz_chart(stepper.current_dot(), width="stretch", height="stretch")
     st.write(f"**Acción:** {step.message}")
     st.code(
         f"items (orden lógico): {step.items}\n"
@@ -59,3 +80,5 @@ else:
         f"head={step.head} tail={step.tail} size={step.size}/{step.capacity}",
         language="python",
     )
+
+render_profile_panel("ring_profile")
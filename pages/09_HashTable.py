@@ -3,6 +3,8 @@ import streamlit as st
 from core.algos.hash.hash_table_ops import build_steps, parse_operations
 from core.render.hash.hash_table_graphviz import hash_table_to_dot
 from core.stepper import Stepper
+from core.ui.cost import render_step_cost
+from core.ui.profiling import build_steps_with_profile, render_profile_panel
 from core.ui.sidebar import render_sidebar_nav
 
 render_sidebar_nav("hash")
@@ -11,6 +13,12 @@ st.title("Hash Table / Dictionary / Map — Visualizer")
 capacity = st.number_input(
     "Buckets (capacidad inicial)", min_value=4, max_value=64, value=8, step=1
 )
+engine = st.selectbox(
+    "Motor",
+    options=["chaining", "open"],
+    format_func=lambda e: "Encadenamiento (listas)" if e == "chaining" else "Open addressing",
+)
+incremental = st.checkbox("Rehash incremental", value=False, disabled=engine != "chaining")
 
 default_ops = """# set key value
 set a 10
@@ -28,8 +36,16 @@ with colA:
 
     if st.button("Construir pasos", type="primary"):
         try:
-            ops = parse_operations(ops_text)
-            steps = build_steps(ops, capacity=int(capacity), dot_builder=hash_table_to_dot)
+            steps = build_steps_with_profile(
+                ops_text,
+                parse_operations,
+                build_steps,
+                profile_key="ht_profile",
+                capacity=int(capacity),
+                dot_builder=hash_table_to_dot,
+                engine=engine,
+                incremental=incremental and engine == "chaining",
+            )
             st.session_state["ht_stepper"] = Stepper(steps=steps, index=0)
         except ValueError as e:
             st.error(str(e))
@@ -53,12 +69,22 @@ with colA:
 
         st.caption(f"Paso {stepper.index + 1} / {len(stepper.steps)}")
         st.write(f"**Acción:** {stepper.current().message}")
+        render_step_cost(stepper)
         st.code(f"Buckets: {stepper.current().buckets}", language="python")
+        old_buckets = stepper.current().old_buckets
+        if old_buckets is not None:
+            moved = stepper.current().migrated
+            st.progress(
+                moved / len(old_buckets),
+                text=f"Migrando buckets: {moved}/{len(old_buckets)}",
+            )
 
 with colB:
     stepper: Stepper | None = st.session_state.get("ht_stepper")
     if stepper is not None:
         step = stepper.current()
-        st.graphviz_chart(step.dot, width="stretch", height="stretch")
+        st.graphviz_chart(stepper.current_dot(), width="stretch", height="stretch")
     else:
         st.info("Aquí se mostrará el diagrama cuando construyas pasos.")
+
+render_profile_panel("ht_profile")
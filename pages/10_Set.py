@@ -3,6 +3,8 @@ import streamlit as st
 from core.algos.hash.hash_set_ops import build_steps, parse_operations
 from core.render.hash.hash_set_graphviz import hash_set_to_dot
 from core.stepper import Stepper
+from core.ui.cost import render_step_cost
+from core.ui.profiling import build_steps_with_profile, render_profile_panel
 from core.ui.sidebar import render_sidebar_nav
 
 render_sidebar_nav("hash")
@@ -24,8 +26,14 @@ ops_text = st.text_area("Operaciones:", value=default_ops, height=200)
 
 if st.button("Construir pasos", type="primary"):
     try:
-        ops = parse_operations(ops_text)
-        steps = build_steps(ops, capacity=int(capacity), dot_builder=hash_set_to_dot)
+        steps = build_steps_with_profile(
+            ops_text,
+            parse_operations,
+            build_steps,
+            profile_key="set_profile",
+            capacity=int(capacity),
+            dot_builder=hash_set_to_dot,
+        )
         st.session_state["set_stepper"] = Stepper(steps=steps, index=0)
     except ValueError as e:
         st.error(str(e))
@@ -54,8 +62,11 @@ else:
         st.caption(f"Paso {stepper.index + 1} / {len(stepper.steps)}")
         step = stepper.current()
         st.write(f"**Acción:** {step.message}")
+        render_step_cost(stepper)
         st.code(f"Set: {step.values}", language="python")
 
     with col_graph:
         st.markdown("### Diagrama")
-        st.graphviz_chart(step.dot, width="stretch")
+        st.graphviz_chart(stepper.current_dot(), width="stretch")
+
+render_profile_panel("set_profile")
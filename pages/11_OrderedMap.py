@@ -3,6 +3,8 @@ import streamlit as st
 from core.algos.hash.ordered_map_ops import build_steps, parse_operations
 from core.render.hash.ordered_map_graphviz import ordered_map_to_dot
 from core.stepper import Stepper
+from core.ui.cost import render_step_cost
+from core.ui.profiling import build_steps_with_profile, render_profile_panel
 from core.ui.sidebar import render_sidebar_nav
 
 render_sidebar_nav("hash")
@@ -13,12 +15,16 @@ capacity = st.number_input(
 )
 
 default_ops = """# set key value
+# touch key = pasa al final (más reciente), evict = saca el más viejo (LRU)
 set a 10
 set b 20
 set c 30
 set a 99
 del b
 get a
+set d 40
+touch a
+evict
 """
 
 colA, colB = st.columns([1, 1], gap="large")
@@ -28,8 +34,14 @@ with colA:
 
     if st.button("Construir pasos", type="primary"):
         try:
-            ops = parse_operations(ops_text)
-            steps = build_steps(ops, capacity=int(capacity), dot_builder=ordered_map_to_dot)
+            steps = build_steps_with_profile(
+                ops_text,
+                parse_operations,
+                build_steps,
+                profile_key="omap_profile",
+                capacity=int(capacity),
+                dot_builder=ordered_map_to_dot,
+            )
             st.session_state["omap_stepper"] = Stepper(steps=steps, index=0)
         except ValueError as e:
             st.error(str(e))
@@ -53,12 +65,15 @@ with colA:
         st.caption(f"Paso {stepper.index + 1} / {len(stepper.steps)}")
         step = stepper.current()
         st.write(f"**Acción:** {step.message}")
+        render_step_cost(stepper)
         st.code(f"Ordered: {step.ordered}", language="python")
 
 with colB:
     stepper: Stepper | None = st.session_state.get("omap_stepper")
     if stepper is not None:
         step = stepper.current()
-        st.graphviz_chart(step.dot, width="stretch", height="stretch")
+        st.graphviz_chart(stepper.current_dot(), width="stretch", height="stretch")
     else:
         st.info("Aquí se mostrará el diagrama cuando construyas pasos.")
+
+render_profile_panel("omap_profile")
@@ -3,6 +3,8 @@ import streamlit as st
 from core.algos.trees.binary_tree_ops import build_steps, parse_operations
 from core.render.trees.binary_tree_graphviz import binary_tree_to_dot
 from core.stepper import Stepper
+from core.ui.cost import render_step_cost
+from core.ui.profiling import build_steps_with_profile, render_profile_panel
 from core.ui.sidebar import render_sidebar_nav
 
 render_sidebar_nav("trees")
@@ -26,8 +28,13 @@ with colA:
 
     if st.button("Construir pasos", type="primary"):
         try:
-            ops = parse_operations(ops_text)
-            steps = build_steps(ops, dot_builder=binary_tree_to_dot)
+            steps = build_steps_with_profile(
+                ops_text,
+                parse_operations,
+                build_steps,
+                profile_key="bt_profile",
+                dot_builder=binary_tree_to_dot,
+            )
             st.session_state["bt_stepper"] = Stepper(steps=steps, index=0)
         except ValueError as e:
             st.error(str(e))
@@ -52,6 +59,7 @@ with colA:
         step = stepper.current()
 
         st.write(f"**Acción:** {step.message}")
+        render_step_cost(stepper)
         st.code(f"Level-order: {step.values}", language="python")
         st.code(f"Levels: {step.levels}", language="python")
 
@@ -61,4 +69,6 @@ with colB:
     if stepper is None:
         st.info("Aquí se mostrará el diagrama cuando construyas pasos.")
     else:
-        st.graphviz_chart(step.dot, width="stretch", height="stretch")
+        st.graphviz_chart(stepper.current_dot(), width="stretch", height="stretch")
+
+render_profile_panel("bt_profile")
@@ -5,6 +5,8 @@ import streamlit as st
 from core.algos.trees.binary_search_tree_ops import build_steps, parse_operations
 from core.render.trees.binary_search_tree_graphviz import binary_search_tree_to_dot
 from core.stepper import Stepper
+from core.ui.cost import render_step_cost
+from core.ui.profiling import build_steps_with_profile, render_profile_panel
 from core.ui.sidebar import render_sidebar_nav
 
 render_sidebar_nav("trees")
@@ -39,8 +41,13 @@ with colA:
 
     if st.button("Construir pasos", type="primary"):
         try:
-            ops = parse_operations(ops_text)
-            steps = build_steps(ops, dot_builder=binary_search_tree_to_dot)
+            steps = build_steps_with_profile(
+                ops_text,
+                parse_operations,
+                build_steps,
+                profile_key="bst_profile",
+                dot_builder=binary_search_tree_to_dot,
+            )
             st.session_state["bst_stepper"] = Stepper(steps=steps, index=0)
         except ValueError as e:
             st.error(str(e))
@@ -65,6 +72,7 @@ with colA:
         step = stepper.current()
 
         st.write(f"**Acción:** {step.message}")
+        render_step_cost(stepper)
         st.code(f"Inorder (ordenado): {step.values}", language="python")
         if step.traversal is not None:
             st.code(f"Traversal: {step.traversal}", language="python")
@@ -73,6 +81,8 @@ with colB:
     stepper: Stepper | None = st.session_state.get("bst_stepper")
 
     if stepper is not None:
-        st.graphviz_chart(step.dot, width="stretch", height="stretch")
+        st.graphviz_chart(stepper.current_dot(), width="stretch", height="stretch")
     else:
         st.info("Aquí se mostrará el diagrama cuando construyas pasos.")
+
+render_profile_panel("bst_profile")
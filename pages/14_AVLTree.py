@@ -3,6 +3,8 @@ import streamlit as st
 from core.algos.trees.avl_tree_ops import build_steps, parse_operations
 from core.render.trees.avl_tree_graphviz import avl_tree_to_dot
 from core.stepper import Stepper
+from core.ui.cost import render_step_cost
+from core.ui.profiling import build_steps_with_profile, render_profile_panel
 from core.ui.sidebar import render_sidebar_nav
 
 render_sidebar_nav("trees")
@@ -28,8 +30,13 @@ with colA:
     ops_text = st.text_area("Operaciones:", value=default_ops, height=220)
     if st.button("Construir pasos", type="primary"):
         try:
-            ops = parse_operations(ops_text)
-            steps = build_steps(ops, dot_builder=avl_tree_to_dot)
+            steps = build_steps_with_profile(
+                ops_text,
+                parse_operations,
+                build_steps,
+                profile_key="avl_profile",
+                dot_builder=avl_tree_to_dot,
+            )
             st.session_state["avl_stepper"] = Stepper(steps=steps, index=0)
         except ValueError as e:
             st.error(str(e))
@@ -53,6 +60,7 @@ with colA:
         st.caption(f"Paso {stepper.index + 1} / {len(stepper.steps)}")
         step = stepper.current()
         st.write(f"**Acción:** {step.message}")
+        render_step_cost(stepper)
         st.code(
             f"inorder: {step.inorder}\n" f"bfs: {step.bfs}\n" f"height: {step.height}",
             language="python",
@@ -65,4 +73,6 @@ with colB:
     if stepper is None:
         st.info("Aquí se mostrará el diagrama cuando construyas pasos.")
     else:
-        st.graphviz_chart(step.dot, width="stretch", height="stretch")
+        st.graphviz_chart(stepper.current_dot(), width="stretch", height="stretch")
+
+render_profile_panel("avl_profile")
@@ -3,6 +3,8 @@ import streamlit as st
 from core.algos.trees.red_black_tree_ops import build_steps, parse_operations
 from core.render.trees.red_black_tree_graphviz import red_black_tree_to_dot
 from core.stepper import Stepper
+from core.ui.cost import render_step_cost
+from core.ui.profiling import build_steps_with_profile, render_profile_panel
 from core.ui.sidebar import render_sidebar_nav
 
 render_sidebar_nav("trees")
@@ -30,8 +32,13 @@ with colA:
 
     if st.button("Construir pasos", type="primary"):
         try:
-            ops = parse_operations(ops_text)
-            steps = build_steps(ops, dot_builder=red_black_tree_to_dot)
+            steps = build_steps_with_profile(
+                ops_text,
+                parse_operations,
+                build_steps,
+                profile_key="rbt_profile",
+                dot_builder=red_black_tree_to_dot,
+            )
             st.session_state["rb_stepper"] = Stepper(steps=steps, index=0)
         except ValueError as e:
             st.error(str(e))
@@ -56,6 +63,7 @@ with colA:
         step = stepper.current()
 
         st.write(f"**Acción:** {step.message}")
+        render_step_cost(stepper)
         st.code(
             f"inorder: {step.inorder}\n" f"bfs: {step.bfs}\n" f"height: {step.height}",
             language="python",
@@ -67,4 +75,6 @@ with colB:
     if stepper is None:
         st.info("Aquí se mostrará el diagrama cuando construyas pasos.")
     else:
-        st.graphviz_chart(step.dot, width="stretch", height="stretch")
+        st.graphviz_chart(stepper.current_dot(), width="stretch", height="stretch")
+
+render_profile_panel("rbt_profile")
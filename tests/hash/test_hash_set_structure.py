@@ -33,3 +33,12 @@ def test_hash_set_basic_add_remove_contains_snapshot() -> None:
     assert "capacity" in snap
     assert isinstance(snap["buckets"], list)
     assert int(snap["capacity"]) > 0
+
+
+def test_hash_set_open_addressing_engine() -> None:
+    s: HashSet[Any] = HashSet(capacity=4, engine="open")
+    for v in ["a", "b", "a", 3]:
+        s.add(v)
+    assert sorted(map(str, s.to_list())) == ["3", "a", "b"]
+    assert s.remove("a") is True
+    assert s.contains("a") is False
@@ -1,6 +1,8 @@
 import pytest
 
-from core.structures.hash.hash_table import HashTable
+from core.structures.hash import hash_table as hash_table_mod
+from core.structures.hash.hash_table import HashTable, stable_hash, stable_hash_many
+from core.structures.hash.open_addressing import OpenAddressingHashTable
 
 
 def test_set_get_update_delete() -> None:
@@ -22,3 +24,139 @@ def test_resize_keeps_items() -> None:
         ht.set(f"k{i}", i)
     for i in range(20):
         assert ht.get(f"k{i}") == i
+
+
+def test_open_addressing_engine_same_api() -> None:
+    ht = HashTable[str, int](capacity=4, engine="open")
+    assert isinstance(ht, OpenAddressingHashTable)
+
+    for i in range(50):
+        ht.set(f"k{i}", i)
+    ht.set("k3", 333)
+    assert len(ht) == 50
+    assert ht.get("k3") == 333
+    assert ht.has("k49") is True
+    assert ht.delete("k10") is True
+    assert ht.delete("k10") is False
+    assert ht.has("k10") is False
+    with pytest.raises(KeyError):
+        ht.get("k10")
+    assert dict(ht.items()) == {f"k{i}": (333 if i == 3 else i) for i in range(50) if i != 10}
+
+    s = ht.snapshot()
+    assert s["engine"] == "open"
+    assert s["tombstones"] == 1
+    assert sum(len(b) for b in s["buckets"]) == 49
+
+
+@pytest.mark.parametrize("engine", ["chaining", "open"])
+def test_is_migrating_on_every_engine(engine: str) -> None:
+    ht = HashTable[int, int](capacity=4, engine=engine)
+    assert ht.is_migrating() is False
+    for i in range(10):
+        ht.set(i, i)
+    assert ht.is_migrating() is False
+
+
+def test_open_addressing_tombstones_are_reused_and_compacted() -> None:
+    ht = HashTable[int, int](capacity=8, engine="open")
+    for i in range(200):
+        ht.set(i, i)
+        assert ht.delete(i)
+    assert len(ht) == 0
+    assert ht.capacity() == 8  # los tombstones no hacen crecer la tabla
+    ht.set(0, 1)
+    assert ht.get(0) == 1
+
+
+def test_invalid_engine() -> None:
+    with pytest.raises(ValueError):
+        HashTable(capacity=4, engine="cuckoo")
+
+
+def test_incremental_rehash_migrates_in_bounded_steps() -> None:
+    ht = HashTable[int, int](capacity=8, incremental=True)
+    for i in range(7):
+        ht.set(i, i)
+    assert ht.is_migrating()  # 7/8 > 0.75 → empieza la migración, sin mover todo
+    s = ht.snapshot()
+    assert s["capacity"] == 16
+    assert s["migrated"] == 0
+    assert s["old_buckets"] is not None
+
+    # las keys siguen accesibles en medio de la migración
+    assert ht.get(5) == 5
+    assert ht.delete(6) is True
+    ht.set(3, 33)
+    assert dict(ht.items()) == {0: 0, 1: 1, 2: 2, 3: 33, 4: 4, 5: 5}
+
+    while ht.is_migrating():
+        ht.has(0)
+    assert ht.snapshot()["migration_progress"] == 1.0
+    for i in range(200):
+        ht.set(i, i)
+    assert len(ht) == 200
+    assert all(ht.get(i) == i for i in range(200))
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_stable_hash_many_matches_scalar(monkeypatch: pytest.MonkeyPatch, use_numpy: bool) -> None:
+    if use_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(hash_table_mod, "np", None)
+
+    keys: list[object] = [
+        "",
+        "a",
+        "banana",
+        "ñandú",
+        "€uro",
+        42,
+        -7,
+        ("t", 1),
+        "a" * 40,
+        "a\x00",
+        "\x00",
+        "a\x00b",
+        "b\x00\x00",
+    ]
+    assert stable_hash_many(keys) == [stable_hash(k) for k in keys]
+    assert stable_hash_many(["a\x00"]) == [stable_hash("a\x00")]
+
+
+def test_stable_hash_many_long_keys_skip_vectorized_path(monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("numpy")
+    widths: list[int] = []
+    fnv_many = hash_table_mod._fnv_str_many_np
+
+    def recording(keys: list[str]) -> list[int]:
+        widths.append(max(map(len, keys)))
+        return fnv_many(keys)
+
+    monkeypatch.setattr(hash_table_mod, "_fnv_str_many_np", recording)
+    keys = ["a", "bb", "x" * 100_000, "ccc", "y" * (hash_table_mod._BULK_MAX_LEN + 1)]
+    assert stable_hash_many(keys) == [stable_hash(k) for k in keys]
+    assert widths == [3]  # el lote vectorizado no se rellena al largo de la key gigante
+    assert stable_hash_many([]) == []
+
+
+@pytest.mark.parametrize("engine", ["chaining", "open"])
+def test_set_many_trailing_nul_keys(engine: str) -> None:
+    ht: HashTable[str, int] = HashTable(capacity=8, engine=engine)
+    ht.set_many([("a\x00", 1), ("a", 2)])
+    assert len(ht) == 2
+    assert ht.get("a\x00") == 1
+    assert ht.get("a") == 2
+
+
+@pytest.mark.parametrize("engine", ["chaining", "open"])
+def test_set_many_uses_stored_hashes(engine: str) -> None:
+    ht: HashTable[str, int] = HashTable(capacity=2, engine=engine)
+    ht.set_many((f"k{i}", i) for i in range(50))
+    ht.set_many([("k0", 100)])
+
+    assert len(ht) == 50
+    assert ht.get("k0") == 100
+    assert ht.get("k49") == 49
+    assert sorted(v for _k, v in ht.items())[-1] == 100
@@ -6,3 +6,12 @@ def test_hash_ops_steps() -> None:
     ops = parse_operations("set a 1\nset b 2\nget a\ndelete b\n")
     steps = build_steps(ops, capacity=4, dot_builder=hash_table_to_dot)
     assert "digraph" in steps[-1].dot
+
+
+def test_hash_ops_steps_open_addressing() -> None:
+    ops = parse_operations("set a 1\nset b 2\nset c 3\nset d 4\nget a\ndelete b\nhas b\n")
+    steps = build_steps(ops, capacity=4, dot_builder=hash_table_to_dot, engine="open")
+    last = steps[-1]
+    assert last.size == 3
+    assert all(len(b) <= 1 for b in last.buckets)
+    assert "digraph" in last.dot
@@ -0,0 +1,65 @@
+import pytest
+
+from core.structures.hash.lru_cache import LRUCache, lru_memoize
+from core.structures.hash.ordered_map import OrderedMap
+
+
+def test_ordered_map_move_to_end_and_pops() -> None:
+    m = OrderedMap[str, int]()
+    for i, k in enumerate("abcd"):
+        m.set(k, i)
+    m.move_to_end("a")
+    m.move_to_end("d", last=False)
+    assert [k for k, _ in m.items()] == ["d", "b", "c", "a"]
+    assert m.pop_first() == ("d", 3)
+    assert m.pop_last() == ("a", 0)
+    assert [k for k, _ in m.items()] == ["b", "c"]
+    with pytest.raises(KeyError):
+        m.move_to_end("zz")
+    m.pop_first()
+    m.pop_first()
+    assert len(m) == 0
+    with pytest.raises(KeyError):
+        m.pop_first()
+
+
+def test_lru_cache_evicts_least_recent() -> None:
+    evicted: list[tuple[str, int]] = []
+    c = LRUCache[str, int](2, on_evict=lambda k, v: evicted.append((k, v)))
+    c.set("a", 1)
+    c.set("b", 2)
+    assert c.get("a") == 1  # "b" pasa a ser el menos reciente
+    c.set("c", 3)
+    assert evicted == [("b", 2)]
+    with pytest.raises(KeyError):
+        c.get("b")
+    c.put("a", 10)  # update también cuenta como uso
+    c.set("d", 4)
+    assert evicted == [("b", 2), ("c", 3)]
+    assert list(c.items()) == [("a", 10), ("d", 4)]
+    assert c.peek("a") == 10
+    assert c.stats() == {"hits": 1, "misses": 1, "evictions": 2, "size": 2, "maxsize": 2}
+    assert c.snapshot()["evictions"] == 2
+    c.clear()
+    assert len(c) == 0 and evicted == [("b", 2), ("c", 3)]
+    with pytest.raises(ValueError):
+        LRUCache(0)
+
+
+def test_lru_memoize_caches_by_arguments() -> None:
+    calls: list[tuple[object, ...]] = []
+
+    @lru_memoize(maxsize=2)
+    def f(*args: object, **kwargs: object) -> int:
+        calls.append((args, tuple(kwargs.items())))
+        return len(calls)
+
+    assert f(1) == f(1) == 1
+    assert f(1, 2) == 2
+    assert f((1, 2)) == 3  # una tupla no choca con dos argumentos
+    assert f(1, x=2) == 4
+    assert f(1, x=2) == 4
+    assert f.cache.stats()["evictions"] == 2
+    f.cache_clear()
+    assert f(1) == 5
+    assert f.__name__ == "f"
@@ -24,3 +24,15 @@ def test_ordered_map_ops_build_steps_smoke() -> None:
     assert steps
     assert isinstance(steps[0].dot, str)
     assert isinstance(steps[0].message, str)
+
+
+def test_ordered_map_ops_touch_and_evict_follow_lru_order() -> None:
+    ops = parse_operations("set a 1\nset b 2\nset c 3\ntouch a\nevict\nevict\n")
+    steps = build_steps(ops, capacity=8, dot_builder=_dot_builder)
+    assert steps[4].ordered == [("b", 2), ("c", 3), ("a", 1)]
+    assert steps[5].message == "evict → (b, 2)"
+    assert steps[-1].ordered == [("a", 1)]
+
+    steps = build_steps(parse_operations("evict\ntouch z\n"), capacity=8, dot_builder=_dot_builder)
+    assert steps[-1].message.startswith("ERROR")
+    assert len(steps) == 2
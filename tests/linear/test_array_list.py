@@ -1,6 +1,11 @@
+import random
+
 import pytest
 
+from core.structures.linear import blocked_array_list, typed_storage
 from core.structures.linear.array_list import ArrayList
+from core.structures.linear.blocked_array_list import BlockedArrayList
+from core.structures.linear.typed_array_list import TypedArrayList
 
 
 def test_array_list_basic() -> None:
@@ -20,3 +25,165 @@ def test_array_list_basic() -> None:
     assert a.to_list() == []
     with pytest.raises(IndexError):
         a.pop()
+
+
+@pytest.fixture(params=["numpy", "array"])
+def typed_backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    if request.param == "array":
+        monkeypatch.setattr(typed_storage, "np", None)
+    elif typed_storage.np is None:
+        pytest.skip("numpy no instalado")
+    return request.param
+
+
+def test_typed_array_list_matches_list_mode(typed_backend: str) -> None:
+    a = ArrayList[int](dtype="int64")
+    assert isinstance(a, TypedArrayList)
+
+    a.extend([5, 3, 8])
+    a.insert(1, 9)
+    a.insert(-1, 7)
+    a.insert(100, 1)
+    a.insert_many(2, [0, 0])
+    assert a.to_list() == [5, 9, 0, 0, 3, 7, 8, 1]
+    assert a.get(-1) == 1 and isinstance(a.get(0), int)
+    assert a.pop_at(1) == 9
+    assert a.remove_first(0) is True
+    assert a.find_all(0) == [1]
+    assert a.take([0, -1]) == [5, 1]
+    assert a.to_list() == [5, 0, 3, 7, 8, 1]
+    assert a.argsort() == [1, 5, 2, 0, 3, 4]
+    a.sort()
+    assert a.to_list() == [0, 1, 3, 5, 7, 8]
+    a.sort(reverse=True)
+    assert a.to_list() == [8, 7, 5, 3, 1, 0]
+
+
+def test_typed_array_list_capacity_doubles(typed_backend: str) -> None:
+    a = ArrayList[float](dtype="float64")
+    caps = set()
+    for i in range(100):
+        a.append(i / 2)
+        caps.add(a.capacity)
+    assert caps == {8, 16, 32, 64, 128}
+    assert a.get(3) == 1.5
+    a.clear()
+    assert len(a) == 0 and a.capacity == 8
+
+
+def test_typed_array_list_rejects_bad_values(typed_backend: str) -> None:
+    a = ArrayList[int](dtype="int8")
+    with pytest.raises(ValueError):
+        a.append("x")
+    with pytest.raises(ValueError):
+        a.append(1.5)
+    with pytest.raises(ValueError):
+        a.append(1000)
+    with pytest.raises(IndexError):
+        a.pop()
+    with pytest.raises(ValueError):
+        ArrayList(dtype="complex128")
+
+
+def test_typed_insert_out_of_range_leaves_list_intact(typed_backend: str) -> None:
+    a = ArrayList[int](dtype="int8")
+    a.extend([1, 2, 3])
+    with pytest.raises(ValueError):
+        a.insert(0, 1000)
+    with pytest.raises(ValueError):
+        a.insert(1, "x")
+    assert a.to_list() == [1, 2, 3]
+
+
+def test_typed_bulk_validates_ndarrays() -> None:
+    np = pytest.importorskip("numpy")
+    a = ArrayList[int](dtype="uint8")
+    a.extend([7, 8])
+    for bad in (np.array([-1, 300]), np.array([1, 256]), np.array([1.0, 2.0])):
+        with pytest.raises(ValueError):
+            a.extend(bad)
+        with pytest.raises(ValueError):
+            a.insert_many(1, bad)
+    assert a.to_list() == [7, 8]
+
+    b = ArrayList[int](dtype="int64")
+    with pytest.raises(ValueError):
+        b.extend(np.array([1.7, -2.2]))
+    b.extend(np.array([1, -2], dtype=np.int16))
+    b.insert_many(0, np.array([2**40], dtype=np.uint64))
+    b.insert_many(0, np.array([], dtype=np.float64))
+    assert b.to_list() == [2**40, 1, -2]
+
+    f = ArrayList[float](dtype="float32")
+    f.extend(np.array([1, 2], dtype=np.int64))
+    f.insert_many(1, np.array([0.5]))
+    assert f.to_list() == [1.0, 0.5, 2.0]
+
+
+def test_list_mode_bulk_ops() -> None:
+    a = ArrayList[int]()
+    a.extend([3, 1, 2])
+    a.insert_many(1, [9, 9])
+    assert a.to_list() == [3, 9, 9, 1, 2]
+    assert a.find_all(9) == [1, 2]
+    assert a.take([0, 4]) == [3, 2]
+    assert a.argsort() == [3, 4, 0, 1, 2]
+    a.sort()
+    assert a.to_list() == [1, 2, 3, 9, 9]
+
+
+def test_blocked_array_list_matches_list_mode(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(blocked_array_list, "LOAD", 4)  # bloques chicos: muchos split/merge
+    a = ArrayList[int](engine="blocked")
+    ref = ArrayList[int]()
+    assert isinstance(a, BlockedArrayList)
+
+    rng = random.Random(11)
+    for _ in range(2000):
+        r = rng.random()
+        v = rng.randrange(20)
+        if r < 0.35:
+            i = rng.randrange(-2, len(ref) + 3)
+            a.insert(i, v)
+            ref.insert(i, v)
+        elif r < 0.5:
+            a.append(v)
+            ref.append(v)
+        elif r < 0.7 and len(ref):
+            i = rng.randrange(-len(ref), len(ref))
+            assert a.pop_at(i) == ref.pop_at(i)
+        elif r < 0.8:
+            assert a.remove_first(v) == ref.remove_first(v)
+        elif r < 0.85:
+            vals = [rng.randrange(20) for _ in range(rng.randrange(10))]
+            i = rng.randrange(len(ref) + 1)
+            a.insert_many(i, vals)
+            ref.insert_many(i, vals)
+        elif len(ref):
+            i = rng.randrange(len(ref))
+            a.set(i, v)
+            ref.set(i, v)
+            assert a.get(i) == ref.get(i)
+
+    assert a.to_list() == ref.to_list()
+    assert a.block_count > 1
+    assert a.find_all(3) == ref.find_all(3)
+    assert a.argsort() == ref.argsort()
+    a.sort(reverse=True)
+    ref.sort(reverse=True)
+    assert a.to_list() == ref.to_list()
+
+
+def test_blocked_array_list_errors() -> None:
+    a = ArrayList[int](engine="blocked")
+    with pytest.raises(IndexError):
+        a.pop()
+    with pytest.raises(IndexError):
+        a.pop_at(0)
+    a.extend(range(3))
+    with pytest.raises(IndexError):
+        a.get(3)
+    with pytest.raises(ValueError):
+        ArrayList(engine="btree")
+    with pytest.raises(ValueError):
+        ArrayList(engine="blocked", dtype="int64")
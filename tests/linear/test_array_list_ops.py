@@ -1,3 +1,5 @@
+import pytest
+
 from core.algos.linear.array_list_ops import build_steps, parse_operations
 from core.render.linear.array_list_graphviz import array_list_to_dot
 
@@ -7,3 +9,36 @@ def test_array_list_ops() -> None:
     steps = build_steps(ops, dot_builder=array_list_to_dot)
     assert "digraph" in steps[-1].dot
     assert steps[-1].values == [1, 9, 2]
+
+
+def test_array_list_ops_bulk_commands_typed() -> None:
+    ops = parse_operations(
+        "extend 4 2 9\ninsert_many 1 7 7\nfind_all 7\ntake 0 -1\nsort\nargsort\n"
+    )
+    steps = build_steps(ops, dot_builder=array_list_to_dot, dtype="int32")
+
+    assert steps[3].message == "find_all 7 → [1, 2]"
+    assert steps[4].message == "take 0 -1 → [4, 9]"
+    assert steps[5].values == [2, 4, 7, 7, 9]
+    assert "dtype=int32" in steps[-1].dot
+
+
+def test_array_list_ops_typed_rejects_strings() -> None:
+    steps = build_steps(parse_operations("append 1\nappend x\n"), array_list_to_dot, dtype="int64")
+    assert steps[-1].message.startswith("ERROR")
+
+
+@pytest.mark.parametrize("cmd", ["sort", "argsort"])
+def test_array_list_ops_mixed_types_sort_is_error_step(cmd: str) -> None:
+    steps = build_steps(parse_operations(f"append 1\nappend a\n{cmd}\n"), array_list_to_dot)
+    assert len(steps) == 4
+    assert steps[-1].message.startswith(f"ERROR: {cmd}:")
+
+
+def test_array_list_ops_blocked_engine_same_steps() -> None:
+    ops = parse_operations("extend 1 2 3 4\ninsert 2 9\npop_at 0\ninsert_many 1 5 6\nsort\n")
+    plain = build_steps(ops, dot_builder=array_list_to_dot)
+    blocked = build_steps(ops, dot_builder=array_list_to_dot, engine="blocked")
+
+    assert [s.values for s in blocked] == [s.values for s in plain]
+    assert [s.message for s in blocked] == [s.message for s in plain]
@@ -0,0 +1,113 @@
+import asyncio
+
+import pytest
+
+from core.structures.linear.async_queue import AsyncDeque, AsyncQueue
+
+
+def test_async_queue_backpressure_and_order() -> None:
+    async def main() -> list[int]:
+        q = AsyncQueue[int](capacity=2)
+        got: list[int] = []
+
+        async def produce(p: int) -> None:
+            for i in range(50):
+                await q.put(p * 100 + i)
+                assert len(q) <= 2
+
+        async def consume() -> None:
+            for _ in range(150):
+                got.append(await q.get())
+
+        await asyncio.gather(*(produce(p) for p in range(3)), consume())
+        return got
+
+    got = asyncio.run(main())
+    assert sorted(got) == sorted(p * 100 + i for p in range(3) for i in range(50))
+    for p in range(3):  # FIFO por productor
+        mine = [v for v in got if v // 100 == p]
+        assert mine == sorted(mine)
+
+
+def test_async_queue_nowait() -> None:
+    q = AsyncQueue[int](capacity=1)
+    with pytest.raises(IndexError):
+        q.get_nowait()
+    q.put_nowait(1)
+    assert q.is_full()
+    with pytest.raises(OverflowError):
+        q.put_nowait(2)
+    assert q.get_nowait() == 1
+    with pytest.raises(ValueError):
+        AsyncQueue(0)
+
+
+def test_get_batch_lingers_until_full_or_timeout() -> None:
+    async def main() -> tuple[list[int], list[int], list[int]]:
+        q = AsyncQueue[int](capacity=10)
+
+        async def trickle() -> None:
+            for i in range(3):
+                await asyncio.sleep(0.01)
+                await q.put(i)
+
+        task = asyncio.create_task(trickle())
+        full = await q.get_batch(3, timeout=1.0)
+        await task
+        empty = await q.get_batch(5, timeout=0.01)
+        for i in range(4):
+            q.put_nowait(i)
+        no_wait = await q.get_batch(10)
+        return full, empty, no_wait
+
+    full, empty, no_wait = asyncio.run(main())
+    assert full == [0, 1, 2]
+    assert empty == []
+    assert no_wait == [0, 1, 2, 3]
+
+
+def test_cancelled_waiters_do_not_lose_items() -> None:
+    async def main() -> tuple[int, list[int], int]:
+        q = AsyncQueue[int](capacity=1)
+        first = asyncio.create_task(q.get())
+        batch = asyncio.create_task(q.get_batch(5, timeout=10))
+        second = asyncio.create_task(q.get())
+        await asyncio.sleep(0)
+        q.put_nowait(7)  # despierta a `first`, que se cancela antes de correr
+        first.cancel()
+        batch.cancel()
+        got = await second
+        # put bloqueado por capacidad y cancelado: el lugar sigue libre
+        q.put_nowait(1)
+        blocked = asyncio.create_task(q.put(2))
+        await asyncio.sleep(0)
+        blocked.cancel()
+        await asyncio.gather(first, batch, blocked, return_exceptions=True)
+        return got, q.to_list(), len(q)
+
+    got, rest, n = asyncio.run(main())
+    assert got == 7
+    assert rest == [1]
+    assert n == 1
+
+
+def test_async_deque_both_ends() -> None:
+    async def main() -> list[int]:
+        d = AsyncDeque[int](capacity=3)
+        await d.put(2)
+        await d.put_front(1)
+        d.put_nowait(3)
+        with pytest.raises(OverflowError):
+            d.put_front_nowait(0)
+        waiter = asyncio.create_task(d.put_front(0))
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        out = [await d.get_back()]
+        await waiter
+        out.append(d.get_nowait())
+        out += await d.get_batch(5)
+        with pytest.raises(IndexError):
+            d.get_back_nowait()
+        return out
+
+    assert asyncio.run(main()) == [3, 0, 1, 2]
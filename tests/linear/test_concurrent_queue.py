@@ -0,0 +1,92 @@
+import threading
+
+import pytest
+
+from core.structures.linear.concurrent_queue import MPMCQueue, SPSCRingBuffer
+
+
+def test_spsc_preserves_order_across_threads() -> None:
+    q = SPSCRingBuffer[int](capacity=8)
+    n = 5_000
+    got: list[int] = []
+
+    def consume() -> None:
+        while len(got) < n:
+            got.extend(q.get_many(16, timeout=5))
+
+    t = threading.Thread(target=consume)
+    t.start()
+    for i in range(n):
+        q.put(i, timeout=5)
+    t.join(timeout=10)
+    assert got == list(range(n))
+    assert q.is_empty()
+
+
+def test_spsc_nonblocking_and_timeout() -> None:
+    q = SPSCRingBuffer[int](capacity=2)
+    with pytest.raises(IndexError):
+        q.get(block=False)
+    assert q.get_many(4, block=False) == []
+    q.put(1)
+    q.put(2)
+    assert q.is_full()
+    with pytest.raises(OverflowError):
+        q.put(3, block=False)
+    with pytest.raises(TimeoutError):
+        q.put(3, timeout=0.01)
+    assert q.get() == 1
+    q.put(3)  # cruza el wrap
+    assert q.get_many(10) == [2, 3]
+    with pytest.raises(TimeoutError):
+        q.get(timeout=0.01)
+    with pytest.raises(ValueError):
+        SPSCRingBuffer(0)
+
+
+def test_mpmc_delivers_every_item_once() -> None:
+    q = MPMCQueue[int](capacity=4)
+    producers, consumers, per = 4, 4, 1_000
+    total = producers * per
+    got: list[int] = []
+    lock = threading.Lock()
+
+    def produce(p: int) -> None:
+        for i in range(per):
+            q.put(p * per + i, timeout=5)
+
+    def consume() -> None:
+        while True:
+            with lock:
+                if len(got) >= total:
+                    return
+            try:
+                batch = q.get_many(8, timeout=0.05)
+            except TimeoutError:
+                continue
+            with lock:
+                got.extend(batch)
+
+    threads = [threading.Thread(target=produce, args=(p,)) for p in range(producers)]
+    threads += [threading.Thread(target=consume) for _ in range(consumers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=10)
+    assert sorted(got) == list(range(total))
+
+
+def test_mpmc_nonblocking_and_timeout() -> None:
+    q = MPMCQueue[int](capacity=1)
+    with pytest.raises(IndexError):
+        q.get(block=False)
+    with pytest.raises(TimeoutError):
+        q.get_many(3, timeout=0.01)
+    q.put(7)
+    assert len(q) == 1
+    with pytest.raises(OverflowError):
+        q.put(8, block=False)
+    with pytest.raises(TimeoutError):
+        q.put(8, timeout=0.01)
+    assert q.get() == 7
+    assert q.get_many(3, block=False) == []
@@ -117,3 +117,17 @@ def test_dll_delete_at_out_of_range() -> None:
     dll.push_back(1)
     with pytest.raises(IndexError):
         dll.delete_at(1)
+
+
+def test_node_at_uses_finger_and_stays_consistent() -> None:
+    dll = DoublyLinkedList[int]()
+    for v in range(20):
+        dll.push_back(v)
+
+    assert [dll.delete_at(10) for _ in range(3)] == [10, 11, 12]
+    dll.push_front(-1)
+    assert dll.delete_at(11) == 13
+    dll.reverse()
+    assert dll.delete_at(5) == 14
+    assert dll.to_list() == [19, 18, 17, 16, 15, 9, 8, 7, 6, 5, 4, 3, 2, 1, 0, -1]
+    assert dll.to_reverse_list() == dll.to_list()[::-1]
@@ -79,3 +79,19 @@ def test_linked_list_delete_at_empty_raises() -> None:
     ll = LinkedList[int]()
     with pytest.raises(IndexError):
         ll.delete_at(0)
+
+
+def test_tail_append_and_sequential_delete_at() -> None:
+    ll = LinkedList[int]()
+    for v in range(10):
+        ll.append(v)
+    assert ll.tail is not None and ll.tail.value == 9
+
+    assert [ll.delete_at(3) for _ in range(3)] == [3, 4, 5]  # reusa el finger
+    assert ll.delete_at(len(ll) - 1) == 9
+    assert ll.tail.value == 8
+    ll.push_front(-1)
+    ll.reverse()
+    ll.append(100)
+    assert ll.to_list() == [8, 7, 6, 2, 1, 0, -1, 100]
+    assert ll.delete_at(3) == 2
@@ -1,6 +1,8 @@
 import pytest
 
+from core.structures.linear import typed_storage
 from core.structures.linear.ring_buffer import RingBuffer
+from core.structures.linear.typed_ring_buffer import TypedRingBuffer
 
 
 def test_basic_write_read_wrap() -> None:
@@ -40,3 +42,114 @@ def test_peek_clear() -> None:
     rb.clear()
     assert rb.peek() is None
     assert rb.to_list() == []
+
+
+def test_write_many_read_many_across_wrap() -> None:
+    rb = RingBuffer[int](capacity=5)
+    rb.write_many([1, 2, 3])
+    assert rb.read_many(2) == [1, 2]
+    rb.write_many([4, 5, 6, 7])  # cruza el wrap
+    assert rb.is_full()
+    assert rb.views() == ([3, 4, 5], [6, 7])
+    assert rb.read_many(10) == [3, 4, 5, 6, 7]
+    assert rb.is_empty()
+    assert rb.read_many(1) == []
+    assert rb.snapshot()["buffer"] == [None] * 5
+
+
+def test_write_many_overflow_is_atomic() -> None:
+    rb = RingBuffer[int](capacity=3)
+    rb.write(1)
+    with pytest.raises(OverflowError):
+        rb.write_many([2, 3, 4])
+    assert rb.to_list() == [1]
+    with pytest.raises(ValueError):
+        rb.read_many(-1)
+
+
+def test_write_many_overwrite() -> None:
+    rb = RingBuffer[int](capacity=4)
+    rb.write_many([1, 2, 3])
+    rb.write_many([4, 5], overwrite=True)
+    assert rb.to_list() == [2, 3, 4, 5]
+    rb.write_many(range(10, 20), overwrite=True)
+    assert rb.to_list() == [16, 17, 18, 19]
+    assert len(rb) == 4
+
+
+@pytest.fixture(params=["numpy", "array"])
+def typed_backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    if request.param == "array":
+        monkeypatch.setattr(typed_storage, "np", None)
+    elif typed_storage.np is None:
+        pytest.skip("numpy no instalado")
+    return request.param
+
+
+def test_typed_ring_buffer_matches_list_mode(typed_backend: str) -> None:
+    rb = RingBuffer[int](capacity=4, dtype="int64")
+    assert isinstance(rb, TypedRingBuffer)
+    rb.write(1)
+    rb.write_many([2, 3])
+    assert rb.read() == 1
+    rb.write_many([4, 5])
+    assert rb.peek() == 2
+    assert type(rb.peek()) is int
+    assert rb.to_list() == [2, 3, 4, 5]
+    assert rb.snapshot()["buffer"] == [5, 2, 3, 4]
+    assert list(rb.read_many(3)) == [2, 3, 4]
+    assert rb.snapshot()["buffer"] == [5, None, None, None]
+    rb.write_over(6)
+    assert rb.to_list() == [5, 6]
+    rb.clear()
+    assert rb.to_list() == []
+    assert rb.nbytes == 4 * 8
+
+
+def test_typed_ring_buffer_views_are_zero_copy(typed_backend: str) -> None:
+    rb = RingBuffer[float](capacity=4, dtype="float64")
+    rb.write_many([1.0, 2.0, 3.0])
+    rb.read_many(2)
+    rb.write_many([4.0, 5.0])
+    first, second = rb.views()
+    assert list(first) == [3.0, 4.0]
+    assert list(second) == [5.0]
+    first[0] = 9.0  # escribe en el buffer, no en una copia
+    assert rb.peek() == 9.0
+
+
+def test_typed_ring_buffer_rejects_bad_values(typed_backend: str) -> None:
+    rb = RingBuffer[int](capacity=2, dtype="int8")
+    with pytest.raises(ValueError):
+        rb.write("x")
+    with pytest.raises(ValueError):
+        rb.write_many([1, 1000])
+    assert rb.is_empty()
+    with pytest.raises(ValueError):
+        RingBuffer(2, dtype="complex")
+
+
+def test_typed_write_many_with_live_views_without_numpy(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(typed_storage, "np", None)
+    rb = RingBuffer[int](capacity=8, dtype="int64")
+    rb.write_many([1, 2, 3])
+    views = rb.views()  # memoryview sobre el array.array
+
+    rb.write_many([4, 5])  # sin wrap: la segunda copia queda vacía
+    rb.write_many([])
+    assert rb.to_list() == [1, 2, 3, 4, 5]
+    assert (rb._head, rb._tail, len(rb)) == (0, 5, 5)
+    assert [list(v) for v in views] == [[1, 2, 3]]
+
+
+def test_typed_write_many_validates_ndarrays() -> None:
+    np = pytest.importorskip("numpy")
+    rb = RingBuffer[int](capacity=4, dtype="int64")
+    rb.write_many([1])
+    with pytest.raises(ValueError):
+        rb.write_many(np.array([1.9, 2.5]))
+    with pytest.raises(ValueError):
+        RingBuffer[int](capacity=2, dtype="uint8").write_many(np.array([-1, 300]))
+    assert rb.to_list() == [1]
+    rb.write_many(np.array([2, 3], dtype=np.int32))
+    assert rb.to_list() == [1, 2, 3]
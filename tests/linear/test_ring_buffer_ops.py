@@ -1,3 +1,5 @@
+import pytest
+
 from core.algos.linear.ring_buffer_ops import build_steps, parse_operations
 from core.render.linear.ring_buffer_graphviz import ring_buffer_to_dot
 
@@ -7,3 +9,25 @@ def test_rb_ops_builds_steps() -> None:
     steps = build_steps(ops, capacity=3, dot_builder=ring_buffer_to_dot)
     assert "digraph" in steps[-1].dot
     assert steps[-1].items == [2, 3]
+
+
+def test_rb_ops_batch_commands() -> None:
+    ops = parse_operations("writemany 1 2 3\nreadmany 2\nwritemany 4 5 6\n")
+    steps = build_steps(ops, capacity=4, dot_builder=ring_buffer_to_dot)
+    assert steps[2].message == "readmany 2 → [1, 2]"
+    assert steps[-1].items == [3, 4, 5, 6]
+    assert steps[-1].head == 2
+
+
+def test_rb_ops_typed_stops_on_error() -> None:
+    ops = parse_operations("writemany 1 2\nwrite x\nread\n")
+    steps = build_steps(ops, capacity=3, dot_builder=ring_buffer_to_dot, dtype="int64")
+    assert steps[-1].message.startswith("ERROR")
+    assert steps[-1].items == [1, 2]
+
+
+def test_rb_ops_rejects_bad_readmany() -> None:
+    with pytest.raises(ValueError):
+        parse_operations("readmany")
+    with pytest.raises(ValueError):
+        parse_operations("readmany -1")
@@ -1,3 +1,5 @@
+import pytest
+
 from core.structures.linear.skip_list import SkipList
 
 
@@ -16,3 +18,46 @@ def test_skip_list_insert_search_delete() -> None:
     assert sl.delete(10) is False
     assert sl.search(10) is False
     assert len(sl) == 2
+
+
+def test_skip_list_indexable_and_auto_level() -> None:
+    sl = SkipList[int]()
+    for v in range(0, 2000, 2):
+        sl.insert(v)
+    sl.delete(500)
+
+    assert sl.max_level >= 10  # creció con el tamaño
+    assert sl.at(0) == 0 and sl.at(250) == 502 and sl.at(-1) == 1998
+    assert sl.index_of(502) == 250
+    assert sl.rank(503) == 251
+    assert sl.rank(-1) == 0
+    assert [sl.at(i) for i in range(len(sl))] == sl.levels_as_lists()[-1]
+
+    with pytest.raises(IndexError):
+        sl.at(len(sl))
+    with pytest.raises(ValueError):
+        sl.index_of(500)
+
+
+def test_skip_list_fixed_max_level() -> None:
+    sl = SkipList[int](max_level=3)
+    for v in range(100):
+        sl.insert(v)
+    assert sl.max_level == 3
+    assert sl.at(42) == 42
+    with pytest.raises(ValueError):
+        sl.insert(1000, level=4)
+
+
+def test_skip_list_ordered_queries() -> None:
+    sl = SkipList[int]()
+    for v in [10, 20, 30, 40]:
+        sl.insert(v)
+
+    assert (sl.floor(25), sl.floor(20), sl.floor(5)) == (20, 20, None)
+    assert (sl.ceiling(25), sl.ceiling(30), sl.ceiling(45)) == (30, 30, None)
+    assert (sl.predecessor(20), sl.predecessor(10)) == (10, None)
+    assert (sl.successor(20), sl.successor(40)) == (30, None)
+    assert list(sl.range(15, 35)) == [20, 30]
+    assert list(sl.range(hi=20)) == [10, 20]
+    assert list(sl.range(35)) == [40]
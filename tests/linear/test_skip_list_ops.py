@@ -1,3 +1,5 @@
+import pytest
+
 from core.algos.linear.skip_list_ops import build_steps, parse_operations
 from core.render.linear.skip_list_graphviz import skip_list_to_dot
 
@@ -8,3 +10,27 @@ def test_skip_list_ops_basic() -> None:
 
     assert "digraph" in steps[-1].dot
     assert "delete 10" in steps[-1].message
+
+
+def test_skip_list_ops_positional_commands() -> None:
+    ops = parse_operations("insert 10\ninsert 20\ninsert 30\nat 1\nindex 30\nindex 99\nrank 25\n")
+    msgs = [s.message for s in build_steps(ops, dot_builder=skip_list_to_dot)]
+
+    assert msgs[-4:] == ["at 1 → 20", "index 30 → 2", "index 99 → NO ENCONTRADO", "rank 25 → 2"]
+
+
+def test_skip_list_ops_at_requires_int() -> None:
+    with pytest.raises(ValueError):
+        parse_operations("at x")
+
+
+def test_skip_list_ops_bounds_and_range() -> None:
+    ops = parse_operations(
+        "insert 10 0\ninsert 20 1\ninsert 30 0\nfloor 25\nceiling 31\nrange 15 30\n"
+    )
+    steps = build_steps(ops, dot_builder=skip_list_to_dot)
+
+    assert steps[-3].message == "floor 25 → 20"
+    assert steps[-2].message == "ceiling 31 → NINGUNO"
+    assert steps[-1].message == "range 15 30 → [20, 30]"
+    assert {(1, 20), (1, 30)} <= steps[-1].highlight
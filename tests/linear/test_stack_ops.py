@@ -1,4 +1,8 @@
-from core.algos.linear.stack_ops import build_steps, parse_operations
+from collections.abc import Iterator
+
+import pytest
+
+from core.algos.linear.stack_ops import build_steps, iter_operations, iter_steps, parse_operations
 from core.render.linear.stack_graphviz import stack_to_dot
 
 
@@ -7,3 +11,23 @@ def test_stack_ops_basic() -> None:
     steps = build_steps(ops, dot_builder=stack_to_dot)
     assert steps[-1].stack == [1]
     assert "digraph" in steps[-1].dot
+
+
+def test_stack_ops_stream_from_file_like() -> None:
+    import io
+
+    ops = iter_operations(io.StringIO("push 1\n# comentario\npush 2\npop\n"))
+    steps = build_steps(ops, dot_builder=stack_to_dot)
+    assert [s.stack for s in steps] == [[], [1], [1, 2], [1]]
+
+
+def test_stack_ops_steps_before_parsing_finishes() -> None:
+    def lines() -> Iterator[str]:
+        yield "push 1"
+        yield "push 2"
+        yield "nope"  # se parsea recién cuando se pide el 4to paso
+
+    steps = iter_steps(iter_operations(lines()), dot_builder=stack_to_dot)
+    assert [next(steps).stack for _ in range(3)] == [[], [1], [1, 2]]
+    with pytest.raises(ValueError, match="Línea 3"):
+        next(steps)
@@ -0,0 +1,54 @@
+import json
+from pathlib import Path
+
+from benchmarks.async_queues import CASES as ASYNC_CASES
+from benchmarks.async_queues import run_all as run_async
+from benchmarks.cases import PIPELINES, STRUCTURES, make_keys
+from benchmarks.run import compare, main, run_all
+from benchmarks.threads import CASES as THREAD_CASES
+from benchmarks.threads import run_all as run_threads
+
+
+def test_every_case_runs_on_every_workload() -> None:
+    report = run_all([50], repeat=1, memory=False)
+    rows = report["results"]
+
+    assert len(rows) == (len(STRUCTURES) + len(PIPELINES)) * 4
+    assert [r for r in rows if "error" in r] == []
+    assert all(r["ops"] > 0 and r["ops_per_sec"] > 0 for r in rows)
+
+
+def test_collision_keys_share_a_bucket() -> None:
+    from core.structures.hash.hash_table import stable_hash
+
+    assert len({stable_hash(k) % 1024 for k in make_keys("collision", 100)}) == 1
+    assert sorted(make_keys("random", 100)) == make_keys("sorted", 100)
+
+
+def test_main_writes_json_and_flags_regressions(tmp_path: Path) -> None:
+    out = tmp_path / "r.json"
+    assert main(["--sizes", "20", "--only", "Stack", "--repeat", "1", "--out", str(out)]) == 0
+    report = json.loads(out.read_text(encoding="utf-8"))
+    assert {r["case"] for r in report["results"]} == {"Stack", "stack_ops"}
+    assert report["results"][0]["peak_kib"] is not None
+
+    faster = json.loads(json.dumps(report))
+    for r in faster["results"]:
+        r["ops_per_sec"] *= 10
+    assert compare(report, faster, threshold=0.1)
+
+
+def test_thread_benchmark_runs_every_case() -> None:
+    report = run_threads([1, 2], items=200, capacity=8, repeat=1)
+    rows = report["results"]
+    spsc = sum(c.spsc for c in THREAD_CASES)
+    assert len(rows) == len(THREAD_CASES) * 2 - spsc
+    assert all(r["items_per_sec"] > 0 for r in rows)
+    assert isinstance(report["meta"]["gil_enabled"], bool)
+
+
+def test_async_benchmark_runs_every_case() -> None:
+    report = run_async([1, 5], items=200, capacity=8, repeat=1)
+    rows = report["results"]
+    assert len(rows) == len(ASYNC_CASES) * 2
+    assert all(r["items"] == 200 and r["items_per_sec"] > 0 for r in rows)
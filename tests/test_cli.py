@@ -0,0 +1,77 @@
+import json
+
+import pytest
+
+from core.cli import TARGETS, get_target, main, replay
+
+
+def test_replay_counts_and_final_stats() -> None:
+    lines = [f"insert {k}" for k in (5, 3, 8, 1)] + ["contains 3", "delete 8", "inorder"]
+    report = replay(get_target("avl"), lines, memory=False)
+    assert report["structure"] == "avl_tree"
+    assert report["done"] == report["ops"] == 7
+    assert report["counts"] == {"insert": 4, "contains": 1, "delete": 1, "inorder": 1}
+    assert report["final"] == {"size": 3, "height": 2}
+    assert report["error"] is None
+    assert report["peak_kib"] is None
+
+
+def test_replay_stops_at_first_failing_op() -> None:
+    report = replay(get_target("stack"), ["push 1", "pop", "pop", "push 2"])
+    assert report["done"] == 2
+    assert report["error"]["op"] == 3
+    assert report["error"]["message"].startswith("IndexError")
+    assert report["peak_kib"] is not None
+
+
+@pytest.mark.parametrize("structure", ["avl", "bst", "rbt", "skip_list"])
+def test_replay_mixed_key_types_is_op_error(tmp_path, capsys, structure: str) -> None:
+    report = replay(get_target(structure), ["insert 1", "insert a"], memory=False)
+    assert report["done"] == 1
+    assert report["error"]["op"] == 2
+    assert report["error"]["message"].startswith("TypeError")
+
+    script = tmp_path / "ops.txt"
+    script.write_text("insert 1\ninsert a\n", encoding="utf-8")
+    assert main(["replay", "-s", structure, str(script)]) == 1
+    assert "TypeError" in capsys.readouterr().out
+
+
+def test_replay_params_and_validation() -> None:
+    report = replay(
+        get_target("hash_table"), ["set a 1", "set b 2"], params={"engine": "open"}, memory=False
+    )
+    assert report["params"] == {"capacity": 8, "engine": "open"}
+    assert report["final"] == {"size": 2, "load_factor": 0.25}
+    with pytest.raises(ValueError):
+        replay(get_target("avl"), ["insert 1"], params={"capacity": 4})
+    with pytest.raises(ValueError):
+        replay(get_target("avl"), ["bogus 1"])
+    with pytest.raises(ValueError):
+        get_target("heap")
+
+
+def test_every_target_replays_empty_script() -> None:
+    for target in TARGETS:
+        assert replay(target, [], memory=False)["final"]["size"] == 0
+
+
+def test_main_json_and_exit_codes(tmp_path, capsys) -> None:
+    script = tmp_path / "ops.txt"
+    script.write_text("write 1\nwrite 2\nread\n", encoding="utf-8")
+    assert main(["replay", "-s", "ring_buffer", "--capacity", "2", str(script), "--json"]) == 0
+    report = json.loads(capsys.readouterr().out)
+    assert report["final"] == {"size": 1, "capacity": 2}
+
+    script.write_text("write 1\nwrite 2\nwrite 3\n", encoding="utf-8")
+    assert main(["replay", "-s", "ring_buffer", "--capacity", "2", str(script)]) == 1
+    script.write_text("nope\n", encoding="utf-8")
+    assert main(["replay", "-s", "ring_buffer", str(script)]) == 2
+
+
+def test_main_missing_paths_exit_2(tmp_path, capsys) -> None:
+    missing = tmp_path / "nope" / "ops.txt"
+    assert main(["replay", "-s", "ring_buffer", str(missing)]) == 2
+    assert "error:" in capsys.readouterr().err
+    assert main(["generate", "-s", "ring_buffer", "-n", "3", "--out", str(missing)]) == 2
+    assert "error:" in capsys.readouterr().err
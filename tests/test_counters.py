@@ -0,0 +1,174 @@
+import pytest
+
+from core.algos.hash.hash_table_ops import build_steps as ht_build_steps
+from core.algos.hash.hash_table_ops import parse_operations as ht_parse
+from core.algos.trees.avl_tree_ops import build_steps as avl_build_steps
+from core.algos.trees.avl_tree_ops import parse_operations as avl_parse
+from core.stepper import Stepper
+from core.structures.counters import OpCounters, format_cost
+from core.structures.hash.hash_set import HashSet
+from core.structures.hash.hash_table import HashTable
+from core.structures.linear.doubly_linked_list import DoublyLinkedList
+from core.structures.linear.linked_list import LinkedList
+from core.structures.linear.skip_list import SkipList
+from core.structures.trees.avl_tree import AVLTree
+from core.structures.trees.binary_search_tree import BinarySearchTree
+from core.structures.trees.red_black_tree import RedBlackTree
+
+
+def _dot(*_args, **_kwargs) -> str:
+    return "digraph {}"
+
+
+def test_counters_disabled_by_default():
+    t = AVLTree()
+    for x in range(10):
+        t.insert(x)
+    assert t.counters is None
+    c = t.enable_counters()
+    assert t.enable_counters() is c
+    t.disable_counters()
+    assert t.counters is None
+
+
+def test_since_only_reports_changes():
+    c = OpCounters()
+    before = c.as_dict()
+    c.compares += 3
+    c.rotations += 1
+    assert c.since(before) == {"compares": 3, "rotations": 1}
+    assert format_cost(c.since(before)) == "compares=3 · rotations=1"
+    c.reset()
+    assert c.as_dict() == dict.fromkeys(before, 0)
+
+
+@pytest.mark.parametrize("cls", [AVLTree, RedBlackTree, BinarySearchTree])
+def test_tree_search_compares_path_length(cls):
+    t = cls()
+    for x in (50, 30, 70, 20, 40):
+        t.insert(x)
+    c = t.enable_counters()
+    before = c.as_dict()
+    assert t.contains(t.root.value)
+    assert c.since(before) == {"compares": 1}
+
+
+def test_avl_sorted_inserts_rotate():
+    t = AVLTree()
+    c = t.enable_counters()
+    for x in range(1, 8):
+        t.insert(x)
+    # 1..7 ascendente: una rotación simple en 3, 5, 6 y 7
+    assert c.rotations == 4
+    assert c.compares > 0
+
+
+@pytest.mark.parametrize("cls", [AVLTree, RedBlackTree])
+def test_arena_counts_match_node_storage(cls):
+    counts = []
+    for storage in ("node", "arena"):
+        t = cls(storage=storage)
+        c = t.enable_counters()
+        for x in (5, 3, 8, 1, 4, 7, 9, 2, 6):
+            t.insert(x)
+        for x in (3, 8, 100):
+            t.delete(x)
+        counts.append(c.as_dict())
+    assert counts[0] == counts[1]
+    assert counts[0]["rotations"] > 0
+
+
+def test_red_black_counts_color_flips():
+    t = RedBlackTree()
+    c = t.enable_counters()
+    for x in range(1, 16):
+        t.insert(x)
+    assert c.color_flips > 0
+
+
+def test_chaining_collisions_probe_whole_bucket():
+    ht = HashTable(capacity=64)
+    for i in range(5):
+        ht.set(i << 32, i)  # stable_hash 0: mismo bucket
+    c = ht.enable_counters()
+    before = c.as_dict()
+    assert not ht.has(99 << 32)
+    assert c.since(before) == {"probes": 5}
+    before = c.as_dict()
+    ht.get(2 << 32)
+    assert c.since(before) == {"probes": 3}
+
+
+@pytest.mark.parametrize("engine", ["chaining", "open"])
+def test_rehash_moves_counts_entries(engine):
+    ht = HashTable(capacity=4, engine=engine)
+    c = ht.enable_counters()
+    for i in range(4):
+        ht.set(i, i)
+    assert c.rehash_moves == 4  # el 4.º set supera 0.75 y mueve las 4 entradas
+
+
+def test_open_addressing_probes_run_length():
+    ht = HashTable(capacity=16, engine="open")
+    for k in (0, 16, 32):  # mismo slot home: 0, 1, 2
+        ht.set(k, k)
+    c = ht.enable_counters()
+    before = c.as_dict()
+    ht.get(32)
+    assert c.since(before) == {"probes": 3}
+
+
+def test_hash_set_shares_table_counters():
+    s = HashSet(capacity=8)
+    c = s.enable_counters()
+    s.add("a")
+    assert c.probes == 0
+    s.contains("a")
+    assert c.probes == 1
+    s.disable_counters()
+    assert s.counters is None and s._ht.counters is None
+
+
+def test_linked_list_hops():
+    ll = LinkedList()
+    for x in range(10):
+        ll.append(x)
+    c = ll.enable_counters()
+    assert ll.find_index(7) == 7
+    assert c.hops == 7
+    assert ll.find_index(99) is None
+    assert c.hops == 17
+
+    dll = DoublyLinkedList()
+    for x in range(10):
+        dll.push_back(x)
+    c = dll.enable_counters()
+    before = c.as_dict()
+    assert dll.delete(3)
+    assert c.since(before) == {"hops": 3}
+
+
+def test_skip_list_compares():
+    sl = SkipList(p=0.5, seed=7)
+    for x in range(50):
+        sl.insert(x)
+    c = sl.enable_counters()
+    assert sl.search(25)
+    assert c.compares > 0
+
+
+def test_build_steps_records_cost_per_step():
+    steps = avl_build_steps(avl_parse("insert 1\ninsert 2\ninsert 3\ninorder"), dot_builder=_dot)
+    assert steps[0].cost == {}
+    assert steps[3].cost["rotations"] == 1
+    assert steps[4].cost == {}
+
+    totals = Stepper(steps=steps).cost_totals()
+    assert totals["rotations"] == 1
+    assert totals["compares"] == sum(s.cost.get("compares", 0) for s in steps)
+
+
+def test_error_step_keeps_cost():
+    steps = ht_build_steps(ht_parse("set 1 a\nget 9"), capacity=8, dot_builder=_dot)
+    assert steps[-1].message.startswith("ERROR")
+    assert steps[-1].cost == {"probes": 1}  # 9 % 8 cae en el bucket de la key 1
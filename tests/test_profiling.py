@@ -0,0 +1,72 @@
+import json
+import pstats
+
+import pytest
+
+from core.algos.hash import hash_table_ops
+from core.algos.linear import array_list_ops, ring_buffer_ops
+from core.algos.trees import avl_tree_ops
+from core.profiling import profile_build
+
+
+def _dot(*_args, **_kwargs) -> str:
+    return "digraph {}"
+
+
+OPS = "insert 5\ninsert 3\ninsert 8\ncontains 3\ndelete 5"
+
+
+def test_profile_has_one_entry_per_step():
+    profile = profile_build(
+        OPS, avl_tree_ops.parse_operations, avl_tree_ops.build_steps, dot_builder=_dot
+    )
+    steps = avl_tree_ops.build_steps(avl_tree_ops.parse_operations(OPS), dot_builder=_dot)
+
+    assert profile.structure == "avl_tree"
+    assert [s.message for s in profile.steps] == [s.message for s in steps]
+    assert [s.index for s in profile.steps] == list(range(len(steps)))
+    assert all(s.op_ms >= 0 and s.dot_ms >= 0 and s.peak_kib >= 0 for s in profile.steps)
+    assert profile.op_ms == pytest.approx(sum(s.op_ms for s in profile.steps))
+
+
+def test_json_export_round_trips():
+    profile = profile_build(
+        OPS, avl_tree_ops.parse_operations, avl_tree_ops.build_steps, dot_builder=_dot
+    )
+    data = json.loads(profile.to_json())
+    assert data["structure"] == "avl_tree"
+    assert len(data["steps"]) == len(profile.steps)
+    assert set(data["steps"][0]) == {"index", "message", "op_ms", "dot_ms", "peak_kib"}
+
+
+def test_pstats_dump_loads(tmp_path):
+    profile = profile_build(
+        OPS, avl_tree_ops.parse_operations, avl_tree_ops.build_steps, dot_builder=_dot
+    )
+    path = tmp_path / "build.prof"
+    path.write_bytes(profile.pstats)
+    stats = pstats.Stats(str(path))
+    assert any(name == "_insert_rec" for (_file, _line, name) in stats.stats)
+    assert "cumulative" in profile.pstats_text
+
+
+@pytest.mark.parametrize(
+    ("module", "ops", "params"),
+    [
+        (hash_table_ops, "set a 1\nget a", {"capacity": 8, "engine": "open"}),
+        (ring_buffer_ops, "write 1\nread", {"capacity": 4}),
+        (array_list_ops, "append 1\npop", {"engine": "list"}),
+    ],
+)
+def test_passes_page_params_to_iter_steps(module, ops, params):
+    profile = profile_build(
+        ops, module.parse_operations, module.build_steps, dot_builder=_dot, **params
+    )
+    assert len(profile.steps) == 3
+
+
+def test_parse_error_propagates():
+    with pytest.raises(ValueError):
+        profile_build(
+            "nope 1", avl_tree_ops.parse_operations, avl_tree_ops.build_steps, dot_builder=_dot
+        )
@@ -0,0 +1,73 @@
+import pytest
+
+from core.algos.linear.array_list_ops import build_steps, parse_operations
+from core.render.linear.array_list_graphviz import array_list_to_dot
+from core.step_cache import StepCache, cache_key, cached_build_steps
+
+TEXT = "\n".join(f"append {i}" for i in range(20))
+
+
+def test_memory_hit_returns_same_timeline(tmp_path) -> None:
+    cache = StepCache(tmp_path / "steps.sqlite")
+    a = cached_build_steps(
+        TEXT, parse_operations, build_steps, cache=cache, dot_builder=array_list_to_dot
+    )
+    b = cached_build_steps(
+        TEXT, parse_operations, build_steps, cache=cache, dot_builder=array_list_to_dot
+    )
+    assert a is b
+    assert list(a)[-1].values == list(range(20))
+    stats = cache.stats()
+    assert stats["builds"] == 1
+    assert stats["memory_hits"] == 1
+
+
+def test_disk_tier_survives_new_instance(tmp_path) -> None:
+    path = tmp_path / "steps.sqlite"
+    first = cached_build_steps(
+        TEXT, parse_operations, build_steps, cache=StepCache(path), dot_builder=array_list_to_dot
+    )
+    cache = StepCache(path)
+    again = cached_build_steps(
+        TEXT, parse_operations, build_steps, cache=cache, dot_builder=array_list_to_dot
+    )
+    assert list(again) == list(first)
+    assert cache.stats()["disk_hits"] == 1
+    assert cache.stats()["builds"] == 0
+
+
+def test_key_ignores_whitespace_but_not_params() -> None:
+    params = {"dot_builder": array_list_to_dot}
+    base = cache_key("m", "append 1\nappend 2", params)
+    assert cache_key("m", "  append 1  \nappend 2", params) == base
+    assert cache_key("m", "append 1\nappend 3", params) != base
+    assert cache_key("m", "append 1\nappend 2", {**params, "dtype": "int64"}) != base
+    assert cache_key("other", "append 1\nappend 2", params) != base
+
+
+def test_unpicklable_result_is_not_cached() -> None:
+    cache = StepCache()
+    for _ in range(2):
+        cached_build_steps(
+            TEXT, parse_operations, build_steps, cache=cache, dot_builder=lambda v: str(v)
+        )
+    assert cache.stats()["builds"] == 2
+    assert cache.stats()["memory_entries"] == 0
+
+
+def test_memory_bytes_bound_evicts() -> None:
+    cache = StepCache(memory_bytes=1)
+    cached_build_steps(
+        TEXT, parse_operations, build_steps, cache=cache, dot_builder=array_list_to_dot
+    )
+    assert cache.stats()["memory_entries"] == 0
+    assert cache.stats()["memory_bytes"] == 0
+
+
+def test_parse_error_propagates() -> None:
+    cache = StepCache()
+    with pytest.raises(ValueError):
+        cached_build_steps(
+            "bogus 1", parse_operations, build_steps, cache=cache, dot_builder=array_list_to_dot
+        )
+    assert cache.stats()["memory_entries"] == 0
@@ -23,3 +23,27 @@ def test_stepper_navigation() -> None:
 
     sp.reset()
     assert sp.current() == "a"
+
+
+def test_stepper_current_dot_lru() -> None:
+    class _S:
+        renders = 0
+
+        @property
+        def dot(self) -> str:
+            _S.renders += 1
+            return "digraph {}"
+
+    sp = Stepper(steps=[_S() for _ in range(5)], dot_cache_size=2)
+    assert sp.current_dot() == "digraph {}"
+    sp.next()
+    sp.current_dot()
+    sp.prev()
+    sp.current_dot()  # cache hit
+    assert _S.renders == 2
+
+    sp.seek(4)
+    sp.current_dot()
+    sp.seek(1)
+    sp.current_dot()  # desalojado por el LRU (size=2)
+    assert _S.renders == 4
@@ -0,0 +1,65 @@
+from core.algos.linear.array_list_ops import build_steps, parse_operations
+from core.render.linear.array_list_graphviz import array_list_to_dot
+from core.stepper import Stepper
+from core.timeline import Timeline
+
+
+def test_timeline_roundtrip_matches_full_steps() -> None:
+    text = "\n".join(f"append {i}" for i in range(50)) + "\ninsert 3 99\npop_at 10\nset 0 7\n"
+    ops = parse_operations(text)
+    tl = build_steps(ops, dot_builder=array_list_to_dot)
+    full = list(tl)
+
+    assert isinstance(tl, Timeline)
+    assert len(tl) == len(ops) + 1
+    assert tl.keyframes() < len(tl)
+    assert full[-1].values[:2] == [7, 1]
+
+    # acceso aleatorio (hacia atrás y adelante) == reconstrucción secuencial
+    for i in (40, 3, 0, 52, 33, 31, 32, -1):
+        assert tl[i] == full[i]
+    assert tl[10:13] == full[10:13]
+
+
+def test_timeline_non_dataclass_and_interval() -> None:
+    tl = Timeline(["a", "b", "c"], keyframe_interval=2)
+    assert list(tl) == ["a", "b", "c"]
+    assert tl[1] == "b"
+
+
+def test_stepper_seek_into_timeline() -> None:
+    ops = parse_operations("\n".join(f"append {i}" for i in range(100)))
+    sp = Stepper(steps=build_steps(ops, dot_builder=array_list_to_dot))
+
+    assert sp.seek(70).values == list(range(70))
+    assert sp.index == 70
+    assert sp.seek(10_000).values == list(range(100))
+    assert sp.seek(-5).values == []
+
+
+def test_timeline_prev_reuses_materialised_steps(monkeypatch) -> None:
+    ops = parse_operations("\n".join(f"append {i}" for i in range(64)))
+    tl = build_steps(ops, dot_builder=array_list_to_dot)
+    full = list(tl)
+    k = tl.keyframe_interval
+
+    applied = 0
+    apply = Timeline._apply
+
+    def counting_apply(cur, frame):
+        nonlocal applied
+        applied += 1
+        return apply(cur, frame)
+
+    monkeypatch.setattr(Timeline, "_apply", staticmethod(counting_apply))
+
+    # Next: un delta por paso desde el cursor
+    for i in range(k + 1, 2 * k):
+        assert tl[i] == full[i]
+    assert applied == k - 1
+
+    # Prev: el primero rearma el tramo desde el keyframe, los demás no aplican nada
+    applied = 0
+    for i in range(2 * k - 2, k - 1, -1):
+        assert tl[i] == full[i]
+    assert applied == k - 2
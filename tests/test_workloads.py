@@ -0,0 +1,82 @@
+import itertools
+from collections import Counter
+
+import pytest
+
+from core import workloads
+from core.cli import get_target, main, replay
+from core.structures.hash.hash_table import stable_hash
+from core.workloads import GRAMMARS, KEY_DISTRIBUTIONS, MIXES, generate, iter_keys
+
+
+@pytest.mark.parametrize("grammar", sorted(GRAMMARS))
+def test_every_grammar_replays_without_errors(grammar: str) -> None:
+    params = {"capacity": 8} if grammar == "ring_buffer" else {}
+    for keys, mix in itertools.product(KEY_DISTRIBUTIONS, MIXES):
+        lines = list(generate(grammar, 150, keys=keys, mix=mix, seed=5, capacity=8))
+        assert len(lines) == 150
+        report = replay(get_target(grammar), lines, params=params, memory=False)
+        assert report["error"] is None, (keys, mix, report["error"])
+
+
+def test_deterministic_and_lazy() -> None:
+    a = list(generate("hash_table_ops", 500, keys="zipf", seed=9))
+    assert a == list(generate("hash_table", 500, keys="zipf", seed=9))
+    assert a != list(generate("hash_table", 500, keys="zipf", seed=10))
+    # un stream gigante no se arma de antemano
+    huge = generate("avl_tree", 10**12, keys="uniform")
+    assert len(list(itertools.islice(huge, 10))) == 10
+
+
+def test_key_distributions() -> None:
+    assert list(itertools.islice(iter_keys("sorted"), 3)) == [0, 1, 2]
+    assert list(itertools.islice(iter_keys("reverse", universe=10), 3)) == [9, 8, 7]
+    assert {stable_hash(k) for k in itertools.islice(iter_keys("collision"), 100)} == {0}
+    zipf = Counter(itertools.islice(iter_keys("zipf", universe=1_000, seed=1), 20_000))
+    assert zipf.most_common(1)[0][0] == 0
+    assert zipf[0] > 10 * zipf[100]
+    assert min(zipf) >= 0 and max(zipf) < 1_000
+
+
+def test_mixes_shape_the_stream() -> None:
+    ops = Counter(line.split()[0] for line in generate("avl_tree", 2_000, mix="read_heavy"))
+    assert ops["contains"] > 5 * ops["insert"]
+    assert ops["delete"] == 0
+    ops = Counter(line.split()[0] for line in generate("stack", 2_000, mix="insert"))
+    assert ops == {"push": 2_000}
+
+
+def test_live_keys_only_tracked_when_needed(monkeypatch: pytest.MonkeyPatch) -> None:
+    added = 0
+
+    def counting_add(self, key: int) -> None:
+        nonlocal added
+        added += 1
+
+    monkeypatch.setattr(workloads._Live, "add", counting_add)
+    for grammar, keys, mix in [
+        ("avl_tree", "sorted", "insert"),
+        ("hash_set", "uniform", "read_heavy"),  # lookups del stream, sin lookup_hit
+    ]:
+        assert len(list(generate(grammar, 1_000, keys=keys, mix=mix))) == 1_000
+    assert added == 0
+    # get de hash_table solo con keys vivas: ahí sí hace falta
+    list(generate("hash_table", 1_000, keys="uniform", mix="read_heavy"))
+    assert added > 0
+
+
+def test_invalid_config() -> None:
+    with pytest.raises(ValueError):
+        generate("heap", 10)
+    with pytest.raises(ValueError):
+        generate("stack", 10, mix="write_only")
+    with pytest.raises(ValueError):
+        generate("stack", 10, keys="gaussian")
+
+
+def test_cli_generate(tmp_path) -> None:
+    out = tmp_path / "ops.txt"
+    assert main(["generate", "-s", "avl", "-n", "50", "--keys", "zipf", "--out", str(out)]) == 0
+    assert out.read_text(encoding="utf-8").splitlines() == list(
+        generate("avl_tree", 50, keys="zipf")
+    )
@@ -1,3 +1,5 @@
+import pytest
+
 from core.algos.trees.avl_tree_ops import build_steps, parse_operations
 from core.render.trees.avl_tree_graphviz import avl_tree_to_dot
 
@@ -6,3 +8,31 @@ def test_avl_ops_basic() -> None:
     ops = parse_operations("insert 3\ninsert 2\ninsert 1\nbfs\n")
     steps = build_steps(ops, dot_builder=avl_tree_to_dot)
     assert steps[-1].bfs == [2, 1, 3]
+
+
+def test_avl_ops_select_rank() -> None:
+    ops = parse_operations("insert 10\ninsert 20\ninsert 30\nselect 1\nrank 25\nselect 9\n")
+    steps = build_steps(ops, dot_builder=avl_tree_to_dot)
+
+    assert steps[4].message == "select 1 → 20"
+    assert steps[4].highlight == [20]
+    assert steps[5].message == "rank 25 → 2"
+    assert steps[-1].message.startswith("ERROR")
+
+
+def test_avl_ops_select_requires_int() -> None:
+    with pytest.raises(ValueError):
+        parse_operations("select x")
+
+
+def test_avl_ops_floor_ceiling_range() -> None:
+    ops = parse_operations("insert 10\ninsert 20\ninsert 30\nfloor 25\nceiling 25\nrange 15 40\n")
+    steps = build_steps(ops, dot_builder=avl_tree_to_dot)
+
+    assert steps[-3].message == "floor 25 → 20"
+    assert steps[-3].highlight == [20, 30]
+    assert steps[-2].message == "ceiling 25 → 30"
+    assert steps[-1].message == "range 15 40 → [20, 30]"
+    assert steps[-1].highlight == [20, 30]
+    with pytest.raises(ValueError):
+        parse_operations("range 1")
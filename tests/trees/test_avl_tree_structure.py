@@ -1,3 +1,5 @@
+import pytest
+
 from core.structures.trees.avl_tree import AVLTree
 
 
@@ -20,3 +22,24 @@ def test_avl_delete_and_balance() -> None:
     assert t.is_valid_avl()
     assert t.contains(25)
     assert not t.contains(999)
+
+
+def test_avl_rl_rotation_keeps_heights_and_sizes() -> None:
+    t = AVLTree[int]()
+    for v in [0, 9, 5]:  # RL
+        t.insert(v)
+    assert t.is_valid_avl()
+    assert t.root is not None and t.root.size == 3
+
+
+def test_avl_order_statistics() -> None:
+    t = AVLTree.from_sorted(range(0, 100, 10))
+    t.insert(55)
+    t.delete(0)
+
+    assert t.select(0) == 10
+    assert t.select(len(t) - 1) == 90
+    assert t.rank(55) == 5
+    assert t.count_range(20, 55) == 5
+    with pytest.raises(IndexError):
+        t.select(len(t))
@@ -11,3 +11,14 @@ def test_bst_ops_basic() -> None:
     # último snapshot: delete 2 y bfs
     last = steps[-1]
     assert last.values == [1, 3]  # inorder ordenado
+
+
+def test_bst_ops_floor_ceiling_range() -> None:
+    ops = parse_operations("insert 4\ninsert 2\ninsert 6\nfloor 5\nceiling 5\nrange 1 4\n")
+    steps = build_steps(ops, dot_builder=binary_search_tree_to_dot)
+
+    assert steps[-3].message == "floor 5 → 4"
+    assert steps[-3].highlight_target == 4
+    assert steps[-2].highlight_values == [4, 6]
+    assert steps[-1].traversal == [2, 4]
+    assert "digraph" in steps[-1].dot
@@ -6,3 +6,38 @@ def test_rbt_ops_basic() -> None:
     ops = parse_operations("insert 3\ninsert 2\ninsert 1\nbfs\n")
     steps = build_steps(ops, dot_builder=red_black_tree_to_dot)
     assert steps[-1].inorder == [1, 2, 3]
+
+
+def test_rbt_steps_render_dot_lazily() -> None:
+    calls: list[int] = []
+
+    def builder(root: object, **kw: object) -> str:
+        calls.append(1)
+        return red_black_tree_to_dot(root, **kw)  # type: ignore[arg-type]
+
+    steps = build_steps(
+        parse_operations("insert 2\ninsert 1\ninsert 3\ntrace 3"), dot_builder=builder
+    )
+    assert calls == []
+
+    dot = steps[-1].dot
+    assert calls == [1]
+    assert "lightyellow" in dot
+    assert dot.count('\nB"') == 3  # raíz + hijos negros tras el flip
+
+
+def test_rbt_ops_select_rank() -> None:
+    ops = parse_operations("insert 3\ninsert 1\ninsert 2\nselect 0\nrank 3\n")
+    steps = build_steps(ops, dot_builder=red_black_tree_to_dot)
+
+    assert steps[-2].message == "select 0 → 1"
+    assert steps[-1].message == "rank 3 → 2"
+
+
+def test_rbt_ops_floor_ceiling_range() -> None:
+    ops = parse_operations("insert 1\ninsert 5\ninsert 9\nfloor 0\nceiling 6\nrange 2 9\n")
+    steps = build_steps(ops, dot_builder=red_black_tree_to_dot)
+
+    assert steps[-3].message == "floor 0 → NINGUNO"
+    assert steps[-2].message == "ceiling 6 → 9"
+    assert steps[-1].highlight == [5, 9]
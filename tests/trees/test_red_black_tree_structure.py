@@ -28,3 +28,25 @@ def test_rbt_delete_keeps_valid() -> None:
 
     assert not t.delete(999)  # no existe
     assert t.is_valid_llrb()
+
+
+def test_rbt_delete_left_path_stays_valid() -> None:
+    t = RedBlackTree[int]()
+    for v in [3, 11, 2, 0, 8]:
+        t.insert(v)
+    assert t.delete(2)
+    assert t.is_valid_llrb()
+    assert t.inorder() == [0, 3, 8, 11]
+
+
+def test_rbt_order_statistics() -> None:
+    t = RedBlackTree[int]()
+    for v in [50, 10, 40, 20, 30, 60, 70, 5]:
+        t.insert(v)
+    t.delete(40)
+
+    assert [t.select(k) for k in range(len(t))] == t.inorder()
+    assert t.rank(5) == 0
+    assert t.rank(35) == 4
+    assert t.count_range(10, 60) == 5
+    assert t.count_range(60, 10) == 0
@@ -0,0 +1,111 @@
+import random
+
+import pytest
+
+from core.render.trees.avl_tree_graphviz import avl_tree_to_dot
+from core.render.trees.red_black_tree_graphviz import red_black_tree_to_dot
+from core.structures.trees.arena import NodeView
+from core.structures.trees.arena_trees import (
+    ArenaAVLTree,
+    ArenaBinarySearchTree,
+    ArenaRedBlackTree,
+)
+from core.structures.trees.avl_tree import AVLTree
+from core.structures.trees.binary_search_tree import BinarySearchTree
+from core.structures.trees.red_black_tree import RedBlackTree
+
+TREES = [
+    (BinarySearchTree, ArenaBinarySearchTree, "is_valid_bst"),
+    (AVLTree, ArenaAVLTree, "is_valid_avl"),
+    (RedBlackTree, ArenaRedBlackTree, "is_valid_llrb"),
+]
+
+
+@pytest.mark.parametrize(("cls", "arena_cls", "check"), TREES)
+def test_storage_dispatch(cls: type, arena_cls: type, check: str) -> None:
+    assert type(cls()) is cls
+    assert type(cls(storage="arena")) is arena_cls
+    assert isinstance(cls(storage="arena"), cls)
+    with pytest.raises(ValueError):
+        cls(storage="disk")
+
+
+@pytest.mark.parametrize(("cls", "arena_cls", "check"), TREES)
+def test_arena_matches_node_tree(cls: type, arena_cls: type, check: str) -> None:
+    rng = random.Random(7)
+    node, arena = cls(), cls(storage="arena")
+    for _ in range(2000):
+        v = rng.randrange(200)
+        if rng.random() < 0.6:
+            assert arena.insert(v) == node.insert(v)
+        else:
+            assert arena.delete(v) == node.delete(v)
+    assert getattr(arena, check)()
+    assert arena.snapshot() == node.snapshot()
+    assert arena.contains(node.min_value()) and not arena.contains(-1)
+    assert arena.search_trace(150) == node.search_trace(150)
+    assert list(reversed(arena)) == list(reversed(node))
+
+
+@pytest.mark.parametrize(("cls", "arena_cls", "check"), TREES)
+def test_arena_reuses_freed_slots(cls: type, arena_cls: type, check: str) -> None:
+    t = cls(storage="arena")
+    for v in range(100):
+        t.insert(v)
+    for v in range(0, 100, 2):
+        t.delete(v)
+    assert len(t._arena) == len(t) == 50
+    for v in range(200, 250):
+        t.insert(v)
+    assert len(t._arena.values) == 100  # sin crecer: usó la free list
+    assert getattr(t, check)()
+
+
+@pytest.mark.parametrize(("cls", "arena_cls", "check"), TREES)
+def test_arena_bulk_insert(cls: type, arena_cls: type, check: str) -> None:
+    t = cls(storage="arena")
+    assert t.bulk_insert(range(1000)) == 1000
+    assert getattr(t, check)()
+    assert t.inorder() == list(range(1000))
+    assert t.height() <= 11
+    t.clear()
+    assert t.root is None and len(t) == 0
+
+
+def test_arena_order_statistics() -> None:
+    for cls in (AVLTree, RedBlackTree):
+        t = cls(storage="arena")
+        for v in random.Random(3).sample(range(500), 300):
+            t.insert(v)
+        for v in range(0, 500, 3):
+            t.delete(v)
+        values = t.inorder()
+        assert [t.select(k) for k in range(len(t))] == values
+        assert t.rank(250) == sum(v < 250 for v in values)
+
+
+def test_views_are_stable_and_die_on_release() -> None:
+    t = BinarySearchTree(storage="arena")
+    for v in [2, 1, 3]:
+        t.insert(v)
+    root = t.root
+    assert isinstance(root, NodeView)
+    assert root.left is root.left and root.left.value == 1
+    leaf = root.right
+    t.delete(3)
+    assert root.right is None
+    assert leaf._i == -1
+    for attr in ("value", "left", "right", "height", "red", "size"):
+        with pytest.raises(ValueError):
+            getattr(leaf, attr)
+    assert repr(leaf) == "NodeView(released)"
+
+
+def test_renderers_work_on_views() -> None:
+    avl = AVLTree(storage="arena")
+    rb = RedBlackTree(storage="arena")
+    for v in range(10):
+        avl.insert(v)
+        rb.insert(v)
+    assert "digraph" in avl_tree_to_dot(avl.root, highlight=[3])
+    assert "digraph" in red_black_tree_to_dot(rb.root)
@@ -0,0 +1,44 @@
+import bisect
+import random
+
+import pytest
+
+from core.structures.trees.avl_tree import AVLTree
+from core.structures.trees.binary_search_tree import BinarySearchTree
+from core.structures.trees.red_black_tree import RedBlackTree
+
+TREES = [BinarySearchTree, AVLTree, RedBlackTree]
+
+
+@pytest.mark.parametrize("cls", TREES)
+def test_floor_ceiling_predecessor_successor(cls: type) -> None:
+    values = sorted(random.Random(5).sample(range(0, 300, 3), 60))
+    t = cls()
+    for v in random.Random(6).sample(values, len(values)):
+        t.insert(v)
+
+    for x in range(-2, 302):
+        i, j = bisect.bisect_right(values, x), bisect.bisect_left(values, x)
+        assert t.floor(x) == (values[i - 1] if i else None)
+        assert t.ceiling(x) == (values[j] if j < len(values) else None)
+        assert t.predecessor(x) == (values[j - 1] if j else None)
+        assert t.successor(x) == (values[i] if i < len(values) else None)
+
+
+@pytest.mark.parametrize("cls", TREES)
+def test_range_is_lazy_and_bounded(cls: type) -> None:
+    t = cls()
+    t.bulk_insert(range(1000))
+
+    assert list(t.range(10, 15)) == [10, 11, 12, 13, 14, 15]
+    assert list(t.range(995)) == [995, 996, 997, 998, 999]
+    assert list(t.range(hi=2)) == [0, 1, 2]
+    assert list(t.range(20, 10)) == []
+    assert next(t.range(500)) == 500
+
+
+def test_bounds_on_empty_tree() -> None:
+    t = AVLTree[int]()
+    assert t.floor(1) is None and t.ceiling(1) is None
+    assert t.predecessor(1) is None and t.successor(1) is None
+    assert list(t.range(0, 10)) == []
@@ -0,0 +1,39 @@
+import pytest
+
+from core.structures.trees.avl_tree import AVLTree
+from core.structures.trees.binary_search_tree import BinarySearchTree
+from core.structures.trees.red_black_tree import RedBlackTree
+
+TREES = [
+    (BinarySearchTree, "is_valid_bst"),
+    (AVLTree, "is_valid_avl"),
+    (RedBlackTree, "is_valid_llrb"),
+]
+
+
+@pytest.mark.parametrize(("cls", "check"), TREES)
+def test_from_sorted_is_balanced_and_valid(cls: type, check: str) -> None:
+    for n in (0, 1, 2, 5, 6, 31, 32, 100):
+        t = cls.from_sorted(range(n))
+        assert getattr(t, check)()
+        assert t.inorder() == list(range(n))
+        assert len(t) == n
+        assert t.height() <= n.bit_length() + 1
+
+    assert cls.from_sorted([1, 1, 2]).inorder() == [1, 2]
+    with pytest.raises(ValueError):
+        cls.from_sorted([3, 1])
+
+
+@pytest.mark.parametrize(("cls", "check"), TREES)
+def test_bulk_insert_unsorted_then_single_ops(cls: type, check: str) -> None:
+    t = cls()
+    assert t.bulk_insert([50, 10, 40, 10, 30, 20]) == 5
+    assert t.bulk_insert(range(0, 200, 5)) == 35  # rebuild + merge
+    assert t.bulk_insert([1000]) == 1  # lote chico: insert normal
+    assert getattr(t, check)()
+    assert t.inorder() == sorted({*range(0, 200, 5), 1000})
+
+    assert t.delete(10)
+    assert t.insert(11)
+    assert getattr(t, check)()
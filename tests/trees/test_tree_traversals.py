@@ -0,0 +1,45 @@
+from itertools import islice
+
+import pytest
+
+from core.structures.trees.avl_tree import AVLTree
+from core.structures.trees.binary_search_tree import BinarySearchTree
+from core.structures.trees.binary_tree import BinaryTree
+from core.structures.trees.red_black_tree import RedBlackTree
+
+
+@pytest.mark.parametrize("cls", [BinarySearchTree, AVLTree, RedBlackTree])
+def test_iterators_match_lists(cls: type) -> None:
+    t = cls()
+    for v in [50, 30, 70, 20, 40, 60, 80, 35, 65]:
+        t.insert(v)
+
+    assert list(t) == t.inorder() == sorted(t.inorder())
+    assert list(reversed(t)) == t.inorder()[::-1]
+    assert list(t.iter_preorder()) == t.preorder()
+    assert list(t.iter_postorder()) == t.postorder()
+    assert list(t.iter_range(33, 65)) == [35, 40, 50, 60, 65]
+    assert list(t.iter_range(hi=30)) == [20, 30]
+    assert list(t.iter_range(lo=81)) == []
+
+
+def test_degenerate_bst_does_not_hit_recursion_limit() -> None:
+    t = BinarySearchTree[int]()
+    for v in range(5000):  # lista enlazada hacia la derecha
+        t.insert(v)
+
+    assert t.height() == 5000
+    assert t.is_valid_bst()
+    assert t.postorder()[:3] == [4999, 4998, 4997]
+    assert list(islice(t.iter_inorder(), 3)) == [0, 1, 2]
+    assert next(reversed(t)) == 4999
+
+
+def test_binary_tree_iterators() -> None:
+    bt = BinaryTree[int]()
+    for v in range(1, 8):
+        bt.insert(v)
+
+    assert list(bt.iter_inorder()) == bt.inorder() == [4, 2, 5, 1, 6, 3, 7]
+    assert list(bt.iter_postorder()) == bt.postorder() == [4, 5, 2, 6, 7, 3, 1]
+    assert list(bt.iter_level_order()) == bt.level_order() == list(range(1, 8))
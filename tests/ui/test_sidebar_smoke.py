@@ -30,6 +30,9 @@ class _FakeStreamlit:
     def expander(self, *_a: Any, **_k: Any) -> _Ctx:
         return _Ctx()
 
+    def toggle(self, *_a: Any, value: bool = False, **_k: Any) -> bool:
+        return value
+
 
 def test_sidebar_render_smoke(monkeypatch: Any) -> None:
     fake = _FakeStreamlit()
@@ -44,3 +47,8 @@ def test_sidebar_render_smoke(monkeypatch: Any) -> None:
         sidebar.render_sidebar_nav("hash")
     except TypeError:
         sidebar.render_sidebar_nav()
+
+    assert sidebar.profiling_enabled() is False
+    fake.session_state[sidebar.PROFILING_KEY] = True
+    sidebar.render_sidebar_nav("trees")
+    assert sidebar.profiling_enabled() is True